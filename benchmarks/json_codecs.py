@@ -0,0 +1,83 @@
+"""Compare DRF's stdlib JSON renderer/parser with the orjson classes on
+large form submission payloads.
+
+Usage:
+    python benchmarks/json_codecs.py [--submissions 1000] [--fields 50] [--repeat 5]
+
+"""
+
+import argparse
+import io
+import os
+import sys
+import timeit
+import uuid
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import django  # noqa: E402
+from django.conf import settings  # noqa: E402
+
+if not settings.configured:
+    settings.configure(INSTALLED_APPS=["rest_framework"], USE_TZ=True)
+django.setup()
+
+from rest_framework.parsers import JSONParser  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from dynamic_form.api.parsers import ORJSONParser  # noqa: E402
+from dynamic_form.api.renderers import ORJSONRenderer  # noqa: E402
+from dynamic_form.api.renderers.orjson_renderer import orjson_installed  # noqa: E402
+
+
+def build_payload(submissions: int, fields: int) -> list:
+    """Build a page of serialized submissions shaped like the API output."""
+    submitted_at = datetime(2025, 3, 24, 17, 15, tzinfo=timezone.utc).isoformat()
+    return [
+        {
+            "id": index,
+            "form_id": 1,
+            "schema_hash": uuid.uuid4().hex,
+            "submitted_at": submitted_at,
+            "user": {"username": f"user{index}"},
+            "submitted_data": {
+                f"field_{number}": (
+                    f"value {number} of submission {index}"
+                    if number % 3
+                    else [number, number * 1.5, True]
+                )
+                for number in range(fields)
+            },
+        }
+        for index in range(submissions)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--submissions", type=int, default=1000)
+    parser.add_argument("--fields", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    payload = build_payload(args.submissions, args.fields)
+    body = JSONRenderer().render(payload)
+    print(
+        f"{args.submissions} submissions x {args.fields} fields, "
+        f"{len(body) / 1024 / 1024:.1f} MiB, orjson installed: {orjson_installed}"
+    )
+
+    cases = {
+        "render (JSONRenderer)": lambda: JSONRenderer().render(payload),
+        "render (ORJSONRenderer)": lambda: ORJSONRenderer().render(payload),
+        "parse (JSONParser)": lambda: JSONParser().parse(io.BytesIO(body)),
+        "parse (ORJSONParser)": lambda: ORJSONParser().parse(io.BytesIO(body)),
+    }
+    for name, case in cases.items():
+        best = min(timeit.repeat(case, number=1, repeat=args.repeat))
+        print(f"{name:<26} {best * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,6 @@ class DynamicFieldAdmin(AdminPermissionControlMixin, admin.ModelAdmin):
     list_display = ("id", "name", "form", "field_type", "is_required", "order")
     list_display_links = ("id", "name")
     autocomplete_fields = ("form", "field_type")
-    list_filter = ("field_type", "is_required", "form")
+    list_filter = ("field_type", "is_required", "is_indexed", "form")
     search_fields = ("name", "form__name")
     ordering = ("order", "name")
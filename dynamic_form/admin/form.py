@@ -1,17 +1,159 @@
-from django.contrib import admin
+import json
+
+from django import forms
+from django.contrib import admin, messages
+from django.contrib.admin.helpers import ActionForm
+from django.db.models import Count
+from django.utils.translation import gettext_lazy as _
 
 from dynamic_form.mixins.admin.permission import AdminPermissionControlMixin
-from dynamic_form.models import DynamicForm
+from dynamic_form.models import DynamicForm, FormSubmission
 from dynamic_form.settings.conf import config
+from dynamic_form.utils.data_operations import (
+    DROP,
+    MAP,
+    RENAME,
+    DataOperation,
+    rewrite_submission_data,
+)
+from dynamic_form.utils.export import export_submissions
+from dynamic_form.utils.form_schema import get_compiled_form
+
+
+class SubmissionDataActionForm(ActionForm):
+    """Action bar form with the parameters of the submission data actions."""
+
+    data_key = forms.CharField(required=False, label=_("Key"))
+    new_key = forms.CharField(required=False, label=_("New key"))
+    value_map = forms.CharField(
+        required=False,
+        label=_("Value map"),
+        help_text=_('A JSON object of old to new values, e.g. {"DE": "Germany"}.'),
+    )
 
 
 @admin.register(DynamicForm, site=config.admin_site_class)
 class DynamicFormAdmin(AdminPermissionControlMixin, admin.ModelAdmin):
     """Admin configuration for managing Dynamic Forms."""
 
-    list_display = ("id", "name", "is_active", "created_at", "updated_at")
+    list_display = (
+        "id",
+        "name",
+        "is_active",
+        "field_count",
+        "submission_count",
+        "last_submitted_at",
+        "created_at",
+        "updated_at",
+    )
     list_display_links = ("id", "name")
     search_fields = ("name", "description")
-    list_filter = ("created_at", "updated_at")
+    list_filter = ("data_keys", "created_at", "updated_at")
     ordering = ("-created_at",)
-    readonly_fields = ("created_at", "updated_at")
+    readonly_fields = (
+        "created_at",
+        "updated_at",
+        "submission_count",
+        "last_submitted_at",
+    )
+    actions = (
+        "export_submissions_csv",
+        "export_submissions_ndjson",
+        "rename_submission_key",
+        "drop_submission_key",
+        "map_submission_values",
+    )
+    action_form = SubmissionDataActionForm
+
+    def get_queryset(self, request):
+        """Annotate the number of fields of each form, so the changelist
+        counts them in its own query."""
+        return super().get_queryset(request).annotate(field_count=Count("fields"))
+
+    def save_model(self, request, obj, form, change):
+        """Save only the changed fields of an existing form, so that the
+        submission counters updated since the page was loaded are kept."""
+        if change:
+            obj.save(update_fields=[*form.changed_data, "updated_at"])
+        else:
+            super().save_model(request, obj, form, change)
+
+    @admin.display(description=_("Fields"), ordering="field_count")
+    def field_count(self, obj: DynamicForm) -> int:
+        """Return the number of fields annotated by `get_queryset`."""
+        return obj.field_count
+
+    @admin.action(description=_("Export submissions as CSV"))
+    def export_submissions_csv(self, request, queryset):
+        return self._export_submissions(request, queryset, "csv")
+
+    @admin.action(description=_("Export submissions as NDJSON"))
+    def export_submissions_ndjson(self, request, queryset):
+        return self._export_submissions(request, queryset, "ndjson")
+
+    def _export_submissions(self, request, queryset, export_format: str):
+        """Stream the submissions of the selected form; the columns differ
+        between forms, so exactly one form must be selected."""
+        form_ids = list(queryset.values_list("pk", flat=True)[:2])
+        if len(form_ids) != 1:
+            self.message_user(
+                request,
+                _("Select exactly one form to export its submissions."),
+                level=messages.WARNING,
+            )
+            return None
+
+        form = get_compiled_form(form_ids[0])
+        return export_submissions(
+            form, FormSubmission.objects.filter(form_id=form.id), export_format
+        )
+
+    @admin.action(description=_("Rename a key of the submitted data"))
+    def rename_submission_key(self, request, queryset):
+        self._rewrite_submission_data(request, queryset, RENAME)
+
+    @admin.action(description=_("Drop a key of the submitted data"))
+    def drop_submission_key(self, request, queryset):
+        self._rewrite_submission_data(request, queryset, DROP)
+
+    @admin.action(description=_("Map the values of a key of the submitted data"))
+    def map_submission_values(self, request, queryset):
+        self._rewrite_submission_data(request, queryset, MAP)
+
+    def _rewrite_submission_data(self, request, queryset, action: str) -> None:
+        """Apply a key operation, read from the action bar, to the
+        submissions of the selected forms (see `rewrite_submission_data`).
+
+        Large tables are better served by the
+        `dynamic_form_rewrite_submission_data` command, which reports
+        progress and can be resumed.
+
+        """
+        try:
+            mapping = {}
+            if action == MAP:
+                mapping = json.loads(request.POST.get("value_map") or "null")
+                if not isinstance(mapping, dict):
+                    raise ValueError(_("The value map must be a JSON object."))
+            operation = DataOperation(
+                action,
+                request.POST.get("data_key", "").strip(),
+                new_key=request.POST.get("new_key", "").strip() or None,
+                mapping=mapping,
+            )
+            if not operation.key:
+                raise ValueError(_("Enter the key to change."))
+        except ValueError as exc:
+            self.message_user(request, str(exc), level=messages.ERROR)
+            return
+
+        updated = 0
+        form_ids = list(queryset.values_list("pk", flat=True))
+        for form_id in form_ids:
+            updated += rewrite_submission_data(form_id, [operation]).updated
+        self.message_user(
+            request,
+            _("Rewrote %(updated)s submission(s) of %(forms)s form(s).")
+            % {"updated": updated, "forms": len(form_ids)},
+            level=messages.SUCCESS,
+        )
@@ -3,6 +3,7 @@ from django.contrib import admin
 from dynamic_form.mixins.admin.permission import AdminPermissionControlMixin
 from dynamic_form.models import FormSubmission
 from dynamic_form.settings.conf import config
+from dynamic_form.utils.counters import deferred_counters
 
 
 @admin.register(FormSubmission, site=config.admin_site_class)
@@ -17,6 +18,12 @@ class FormSubmissionAdmin(AdminPermissionControlMixin, admin.ModelAdmin):
     ordering = ("-submitted_at",)
     readonly_fields = ("user", "submitted_at", "submitted_data")
 
+    def delete_queryset(self, request, queryset):
+        """Delete the selected submissions, updating the counters of each
+        form once instead of once per submission."""
+        with deferred_counters():
+            super().delete_queryset(request, queryset)
+
     def has_add_permission(self, request, obj=...):
         return False
 
@@ -0,0 +1 @@
+from .submitted_data import SubmittedDataFilterBackend
@@ -0,0 +1,314 @@
+import json
+import math
+from typing import Any, Container, Dict, List, Optional, Tuple
+
+from django.db import connections
+from django.db.models import ExpressionWrapper, F, JSONField, Q, QuerySet
+from django.db.models.fields.json import (
+    DataContains,
+    KeyTransform,
+    KeyTransformExact,
+    KeyTransformGte,
+    KeyTransformIContains,
+    KeyTransformIn,
+    KeyTransformLte,
+)
+from django.db.models.lookups import Exact, In
+from django.utils.dateparse import parse_date, parse_datetime
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+from rest_framework.request import Request
+
+from dynamic_form.settings.conf import config
+from dynamic_form.utils.compression import MIN_COMPRESSED_VALUE_LENGTH
+from dynamic_form.utils.form_schema import (
+    CompiledField,
+    CompiledForm,
+    get_compiled_form,
+)
+from dynamic_form.utils.indexes import (
+    SubmittedValue,
+    configured_filter_keys,
+    is_indexable_key,
+    supports_data_indexes,
+)
+from dynamic_form.validators.submission_validators import (
+    CHOICE_TYPES,
+    TEXT_TYPES,
+    normalize_choices,
+)
+
+# Query parameters starting with this prefix filter on submitted answers
+PARAM_PREFIX = "submitted_data__"
+
+# Supported predicates; a parameter without a lookup means "exact"
+LOOKUPS = ("exact", "in", "range", "contains")
+
+# Field types whose values are compared as plain strings
+STRING_TYPES = TEXT_TYPES | CHOICE_TYPES | {"email"}
+
+# Field types supporting the "range" lookup
+ORDERED_TYPES = frozenset({"number", "date"})
+
+# (query parameter, field name, lookup, raw value)
+Predicate = Tuple[str, str, str, str]
+
+
+def submitted_key(key: str) -> KeyTransform:
+    """Return the value of a single key of the submitted data.
+
+    The column is typed up front so that the lookups built on the
+    transform prepare their values as JSON before the query resolves it.
+
+    """
+    column = ExpressionWrapper(F("submitted_data"), output_field=JSONField())
+    return KeyTransform(key, column)
+
+
+def split_lookup(path: str, field_names: Container[str] = ()) -> Tuple[str, str]:
+    """Split ``<field>[__<lookup>]`` into a field name and one of `LOOKUPS`.
+
+    Field names are admin-defined and may contain ``__`` or be named like
+    a lookup, so only a trailing `LOOKUPS` suffix is split off, and only
+    when the remaining name is a field of the form (or the whole path is
+    not).
+
+    """
+    name, _sep, lookup = path.rpartition("__")
+    if name and lookup in LOOKUPS and (name in field_names or path not in field_names):
+        return name, lookup
+    return path, "exact"
+
+
+def parse_predicates(
+    request: Request, field_names: Container[str] = ()
+) -> List[Predicate]:
+    """Extract the submitted data predicates from the query parameters.
+
+    ``submitted_data__<field>`` is an exact match, and
+    ``submitted_data__<field>__<lookup>`` applies one of `LOOKUPS`.
+
+    Args:
+        request (Request): The request to read the query parameters of.
+        field_names (Container[str]): Field names of the filtered form, used
+            to tell lookups from field names ending like one.
+
+    """
+    predicates: List[Predicate] = []
+    for param, raw in request.query_params.items():
+        if not param.startswith(PARAM_PREFIX):
+            continue
+        name, lookup = split_lookup(param[len(PARAM_PREFIX) :], field_names)
+        predicates.append((param, name, lookup, raw))
+    return predicates
+
+
+def cast_value(field: CompiledField, raw: str) -> Any:
+    """Cast a query parameter to the Python type stored for the field.
+
+    Args:
+        field (CompiledField): The field the value is compared with.
+        raw (str): The value from the query string.
+
+    Returns:
+        Any: The value as it appears in the submitted data.
+
+    Raises:
+        ValueError: If the value does not match the field type.
+
+    """
+    field_type = field.field_type
+    if field_type == "number":
+        try:
+            number = float(raw)
+        except ValueError:
+            raise ValueError(_("Expected a number."))
+        # inf, nan and overflowing values (e.g. 1e400) have no JSON form
+        if not math.isfinite(number):
+            raise ValueError(_("Expected a number."))
+        return int(number) if number.is_integer() else number
+
+    if field_type == "boolean" or (field_type == "checkbox" and not field.choices):
+        value = raw.lower()
+        if value in ("true", "1", "yes"):
+            return True
+        if value in ("false", "0", "no"):
+            return False
+        raise ValueError(_("Expected a boolean."))
+
+    if field_type == "date":
+        try:
+            valid = bool(parse_date(raw) or parse_datetime(raw))
+        except ValueError:
+            valid = False
+        if not valid:
+            raise ValueError(_("Enter a valid date in ISO 8601 format."))
+        return raw
+
+    choices = normalize_choices(field.choices)
+    if choices and raw not in choices:
+        # Choices may be stored as numbers or booleans
+        try:
+            value = json.loads(raw)
+        except ValueError:
+            return raw
+        return value if value in choices else raw
+    return raw
+
+
+def may_be_compressed(form: CompiledForm, field: CompiledField) -> bool:
+    """Return whether answers of a field may be stored in the compressed
+    column, where filters cannot read them.
+
+    That is the case for text answers when compression is enabled, unless
+    the field is indexed or a configured filter key (see
+    `uncompressed_keys`), or its answers are always shorter than
+    `MIN_COMPRESSED_VALUE_LENGTH` (short choices or ``max_length``).
+
+    """
+    if not config.submission_compression or field.field_type not in STRING_TYPES:
+        return False
+    if field.key in form.indexed_keys or field.key in configured_filter_keys():
+        return False
+    max_length = field.validation_rules.get("max_length")
+    if isinstance(max_length, int) and max_length < MIN_COMPRESSED_VALUE_LENGTH:
+        return False
+    choices = normalize_choices(field.choices)
+    return not choices or any(
+        isinstance(choice, str) and len(choice) >= MIN_COMPRESSED_VALUE_LENGTH
+        for choice in choices
+    )
+
+
+class SubmittedDataFilterBackend(BaseFilterBackend):
+    """Filter submissions on their answers, e.g.
+    ``?form_id=1&submitted_data__country=DE&submitted_data__age__range=18,65``.
+
+    Field names are validated against the fields of the form given by
+    ``form_id``, translated to the keys the form stores answers by, and
+    values are cast according to each field type. All
+    predicates are compiled into a single query on JSON key transforms, so
+    the filtering happens in the database. Conditions are built from
+    `KeyTransform` expressions rather than ``submitted_data__<key>`` keyword
+    paths, so a field named like a lookup (``in``, ``gt``, ``has_key``) or
+    containing ``__`` is still a single key. String comparisons use
+    `SubmittedValue`, which can be served by the indexes created by the
+    `dynamic_form_indexes` command. When submission compression is
+    enabled, text filters are refused on fields whose answers may be
+    compressed (see `may_be_compressed`), as they would miss them.
+
+    Lookups:
+        exact: ``submitted_data__<field>=<value>``
+        in: comma-separated values
+        range: ``<min>,<max>``, either bound may be empty (number and date fields)
+        contains: case-insensitive substring for text fields, membership for
+            multi-choice checkbox fields (requires JSON containment support)
+
+    """
+
+    def filter_queryset(
+        self, request: Request, queryset: QuerySet, view: Any
+    ) -> QuerySet:
+        if not any(param.startswith(PARAM_PREFIX) for param in request.query_params):
+            return queryset
+
+        form = get_compiled_form(request.query_params.get("form_id"))
+        if form is None:
+            raise ValidationError(
+                {
+                    "form_id": _(
+                        "A valid form ID is required to filter on submitted data."
+                    )
+                },
+                code="invalid_form_id",
+            )
+
+        predicates = parse_predicates(request, form.field_map)
+        connection = connections[queryset.db]
+        conditions: List[Any] = [Q(form_id=form.id)]
+        errors: Dict[str, List[str]] = {}
+        for param, name, lookup, raw in predicates:
+            try:
+                conditions.append(
+                    self.build_condition(form, name, lookup, raw, connection)
+                )
+            except ValueError as exc:
+                errors.setdefault(param, []).append(str(exc))
+
+        if errors:
+            raise ValidationError(errors, code="invalid_filter")
+        return queryset.filter(*conditions)
+
+    def build_condition(
+        self, form: CompiledForm, name: str, lookup: str, raw: str, connection: Any
+    ) -> Any:
+        """Compile one predicate into a filter condition.
+
+        Raises:
+            ValueError: If the field is unknown, or the lookup or value does
+                not match the field type.
+
+        """
+        field: Optional[CompiledField] = form.field_map.get(name)
+        if field is None:
+            raise ValueError(
+                _("Form #%(form_id)s has no field named '%(name)s'.")
+                % {"form_id": form.id, "name": name}
+            )
+
+        value_of = submitted_key(field.key)
+        is_string = field.field_type in STRING_TYPES
+        if may_be_compressed(form, field):
+            raise ValueError(
+                _(
+                    "Answers of field '%(name)s' may be stored compressed; mark "
+                    "the field as indexed to filter on it."
+                )
+                % {"name": name}
+            )
+        use_index = (
+            is_string
+            and is_indexable_key(field.key)
+            and supports_data_indexes(connection)
+        )
+
+        if lookup == "exact":
+            value = cast_value(field, raw)
+            if use_index and isinstance(value, str):
+                return Exact(SubmittedValue(field.key), value)
+            return KeyTransformExact(value_of, value)
+
+        if lookup == "in":
+            values = [cast_value(field, item) for item in raw.split(",") if item]
+            if not values:
+                raise ValueError(_("Expected a comma-separated list of values."))
+            if use_index and all(isinstance(value, str) for value in values):
+                return In(SubmittedValue(field.key), values)
+            return KeyTransformIn(value_of, values)
+
+        if lookup == "range":
+            if field.field_type not in ORDERED_TYPES:
+                raise ValueError(_("Range filters require a number or date field."))
+            lower, sep, upper = raw.partition(",")
+            if not sep or not (lower or upper):
+                raise ValueError(
+                    _("Expected '<min>,<max>'; either bound may be empty.")
+                )
+            condition = Q()
+            if lower:
+                condition &= Q(KeyTransformGte(value_of, cast_value(field, lower)))
+            if upper:
+                condition &= Q(KeyTransformLte(value_of, cast_value(field, upper)))
+            return condition
+
+        # lookup == "contains"
+        if field.field_type == "checkbox" and field.choices:
+            if not connection.features.supports_json_field_contains:
+                raise ValueError(
+                    _("Filtering on list values is not supported by this database.")
+                )
+            return DataContains(value_of, [cast_value(field, raw)])
+        if is_string:
+            return KeyTransformIContains(value_of, raw)
+        raise ValueError(_("Contains filters require a text or multi-choice field."))
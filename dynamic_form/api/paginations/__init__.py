@@ -1 +1,2 @@
+from .cursor_pagination import SubmissionCursorPagination
 from .limit_offset_pagination import DefaultLimitOffSetPagination
@@ -0,0 +1,49 @@
+from typing import Optional
+
+from rest_framework.pagination import CursorPagination
+from rest_framework.request import Request
+
+
+class SubmissionCursorPagination(CursorPagination):
+    """A keyset (cursor) pagination class for form submission listings.
+
+    Pages are fetched with ``WHERE submitted_at < <cursor>`` on the
+    ``(form, submitted_at)`` and ``(user, submitted_at)`` indexes instead of
+    ``COUNT(*)`` and ``OFFSET``, so the cost of a page does not grow with the
+    number of submissions. Cursors are opaque tokens returned in the `next`
+    and `previous` links.
+
+    """
+
+    # Newest first; the id breaks ties between equal timestamps
+    ordering = ("-submitted_at", "-id")
+
+    # Query parameter used to request a page size, shared with the
+    # limit/offset pagination
+    page_size_query_param: str = "limit"
+
+    # Minimum page size allowed in query parameters
+    min_page_size: int = 1
+
+    # Maximum page size allowed in query parameters
+    max_page_size: int = 100
+
+    # Default page size when no limit is specified
+    page_size: int = 10
+
+    def get_page_size(self, request: Request) -> Optional[int]:
+        """Return the requested page size, constrained by the minimum and
+        maximum page sizes, or the default page size if none is valid."""
+        page_size = request.query_params.get(self.page_size_query_param)
+
+        if page_size:
+            try:
+                page_size = int(page_size)
+            except ValueError:
+                return self.page_size
+
+            if page_size < self.min_page_size:
+                return self.page_size
+            return min(page_size, self.max_page_size)
+
+        return self.page_size
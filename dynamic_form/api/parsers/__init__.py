@@ -0,0 +1 @@
+from .orjson_parser import ORJSONParser
@@ -0,0 +1,39 @@
+import codecs
+from typing import IO, Any, Mapping, Optional
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+try:
+    import orjson
+
+    orjson_installed = True
+except ImportError:  # pragma: no cover
+    orjson_installed = False
+
+
+class ORJSONParser(JSONParser):
+    """A JSONParser that decodes with `orjson` when it is installed.
+
+    Falls back to DRF's stdlib `json` parsing when `orjson` is missing or
+    the request body is not UTF-8 encoded.
+
+    """
+
+    def parse(
+        self,
+        stream: IO[bytes],
+        media_type: Optional[str] = None,
+        parser_context: Optional[Mapping[str, Any]] = None,
+    ) -> Any:
+        """Parse the incoming JSON stream into Python data."""
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        if not orjson_installed or codecs.lookup(encoding).name != "utf-8":
+            return super().parse(stream, media_type, parser_context)
+
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
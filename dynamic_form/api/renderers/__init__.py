@@ -0,0 +1 @@
+from .orjson_renderer import ORJSONRenderer
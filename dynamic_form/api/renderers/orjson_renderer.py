@@ -0,0 +1,52 @@
+from typing import Any, Mapping, Optional
+
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+
+    orjson_installed = True
+except ImportError:  # pragma: no cover
+    orjson_installed = False
+
+
+class ORJSONRenderer(JSONRenderer):
+    """A JSONRenderer that serializes with `orjson` when it is installed.
+
+    Falls back to DRF's stdlib `json` rendering when `orjson` is missing,
+    or when the client asks for an indentation `orjson` cannot produce
+    (anything other than 2 spaces), so it can be enabled unconditionally.
+
+    """
+
+    # Options matching DRF's output: UTC datetimes end with 'Z' and
+    # non-string dictionary keys are coerced to strings
+    orjson_options: int = (
+        orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS if orjson_installed else 0
+    )
+
+    def render(
+        self,
+        data: Any,
+        accepted_media_type: Optional[str] = None,
+        renderer_context: Optional[Mapping[str, Any]] = None,
+    ) -> bytes:
+        """Render `data` into JSON bytes.
+
+        Types `orjson` does not support natively (Decimal, lazy strings,
+        querysets, ...) are converted by DRF's `encoder_class`.
+
+        """
+        if not orjson_installed:
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b""
+
+        options = self.orjson_options
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if indent == 2:
+            options |= orjson.OPT_INDENT_2
+        elif indent:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        return orjson.dumps(data, default=self.encoder_class().default, option=options)
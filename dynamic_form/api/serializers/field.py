@@ -1,21 +1,41 @@
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List
+
+from django.db import IntegrityError, transaction
+from django.db.models import Q
 from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
 
-from dynamic_form.api.serializers.field_type import FieldTypeSerializer
-from dynamic_form.models import DynamicField, DynamicForm, FieldType
+from dynamic_form.api.serializers.field_type import RegisteredFieldTypeSerializer
+from dynamic_form.models import DynamicField, DynamicForm
+from dynamic_form.settings.conf import config
+from dynamic_form.utils.field_order import (
+    append_positions,
+    move_field,
+    spaced_positions,
+)
+from dynamic_form.utils.field_types import get_field_type, get_field_types
+from dynamic_form.utils.form_schema import invalidate_form_schema
+from dynamic_form.validators.submission_validators import validate_rules_definition
+
+# Error reported when a field name is already used in the form
+DUPLICATE_NAME_MESSAGE = _(
+    "A field with this name already exists in the specified form."
+)
 
 
 class DynamicFieldSerializer(serializers.ModelSerializer):
     """Serializer for DynamicField model.
 
-    Validates that each field name is unique within its associated form
-    during creation and updates. Ensures the referenced form exists and
-    is active. Supports partial updates (PATCH) by making field_type_id
+    Validates that the validation rules can be compiled and that the
+    referenced form exists and is active. Duplicate names within a form are
+    rejected by the database constraint and reported as a validation error
+    on `name`. Supports partial updates (PATCH) by making field_type_id
     optional.
 
     """
 
-    field_type = FieldTypeSerializer(read_only=True)
+    field_type = RegisteredFieldTypeSerializer(read_only=True)
     field_type_id = serializers.IntegerField(
         write_only=True,
         label=_("Field Type ID"),
@@ -27,75 +47,374 @@ class DynamicFieldSerializer(serializers.ModelSerializer):
         fields = "__all__"
         read_only_fields = ["form"]
 
-    def validate(self, attrs):
-        """Validate the field data, ensuring the field type exists and the
-        field name is unique per form.
-
-        For PATCH updates, only validates field_type_id if provided.
-        Preserves existing form and field_type if not included in the request.
-
-        Args:
-            attrs (dict): The incoming data to validate.
+    def validate_validation_rules(self, value):
+        """Reject validation rules that the submission validator engine
+        cannot compile (e.g. a non-numeric bound or an invalid regex)."""
+        errors = validate_rules_definition(value)
+        if errors:
+            raise serializers.ValidationError(errors)
+        return value
 
-        Returns:
-            dict: The validated attributes with the resolved form instance.
+    def get_form(self) -> DynamicForm:
+        """Return the form a new field is created in: the ``form`` context
+        key set by the view, or else the active form of the URL.
 
         Raises:
-            serializers.ValidationError: If the form is invalid or the field name is not unique.
+            serializers.ValidationError: If the form ID is invalid, or the
+                form does not exist or is inactive.
 
         """
-        # Get form from view's URL kwargs
+        form = self.context.get("form")
+        if form is not None:
+            return form
+
         view = self.context.get("view")
         form_pk = view.kwargs.get("form_pk") if view else None
-
         if not form_pk or not str(form_pk).isdigit():
             raise serializers.ValidationError(
                 {"form_pk": _("Invalid Form ID specified in the URL.")}
             )
+        form = DynamicForm.objects.filter(is_active=True, pk=form_pk).first()
+        if not form:
+            raise serializers.ValidationError(
+                {"form": _("Specified form not found or inactive.")}
+            )
+        return form
 
-        if not (self.instance and self.instance.form_id):
-            form = DynamicForm.objects.filter(is_active=True, pk=form_pk).first()
-            if not form:
-                raise serializers.ValidationError(
-                    {"form": _("Specified form not found or inactive.")}
-                )
-        else:
-            form = self.instance.form
+    def validate(self, attrs):
+        """Validate the field data, ensuring the field type exists.
+
+        The form of a new field is resolved once (see `get_form`) and the
+        field type comes from the in-memory registry, so validation runs no
+        query. Name uniqueness is left to the `unique_together` constraint
+        on (form, name), checked when the field is saved. For PATCH
+        updates, the form and the field type are kept unless
+        `field_type_id` is given.
+
+        Args:
+            attrs (dict): The incoming data to validate.
+
+        Returns:
+            dict: The validated attributes with the resolved form and field type.
+
+        Raises:
+            serializers.ValidationError: If the form or the field type is invalid.
+
+        """
+        if self.instance is None:
+            attrs["form"] = self.get_form()
 
-        attrs["form"] = form
-        # Handle field_type_id if provided
         field_type_id = attrs.pop("field_type_id", None)
         if field_type_id is not None:
-            field_type = FieldType.objects.filter(pk=field_type_id).first()
+            field_type = get_field_type(field_type_id)
             if not field_type:
                 raise serializers.ValidationError(
                     {"field_type_id": _("Field Type with the given ID was not found.")}
                 )
             attrs["field_type"] = field_type
-        else:
-            # Use the existing field_type for updates if field_type_id is not provided
-            attrs["field_type"] = self.instance.field_type
-
-        # Extract the name from the incoming data (if provided)
-        name = attrs.get("name")
-        if name is not None:
-            instance = self.instance  # None for create, existing instance for update
-            conflicting_field = (
-                DynamicField.objects.filter(form=attrs["form"], name=name)
-                .exclude(
-                    pk=(
-                        instance.pk if instance else None
-                    )  # Exclude current instance during update
-                )
-                .exists()
+
+        return attrs
+
+    @contextmanager
+    def unique_name(self, form_id: int, name: Any) -> Iterator[None]:
+        """Translate a violation of the (form, name) constraint raised by
+        the block into the validation error of a duplicate name.
+
+        The block runs in a savepoint, so the surrounding transaction stays
+        usable. Other integrity errors are re-raised.
+
+        """
+        try:
+            with transaction.atomic():
+                yield
+        except IntegrityError:
+            duplicate = DynamicField.objects.filter(form_id=form_id, name=name)
+            if self.instance is not None:
+                duplicate = duplicate.exclude(pk=self.instance.pk)
+            if not duplicate.exists():
+                raise
+            raise serializers.ValidationError({"name": [DUPLICATE_NAME_MESSAGE]})
+
+    def create(self, validated_data):
+        """Create the field, after the last field of the form unless an
+        `order` is given."""
+        form_id = validated_data["form"].pk
+        with self.unique_name(form_id, validated_data.get("name")):
+            if "order" not in validated_data:
+                validated_data["order"] = append_positions(form_id, 1)[0]
+            return super().create(validated_data)
+
+    def update(self, instance, validated_data):
+        name = validated_data.get("name", instance.name)
+        with self.unique_name(instance.form_id, name):
+            return super().update(instance, validated_data)
+
+
+class BulkDynamicFieldItemSerializer(serializers.ModelSerializer):
+    """A field definition of a bulk request.
+
+    Items are validated without queries; the form, field types and names
+    are checked once for the whole batch by `BulkDynamicFieldSerializer`.
+    An item with an ``id`` updates that field of the form with the given
+    attributes, an item without one creates a field.
+
+    """
+
+    id = serializers.IntegerField(
+        required=False,
+        label=_("ID"),
+        help_text=_("The ID of an existing field of the form to update."),
+    )
+    field_type_id = serializers.IntegerField(
+        label=_("Field Type ID"),
+        help_text=_("The ID of the Field Type related to this Field."),
+    )
+
+    class Meta:
+        model = DynamicField
+        exclude = ["form", "field_type"]
+
+    validate_validation_rules = DynamicFieldSerializer.validate_validation_rules
+
+
+class BulkDynamicFieldSerializer(serializers.Serializer):
+    """Serializer for creating and updating many fields of a form in a
+    single request.
+
+    The form is resolved once by the view and passed in the ``form``
+    context key. Field types are resolved from the field type registry, and
+    the fields being updated and the names in use are loaded with one
+    query; the `unique_together` constraint on (form, name) catches the
+    conflicts left by concurrent writers. The batch is all or nothing.
+
+    """
+
+    fields = serializers.ListField(
+        child=BulkDynamicFieldItemSerializer(),
+        allow_empty=False,
+        label=_("Fields"),
+        help_text=_("Field definitions; items with an 'id' update that field."),
+    )
+
+    def validate_fields(self, value):
+        """Ensure the batch does not exceed the configured maximum size."""
+        max_items = config.api_admin_dynamic_field_bulk_max_items
+        if max_items and len(value) > max_items:
+            raise serializers.ValidationError(
+                _("Ensure this list has at most %(limit)s items.")
+                % {"limit": max_items}
             )
-            if conflicting_field:
-                raise serializers.ValidationError(
-                    {
-                        "name": _(
-                            "A field with this name already exists in the specified form."
-                        )
-                    }
-                )
+        return value
+
+    def validate(self, attrs):
+        """Check the field types, the updated fields and the names of the
+        whole batch.
+
+        Returns:
+            dict: The attributes with the resolved `field_types` and the
+                `existing` fields to update, keyed by ID.
+
+        Raises:
+            serializers.ValidationError: With the errors of each invalid
+                item, keyed by its index.
+
+        """
+        form: DynamicForm = self.context["form"]
+        items: List[Dict[str, Any]] = attrs["fields"]
+        ids = [item["id"] for item in items if "id" in item]
+        names = [item["name"] for item in items]
+
+        field_types = get_field_types()
+        related = DynamicField.objects.filter(form=form).filter(
+            Q(pk__in=ids) | Q(name__in=names)
+        )
+        existing: Dict[int, DynamicField] = {}
+        taken: Dict[str, int] = {}
+        for field in related:
+            taken[field.name] = field.pk
+            if field.pk in ids:
+                existing[field.pk] = field
+        # Names released by fields renamed in this batch
+        released = {
+            field.name
+            for item in items
+            if (field := existing.get(item.get("id"))) and field.name != item["name"]
+        }
+
+        errors: Dict[int, Dict[str, List[Any]]] = {}
+        seen_ids, seen_names = set(), set()
+        for index, item in enumerate(items):
+            item_errors: Dict[str, List[Any]] = {}
+            pk, name = item.get("id"), item["name"]
+            if pk is not None and (pk not in existing or pk in seen_ids):
+                item_errors["id"] = [
+                    _("Field #%(id)s is not a field of the form or is repeated.")
+                    % {"id": pk}
+                ]
+            if item["field_type_id"] not in field_types:
+                item_errors["field_type_id"] = [
+                    _("Field Type with the given ID was not found.")
+                ]
+            if name in seen_names or (
+                name in taken and taken[name] != pk and name not in released
+            ):
+                item_errors["name"] = [DUPLICATE_NAME_MESSAGE]
+            seen_ids.add(pk)
+            seen_names.add(name)
+            if item_errors:
+                errors[index] = item_errors
+
+        if errors:
+            raise serializers.ValidationError({"fields": errors})
+
+        attrs["field_types"] = field_types
+        attrs["existing"] = existing
+        return attrs
+
+    @property
+    def has_updates(self) -> bool:
+        """Whether the batch updates existing fields."""
+        return bool(self.validated_data["existing"])
+
+    def create(self, validated_data):
+        """Write the batch with one `bulk_update` and one `bulk_create`
+        inside a single transaction. Names swapped between existing fields
+        conflict in the database and are reported as duplicates. New fields
+        without an `order` are appended after the last field of the form,
+        in request order.
+
+        Returns:
+            List[DynamicField]: The created and updated fields, in request order.
+
+        """
+        form: DynamicForm = self.context["form"]
+        field_types = validated_data["field_types"]
+        existing = validated_data["existing"]
+        created, updated, update_fields = [], [], set()
+        new_items, results = [], []
+        for item in validated_data["fields"]:
+            values = dict(item)
+            pk = values.pop("id", None)
+            values["field_type"] = field_types[values.pop("field_type_id")]
+            if pk is None:
+                field = DynamicField(form=form, **values)
+                created.append(field)
+                new_items.append(item)
+            else:
+                field = existing[pk]
+                for attr, value in values.items():
+                    setattr(field, attr, value)
+                update_fields.update(values)
+                updated.append(field)
+            results.append(field)
+
+        try:
+            with transaction.atomic():
+                unordered = [
+                    field
+                    for field, item in zip(created, new_items)
+                    if "order" not in item
+                ]
+                for field, position in zip(
+                    unordered, append_positions(form.pk, len(unordered))
+                ):
+                    field.order = position
+                # Renames first, so new fields can take the names they free
+                if updated:
+                    DynamicField.objects.bulk_update(updated, sorted(update_fields))
+                DynamicField.objects.bulk_create(created)
+        except IntegrityError:
+            raise serializers.ValidationError({"name": [DUPLICATE_NAME_MESSAGE]})
+
+        # Bulk writes send no signals
+        invalidate_form_schema(form.pk)
+        return results
+
 
+class DynamicFieldOrderSerializer(serializers.Serializer):
+    """Serializer for reordering the fields of a form in a single request.
+
+    The form is passed in the ``form`` context key. The fields are loaded
+    with one query and the changed positions are written with one
+    `bulk_update`.
+
+    """
+
+    order = serializers.ListField(
+        child=serializers.IntegerField(),
+        allow_empty=False,
+        label=_("Order"),
+        help_text=_("The IDs of every field of the form, in their new order."),
+    )
+
+    def validate(self, attrs):
+        """Ensure the order lists every field of the form exactly once.
+
+        Returns:
+            dict: The attributes with the form's `fields` in their new order.
+
+        """
+        order: List[int] = attrs["order"]
+        fields = {
+            field.pk: field
+            for field in DynamicField.objects.filter(form=self.context["form"])
+        }
+        if len(set(order)) != len(order) or set(order) != set(fields):
+            raise serializers.ValidationError(
+                {"order": _("List the ID of every field of the form exactly once.")}
+            )
+        attrs["fields"] = [fields[pk] for pk in order]
         return attrs
+
+    def create(self, validated_data):
+        """Respace the fields in their new order (see
+        `dynamic_form.utils.field_order`), writing only the fields whose
+        position changed.
+
+        Returns:
+            List[DynamicField]: The fields of the form in their new order.
+
+        """
+        fields: List[DynamicField] = validated_data["fields"]
+        changed = []
+        for field, position in zip(fields, spaced_positions(len(fields))):
+            if field.order != position:
+                field.order = position
+                changed.append(field)
+        with transaction.atomic():
+            DynamicField.objects.bulk_update(changed, ["order"])
+
+        # Bulk writes send no signals
+        invalidate_form_schema(self.context["form"].pk)
+        return fields
+
+
+class DynamicFieldMoveSerializer(serializers.Serializer):
+    """Serializer for moving a field of a form after another one."""
+
+    after = serializers.IntegerField(
+        allow_null=True,
+        label=_("After"),
+        help_text=_("The ID of the field to move it after, null to move it first."),
+    )
+
+    def validate_after(self, value):
+        """Resolve the field to move after, which must be another field of
+        the same form."""
+        if value is None:
+            return None
+        field: DynamicField = self.instance
+        after = (
+            DynamicField.objects.filter(form_id=field.form_id, pk=value)
+            .exclude(pk=field.pk)
+            .first()
+        )
+        if after is None:
+            raise serializers.ValidationError(
+                _("Expected the ID of another field of the form.")
+            )
+        return after
+
+    def update(self, instance, validated_data):
+        """Move the field with a single write (see `move_field`)."""
+        return move_field(instance, validated_data["after"])
@@ -1,6 +1,7 @@
 from rest_framework import serializers
 
 from dynamic_form.models import FieldType
+from dynamic_form.utils.field_types import get_field_types
 
 
 class FieldTypeSerializer(serializers.ModelSerializer):
@@ -9,3 +10,21 @@ class FieldTypeSerializer(serializers.ModelSerializer):
     class Meta:
         model = FieldType
         fields = "__all__"
+
+
+class RegisteredFieldTypeSerializer(FieldTypeSerializer):
+    """Serializer for the FieldType of a DynamicField, read from the field
+    type registry instead of a join or a query per field.
+
+    The registry is resolved once per serializer context.
+
+    """
+
+    def get_attribute(self, instance):
+        context = self.context
+        if "field_types" not in context:
+            context["field_types"] = get_field_types()
+        field_type = context["field_types"].get(instance.field_type_id)
+        if field_type is None:
+            return super().get_attribute(instance)
+        return field_type
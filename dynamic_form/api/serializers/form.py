@@ -1,3 +1,5 @@
+from typing import Any, Dict
+
 from rest_framework import serializers
 
 from dynamic_form.api.serializers.field import DynamicFieldSerializer
@@ -5,10 +7,36 @@ from dynamic_form.models import DynamicForm
 
 
 class DynamicFormSerializer(serializers.ModelSerializer):
-    """Serializer for DynamicForm model."""
+    """Serializer for DynamicForm model.
+
+    The submission counters are left out: they change with every
+    submission, while public form definitions are cached by clients (see
+    the conditional GET support of `DynamicFormViewSet`). The storage key
+    format of the answers is left out too; the API always uses field names.
+
+    """
 
     fields = DynamicFieldSerializer(many=True, read_only=True)
 
+    class Meta:
+        model = DynamicForm
+        exclude = ["submission_count", "last_submitted_at", "data_keys"]
+
+    def update(self, instance: DynamicForm, validated_data: Dict[str, Any]):
+        """Save only the submitted fields, so that the submission counters
+        updated since the form was loaded are kept."""
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        instance.save(update_fields=[*validated_data, "updated_at"])
+        return instance
+
+
+class AdminDynamicFormSerializer(DynamicFormSerializer):
+    """Serializer for DynamicForm model, including the denormalized
+    submission counters, which are read from the form row without extra
+    queries."""
+
     class Meta:
         model = DynamicForm
         fields = "__all__"
+        read_only_fields = ["submission_count", "last_submitted_at"]
@@ -1,15 +1,61 @@
+from typing import Any, Dict, Optional
+
+from django.db import transaction
+from django.db.models import prefetch_related_objects
 from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
 
 from dynamic_form.api.serializers.form import DynamicFormSerializer
 from dynamic_form.api.serializers.helper.get_serializer_cls import user_serializer_class
-from dynamic_form.models import DynamicForm, FormSubmission
+from dynamic_form.models import FormSubmission
+from dynamic_form.settings.conf import config
+from dynamic_form.utils.counters import record_bulk_submissions
+from dynamic_form.utils.form_schema import CompiledForm, get_compiled_form
+from dynamic_form.utils.form_versions import (
+    CompiledVersion,
+    get_current_version_id,
+    get_form_version,
+)
+
+
+class SubmissionFormField(serializers.Field):
+    """The form of a submission, as it was when the submission was made.
+
+    Submissions referencing a `FormVersion` are rendered from its cached
+    snapshot; older submissions fall back to the current form, serialized
+    once per form and request.
+
+    """
+
+    def __init__(self, **kwargs):
+        kwargs["source"] = "*"
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value: FormSubmission) -> Dict[str, Any]:
+        version = get_form_version(value.form_version_id)
+        if version is not None:
+            return version.form
+
+        forms = self.context.setdefault("serialized_forms", {})
+        if value.form_id not in forms:
+            form = value.form
+            prefetch_related_objects([form], "fields")
+            forms[value.form_id] = DynamicFormSerializer(
+                form, context=self.context
+            ).data
+        return forms[value.form_id]
 
 
 class FormSubmissionSerializer(serializers.ModelSerializer):
-    """Serializer for FormSubmission model."""
+    """Serializer for FormSubmission model.
+
+    New and updated submissions reference the `FormVersion` of the schema
+    they were validated against, and are rendered with it.
 
-    form = DynamicFormSerializer(read_only=True)
+    """
+
+    form = SubmissionFormField()
     form_id = serializers.IntegerField(
         write_only=True,
         label=_("Form ID"),
@@ -20,11 +66,43 @@ class FormSubmissionSerializer(serializers.ModelSerializer):
     class Meta:
         model = FormSubmission
         fields = "__all__"
-        read_only_fields = ["submitted_at", "user"]
+        read_only_fields = ["submitted_at", "user", "form_version"]
+
+    def get_compiled_form(self, form_id: Any) -> Optional[CompiledForm]:
+        """Return the compiled schema of a form, resolved once per form and
+        request."""
+        forms = self.context.setdefault("compiled_forms", {})
+        if form_id not in forms:
+            forms[form_id] = get_compiled_form(form_id)
+        return forms[form_id]
+
+    def get_form_version(self, instance: FormSubmission) -> Optional[CompiledVersion]:
+        """Return the form version a submission references, if any."""
+        return get_form_version(instance.form_version_id)
+
+    def to_representation(self, instance):
+        """Serialize the submission with its stored answers translated back
+        to field names (see `DynamicForm.data_keys`), using the fields of
+        its form version when it has one."""
+        data = super().to_representation(instance)
+        if "submitted_data" in data:
+            form = self.get_form_version(instance) or self.get_compiled_form(
+                instance.form_id
+            )
+            if form is not None:
+                data["submitted_data"] = form.decode_data(data["submitted_data"])
+        return data
 
     def validate(self, attrs):
         """Validates that submitted data matches the expected form
-        structure."""
+        structure.
+
+        Every field is checked against the form's pre-compiled validators
+        (required, type, choices and validation rules), and all errors are
+        reported at once, keyed by field name. The validated data is then
+        translated to the keys the form stores answers by.
+
+        """
         form_id = (
             attrs["form_id"]
             if attrs.get("form_id") is not None
@@ -43,22 +121,24 @@ class FormSubmissionSerializer(serializers.ModelSerializer):
                 {"submitted_data": _("This field may not be null.")}
             )
 
-        form = (
-            DynamicForm.objects.prefetch_related("fields")
-            .filter(is_active=True, pk=form_id)
-            .first()
-        )
-        if not form:
+        form = self.get_compiled_form(form_id)
+        if not form or not form.is_active:
             raise serializers.ValidationError(
                 {"form_id": _("Form with the given ID was not found or is inactive.")}
             )
-        all_fields = form.fields.all()
-        for field in all_fields:
-            if field.is_required and field.name not in submitted_data:
-                raise serializers.ValidationError(
-                    {field.name: _("This field is required.")}
-                )
+        if not isinstance(submitted_data, dict):
+            raise serializers.ValidationError(
+                {"submitted_data": _("Expected a JSON object keyed by field name.")}
+            )
 
+        if "submitted_data" not in attrs:
+            submitted_data = form.decode_data(submitted_data)
+        errors = form.validate(submitted_data)
+        if errors:
+            raise serializers.ValidationError(errors)
+
+        if "submitted_data" in attrs:
+            attrs["submitted_data"] = form.encode_data(submitted_data)
         return attrs
 
     def create(self, validated_data):
@@ -68,4 +148,185 @@ class FormSubmissionSerializer(serializers.ModelSerializer):
         if request and hasattr(request, "user") and request.user.is_authenticated:
             validated_data["user"] = request.user
 
+        form = self.get_compiled_form(validated_data["form_id"])
+        validated_data["form_version_id"] = get_current_version_id(form)
         return super().create(validated_data)
+
+    def update(self, instance, validated_data):
+        """Update a FormSubmission instance, referencing the current version
+        of its form when the answers change."""
+        if "submitted_data" in validated_data or "form_id" in validated_data:
+            form = self.get_compiled_form(
+                validated_data.get("form_id", instance.form_id)
+            )
+            validated_data["form_version_id"] = get_current_version_id(form)
+        return super().update(instance, validated_data)
+
+
+class CompactFormSubmissionSerializer(FormSubmissionSerializer):
+    """Lightweight serializer for FormSubmission model.
+
+    Returns the `form_id` and the `schema_hash` of the form instead of
+    nesting the whole form with its fields, so clients can fetch the form
+    schema once and reuse it for every submission.
+
+    """
+
+    form = None
+    form_id = serializers.IntegerField(
+        label=_("Form ID"),
+        help_text=_("The ID of the form to which this submission belongs."),
+    )
+    schema_hash = serializers.SerializerMethodField(
+        label=_("Schema Hash"),
+        help_text=_("Content hash of the form fields the submission is shown with."),
+    )
+
+    class Meta:
+        model = FormSubmission
+        exclude = ["form"]
+        read_only_fields = ["submitted_at", "user"]
+
+    def get_schema_hash(self, obj: FormSubmission) -> Optional[str]:
+        """Return the schema hash of the submission's form version, or of
+        its current form for submissions without a version."""
+        form = self.get_form_version(obj) or self.get_compiled_form(obj.form_id)
+        return form.schema_hash if form else None
+
+
+class BulkFormSubmissionSerializer(serializers.Serializer):
+    """Serializer for creating many FormSubmissions in a single request.
+
+    Each distinct form is loaded once and every item is validated against
+    its compiled validators, and references the form's current version. In ``partial`` mode the valid items are saved
+    and the invalid ones are reported by index; in ``atomic`` mode a single
+    invalid item rejects the whole batch.
+
+    """
+
+    MODE_PARTIAL = "partial"
+    MODE_ATOMIC = "atomic"
+
+    mode = serializers.ChoiceField(
+        choices=[MODE_PARTIAL, MODE_ATOMIC],
+        default=MODE_PARTIAL,
+        label=_("Mode"),
+        help_text=_(
+            "'partial' saves the valid submissions, 'atomic' saves all or nothing."
+        ),
+    )
+    submissions = serializers.ListField(
+        child=serializers.JSONField(),
+        allow_empty=False,
+        label=_("Submissions"),
+        help_text=_("A list of objects with 'form_id' and 'submitted_data' keys."),
+    )
+
+    def validate_submissions(self, value):
+        """Ensure the batch does not exceed the configured maximum size."""
+        max_items = config.api_form_submission_bulk_max_items
+        if max_items and len(value) > max_items:
+            raise serializers.ValidationError(
+                _("Ensure this list has at most %(limit)s items.")
+                % {"limit": max_items}
+            )
+        return value
+
+    def validate(self, attrs):
+        """Validate every submission, loading each distinct form once.
+
+        Item errors are not raised, so that their index stays an integer
+        in the response; check `is_rejected` before saving. The submitted
+        data of valid items is translated to the keys their form stores
+        answers by, and their compiled form is kept under ``form``.
+
+        Returns:
+            dict: The attributes with the `valid` items and per-item `errors` added.
+
+        """
+        forms: Dict[int, Optional[CompiledForm]] = {}
+        valid, errors = [], []
+        for index, item in enumerate(attrs["submissions"]):
+            item_errors = self._validate_item(item, forms)
+            if item_errors:
+                errors.append({"index": index, "errors": item_errors})
+            else:
+                form = forms[item["form_id"]]
+                data = form.encode_data(item["submitted_data"])
+                valid.append({**item, "submitted_data": data, "form": form})
+
+        attrs["valid"] = valid
+        attrs["errors"] = errors
+        return attrs
+
+    @property
+    def is_rejected(self) -> bool:
+        """Whether the batch must not be saved: no item is valid, or any
+        item is invalid in atomic mode."""
+        errors = self.validated_data["errors"]
+        return bool(errors) and (
+            self.validated_data["mode"] == self.MODE_ATOMIC
+            or not self.validated_data["valid"]
+        )
+
+    @staticmethod
+    def _validate_item(
+        item: Any, forms: Dict[int, Optional[CompiledForm]]
+    ) -> Dict[str, Any]:
+        """Validate a single submission and return its errors, if any."""
+        if not isinstance(item, dict):
+            return {
+                "non_field_errors": [
+                    _("Expected an object with 'form_id' and 'submitted_data'.")
+                ]
+            }
+
+        form_id = item.get("form_id")
+        if not isinstance(form_id, int) or isinstance(form_id, bool):
+            return {"form_id": [_("A valid integer is required.")]}
+
+        submitted_data = item.get("submitted_data")
+        if not submitted_data or not isinstance(submitted_data, dict):
+            return {
+                "submitted_data": [_("Expected a JSON object keyed by field name.")]
+            }
+
+        if form_id not in forms:
+            forms[form_id] = get_compiled_form(form_id)
+        form = forms[form_id]
+        if not form or not form.is_active:
+            return {
+                "form_id": [_("Form with the given ID was not found or is inactive.")]
+            }
+
+        return form.validate(submitted_data)
+
+    def create(self, validated_data):
+        """Insert the valid submissions with batched `bulk_create` calls
+        inside a single transaction."""
+        request = self.context.get("request")
+        user = (
+            request.user
+            if request and hasattr(request, "user") and request.user.is_authenticated
+            else None
+        )
+        with transaction.atomic():
+            version_ids: Dict[int, Optional[int]] = {}
+            for item in validated_data["valid"]:
+                if item["form_id"] not in version_ids:
+                    version_ids[item["form_id"]] = get_current_version_id(item["form"])
+            submissions = [
+                FormSubmission(
+                    form_id=item["form_id"],
+                    form_version_id=version_ids[item["form_id"]],
+                    submitted_data=item["submitted_data"],
+                    user=user,
+                )
+                for item in validated_data["valid"]
+            ]
+            created = FormSubmission.objects.bulk_create(
+                submissions, batch_size=config.api_form_submission_bulk_batch_size
+            )
+            # bulk_create sends no post_save signal
+            record_bulk_submissions(created)
+        return created
@@ -15,13 +15,19 @@ def dynamic_form_serializer_class(is_admin: bool = False) -> Type[BaseSerializer
                          Defaults to False.
 
     Returns:
-        The configured serializer class from settings or the default DynamicFormSerializer.
+        The configured serializer class from settings or the default
+        DynamicFormSerializer (AdminDynamicFormSerializer for admins).
 
     """
-    from dynamic_form.api.serializers.form import DynamicFormSerializer
+    from dynamic_form.api.serializers.form import (
+        AdminDynamicFormSerializer,
+        DynamicFormSerializer,
+    )
 
     if is_admin:
-        return config.api_admin_dynamic_form_serializer_class or DynamicFormSerializer
+        return (
+            config.api_admin_dynamic_form_serializer_class or AdminDynamicFormSerializer
+        )
     return config.api_dynamic_form_serializer_class or DynamicFormSerializer
 
 
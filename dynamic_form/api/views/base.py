@@ -1,9 +1,10 @@
-from typing import List, Optional, Type
+from dataclasses import replace
+from typing import Any, Dict, List, Optional, Type
 
 from rest_framework import filters, viewsets
 from rest_framework.serializers import Serializer
 
-from dynamic_form.mixins.api.config_api_attrs import ConfigureAttrsMixin
+from dynamic_form.mixins.api.config_api_attrs import ConfigSnapshot, ConfigureAttrsMixin
 from dynamic_form.mixins.api.control_api_methods import ControlAPIMethodsMixin
 from dynamic_form.settings.conf import config
 
@@ -31,28 +32,40 @@ class BaseViewSet(viewsets.GenericViewSet, ConfigureAttrsMixin, ControlAPIMethod
     serializer_class: Optional[Type[Serializer]] = None
 
     def __init__(self, *args, **kwargs) -> None:
-        """Initialize the viewset and configure attributes based on settings.
+        """Initialize the viewset and apply its configuration snapshot.
 
         Disables the 'list', 'retrieve', 'create', 'update', and 'destroy' methods
-        if their corresponding settings are set to `False`.
+        if their corresponding settings are set to `False`. Settings are
+        resolved once per class (see `build_config_snapshot`), not per request.
 
         """
         super().__init__(*args, **kwargs)
-        self.configure_attrs()
-        self.config_prefix += "_" if self.config_prefix else ""
+        snapshot = self.get_config_snapshot()
+        self.__dict__.update(snapshot.attrs)
+        if snapshot.disabled_methods:
+            self.disable_methods(snapshot.disabled_methods)
+
+    @classmethod
+    def build_config_snapshot(cls) -> ConfigSnapshot:
+        """Extend the configuration snapshot with the methods disabled by
+        the viewset's `allow_*` settings."""
+        snapshot = super().build_config_snapshot()
+        prefix = f"{cls.config_prefix}_" if cls.config_prefix else ""
 
         # Mapping of configuration settings to the corresponding methods to disable
         config_method_mapping = {
-            f"api_{self.config_prefix}allow_list": "LIST",
-            f"api_{self.config_prefix}allow_retrieve": "RETRIEVE",
-            f"api_{self.config_prefix}allow_create": "CREATE",
-            f"api_{self.config_prefix}allow_update": "UPDATE",
-            f"api_{self.config_prefix}allow_delete": "DESTROY",
+            f"api_{prefix}allow_list": "LIST",
+            f"api_{prefix}allow_retrieve": "RETRIEVE",
+            f"api_{prefix}allow_create": "CREATE",
+            f"api_{prefix}allow_update": "UPDATE",
+            f"api_{prefix}allow_delete": "DESTROY",
         }
-
-        for config_setting, method in config_method_mapping.items():
-            if not getattr(config, config_setting, True):
-                self.disable_methods([method])
+        disabled_methods = frozenset(
+            method
+            for config_setting, method in config_method_mapping.items()
+            if not getattr(config, config_setting, True)
+        )
+        return replace(snapshot, disabled_methods=disabled_methods)
 
     def get_queryset(self):
         """Get the queryset for the viewset.
@@ -76,7 +89,9 @@ class BaseViewSet(viewsets.GenericViewSet, ConfigureAttrsMixin, ControlAPIMethod
 
 
 class AdminViewSet(BaseViewSet):
-    def __init__(self, **kwargs):
-        super().__init__()
-        # Modify the default permission class which is the first one
-        self.permission_classes[0] = config.api_admin_permission_class
+    @classmethod
+    def resolve_config(cls, config_prefix: str) -> Dict[str, Any]:
+        attrs = super().resolve_config(config_prefix)
+        # Replace the default permission class which is the first one
+        attrs["permission_classes"][0] = config.api_admin_permission_class
+        return attrs
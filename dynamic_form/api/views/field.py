@@ -1,20 +1,42 @@
 from django.utils.translation import gettext_lazy as _
-from rest_framework.exceptions import ValidationError
+from rest_framework.decorators import action
+from rest_framework.exceptions import MethodNotAllowed, ValidationError
 from rest_framework.mixins import ListModelMixin, RetrieveModelMixin
+from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 
+from dynamic_form.api.serializers.field import (
+    BulkDynamicFieldSerializer,
+    DynamicFieldMoveSerializer,
+    DynamicFieldOrderSerializer,
+)
 from dynamic_form.api.serializers.helper.get_serializer_cls import (
     dynamic_field_serializer_class,
 )
 from dynamic_form.api.views.base import AdminViewSet, BaseViewSet
-from dynamic_form.models import DynamicField
+from dynamic_form.mixins.api.conditional_get import ConditionalGetMixin
+from dynamic_form.models import DynamicField, DynamicForm
+from dynamic_form.settings.conf import config
+from dynamic_form.utils.form_schema import FIELD_TYPES_NAMESPACE, FORMS_NAMESPACE
 
 
 class AdminDynamicFieldViewSet(AdminViewSet, ModelViewSet):
-    """API for managing Dynamic Fields inside a form."""
+    """API for managing Dynamic Fields inside a form.
+
+    Besides the single field endpoints, ``bulk`` creates and updates many
+    fields at once and ``reorder`` sets the order of every field of the
+    form, each with a constant number of queries. ``move`` moves a single
+    field with one write, using the gaps between field positions (see
+    `dynamic_form.utils.field_order`).
+
+    """
 
     config_prefix = "admin_dynamic_field"
     serializer_class = dynamic_field_serializer_class(is_admin=True)
+    batch_serializer_classes = {
+        "bulk": BulkDynamicFieldSerializer,
+        "reorder": DynamicFieldOrderSerializer,
+    }
 
     def get_queryset(self):
         """Filter the queryset to only include fields for the specified form_pk
@@ -36,12 +58,114 @@ class AdminDynamicFieldViewSet(AdminViewSet, ModelViewSet):
                 code="invalid_form_id",
             )
 
-        return DynamicField.objects.select_related("field_type").filter(form_id=form_pk)
+        return DynamicField.objects.filter(form_id=form_pk)
+
+    def get_form(self) -> DynamicForm:
+        """Return the active form of the URL.
+
+        Raises:
+            ValidationError: If the form ID is invalid, or the form does not
+                exist or is inactive.
+
+        """
+        form_pk = self.kwargs.get("form_pk")
+        if not str(form_pk).isdigit():
+            raise ValidationError(
+                {"form_pk": [_("Invalid Form ID specified in the URL.")]}
+            )
+        form = DynamicForm.objects.filter(is_active=True, pk=form_pk).first()
+        if form is None:
+            raise ValidationError(
+                {"form": [_("Specified form not found or inactive.")]}
+            )
+        return form
+
+    def get_serializer_class(self):
+        if self.action in self.batch_serializer_classes:
+            return self.batch_serializer_classes[self.action]
+        if self.action == "move":
+            return DynamicFieldMoveSerializer
+        return super().get_serializer_class()
+
+    def get_serializer_context(self):
+        """Resolve the form of the URL once for the actions creating or
+        reordering fields."""
+        context = super().get_serializer_context()
+        if self.action == "create" or self.action in self.batch_serializer_classes:
+            context["form"] = self.get_form()
+        return context
+
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk(self, request, *args, **kwargs):
+        """Create and update many fields of the form at once.
+
+        Items with an ``id`` update that field and require updates to be
+        allowed. The batch is written in a single transaction and the
+        response lists the fields in request order.
+
+        """
+        if not config.api_admin_dynamic_field_allow_create:
+            raise MethodNotAllowed(request.method)
+
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        if serializer.has_updates and not config.api_admin_dynamic_field_allow_update:
+            raise MethodNotAllowed(request.method)
+        fields = serializer.save()
+
+        return Response(
+            {
+                "created": len(fields) - len(serializer.validated_data["existing"]),
+                "updated": len(serializer.validated_data["existing"]),
+                "fields": self.serialize_fields(fields),
+            }
+        )
+
+    @action(detail=False, methods=["post"], url_path="reorder")
+    def reorder(self, request, *args, **kwargs):
+        """Set the order of the fields of the form from the list of their
+        IDs, and return the fields in their new order."""
+        if not config.api_admin_dynamic_field_allow_update:
+            raise MethodNotAllowed(request.method)
+
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        fields = serializer.save()
+
+        return Response({"fields": self.serialize_fields(fields)})
+
+    @action(detail=True, methods=["post"], url_path="move")
+    def move(self, request, *args, **kwargs):
+        """Move the field after another field of the form (``after``), or
+        first (``after`` null), and return it with its new position."""
+        if not config.api_admin_dynamic_field_allow_update:
+            raise MethodNotAllowed(request.method)
+
+        serializer = self.get_serializer(self.get_object(), data=request.data)
+        serializer.is_valid(raise_exception=True)
+        field = serializer.save()
+
+        return Response(self.serialize_fields([field])[0])
+
+    def serialize_fields(self, fields):
+        """Serialize fields with the viewset's field serializer."""
+        serializer_class = super().get_serializer_class()
+        return serializer_class(
+            fields, many=True, context=super().get_serializer_context()
+        ).data
+
+
+class DynamicFieldViewSet(
+    ConditionalGetMixin, BaseViewSet, ListModelMixin, RetrieveModelMixin
+):
+    """API for managing Dynamic Fields inside a form.
 
+    Supports conditional GET; every field or field type change bumps the
+    validated schema versions.
 
-class DynamicFieldViewSet(BaseViewSet, ListModelMixin, RetrieveModelMixin):
-    """API for managing Dynamic Fields inside a form."""
+    """
 
     config_prefix = "dynamic_field"
-    queryset = DynamicField.objects.select_related("field_type").all()
+    queryset = DynamicField.objects.all()
     serializer_class = dynamic_field_serializer_class()
+    conditional_namespaces = (FIELD_TYPES_NAMESPACE, FORMS_NAMESPACE)
@@ -1,11 +1,27 @@
+from django.http import HttpResponseBase
 from rest_framework.mixins import ListModelMixin, RetrieveModelMixin
+from rest_framework.pagination import CursorPagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
 from rest_framework.viewsets import ModelViewSet
 
 from dynamic_form.api.serializers.helper.get_serializer_cls import (
     field_type_serializer_class,
 )
 from dynamic_form.api.views.base import AdminViewSet, BaseViewSet
+from dynamic_form.mixins.api.conditional_get import ConditionalGetMixin
 from dynamic_form.models import FieldType
+from dynamic_form.utils.field_types import get_active_field_types
+from dynamic_form.utils.form_schema import FIELD_TYPES_NAMESPACE
+
+# Query parameters of the paginators that leave the listing itself unchanged
+PAGINATION_QUERY_PARAMS = (
+    "limit_query_param",
+    "offset_query_param",
+    "page_query_param",
+    "page_size_query_param",
+)
 
 
 class AdminFieldTypeViewSet(AdminViewSet, ModelViewSet):
@@ -16,9 +32,48 @@ class AdminFieldTypeViewSet(AdminViewSet, ModelViewSet):
     serializer_class = field_type_serializer_class(is_admin=True)
 
 
-class FieldTypeViewSet(BaseViewSet, ListModelMixin, RetrieveModelMixin):
-    """API for managing Field Types inside a form."""
+class FieldTypeViewSet(
+    ConditionalGetMixin, BaseViewSet, ListModelMixin, RetrieveModelMixin
+):
+    """API for managing Field Types inside a form.
+
+    Supports conditional GET, validated against the field type version.
+    Unfiltered listings are served from the field type registry without a
+    query; filtered, searched or ordered listings use the database.
+
+    """
 
     config_prefix = "field_type"
     queryset = FieldType.objects.filter(is_active=True)
     serializer_class = field_type_serializer_class()
+    conditional_namespaces = (FIELD_TYPES_NAMESPACE,)
+
+    def can_list_from_registry(self, request: Request) -> bool:
+        """Return whether the listing can be served from the field type
+        registry, i.e. whether the request only carries pagination or
+        format parameters and the paginator accepts a list."""
+        paginator = self.paginator
+        if isinstance(paginator, CursorPagination):
+            return False
+        allowed = {api_settings.URL_FORMAT_OVERRIDE}
+        allowed.update(
+            getattr(paginator, attr, None) for attr in PAGINATION_QUERY_PARAMS
+        )
+        return set(request.query_params).issubset(allowed)
+
+    def list(self, request: Request, *args, **kwargs) -> HttpResponseBase:
+        """List the active field types, from memory when possible."""
+        if not self.can_list_from_registry(request):
+            return super().list(request, *args, **kwargs)
+        return self.conditional_response(
+            self.list_from_registry, request, *args, **kwargs
+        )
+
+    def list_from_registry(self, request: Request, *args, **kwargs) -> Response:
+        """List the active field types of the field type registry."""
+        field_types = get_active_field_types()
+        page = self.paginate_queryset(field_types)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+        return Response(self.get_serializer(field_types, many=True).data)
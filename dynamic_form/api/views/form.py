@@ -1,3 +1,6 @@
+from typing import Optional
+
+from django.db.models import Exists, OuterRef, Prefetch
 from rest_framework.mixins import ListModelMixin, RetrieveModelMixin
 from rest_framework.viewsets import ModelViewSet
 
@@ -5,22 +8,63 @@ from dynamic_form.api.serializers.helper.get_serializer_cls import (
     dynamic_form_serializer_class,
 )
 from dynamic_form.api.views.base import AdminViewSet, BaseViewSet
-from dynamic_form.models import DynamicForm
+from dynamic_form.mixins.api.conditional_get import (
+    ConditionalGetMixin,
+    ConditionalState,
+)
+from dynamic_form.models import DynamicField, DynamicForm
+from dynamic_form.utils.form_schema import (
+    FIELD_TYPES_NAMESPACE,
+    FORMS_NAMESPACE,
+    get_compiled_form,
+)
 
 
 class AdminDynamicFormViewSet(AdminViewSet, ModelViewSet):
     """API for managing Dynamic Forms."""
 
     config_prefix = "admin_dynamic_form"
-    queryset = DynamicForm.objects.prefetch_related("fields__field_type").all()
+    queryset = DynamicForm.objects.prefetch_related("fields").all()
     serializer_class = dynamic_form_serializer_class(is_admin=True)
 
 
-class DynamicFormViewSet(BaseViewSet, ListModelMixin, RetrieveModelMixin):
-    """API for managing Dynamic Forms."""
+class DynamicFormViewSet(
+    ConditionalGetMixin, BaseViewSet, ListModelMixin, RetrieveModelMixin
+):
+    """API for managing Dynamic Forms.
+
+    Only active forms with at least one active-type field are listed, and
+    only their active-type fields are returned. The check is an `EXISTS`
+    subquery rather than a join, so each form appears once however many
+    fields it has.
+
+    Responses carry ETag / Last-Modified validators derived from the schema
+    version, so unchanged definitions are answered with `304 Not Modified`.
+
+    """
 
     config_prefix = "dynamic_form"
-    queryset = DynamicForm.objects.prefetch_related("fields__field_type").filter(
-        is_active=True, fields__field_type__is_active=True
+    active_fields = DynamicField.objects.filter(field_type__is_active=True)
+    queryset = (
+        DynamicForm.objects.filter(is_active=True)
+        .filter(Exists(active_fields.filter(form_id=OuterRef("pk"))))
+        .prefetch_related(
+            Prefetch(
+                "fields",
+                queryset=active_fields.order_by("order", "id"),
+            )
+        )
     )
     serializer_class = dynamic_form_serializer_class()
+    conditional_namespaces = (FIELD_TYPES_NAMESPACE, FORMS_NAMESPACE)
+
+    def get_conditional_state(self) -> Optional[ConditionalState]:
+        """Validate a single form against its compiled schema, which is
+        served from the schema cache."""
+        if self.action != "retrieve":
+            return super().get_conditional_state()
+
+        compiled = get_compiled_form(self.kwargs.get(self.lookup_field))
+        if compiled is None or not compiled.is_active:
+            return None
+        return compiled.version.split("."), compiled.updated_at
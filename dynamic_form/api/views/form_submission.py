@@ -1,28 +1,181 @@
+from django.http import Http404
+from django.utils.dateparse import parse_date, parse_datetime
+from django.utils.timezone import is_naive, make_aware
+from django.utils.translation import gettext_lazy as _
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.exceptions import MethodNotAllowed, NotFound, ValidationError
+from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 
+from dynamic_form.api.filters import SubmittedDataFilterBackend
+from dynamic_form.api.serializers.form_submission import (
+    BulkFormSubmissionSerializer,
+    CompactFormSubmissionSerializer,
+    FormSubmissionSerializer,
+)
 from dynamic_form.api.serializers.helper.get_serializer_cls import (
     form_submission_serializer_class,
 )
 from dynamic_form.api.views.base import AdminViewSet, BaseViewSet
+from dynamic_form.mixins.api.idempotency import IdempotencyMixin
 from dynamic_form.models import FormSubmission
+from dynamic_form.settings.conf import config
+from dynamic_form.utils.archive import get_archived_submission, iter_archived_rows
+from dynamic_form.utils.export import EXPORT_CONTENT_TYPES, export_submissions
+from dynamic_form.utils.form_schema import get_compiled_form
+
+
+class CompactRepresentationMixin:
+    """Serve submissions with `CompactFormSubmissionSerializer` when the
+    request asks for it (``?compact=true``) or the viewset's
+    `compact_setting` is enabled, skipping the form join.
+
+    A custom serializer class configured for the viewset always takes
+    precedence over the compact representation.
+
+    """
+
+    compact_setting: str = ""
+
+    def is_compact(self) -> bool:
+        if self.serializer_class is not FormSubmissionSerializer:
+            return False
+        request = getattr(self, "request", None)
+        value = request.query_params.get("compact") if request else None
+        if value is not None:
+            return value.lower() in ("1", "true", "yes")
+        return bool(getattr(config, self.compact_setting, False))
+
+    def get_serializer_class(self):
+        if self.is_compact():
+            return CompactFormSubmissionSerializer
+        return super().get_serializer_class()
+
+    def get_base_queryset(self):
+        """Return the submission queryset with the relations required by the
+        selected representation."""
+        queryset = FormSubmission.objects.select_related("user")
+        if self.is_compact():
+            return queryset
+        # Forms are rendered from the cached snapshot of their version
+        return queryset.select_related("form")
 
 
-class AdminFormSubmissionViewSet(AdminViewSet, ModelViewSet):
-    """API for managing form submissions."""
+class AdminFormSubmissionViewSet(
+    CompactRepresentationMixin, AdminViewSet, ModelViewSet
+):
+    """API for managing form submissions.
+
+    Submissions can be filtered on their answers with
+    ``submitted_data__<field>`` query parameters (see
+    `SubmittedDataFilterBackend`). When `DYNAMIC_FORM_ARCHIVE_DIR` is set,
+    archived submissions are served by `retrieve` and included in exports.
+
+    """
 
     config_prefix = "admin_form_submission"
-    queryset = (
-        FormSubmission.objects.select_related("user", "form")
-        .prefetch_related("form__fields__field_type")
-        .all()
-    )
+    compact_setting = "api_admin_form_submission_compact_representation"
+    filter_backends = [*AdminViewSet.filter_backends, SubmittedDataFilterBackend]
+    queryset = FormSubmission.objects.all()
     serializer_class = form_submission_serializer_class(is_admin=True)
 
+    def get_queryset(self):
+        return self.get_base_queryset()
+
+    def retrieve(self, request, *args, **kwargs):
+        """Return a submission, falling back to the archive for submissions
+        moved out of the database."""
+        try:
+            return super().retrieve(request, *args, **kwargs)
+        except Http404:
+            lookup = str(kwargs.get(self.lookup_url_kwarg or self.lookup_field, ""))
+            if not config.archive_dir or not lookup.isdigit():
+                raise
+            record = get_archived_submission(int(lookup))
+            if record is None:
+                raise
+            form = get_compiled_form(record["form_id"])
+            if form is not None:
+                record["submitted_data"] = form.decode_data(record["submitted_data"])
+            return Response({**record, "archived": True})
+
+    def get_time_range(self, request):
+        """Parse the ``submitted_after`` and ``submitted_before`` query
+        parameters (ISO 8601 dates or date-times)."""
+        bounds = {}
+        for param in ("submitted_after", "submitted_before"):
+            raw = request.query_params.get(param)
+            if not raw:
+                bounds[param] = None
+                continue
+            value = parse_datetime(raw)
+            if value is None and parse_date(raw) is not None:
+                value = parse_datetime(f"{raw}T00:00:00")
+            if value is None:
+                raise ValidationError(
+                    {param: _("Enter a valid date in ISO 8601 format.")}
+                )
+            bounds[param] = make_aware(value) if is_naive(value) else value
+        return bounds["submitted_after"], bounds["submitted_before"]
+
+    @action(detail=False, methods=["get"], url_path="export")
+    def export(self, request, *args, **kwargs):
+        """Stream every submission of a form as a CSV or NDJSON file.
+
+        Archived submissions come first when an archive is configured.
+
+        Query parameters:
+            form_id: ID of the form to export (required).
+            file_format: ``csv`` (default) or ``ndjson``.
+            submitted_after: Only export submissions made at or after this time.
+            submitted_before: Only export submissions made before this time.
 
-class FormSubmissionViewSet(BaseViewSet, ModelViewSet):
-    """API for managing form submissions."""
+        """
+        if not config.api_admin_form_submission_allow_list:
+            raise MethodNotAllowed(request.method)
+
+        export_format = request.query_params.get("file_format", "csv")
+        if export_format not in EXPORT_CONTENT_TYPES:
+            raise ValidationError(
+                {"file_format": _("Supported formats are 'csv' and 'ndjson'.")}
+            )
+
+        form = get_compiled_form(request.query_params.get("form_id"))
+        if form is None:
+            raise NotFound(_("Form with the given ID was not found."))
+
+        after, before = self.get_time_range(request)
+        queryset = FormSubmission.objects.filter(form_id=form.id)
+        if after is not None:
+            queryset = queryset.filter(submitted_at__gte=after)
+        if before is not None:
+            queryset = queryset.filter(submitted_at__lt=before)
+
+        archived_rows = None
+        if config.archive_dir:
+            archived_rows = iter_archived_rows(form.id, after, before)
+        return export_submissions(
+            form, queryset, export_format, archived_rows=archived_rows
+        )
+
+
+class FormSubmissionViewSet(
+    IdempotencyMixin, CompactRepresentationMixin, BaseViewSet, ModelViewSet
+):
+    """API for managing form submissions.
+
+    Submissions can be filtered on their answers with
+    ``submitted_data__<field>`` query parameters (see
+    `SubmittedDataFilterBackend`). Creating submissions (single or bulk)
+    is idempotent for requests sent with an ``Idempotency-Key`` header
+    (see `IdempotencyMixin`).
+
+    """
 
     config_prefix = "form_submission"
+    compact_setting = "api_form_submission_compact_representation"
+    filter_backends = [*BaseViewSet.filter_backends, SubmittedDataFilterBackend]
     serializer_class = form_submission_serializer_class()
 
     def get_queryset(self):
@@ -30,8 +183,44 @@ class FormSubmissionViewSet(BaseViewSet, ModelViewSet):
         if not user.is_authenticated or not user.id:
             return FormSubmission.objects.none()
 
-        return (
-            FormSubmission.objects.select_related("user", "form")
-            .prefetch_related("form__fields__field_type")
-            .filter(user_id=user.id)
+        return self.get_base_queryset().filter(user_id=user.id)
+
+    def get_serializer_class(self):
+        if self.action == "bulk":
+            return BulkFormSubmissionSerializer
+        return super().get_serializer_class()
+
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk(self, request, *args, **kwargs):
+        """Create many submissions at once (e.g. when an offline client
+        syncs its queue).
+
+        Valid submissions are written with batched inserts in a single
+        transaction. The response lists the created IDs and the errors of
+        the rejected items by their index in the request.
+
+        """
+        if not config.api_form_submission_allow_create:
+            raise MethodNotAllowed(request.method)
+
+        return self.idempotent_response(self.create_bulk, request, *args, **kwargs)
+
+    def create_bulk(self, request, *args, **kwargs):
+        """Validate and save the submissions of a bulk request."""
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        if serializer.is_rejected:
+            return Response(
+                {"submissions": serializer.validated_data["errors"]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        submissions = serializer.save()
+
+        return Response(
+            {
+                "created": len(submissions),
+                "ids": [submission.pk for submission in submissions],
+                "errors": serializer.validated_data["errors"],
+            },
+            status=status.HTTP_201_CREATED,
         )
@@ -17,7 +17,9 @@ class DjDynamicFormConfig(AppConfig):
 
         In this case, it imports the settings checks from the
         `dynamic_form.settings` module to validate the configuration
-        settings.
+        settings, and connects the signal handlers that keep the
+        compiled form schema cache up to date.
 
         """
+        from dynamic_form import signals
         from dynamic_form.settings import checks
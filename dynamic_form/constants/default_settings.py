@@ -44,6 +44,34 @@ class DefaultAPISettings:
             "rest_framework.parsers.FormParser",
         ]
     )
+    renderer_classes: Optional[List[str]] = None
+
+
+@dataclass(frozen=True)
+class DefaultCacheSettings:
+    cache_alias: str = "default"
+    schema_cache_timeout: Optional[int] = 3600
+
+
+@dataclass(frozen=True)
+class DefaultExportSettings:
+    export_chunk_size: int = 2000
+
+
+@dataclass(frozen=True)
+class DefaultArchiveSettings:
+    archive_dir: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class DefaultIdempotencySettings:
+    idempotency_key_ttl: int = 86400
+
+
+@dataclass(frozen=True)
+class DefaultCompressionSettings:
+    submission_compression: Optional[str] = None
+    submission_compression_threshold: int = 4096
 
 
 @dataclass(frozen=True)
@@ -74,6 +102,7 @@ class DefaultDynamicFieldAPISettings:
     admin_allow_create: bool = True
     admin_allow_update: bool = True
     admin_allow_delete: bool = True
+    admin_bulk_max_items: Optional[int] = 500
 
 
 @dataclass(frozen=True)
@@ -97,6 +126,7 @@ class DefaultFieldTypeAPISettings:
 @dataclass(frozen=True)
 class DefaultFormSubmissionAPISettings:
     filterset_class: Optional[str] = None
+    pagination_class: str = "dynamic_form.api.paginations.SubmissionCursorPagination"
     ordering_fields: List[str] = field(default_factory=lambda: ["submitted_at"])
     search_fields: List[str] = field(
         default_factory=lambda: ["form__name", "form__description"]
@@ -111,12 +141,21 @@ class DefaultFormSubmissionAPISettings:
     admin_allow_create: bool = False
     admin_allow_update: bool = False
     admin_allow_delete: bool = False
+    compact_representation: bool = False
+    admin_compact_representation: bool = False
+    bulk_batch_size: Optional[int] = 500
+    bulk_max_items: Optional[int] = 1000
 
 
 admin_settings = DefaultAdminSettings()
 throttle_settings = DefaultThrottleSettings()
 serializer_settings = DefaultSerializerSettings()
 api_settings = DefaultAPISettings()
+cache_settings = DefaultCacheSettings()
+export_settings = DefaultExportSettings()
+archive_settings = DefaultArchiveSettings()
+idempotency_settings = DefaultIdempotencySettings()
+compression_settings = DefaultCompressionSettings()
 api_dynamic_form_settings = DefaultDynamicFormAPISettings()
 api_dynamic_field_settings = DefaultDynamicFieldAPISettings()
 api_field_type_settings = DefaultFieldTypeAPISettings()
@@ -0,0 +1,85 @@
+from datetime import timedelta
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import DEFAULT_DB_ALIAS
+from django.utils import timezone
+
+from dynamic_form.utils.archive import archive_submissions
+
+
+class Command(BaseCommand):
+    """Move old submissions from the database to compressed segment files
+    in `DYNAMIC_FORM_ARCHIVE_DIR`.
+
+    Archived submissions remain available through the admin submission
+    API (retrieve by ID and export). Run the command again to resume an
+    interrupted run.
+
+    """
+
+    help = "Archive form submissions older than the given number of days."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=90,
+            help="Archive submissions made more than this many days ago (default: 90).",
+        )
+        parser.add_argument(
+            "--form",
+            type=int,
+            action="append",
+            dest="form_ids",
+            help="ID of a form to archive; may be repeated. Defaults to all forms.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Maximum number of submissions per segment file (default: 5000).",
+        )
+        parser.add_argument(
+            "--archive-dir",
+            help="The archive directory; defaults to DYNAMIC_FORM_ARCHIVE_DIR.",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="The database to archive submissions from.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only count the submissions that would be archived.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if options["days"] < 0:
+            raise CommandError("--days must not be negative.")
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be a positive integer.")
+
+        try:
+            result = archive_submissions(
+                timezone.now() - timedelta(days=options["days"]),
+                form_ids=options["form_ids"],
+                batch_size=options["batch_size"],
+                dry_run=options["dry_run"],
+                root=options["archive_dir"],
+                using=options["database"],
+            )
+        except ValueError as exc:
+            raise CommandError(str(exc))
+
+        for form_id, count in sorted(result.per_form.items()):
+            self.stdout.write(f"Form #{form_id}: {count} submission(s)")
+        if options["dry_run"]:
+            message = f"Would archive {result.archived} submission(s)."
+        else:
+            message = (
+                f"Archived {result.archived} submission(s) "
+                f"in {result.segments} segment(s)."
+            )
+        self.stdout.write(self.style.SUCCESS(message))
@@ -0,0 +1,82 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import DEFAULT_DB_ALIAS
+
+from dynamic_form.settings.conf import config
+from dynamic_form.utils.compression import available_codecs, recompress_submissions
+
+
+class Command(BaseCommand):
+    """Compress the large answers of existing submissions.
+
+    New submissions are compressed when they are saved; this command
+    applies `DYNAMIC_FORM_SUBMISSION_COMPRESSION` to the rows written
+    before it was enabled, or expands every row back to plain JSON with
+    ``--decompress``. Run it again with ``--start-after`` to resume.
+
+    """
+
+    help = "Compress, or decompress, the submitted data of existing submissions."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--codec",
+            choices=available_codecs(),
+            help="Compression codec; defaults to DYNAMIC_FORM_SUBMISSION_COMPRESSION.",
+        )
+        parser.add_argument(
+            "--decompress",
+            action="store_true",
+            help="Store the submitted data of every submission as plain JSON.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of submissions rewritten per transaction (default: 1000).",
+        )
+        parser.add_argument(
+            "--start-after",
+            type=int,
+            default=0,
+            help="Resume after this submission ID.",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="The database to rewrite submissions in.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only count the submissions that would be rewritten.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be a positive integer.")
+
+        codec = None
+        if not options["decompress"]:
+            codec = options["codec"] or config.submission_compression
+            if not codec:
+                raise CommandError(
+                    "Compression is disabled; set "
+                    "DYNAMIC_FORM_SUBMISSION_COMPRESSION, pass --codec, "
+                    "or use --decompress."
+                )
+
+        changed, last_pk = recompress_submissions(
+            codec,
+            batch_size=options["batch_size"],
+            start_after=options["start_after"],
+            dry_run=options["dry_run"],
+            using=options["database"],
+        )
+        verb = "Decompressed" if codec is None else "Compressed"
+        if options["dry_run"]:
+            message = f"Would rewrite {changed} submission(s)."
+        else:
+            message = f"{verb} {changed} submission(s)."
+        self.stdout.write(self.style.SUCCESS(f"{message} Last ID: {last_pk}."))
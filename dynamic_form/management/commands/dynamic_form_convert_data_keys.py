@@ -0,0 +1,80 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import DEFAULT_DB_ALIAS
+
+from dynamic_form.models.form import DATA_KEYS_CHOICES
+from dynamic_form.utils.data_keys import convert_data_keys
+
+
+class Command(BaseCommand):
+    """Store the answers of a form keyed by field ID, or by field name.
+
+    Answers keyed by field ID are shorter and survive field renames; the
+    API keeps exposing them by field name. The form is switched before its
+    existing submissions are rewritten in batches; run the command again
+    with ``--start-after`` to resume.
+
+    """
+
+    help = "Convert the stored submissions of a form to field ID or name keys."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--form",
+            type=int,
+            required=True,
+            dest="form_id",
+            help="ID of the form to convert.",
+        )
+        parser.add_argument(
+            "--to",
+            choices=[choice for choice, _label in DATA_KEYS_CHOICES],
+            required=True,
+            dest="data_keys",
+            help="Key the answers by field 'id' or by field 'name'.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of submissions rewritten per transaction (default: 1000).",
+        )
+        parser.add_argument(
+            "--start-after",
+            type=int,
+            default=0,
+            help="Resume after this submission ID.",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="The database to rewrite submissions in.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only count the submissions that would be rewritten.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be a positive integer.")
+
+        try:
+            changed, last_pk = convert_data_keys(
+                options["form_id"],
+                options["data_keys"],
+                batch_size=options["batch_size"],
+                start_after=options["start_after"],
+                dry_run=options["dry_run"],
+                using=options["database"],
+            )
+        except ValueError as exc:
+            raise CommandError(str(exc))
+
+        if options["dry_run"]:
+            message = f"Would rewrite {changed} submission(s)."
+        else:
+            message = f"Rewrote {changed} submission(s)."
+        self.stdout.write(self.style.SUCCESS(f"{message} Last ID: {last_pk}."))
@@ -0,0 +1,98 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from dynamic_form.utils.indexes import (
+    create_index_sql,
+    declared_indexes,
+    drop_index_sql,
+    existing_index_names,
+    supports_data_indexes,
+)
+
+
+class Command(BaseCommand):
+    """Create and drop the indexes on `FormSubmission.submitted_data`.
+
+    By default the command synchronizes the database with the declared
+    indexes: a GIN `jsonb_path_ops` index on PostgreSQL, plus one expression
+    index per field name flagged with `DynamicField.is_indexed`. Managed
+    indexes that are no longer declared are dropped.
+
+    """
+
+    help = (
+        "Create the declared indexes on submitted form data and drop the "
+        "ones that are no longer declared."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="The database to manage the indexes of.",
+        )
+        parser.add_argument(
+            "--list",
+            action="store_true",
+            help="Show the declared and existing indexes without changing anything.",
+        )
+        parser.add_argument(
+            "--drop",
+            action="store_true",
+            help="Drop every managed index.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Print the SQL statements instead of executing them.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        connection = connections[options["database"]]
+        if not supports_data_indexes(connection):
+            raise CommandError(
+                f"Submitted data indexes are not supported on '{connection.vendor}'."
+            )
+
+        declared, skipped = declared_indexes(connection)
+        existing = existing_index_names(connection)
+        for field in skipped:
+            self.stderr.write(
+                f"Skipping field '{field.name}' of form #{field.form_id}: "
+                "only letters, digits, '_' and '-' can be indexed."
+            )
+
+        if options["list"]:
+            for index in declared:
+                state = "present" if index.name in existing else "missing"
+                target = f"key '{index.key}'" if index.key else "submitted_data"
+                self.stdout.write(f"{index.name} ({target}): {state}")
+            for name in sorted(existing - {index.name for index in declared}):
+                self.stdout.write(f"{name}: not declared")
+            return
+
+        if options["drop"]:
+            to_create = []
+            to_drop = sorted(existing)
+        else:
+            to_create = [index for index in declared if index.name not in existing]
+            to_drop = sorted(existing - {index.name for index in declared})
+
+        statements = [drop_index_sql(name, connection) for name in to_drop] + [
+            create_index_sql(index, connection) for index in to_create
+        ]
+        for statement in statements:
+            if options["dry_run"]:
+                self.stdout.write(f"{statement};")
+                continue
+            with connection.cursor() as cursor:
+                cursor.execute(statement)
+
+        if not options["dry_run"]:
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Created {len(to_create)} and dropped {len(to_drop)} index(es)."
+                )
+            )
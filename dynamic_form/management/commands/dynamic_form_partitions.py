@@ -0,0 +1,138 @@
+from typing import Any, List
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.utils import timezone
+
+from dynamic_form.utils.partitioning import (
+    add_months,
+    create_partition_sql,
+    data_range,
+    default_partition_name,
+    detach_partition_sql,
+    existing_partitions,
+    is_partitioned,
+    month_range,
+    month_start,
+    move_default_rows_sql,
+    partition_name,
+    partitions_to_detach,
+    setup_sql,
+)
+
+
+class Command(BaseCommand):
+    """Manage the monthly partitions of the submission table on PostgreSQL.
+
+    ``--setup`` converts the table into a table partitioned by month of
+    `submitted_at` (once, during a maintenance window: rows are copied).
+    Afterwards, run the command periodically (e.g. daily from cron) to
+    create the partitions of the coming months and, with
+    ``--detach-older-than``, to detach the partitions of old months. Rows
+    that landed in the default partition are moved into the partition of
+    their month when it is created.
+
+    """
+
+    help = (
+        "Partition form submissions by month on PostgreSQL: create upcoming "
+        "partitions and detach old ones."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="The database holding the submission table.",
+        )
+        parser.add_argument(
+            "--setup",
+            action="store_true",
+            help="Convert the submission table into a partitioned table.",
+        )
+        parser.add_argument(
+            "--ahead",
+            type=int,
+            default=3,
+            help="Number of future months to create partitions for (default: 3).",
+        )
+        parser.add_argument(
+            "--detach-older-than",
+            type=int,
+            metavar="MONTHS",
+            help="Detach the partitions of months ended more than MONTHS months ago.",
+        )
+        parser.add_argument(
+            "--list",
+            action="store_true",
+            help="Show the existing partitions without changing anything.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Print the SQL statements instead of executing them.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        connection = connections[options["database"]]
+        if connection.vendor != "postgresql":
+            raise CommandError("Partitioning is only supported on PostgreSQL.")
+        if options["ahead"] < 0:
+            raise CommandError("--ahead must not be negative.")
+        if (options["detach_older_than"] or 0) < 0:
+            raise CommandError("--detach-older-than must not be negative.")
+
+        now = timezone.now()
+        last = add_months(month_start(now), options["ahead"])
+        if options["setup"]:
+            if is_partitioned(connection):
+                raise CommandError("The submission table is already partitioned.")
+            first, _latest = data_range(connection)
+            self.execute_sql(
+                connection, setup_sql(connection, first or now, last), options
+            )
+            return
+
+        if not is_partitioned(connection):
+            raise CommandError(
+                "The submission table is not partitioned; run the command with "
+                "--setup first."
+            )
+
+        existing = existing_partitions(connection)
+        if options["list"]:
+            for name in existing:
+                self.stdout.write(name)
+            return
+
+        statements = []
+        for month in month_range(now, last):
+            if partition_name(month) in existing:
+                continue
+            if default_partition_name() in existing:
+                statements.extend(move_default_rows_sql(month, connection))
+            else:
+                statements.append(create_partition_sql(month, connection))
+        if options["detach_older_than"] is not None:
+            statements.extend(
+                detach_partition_sql(name, connection)
+                for name in partitions_to_detach(
+                    existing, options["detach_older_than"], now
+                )
+            )
+        self.execute_sql(connection, statements, options)
+
+    def execute_sql(self, connection: Any, statements: List[str], options: Any) -> None:
+        """Run the statements in one transaction, or print them in a dry run."""
+        if options["dry_run"]:
+            for statement in statements:
+                self.stdout.write(f"{statement};")
+            return
+
+        with transaction.atomic(using=connection.alias):
+            with connection.cursor() as cursor:
+                for statement in statements:
+                    cursor.execute(statement)
+        self.stdout.write(
+            self.style.SUCCESS(f"Executed {len(statements)} statement(s).")
+        )
@@ -0,0 +1,34 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from dynamic_form.utils.idempotency import purge_expired_keys
+
+
+class Command(BaseCommand):
+    """Delete the idempotency keys older than
+    `DYNAMIC_FORM_IDEMPOTENCY_KEY_TTL`.
+
+    Run it periodically (e.g. daily from cron) to keep the table small;
+    rows are deleted in batches so the command never holds long locks.
+
+    """
+
+    help = "Delete expired idempotency keys."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of keys deleted per query (default: 1000).",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be a positive integer.")
+
+        deleted = purge_expired_keys(options["batch_size"])
+        self.stdout.write(
+            self.style.SUCCESS(f"Deleted {deleted} expired idempotency key(s).")
+        )
@@ -0,0 +1,67 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from dynamic_form.utils.field_order import ORDER_GAP, rebalance_forms
+
+
+class Command(BaseCommand):
+    """Respace the field positions of forms that ran out of room.
+
+    Fields are inserted and moved into the gaps between their neighbours'
+    positions; once two neighbours are too close, the next insert between
+    them renumbers the whole form. Running this command periodically does
+    that work in the background instead.
+
+    """
+
+    help = "Respace the field positions of forms whose fields are too close."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--form",
+            type=int,
+            action="append",
+            dest="form_ids",
+            help="ID of a form to check; may be repeated. Defaults to all forms.",
+        )
+        parser.add_argument(
+            "--min-gap",
+            type=int,
+            default=2,
+            help=(
+                "Rebalance forms with two fields closer than this many positions "
+                "(default: 2, the forms where some insert has no room left)."
+            ),
+        )
+        parser.add_argument(
+            "--gap",
+            type=int,
+            default=ORDER_GAP,
+            help=(
+                f"Distance between positions after a rebalance (default: {ORDER_GAP})."
+            ),
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report the forms that need a rebalance.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if options["min_gap"] < 1:
+            raise CommandError("--min-gap must be a positive integer.")
+        if options["gap"] < 2:
+            raise CommandError("--gap must be at least 2.")
+
+        form_ids = rebalance_forms(
+            options["form_ids"],
+            threshold=options["min_gap"],
+            gap=options["gap"],
+            dry_run=options["dry_run"],
+        )
+        verb = "Would rebalance" if options["dry_run"] else "Rebalanced"
+        listed = f": {', '.join(map(str, form_ids))}" if form_ids else ""
+        self.stdout.write(
+            self.style.SUCCESS(f"{verb} {len(form_ids)} form(s){listed}.")
+        )
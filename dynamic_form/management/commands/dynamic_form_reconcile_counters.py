@@ -0,0 +1,41 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from dynamic_form.utils.counters import reconcile_counters
+
+
+class Command(BaseCommand):
+    """Recompute the denormalized submission counters of forms.
+
+    Counters are maintained on every submission create and delete; this
+    command repairs them after writes that bypass those code paths (raw SQL,
+    `QuerySet.update()`, restored backups, ...).
+
+    """
+
+    help = "Recompute submission_count and last_submitted_at of every form."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--form",
+            type=int,
+            action="append",
+            dest="form_ids",
+            help="ID of a form to reconcile; may be repeated. Defaults to all forms.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="Number of forms recomputed per transaction (default: 500).",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be a positive integer.")
+
+        changed = reconcile_counters(options["form_ids"], options["chunk_size"])
+        self.stdout.write(
+            self.style.SUCCESS(f"Updated the counters of {changed} form(s).")
+        )
@@ -0,0 +1,161 @@
+import json
+from argparse import Action, ArgumentParser, Namespace
+from typing import Any, List, Optional, Sequence, Tuple
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import DEFAULT_DB_ALIAS
+
+from dynamic_form.utils.data_operations import (
+    DROP,
+    MAP,
+    RENAME,
+    DataOperation,
+    DataOperationResult,
+    rewrite_submission_data,
+)
+
+
+class OperationAction(Action):
+    """Collect the operation options in the order they are given."""
+
+    def __call__(
+        self,
+        parser: ArgumentParser,
+        namespace: Namespace,
+        values: Any,
+        option_string: Optional[str] = None,
+    ) -> None:
+        operations: List[Tuple[str, Sequence[str]]] = list(
+            getattr(namespace, self.dest, None) or []
+        )
+        values = values if isinstance(values, list) else [values]
+        operations.append((self.const, values))
+        setattr(namespace, self.dest, operations)
+
+
+class Command(BaseCommand):
+    """Rename, drop or map keys of the stored data of a form's submissions.
+
+    Use it after renaming or deleting a `DynamicField`, or changing its
+    choices. Submissions are rewritten in batches by SQL statements where
+    the database supports it; run the command again with ``--start-after``
+    to resume an interrupted run.
+
+    """
+
+    help = "Rename, drop or map keys of the submitted data of a form, in batches."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--form",
+            type=int,
+            required=True,
+            dest="form_id",
+            help="ID of the form whose submissions are rewritten.",
+        )
+        parser.add_argument(
+            "--rename",
+            nargs=2,
+            metavar=("OLD", "NEW"),
+            action=OperationAction,
+            const=RENAME,
+            dest="operations",
+            help="Rename a key; may be repeated.",
+        )
+        parser.add_argument(
+            "--drop",
+            metavar="KEY",
+            action=OperationAction,
+            const=DROP,
+            dest="operations",
+            help="Remove a key; may be repeated.",
+        )
+        parser.add_argument(
+            "--map",
+            nargs=2,
+            metavar=("KEY", "JSON"),
+            action=OperationAction,
+            const=MAP,
+            dest="operations",
+            help=(
+                "Replace the values of a key, given as a JSON object of "
+                'old to new values, e.g. \'{"DE": "Germany"}\'; may be repeated.'
+            ),
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of submissions rewritten per transaction (default: 1000).",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=0,
+            help="Seconds to wait between batches (default: 0).",
+        )
+        parser.add_argument(
+            "--start-after",
+            type=int,
+            default=0,
+            help="Resume after this submission ID.",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="The database to rewrite submissions in.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only count the submissions that would be rewritten.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be a positive integer.")
+        if options["sleep"] < 0:
+            raise CommandError("--sleep must not be negative.")
+        if not options["operations"]:
+            raise CommandError("Give at least one --rename, --drop or --map.")
+
+        operations = [
+            self.parse_operation(action, values)
+            for action, values in options["operations"]
+        ]
+        for operation in operations:
+            self.stdout.write(f"Operation: {operation}")
+
+        result = rewrite_submission_data(
+            options["form_id"],
+            operations,
+            batch_size=options["batch_size"],
+            sleep=options["sleep"],
+            dry_run=options["dry_run"],
+            start_after=options["start_after"],
+            using=options["database"],
+            progress=self.report_batch,
+        )
+
+        verb = "Would rewrite" if options["dry_run"] else "Rewrote"
+        self.stdout.write(self.style.SUCCESS(f"{verb} {result.updated} submission(s)."))
+
+    def parse_operation(self, action: str, values: Sequence[str]) -> DataOperation:
+        """Build an operation from its command line values."""
+        try:
+            if action == RENAME:
+                return DataOperation(RENAME, values[0], new_key=values[1])
+            if action == DROP:
+                return DataOperation(DROP, values[0])
+            mapping = json.loads(values[1])
+            if not isinstance(mapping, dict):
+                raise ValueError("--map expects a JSON object.")
+            return DataOperation(MAP, values[0], mapping=mapping)
+        except ValueError as exc:
+            raise CommandError(str(exc))
+
+    def report_batch(self, result: DataOperationResult) -> None:
+        self.stdout.write(
+            f"Batch {result.batches}: {result.updated} rewritten so far, "
+            f"last ID {result.last_pk}"
+        )
@@ -0,0 +1,94 @@
+from datetime import timedelta
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import DEFAULT_DB_ALIAS
+from django.utils import timezone
+
+from dynamic_form.utils.retention import PurgeResult, purge_submissions
+
+
+class Command(BaseCommand):
+    """Delete the submissions older than a retention period.
+
+    Rows are deleted in primary key ordered batches, each in its own short
+    transaction, so the table is never locked for long and memory usage
+    stays flat. Every batch reports the last deleted ID; pass it to
+    ``--start-after`` to resume an interrupted run.
+
+    """
+
+    help = "Delete form submissions older than the given number of days."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--days",
+            type=int,
+            required=True,
+            help="Delete submissions made more than this many days ago.",
+        )
+        parser.add_argument(
+            "--form",
+            type=int,
+            action="append",
+            dest="form_ids",
+            help="ID of a form to purge; may be repeated. Defaults to all forms.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of submissions deleted per transaction (default: 1000).",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=0,
+            help="Seconds to wait between batches (default: 0).",
+        )
+        parser.add_argument(
+            "--start-after",
+            type=int,
+            default=0,
+            help="Resume after this submission ID, as reported by a previous run.",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="The database to purge submissions from.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only count the submissions that would be deleted.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if options["days"] < 0:
+            raise CommandError("--days must not be negative.")
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be a positive integer.")
+        if options["sleep"] < 0:
+            raise CommandError("--sleep must not be negative.")
+
+        result = purge_submissions(
+            timezone.now() - timedelta(days=options["days"]),
+            form_ids=options["form_ids"],
+            batch_size=options["batch_size"],
+            sleep=options["sleep"],
+            dry_run=options["dry_run"],
+            start_after=options["start_after"],
+            using=options["database"],
+            progress=self.report_batch,
+        )
+
+        for form_id, count in sorted(result.per_form.items()):
+            self.stdout.write(f"Form #{form_id}: {count} submission(s)")
+        verb = "Would delete" if options["dry_run"] else "Deleted"
+        self.stdout.write(self.style.SUCCESS(f"{verb} {result.deleted} submission(s)."))
+
+    def report_batch(self, result: PurgeResult) -> None:
+        self.stdout.write(
+            f"Batch {result.batches}: {result.deleted} deleted so far, "
+            f"last ID {result.last_pk}"
+        )
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("dynamic_form", "0002_seed_field_types"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="dynamicfield",
+            name="is_indexed",
+            field=models.BooleanField(
+                db_comment="If True, an expression index is maintained on this field's submitted values.",
+                default=False,
+                help_text="Whether submitted values of this field are indexed in the database (applied by the 'dynamic_form_indexes' management command).",
+                verbose_name="Indexed",
+            ),
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:25
+
+from django.db import migrations, models
+
+
+def populate_counters(apps, schema_editor):
+    """
+    Initialize the counters of existing forms from their submissions.
+    """
+    DynamicForm = apps.get_model("dynamic_form", "DynamicForm")
+    FormSubmission = apps.get_model("dynamic_form", "FormSubmission")
+    db_alias = schema_editor.connection.alias
+
+    stats = (
+        FormSubmission.objects.using(db_alias)
+        .order_by()
+        .values("form_id")
+        .annotate(count=models.Count("pk"), last=models.Max("submitted_at"))
+    )
+    for row in stats.iterator():
+        DynamicForm.objects.using(db_alias).filter(pk=row["form_id"]).update(
+            submission_count=row["count"], last_submitted_at=row["last"]
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("dynamic_form", "0003_dynamicfield_is_indexed"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="dynamicform",
+            name="last_submitted_at",
+            field=models.DateTimeField(
+                blank=True,
+                db_comment="Denormalized time of the latest submission.",
+                editable=False,
+                help_text="Timestamp of the latest submission of the form.",
+                null=True,
+                verbose_name="Last Submission",
+            ),
+        ),
+        migrations.AddField(
+            model_name="dynamicform",
+            name="submission_count",
+            field=models.PositiveIntegerField(
+                db_comment="Denormalized submission count, maintained on submission create and delete.",
+                default=0,
+                editable=False,
+                help_text="Number of submissions of the form.",
+                verbose_name="Submissions",
+            ),
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,100 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:30
+
+import django.core.serializers.json
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("dynamic_form", "0004_dynamicform_submission_counters"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IdempotencyKey",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "key",
+                    models.CharField(
+                        db_comment="Client-generated key identifying a request and its retries.",
+                        help_text="The value of the Idempotency-Key request header.",
+                        max_length=255,
+                        verbose_name="Key",
+                    ),
+                ),
+                (
+                    "request_fingerprint",
+                    models.CharField(
+                        db_comment="SHA-256 of the request path and body, to detect reused keys.",
+                        help_text="Hash of the endpoint and body of the original request.",
+                        max_length=64,
+                        verbose_name="Request Fingerprint",
+                    ),
+                ),
+                (
+                    "status_code",
+                    models.PositiveSmallIntegerField(
+                        blank=True,
+                        db_comment="Status code of the original response, NULL while processing.",
+                        help_text="HTTP status of the stored response; empty while in progress.",
+                        null=True,
+                        verbose_name="Status Code",
+                    ),
+                ),
+                (
+                    "response_data",
+                    models.JSONField(
+                        blank=True,
+                        db_comment="Serialized body of the original response.",
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                        help_text="Body of the original response, returned to retries.",
+                        null=True,
+                        verbose_name="Response Data",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True,
+                        db_comment="The date and time when the key was claimed; drives expiry.",
+                        db_index=True,
+                        help_text="Timestamp when the key was first used.",
+                        verbose_name="Creation Date",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        db_comment="The user the idempotency key belongs to.",
+                        help_text="The user who sent the request.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="User",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Idempotency Key",
+                "verbose_name_plural": "Idempotency Keys",
+                "db_table": "idempotency_keys",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("user", "key"), name="unique_idempotency_key"
+                    )
+                ],
+            },
+        ),
+    ]
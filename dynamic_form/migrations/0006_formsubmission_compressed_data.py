@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("dynamic_form", "0005_idempotencykey"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="formsubmission",
+            name="compressed_data",
+            field=models.BinaryField(
+                blank=True,
+                db_comment="zlib/zstd-compressed JSON of the large text responses.",
+                help_text="Large text responses, compressed.",
+                null=True,
+                verbose_name="Compressed Data",
+            ),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("dynamic_form", "0006_formsubmission_compressed_data"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="dynamicform",
+            name="data_keys",
+            field=models.CharField(
+                choices=[("name", "Field names"), ("id", "Field IDs")],
+                db_comment="Key of the stored answers: 'name' or 'id' of the field.",
+                default="name",
+                help_text=(
+                    "How answers are keyed in stored submissions. Use the "
+                    "dynamic_form_convert_data_keys command to convert existing ones."
+                ),
+                max_length=4,
+                verbose_name="Data Keys",
+            ),
+        ),
+    ]
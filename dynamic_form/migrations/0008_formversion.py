@@ -0,0 +1,93 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:06
+
+import django.core.serializers.json
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("dynamic_form", "0007_dynamicform_data_keys"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FormVersion",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "schema_hash",
+                    models.CharField(
+                        db_comment="SHA-256 of the field definitions, unique per form.",
+                        help_text="Content hash of the field definitions.",
+                        max_length=64,
+                        verbose_name="Schema Hash",
+                    ),
+                ),
+                (
+                    "schema",
+                    models.JSONField(
+                        db_comment="Frozen API representation of the form and its fields.",
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                        help_text="The serialized form and fields at the time of the version.",
+                        verbose_name="Schema",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True,
+                        db_comment="The date and time when the version was recorded.",
+                        help_text="Timestamp when the version was recorded.",
+                        verbose_name="Creation Date",
+                    ),
+                ),
+                (
+                    "form",
+                    models.ForeignKey(
+                        db_comment="A foreign key linking this version to its dynamic form.",
+                        help_text="The form this version is a snapshot of.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="versions",
+                        to="dynamic_form.dynamicform",
+                        verbose_name="Form",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Form Version",
+                "verbose_name_plural": "Form Versions",
+                "db_table": "form_versions",
+                "ordering": ["-created_at"],
+            },
+        ),
+        migrations.AddField(
+            model_name="formsubmission",
+            name="form_version",
+            field=models.ForeignKey(
+                blank=True,
+                db_comment="A foreign key to the form schema snapshot of the submission.",
+                help_text="The form schema version the submission was made against.",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="submissions",
+                to="dynamic_form.formversion",
+                verbose_name="Form Version",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="formversion",
+            constraint=models.UniqueConstraint(
+                fields=("form", "schema_hash"), name="unique_form_version"
+            ),
+        ),
+    ]
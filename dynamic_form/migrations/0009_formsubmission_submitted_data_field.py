@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:35
+
+import dynamic_form.models.form_submission
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("dynamic_form", "0008_formversion"),
+    ]
+
+    operations = [
+        # The column is unchanged; altering it for real would make SQLite
+        # rebuild the table and drop the submitted data indexes
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name="formsubmission",
+                    name="submitted_data",
+                    field=dynamic_form.models.form_submission.SubmittedDataField(
+                        db_comment="Stores user responses in a JSON format.",
+                        help_text="The data submitted by the user.",
+                        verbose_name="Submission Data",
+                    ),
+                ),
+            ],
+        ),
+    ]
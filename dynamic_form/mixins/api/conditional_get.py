@@ -0,0 +1,123 @@
+import hashlib
+import math
+import time
+from datetime import datetime
+from typing import Any, Callable, List, Optional, Tuple
+
+from django.http import HttpResponseBase
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework.request import Request
+
+from dynamic_form.utils.cache import get_versions
+
+# Version tokens and last modification time a response depends on
+ConditionalState = Tuple[List[str], Optional[datetime]]
+
+
+class ConditionalGetMixin:
+    """A mixin adding ETag / Last-Modified support to `list` and `retrieve`.
+
+    Validators are computed from the version tokens of cached namespaces
+    (and optionally a modification time), without touching the queryset or
+    serializing the body. When the client's validators still match, a
+    `304 Not Modified` response is returned right away.
+
+    Attributes:
+        conditional_namespaces (Tuple[str, ...]): Versioned cache namespaces
+            whose tokens change whenever the responses of the viewset change
+
+    """
+
+    conditional_namespaces: Tuple[str, ...] = ()
+
+    def get_conditional_state(self) -> Optional[ConditionalState]:
+        """Return the version tokens and the last modification time the
+        current response depends on, or None to skip conditional handling.
+
+        Subclasses may override this for detail-specific validators.
+
+        """
+        if not self.conditional_namespaces:
+            return None
+        return list(get_versions(*self.conditional_namespaces).values()), None
+
+    def get_conditional_validators(
+        self, request: Request
+    ) -> Optional[Tuple[str, Optional[int]]]:
+        """Compute the ETag and Last-Modified timestamp of the current
+        request.
+
+        Version tokens are nanosecond timestamps of the last change, so they
+        also provide the Last-Modified time. HTTP dates have a one-second
+        resolution, so Last-Modified is left out while the second of the
+        last change has not elapsed: a later change within that second
+        would carry the same date and be answered with a false 304. Such
+        responses are validated by their ETag only.
+
+        Returns:
+            Optional[Tuple[str, Optional[int]]]: The quoted ETag and the
+                last modification time in seconds, or None to skip.
+
+        """
+        state = self.get_conditional_state()
+        if state is None:
+            return None
+        tokens, updated_at = state
+
+        timestamps = [int(token) / 1e9 for token in tokens if token.isdigit()]
+        if updated_at is not None:
+            timestamps.append(updated_at.timestamp())
+        last_modified = math.floor(max(timestamps)) if timestamps else None
+        if last_modified is not None and last_modified >= math.floor(time.time()):
+            last_modified = None
+
+        renderer = getattr(request, "accepted_renderer", None)
+        key = "|".join(
+            [
+                *tokens,
+                str(updated_at),
+                request.get_full_path(),
+                getattr(renderer, "format", "") or "",
+            ]
+        )
+        etag = quote_etag(hashlib.sha256(key.encode("utf-8")).hexdigest()[:32])
+        return etag, last_modified
+
+    def conditional_response(
+        self,
+        handler: Callable[..., HttpResponseBase],
+        request: Request,
+        *args: Any,
+        **kwargs: Any,
+    ) -> HttpResponseBase:
+        """Answer with `304 Not Modified` when the client's validators match,
+        otherwise call the handler and attach the validators to its
+        response."""
+        validators = self.get_conditional_validators(request)
+        if validators is None:
+            return handler(request, *args, **kwargs)
+
+        etag, last_modified = validators
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is None:
+            response = handler(request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+
+        response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified)
+        return response
+
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> HttpResponseBase:
+        return self.conditional_response(
+            super().list, request, *args, **kwargs  # type: ignore[misc]
+        )
+
+    def retrieve(self, request: Request, *args: Any, **kwargs: Any) -> HttpResponseBase:
+        return self.conditional_response(
+            super().retrieve, request, *args, **kwargs  # type: ignore[misc]
+        )
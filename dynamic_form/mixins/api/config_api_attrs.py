@@ -1,17 +1,40 @@
-from typing import Any, Dict, List, Optional, Type, Union
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Type, Union
 
 from rest_framework.pagination import BasePagination
 from rest_framework.parsers import BaseParser
 from rest_framework.permissions import AllowAny, BasePermission
+from rest_framework.renderers import BaseRenderer
+from rest_framework.settings import api_settings
 from rest_framework.throttling import BaseThrottle
 
 from dynamic_form.settings.conf import config
 
 
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """The resolved API configuration of a viewset class.
+
+    Attributes:
+        version (int): Version of the global config the snapshot was built from
+        attrs (Mapping[str, Any]): Viewset attributes to apply to each instance
+        disabled_methods (FrozenSet[str]): HTTP methods disabled by settings
+
+    """
+
+    version: int
+    attrs: Mapping[str, Any]
+    disabled_methods: FrozenSet[str] = field(default_factory=frozenset)
+
+
 class ConfigureAttrsMixin:
     """A mixin for dynamically configuring API attributes based on settings.
     Supports both global defaults and viewset-specific configurations.
 
+    Settings are resolved once per class into a `ConfigSnapshot`, which is
+    rebuilt only when the global config changes.
+
     Attributes:
         config_prefix (str): Prefix for config attributes specific to this viewset
         default_config (Dict[str, Any]): Default configuration values
@@ -26,6 +49,7 @@ class ConfigureAttrsMixin:
         "ordering_fields": None,
         "search_fields": None,
         "parser_classes": [],
+        "renderer_classes": None,
         "permission_classes": [AllowAny],
         "filterset_class": None,
         "pagination_class": None,
@@ -33,80 +57,100 @@ class ConfigureAttrsMixin:
         "extra_permission_class": None,
     }
 
-    def configure_attrs(self) -> None:
-        """Configures API attributes dynamically based on settings from config.
+    @classmethod
+    def resolve_config(cls, config_prefix: str) -> Dict[str, Any]:
+        """Resolve the API attributes for the given config prefix.
 
         Uses viewset-specific settings when available, falling back to
         global defaults.
 
+        Args:
+            config_prefix (str): Prefix of the viewset-specific config attributes.
+
+        Returns:
+            Dict[str, Any]: The resolved attributes keyed by viewset attribute name.
+
         """
         # Get viewset-specific config attribute names
         specific_ordering = (
-            f"api_{self.config_prefix}_ordering_fields"
-            if self.config_prefix
+            f"api_{config_prefix}_ordering_fields"
+            if config_prefix
             else "api_ordering_fields"
         )
         specific_search = (
-            f"api_{self.config_prefix}_search_fields"
-            if self.config_prefix
+            f"api_{config_prefix}_search_fields"
+            if config_prefix
             else "api_search_fields"
         )
         specific_parsers = (
-            f"api_{self.config_prefix}_parser_classes"
-            if self.config_prefix
+            f"api_{config_prefix}_parser_classes"
+            if config_prefix
             else "api_parser_classes"
         )
+        specific_renderers = (
+            f"api_{config_prefix}_renderer_classes"
+            if config_prefix
+            else "api_renderer_classes"
+        )
         specific_permissions = (
-            f"api_{self.config_prefix}_extra_permission_class"
-            if self.config_prefix
+            f"api_{config_prefix}_extra_permission_class"
+            if config_prefix
             else "api_extra_permission_class"
         )
         specific_filterset = (
-            f"api_{self.config_prefix}_filterset_class"
-            if self.config_prefix
+            f"api_{config_prefix}_filterset_class"
+            if config_prefix
             else "api_filterset_class"
         )
         specific_pagination = (
-            f"api_{self.config_prefix}_pagination_class"
-            if self.config_prefix
+            f"api_{config_prefix}_pagination_class"
+            if config_prefix
             else "api_pagination_class"
         )
         specific_throttle = (
-            f"api_{self.config_prefix}_throttle_classes"
-            if self.config_prefix
+            f"api_{config_prefix}_throttle_classes"
+            if config_prefix
             else "api_throttle_classes"
         )
 
         # Set ordering fields
-        self.ordering_fields: Optional[List[str]] = (
+        ordering_fields: Optional[List[str]] = (
             getattr(config, specific_ordering, None)
             if hasattr(config, specific_ordering)
             else getattr(
-                config, "api_ordering_fields", self.default_config["ordering_fields"]
+                config, "api_ordering_fields", cls.default_config["ordering_fields"]
             )
         )
 
         # Set search fields
-        self.search_fields: Optional[List[str]] = (
+        search_fields: Optional[List[str]] = (
             getattr(config, specific_search, None)
             if hasattr(config, specific_search)
             else getattr(
-                config, "api_search_fields", self.default_config["search_fields"]
+                config, "api_search_fields", cls.default_config["search_fields"]
             )
         )
 
         # Set parser classes
-        self.parser_classes: List[Type[BaseParser]] = (
+        parser_classes: List[Type[BaseParser]] = (
             getattr(config, specific_parsers, [])
             if hasattr(config, specific_parsers)
             else getattr(
-                config, "api_parser_classes", self.default_config["parser_classes"]
+                config, "api_parser_classes", cls.default_config["parser_classes"]
             )
         )
 
+        # Set renderer classes, defaulting to DRF's DEFAULT_RENDERER_CLASSES
+        renderer_classes: List[Type[BaseRenderer]] = list(
+            getattr(config, specific_renderers, None)
+            or getattr(config, "api_renderer_classes", None)
+            or cls.default_config["renderer_classes"]
+            or api_settings.DEFAULT_RENDERER_CLASSES
+        )
+
         # Set permission classes
-        self.permission_classes: List[Type[BasePermission]] = list(
-            self.default_config["permission_classes"]
+        permission_classes: List[Type[BasePermission]] = list(
+            cls.default_config["permission_classes"]
         )
         extra_perm = (
             getattr(config, specific_permissions, None)
@@ -114,27 +158,27 @@ class ConfigureAttrsMixin:
             else getattr(
                 config,
                 "api_extra_permission_class",
-                self.default_config["extra_permission_class"],
+                cls.default_config["extra_permission_class"],
             )
         )
         if extra_perm:
-            self.permission_classes.append(extra_perm)
+            permission_classes.append(extra_perm)
 
         # Set filterset class
-        self.filterset_class = (
+        filterset_class = (
             getattr(config, specific_filterset, None)
             if hasattr(config, specific_filterset)
             else getattr(
-                config, "api_filterset_class", self.default_config["filterset_class"]
+                config, "api_filterset_class", cls.default_config["filterset_class"]
             )
         )
 
         # Set pagination class
-        self.pagination_class: Optional[Type[BasePagination]] = (
+        pagination_class: Optional[Type[BasePagination]] = (
             getattr(config, specific_pagination, None)
             if hasattr(config, specific_pagination)
             else getattr(
-                config, "api_pagination_class", self.default_config["pagination_class"]
+                config, "api_pagination_class", cls.default_config["pagination_class"]
             )
         )
 
@@ -143,15 +187,72 @@ class ConfigureAttrsMixin:
             getattr(config, specific_throttle, None)
             if hasattr(config, specific_throttle)
             else getattr(
-                config, "api_throttle_classes", self.default_config["throttle_classes"]
+                config, "api_throttle_classes", cls.default_config["throttle_classes"]
             )
         )
-        self.throttle_classes: List[Type[BaseThrottle]] = (
-            self._normalize_throttle_classes(throttle_setting)
-        )
 
+        return {
+            "ordering_fields": ordering_fields,
+            "search_fields": search_fields,
+            "parser_classes": parser_classes,
+            "renderer_classes": renderer_classes,
+            "permission_classes": permission_classes,
+            "filterset_class": filterset_class,
+            "pagination_class": pagination_class,
+            "throttle_classes": cls._normalize_throttle_classes(throttle_setting),
+        }
+
+    def configure_attrs(self) -> None:
+        """Configures API attributes dynamically based on settings from config.
+
+        Resolves the settings on every call; viewsets use
+        `get_config_snapshot` instead to resolve them once per class.
+
+        """
+        for name, value in self.resolve_config(self.config_prefix).items():
+            setattr(self, name, value)
+
+    @classmethod
+    def build_config_snapshot(cls) -> ConfigSnapshot:
+        """Resolve the configuration of the class into an immutable
+        snapshot.
+
+        Subclasses may extend the snapshot (see `BaseViewSet`).
+
+        """
+        version = config.version
+        attrs = {
+            name: tuple(value) if isinstance(value, list) else value
+            for name, value in cls.resolve_config(cls.config_prefix).items()
+        }
+        return ConfigSnapshot(version=version, attrs=MappingProxyType(attrs))
+
+    @classmethod
+    def get_config_snapshot(cls) -> ConfigSnapshot:
+        """Return the configuration snapshot of the class, building it on
+        first use and whenever the global config has changed since."""
+        snapshot: Optional[ConfigSnapshot] = cls.__dict__.get("_config_snapshot")
+        if snapshot is None or snapshot.version != config.version:
+            snapshot = cls.build_config_snapshot()
+            cls._config_snapshot = snapshot
+        return snapshot
+
+    @classmethod
+    def reset_config_snapshot(cls) -> None:
+        """Drop the configuration snapshot of the class so that the next
+        request resolves the settings again.
+
+        Changes made through `override_settings` or by assigning attributes
+        on `config` are picked up automatically; this hook covers the
+        remaining cases (e.g. patched import paths).
+
+        """
+        if "_config_snapshot" in cls.__dict__:
+            delattr(cls, "_config_snapshot")
+
+    @classmethod
     def _normalize_throttle_classes(
-        self,
+        cls,
         throttle_setting: Union[Type[BaseThrottle], List[Type[BaseThrottle]], None],
     ) -> List[Type[BaseThrottle]]:
         """Normalizes throttle settings into a list of throttle classes.
@@ -164,7 +265,7 @@ class ConfigureAttrsMixin:
 
         """
         if throttle_setting is None:
-            return self.default_config["throttle_classes"]
+            return cls.default_config["throttle_classes"]
         elif isinstance(throttle_setting, (list, tuple)):
             return [cls for cls in throttle_setting if issubclass(cls, BaseThrottle)]
         elif issubclass(throttle_setting, BaseThrottle):
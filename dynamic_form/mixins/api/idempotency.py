@@ -0,0 +1,97 @@
+from typing import Any, Callable
+
+from django.db import transaction
+from django.http import HttpResponseBase
+from django.utils.translation import gettext_lazy as _
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from dynamic_form.models import IdempotencyKey
+from dynamic_form.utils.idempotency import (
+    IDEMPOTENCY_HEADER,
+    REPLAYED_HEADER,
+    claim_key,
+    complete_key,
+    release_key,
+    request_fingerprint,
+)
+
+
+class IdempotencyMixin:
+    """A mixin making `create` idempotent when the client sends an
+    `Idempotency-Key` header.
+
+    The first request with a key is processed normally and its successful
+    response is stored. Retries with the same key are answered with the
+    stored response, without validating or serializing anything again, and
+    carry an `Idempotent-Replayed: true` header. A retry arriving while the
+    first request is still processed gets `409 Conflict`; reusing a key for
+    a different request gets `422 Unprocessable Entity`. Failed requests do
+    not keep their key.
+
+    The key is claimed, the request processed and its result stored in one
+    transaction, so a crash in between leaves neither a submission nor a
+    stuck key behind.
+
+    """
+
+    def idempotent_response(
+        self,
+        handler: Callable[..., HttpResponseBase],
+        request: Request,
+        *args: Any,
+        **kwargs: Any,
+    ) -> HttpResponseBase:
+        """Call the handler at most once per idempotency key of the user."""
+        key = request.headers.get(IDEMPOTENCY_HEADER)
+        if key is None or not request.user.is_authenticated:
+            return handler(request, *args, **kwargs)
+
+        key = key.strip()
+        if not key or len(key) > IdempotencyKey._meta.get_field("key").max_length:
+            raise ValidationError(
+                {IDEMPOTENCY_HEADER: _("Send a key of 1 to 255 characters.")}
+            )
+
+        fingerprint = request_fingerprint(request)
+        with transaction.atomic():
+            record, claimed = claim_key(request.user, key, fingerprint)
+            if claimed:
+                response = handler(request, *args, **kwargs)
+                if status.is_success(response.status_code):
+                    complete_key(record, response.status_code, response.data)
+                else:
+                    release_key(record)
+                return response
+
+        return self.replay_response(record, fingerprint)
+
+    def replay_response(
+        self, record: IdempotencyKey, fingerprint: str
+    ) -> HttpResponseBase:
+        """Answer a retry from the stored response of its key."""
+        if record is not None and record.request_fingerprint != fingerprint:
+            return Response(
+                {
+                    "detail": _(
+                        "This idempotency key was already used for a different request."
+                    )
+                },
+                status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            )
+        if record is None or not record.is_completed:
+            return Response(
+                {"detail": _("A request with this idempotency key is in progress.")},
+                status=status.HTTP_409_CONFLICT,
+            )
+
+        response = Response(record.response_data, status=record.status_code)
+        response[REPLAYED_HEADER] = "true"
+        return response
+
+    def create(self, request: Request, *args: Any, **kwargs: Any) -> HttpResponseBase:
+        return self.idempotent_response(
+            super().create, request, *args, **kwargs  # type: ignore[misc]
+        )
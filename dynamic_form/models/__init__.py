@@ -2,3 +2,5 @@ from .field import DynamicField
 from .field_type import FieldType
 from .form import DynamicForm
 from .form_submission import FormSubmission
+from .form_version import FormVersion
+from .idempotency_key import IdempotencyKey
@@ -27,7 +27,10 @@ class DynamicField(Model):
         choices (JSON, optional): Available options for dropdown/radio/checkbox fields
         default_value (JSON, optional): Initial value for the field
         validation_rules (JSON, optional): Custom validation constraints
-        order (int): Position of the field in the form layout
+        order (int): Position of the field in the form layout; positions
+            are spaced (see `dynamic_form.utils.field_order`) so a field can
+            be inserted or moved with a single write
+        is_indexed (bool): Whether submitted values of this field are indexed
 
     """
 
@@ -99,6 +102,15 @@ class DynamicField(Model):
         help_text=_("Order in which this field appears in the form."),
         db_comment="Sorting order for field display.",
     )
+    is_indexed = BooleanField(
+        _("Indexed"),
+        default=False,
+        help_text=_(
+            "Whether submitted values of this field are indexed in the database "
+            "(applied by the 'dynamic_form_indexes' management command)."
+        ),
+        db_comment="If True, an expression index is maintained on this field's submitted values.",
+    )
 
     class Meta:
         verbose_name = _("Dynamic Field")
@@ -1,6 +1,51 @@
-from django.db.models import BooleanField, CharField, DateTimeField, Model, TextField
+from typing import Any, Dict, Tuple
+
+from django.db import router, transaction
+from django.db.models import (
+    BooleanField,
+    CharField,
+    DateTimeField,
+    Model,
+    PositiveIntegerField,
+    QuerySet,
+    TextField,
+)
 from django.utils.translation import gettext_lazy as _
 
+# Keys of the answers in the stored submitted data: field names, or field
+# IDs, which survive renames and are shorter
+DATA_KEYS_NAME = "name"
+DATA_KEYS_ID = "id"
+DATA_KEYS_CHOICES = [
+    (DATA_KEYS_NAME, _("Field names")),
+    (DATA_KEYS_ID, _("Field IDs")),
+]
+
+
+def _add_deleted_submissions(
+    result: Tuple[int, Dict[str, int]], count: int
+) -> Tuple[int, Dict[str, int]]:
+    if not count:
+        return result
+    total, per_model = result
+    label = "dynamic_form.FormSubmission"
+    return total + count, {**per_model, label: per_model.get(label, 0) + count}
+
+
+class DynamicFormQuerySet(QuerySet):
+    """QuerySet of DynamicForm deleting the submissions of the deleted
+    forms without loading them (see `delete_form_submissions`)."""
+
+    def delete(self) -> Tuple[int, Dict[str, int]]:
+        from dynamic_form.utils.retention import delete_form_submissions
+
+        with transaction.atomic(using=self.db, savepoint=False):
+            count = delete_form_submissions(self.order_by().values("pk"), using=self.db)
+            return _add_deleted_submissions(super().delete(), count)
+
+    delete.alters_data = True
+    delete.queryset_only = True
+
 
 class DynamicForm(Model):
     """A configurable form that can be created dynamically with custom fields.
@@ -15,6 +60,16 @@ class DynamicForm(Model):
         is_active (bool): Toggles whether the form is available for submissions
         created_at (datetime): Auto-generated creation timestamp
         updated_at (datetime): Auto-generated last modification timestamp
+        submission_count (int): Denormalized number of submissions of the form
+        last_submitted_at (datetime, optional): Time of the latest submission
+        data_keys (str): Whether submitted answers are stored keyed by field
+            name or by field ID
+
+    The counters are maintained with atomic `F()` updates (see
+    `dynamic_form.utils.counters`). A full `save()` writes back the values
+    loaded with the instance, so existing forms are saved with
+    `update_fields` listing the changed fields, as the API and the admin
+    do.
 
     """
 
@@ -51,6 +106,34 @@ class DynamicForm(Model):
         help_text=_("Timestamp when the form was last updated."),
         db_comment="The date and time of the last modification.",
     )
+    submission_count = PositiveIntegerField(
+        _("Submissions"),
+        default=0,
+        editable=False,
+        help_text=_("Number of submissions of the form."),
+        db_comment="Denormalized submission count, maintained on submission create and delete.",
+    )
+    last_submitted_at = DateTimeField(
+        _("Last Submission"),
+        blank=True,
+        null=True,
+        editable=False,
+        help_text=_("Timestamp of the latest submission of the form."),
+        db_comment="Denormalized time of the latest submission.",
+    )
+    data_keys = CharField(
+        _("Data Keys"),
+        max_length=4,
+        choices=DATA_KEYS_CHOICES,
+        default=DATA_KEYS_NAME,
+        help_text=_(
+            "How answers are keyed in stored submissions. Use the "
+            "dynamic_form_convert_data_keys command to convert existing ones."
+        ),
+        db_comment="Key of the stored answers: 'name' or 'id' of the field.",
+    )
+
+    objects = DynamicFormQuerySet.as_manager()
 
     class Meta:
         verbose_name = _("Dynamic Form")
@@ -60,3 +143,13 @@ class DynamicForm(Model):
 
     def __str__(self):
         return self.name
+
+    def delete(self, using: Any = None, keep_parents: bool = False):
+        """Delete the form, removing its submissions without loading them
+        (see `delete_form_submissions`)."""
+        from dynamic_form.utils.retention import delete_form_submissions
+
+        using = using or router.db_for_write(self.__class__, instance=self)
+        with transaction.atomic(using=using, savepoint=False):
+            count = delete_form_submissions([self.pk], using=using)
+            return _add_deleted_submissions(super().delete(using, keep_parents), count)
@@ -1,15 +1,95 @@
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
 from django.conf import settings
+from django.db import router, transaction
 from django.db.models import (
     CASCADE,
     SET_NULL,
+    BinaryField,
+    Count,
     DateTimeField,
     ForeignKey,
     Index,
     JSONField,
     Model,
+    QuerySet,
 )
+from django.db.models.query_utils import DeferredAttribute
 from django.utils.translation import gettext_lazy as _
 
+from dynamic_form.utils.compression import expand_submitted_data, split_submitted_data
+
+# Instance attribute flagging data loaded from the database whose
+# compressed answers have not been merged yet
+PENDING_EXPANSION = "_submitted_data_pending_expansion"
+
+
+class SubmittedDataDescriptor(DeferredAttribute):
+    """Merge the compressed answers of a submission loaded from the
+    database into its data on first access."""
+
+    def __get__(self, instance: Any, cls: Any = None) -> Any:
+        if instance is None:
+            return self
+        data = super().__get__(instance, cls)
+        if instance.__dict__.pop(PENDING_EXPANSION, False):
+            data = expand_submitted_data(data, instance.compressed_data)
+            instance.__dict__[self.field.attname] = data
+        return data
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        instance.__dict__[self.field.attname] = value
+        instance.__dict__.pop(PENDING_EXPANSION, None)
+
+
+class SubmittedDataField(JSONField):
+    """A JSONField storing large text answers in the `compressed_data`
+    column of the model when submission compression is enabled (see
+    `split_submitted_data`).
+
+    The model instance always holds the complete data; only the stored
+    JSON is reduced.
+
+    """
+
+    descriptor_class = SubmittedDataDescriptor
+
+    def pre_save(self, model_instance: Model, add: bool) -> Any:
+        stored, blob = split_submitted_data(
+            getattr(model_instance, self.attname), form_id=model_instance.form_id
+        )
+        model_instance.compressed_data = blob
+        return stored
+
+
+class FormSubmissionQuerySet(QuerySet):
+    """QuerySet of FormSubmission uncounting the deleted submissions from
+    the submission counters of their forms.
+
+    Deletions are counted here rather than by a `post_delete` receiver, so
+    that the package itself connects no deletion receiver and Django can
+    delete submissions without loading them.
+
+    """
+
+    def delete(self) -> Tuple[int, Dict[str, int]]:
+        from dynamic_form.utils.counters import record_deletions
+
+        with transaction.atomic(using=self.db, savepoint=False):
+            counts = list(
+                self.order_by()
+                .values("form_id")
+                .annotate(count=Count("pk"))
+                .values_list("form_id", "count")
+            )
+            result = super().delete()
+            for form_id, count in counts:
+                record_deletions(form_id, count)
+        return result
+
+    delete.alters_data = True
+    delete.queryset_only = True
+
 
 class FormSubmission(Model):
     """Records a user's submission of data to a dynamic form.
@@ -21,7 +101,11 @@ class FormSubmission(Model):
     Attributes:
         user (User, optional): Authenticated user who made the submission
         form (DynamicForm): Reference to the submitted form definition
+        form_version (FormVersion, optional): Snapshot of the form schema the
+            submission was made against
         submitted_data (JSON): Structured data containing all field responses
+        compressed_data (bytes, optional): Compressed large text responses,
+            merged into `submitted_data` when it is accessed
         submitted_at (datetime): Timestamp of when the submission occurred
 
     """
@@ -42,11 +126,30 @@ class FormSubmission(Model):
         help_text=_("The form to which this submission belongs."),
         db_comment="A foreign key linking this submission to a dynamic form.",
     )
-    submitted_data = JSONField(
+    form_version = ForeignKey(
+        "FormVersion",
+        verbose_name=_("Form Version"),
+        on_delete=SET_NULL,
+        null=True,
+        blank=True,
+        related_name="submissions",
+        help_text=_("The form schema version the submission was made against."),
+        db_comment="A foreign key to the form schema snapshot of the submission.",
+    )
+    submitted_data = SubmittedDataField(
         _("Submission Data"),
         help_text=_("The data submitted by the user."),
         db_comment="Stores user responses in a JSON format.",
     )
+    # Must follow submitted_data, whose pre_save sets it
+    compressed_data = BinaryField(
+        _("Compressed Data"),
+        null=True,
+        blank=True,
+        editable=False,
+        help_text=_("Large text responses, compressed."),
+        db_comment="zlib/zstd-compressed JSON of the large text responses.",
+    )
     submitted_at = DateTimeField(
         _("Submission Time"),
         auto_now_add=True,
@@ -54,6 +157,8 @@ class FormSubmission(Model):
         db_comment="The date and time when this form was submitted.",
     )
 
+    objects = FormSubmissionQuerySet.as_manager()
+
     class Meta:
         verbose_name = _("Form Submission")
         verbose_name_plural = _("Form Submissions")
@@ -66,3 +171,31 @@ class FormSubmission(Model):
 
     def __str__(self):
         return f"Submission #{self.id} for Form #{self.form_id} at {self.submitted_at}"
+
+    @classmethod
+    def from_db(
+        cls, db: Optional[str], field_names: Iterable[str], values: Sequence[Any]
+    ) -> "FormSubmission":
+        instance = super().from_db(db, field_names, values)
+        if "submitted_data" in field_names:
+            instance.__dict__[PENDING_EXPANSION] = True
+        return instance
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        """Save the submission; the compressed answers are always written
+        along with the submitted data."""
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "submitted_data" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "compressed_data"}
+        super().save(*args, **kwargs)
+
+    def delete(self, using: Any = None, keep_parents: bool = False):
+        """Delete the submission and uncount it from its form."""
+        from dynamic_form.utils.counters import record_deletions
+
+        using = using or router.db_for_write(self.__class__, instance=self)
+        with transaction.atomic(using=using, savepoint=False):
+            result = super().delete(using, keep_parents)
+            if result[0]:
+                record_deletions(self.form_id)
+        return result
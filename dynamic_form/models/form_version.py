@@ -0,0 +1,68 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import (
+    CASCADE,
+    CharField,
+    DateTimeField,
+    ForeignKey,
+    JSONField,
+    Model,
+    UniqueConstraint,
+)
+from django.utils.translation import gettext_lazy as _
+
+
+class FormVersion(Model):
+    """An immutable snapshot of the schema of a DynamicForm.
+
+    A version is recorded the first time a submission is made against a
+    given set of field definitions, identified by their content hash.
+    Submissions reference the version they were made against, so they are
+    rendered with the fields they were validated with, from a single cached
+    blob, even after the form changes.
+
+    Attributes:
+        form (DynamicForm): The form the snapshot belongs to
+        schema_hash (str): Content hash of the field definitions
+        schema (JSON): The form as serialized by the API, with its fields
+        created_at (datetime): Timestamp when the version was recorded
+
+    """
+
+    form = ForeignKey(
+        "DynamicForm",
+        verbose_name=_("Form"),
+        on_delete=CASCADE,
+        related_name="versions",
+        help_text=_("The form this version is a snapshot of."),
+        db_comment="A foreign key linking this version to its dynamic form.",
+    )
+    schema_hash = CharField(
+        _("Schema Hash"),
+        max_length=64,
+        help_text=_("Content hash of the field definitions."),
+        db_comment="SHA-256 of the field definitions, unique per form.",
+    )
+    schema = JSONField(
+        _("Schema"),
+        encoder=DjangoJSONEncoder,
+        help_text=_("The serialized form and fields at the time of the version."),
+        db_comment="Frozen API representation of the form and its fields.",
+    )
+    created_at = DateTimeField(
+        _("Creation Date"),
+        auto_now_add=True,
+        help_text=_("Timestamp when the version was recorded."),
+        db_comment="The date and time when the version was recorded.",
+    )
+
+    class Meta:
+        verbose_name = _("Form Version")
+        verbose_name_plural = _("Form Versions")
+        db_table = "form_versions"
+        ordering = ["-created_at"]
+        constraints = [
+            UniqueConstraint(fields=["form", "schema_hash"], name="unique_form_version")
+        ]
+
+    def __str__(self):
+        return f"Version {self.schema_hash[:12]} of Form #{self.form_id}"
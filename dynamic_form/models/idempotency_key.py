@@ -0,0 +1,92 @@
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import (
+    CASCADE,
+    CharField,
+    DateTimeField,
+    ForeignKey,
+    JSONField,
+    Model,
+    PositiveSmallIntegerField,
+    UniqueConstraint,
+)
+from django.utils.translation import gettext_lazy as _
+
+
+class IdempotencyKey(Model):
+    """Records the outcome of a request sent with an `Idempotency-Key`
+    header, so that retries of the same request are answered with the
+    original response instead of creating duplicate submissions.
+
+    A key is claimed (with an empty response) in the transaction that
+    processes the request, so it is never left in progress by a crash; the
+    unique constraint keeps concurrent retries from processing it twice.
+    Keys expire after `DYNAMIC_FORM_IDEMPOTENCY_KEY_TTL` seconds and are
+    removed by the `dynamic_form_purge_idempotency_keys` command.
+
+    Attributes:
+        user (User): User who sent the request; keys are scoped per user
+        key (str): Value of the Idempotency-Key header
+        request_fingerprint (str): Hash of the endpoint and request body
+        status_code (int, optional): Status of the stored response, None while in progress
+        response_data (JSON, optional): Body of the stored response
+        created_at (datetime): Timestamp when the key was first used
+
+    """
+
+    user = ForeignKey(
+        settings.AUTH_USER_MODEL,
+        verbose_name=_("User"),
+        on_delete=CASCADE,
+        help_text=_("The user who sent the request."),
+        db_comment="The user the idempotency key belongs to.",
+    )
+    key = CharField(
+        _("Key"),
+        max_length=255,
+        help_text=_("The value of the Idempotency-Key request header."),
+        db_comment="Client-generated key identifying a request and its retries.",
+    )
+    request_fingerprint = CharField(
+        _("Request Fingerprint"),
+        max_length=64,
+        help_text=_("Hash of the endpoint and body of the original request."),
+        db_comment="SHA-256 of the request path and body, to detect reused keys.",
+    )
+    status_code = PositiveSmallIntegerField(
+        _("Status Code"),
+        null=True,
+        blank=True,
+        help_text=_("HTTP status of the stored response; empty while in progress."),
+        db_comment="Status code of the original response, NULL while processing.",
+    )
+    response_data = JSONField(
+        _("Response Data"),
+        null=True,
+        blank=True,
+        encoder=DjangoJSONEncoder,
+        help_text=_("Body of the original response, returned to retries."),
+        db_comment="Serialized body of the original response.",
+    )
+    created_at = DateTimeField(
+        _("Creation Date"),
+        auto_now_add=True,
+        db_index=True,
+        help_text=_("Timestamp when the key was first used."),
+        db_comment="The date and time when the key was claimed; drives expiry.",
+    )
+
+    class Meta:
+        verbose_name = _("Idempotency Key")
+        verbose_name_plural = _("Idempotency Keys")
+        db_table = "idempotency_keys"
+        constraints = [
+            UniqueConstraint(fields=["user", "key"], name="unique_idempotency_key")
+        ]
+
+    def __str__(self):
+        return f"Idempotency key '{self.key}' of user #{self.user_id}"
+
+    @property
+    def is_completed(self) -> bool:
+        return self.status_code is not None
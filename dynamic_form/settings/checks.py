@@ -1,16 +1,29 @@
-from typing import Any, List
+from typing import Any, List, Optional, Sequence
 
-from django.core.checks import Error, register
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.checks import CheckMessage, Error, Tags, Warning, register
+from django.db import DatabaseError, connections
 
 from dynamic_form.settings.conf import config
+from dynamic_form.utils.compression import available_codecs
 from dynamic_form.validators.config_validators import (
     validate_boolean_setting,
+    validate_cache_alias,
+    validate_choice_setting,
     validate_list_fields,
+    validate_optional_directory,
     validate_optional_path_setting,
     validate_optional_paths_setting,
+    validate_positive_integer_setting,
     validate_throttle_rate,
 )
 
+# Cache backends keeping their entries in the memory of a single process
+PROCESS_LOCAL_CACHES = (LocMemCache, DummyCache)
+
 
 @register()
 def check_dynamic_form_settings(app_configs: Any, **kwargs: Any) -> List[Error]:
@@ -97,6 +110,67 @@ def check_dynamic_form_settings(app_configs: Any, **kwargs: Any) -> List[Error]:
             config.user_serializer_fields, f"{config.prefix}API_USER_SERIALIZER_FIELDS"
         )
     )
+    errors.extend(
+        validate_optional_paths_setting(
+            config.get_setting(f"{config.prefix}API_RENDERER_CLASSES", None),
+            f"{config.prefix}API_RENDERER_CLASSES",
+        )
+    )
+
+    # Validate Cache settings
+    errors.extend(
+        validate_cache_alias(
+            config.get_setting(f"{config.prefix}CACHE_ALIAS", None),
+            f"{config.prefix}CACHE_ALIAS",
+        )
+    )
+    errors.extend(
+        validate_positive_integer_setting(
+            config.get_setting(f"{config.prefix}SCHEMA_CACHE_TIMEOUT", None),
+            f"{config.prefix}SCHEMA_CACHE_TIMEOUT",
+        )
+    )
+
+    # Validate Export settings
+    errors.extend(
+        validate_positive_integer_setting(
+            config.get_setting(f"{config.prefix}EXPORT_CHUNK_SIZE", None),
+            f"{config.prefix}EXPORT_CHUNK_SIZE",
+        )
+    )
+
+    # Validate Archive settings
+    errors.extend(
+        validate_optional_directory(
+            config.get_setting(f"{config.prefix}ARCHIVE_DIR", None),
+            f"{config.prefix}ARCHIVE_DIR",
+        )
+    )
+
+    # Validate Idempotency settings
+    errors.extend(
+        validate_positive_integer_setting(
+            config.get_setting(f"{config.prefix}IDEMPOTENCY_KEY_TTL", None),
+            f"{config.prefix}IDEMPOTENCY_KEY_TTL",
+        )
+    )
+
+    # Validate Compression settings
+    errors.extend(
+        validate_choice_setting(
+            config.get_setting(f"{config.prefix}SUBMISSION_COMPRESSION", None),
+            f"{config.prefix}SUBMISSION_COMPRESSION",
+            available_codecs(),
+        )
+    )
+    errors.extend(
+        validate_positive_integer_setting(
+            config.get_setting(
+                f"{config.prefix}SUBMISSION_COMPRESSION_THRESHOLD", None
+            ),
+            f"{config.prefix}SUBMISSION_COMPRESSION_THRESHOLD",
+        )
+    )
 
     # Validate DynamicForm-specific API settings
     errors.extend(
@@ -427,6 +501,14 @@ def check_dynamic_form_settings(app_configs: Any, **kwargs: Any) -> List[Error]:
             f"{config.prefix}API_ADMIN_DYNAMIC_FIELD_ALLOW_DELETE",
         )
     )
+    errors.extend(
+        validate_positive_integer_setting(
+            config.get_setting(
+                f"{config.prefix}API_ADMIN_DYNAMIC_FIELD_BULK_MAX_ITEMS", None
+            ),
+            f"{config.prefix}API_ADMIN_DYNAMIC_FIELD_BULK_MAX_ITEMS",
+        )
+    )
 
     # Validate FieldType-specific API settings
     errors.extend(
@@ -637,6 +719,14 @@ def check_dynamic_form_settings(app_configs: Any, **kwargs: Any) -> List[Error]:
             f"{config.prefix}API_FORM_SUBMISSION_PARSER_CLASSES",
         )
     )
+    errors.extend(
+        validate_optional_paths_setting(
+            config.get_setting(
+                f"{config.prefix}API_FORM_SUBMISSION_RENDERER_CLASSES", None
+            ),
+            f"{config.prefix}API_FORM_SUBMISSION_RENDERER_CLASSES",
+        )
+    )
     errors.extend(
         validate_optional_path_setting(
             config.get_setting(
@@ -675,6 +765,28 @@ def check_dynamic_form_settings(app_configs: Any, **kwargs: Any) -> List[Error]:
             f"{config.prefix}API_FORM_SUBMISSION_ALLOW_DELETE",
         )
     )
+    errors.extend(
+        validate_boolean_setting(
+            config.api_form_submission_compact_representation,
+            f"{config.prefix}API_FORM_SUBMISSION_COMPACT_REPRESENTATION",
+        )
+    )
+    errors.extend(
+        validate_positive_integer_setting(
+            config.get_setting(
+                f"{config.prefix}API_FORM_SUBMISSION_BULK_BATCH_SIZE", None
+            ),
+            f"{config.prefix}API_FORM_SUBMISSION_BULK_BATCH_SIZE",
+        )
+    )
+    errors.extend(
+        validate_positive_integer_setting(
+            config.get_setting(
+                f"{config.prefix}API_FORM_SUBMISSION_BULK_MAX_ITEMS", None
+            ),
+            f"{config.prefix}API_FORM_SUBMISSION_BULK_MAX_ITEMS",
+        )
+    )
 
     # Validate AdminFormSubmission-specific API settings
     errors.extend(
@@ -729,6 +841,14 @@ def check_dynamic_form_settings(app_configs: Any, **kwargs: Any) -> List[Error]:
             f"{config.prefix}API_ADMIN_FORM_SUBMISSION_PARSER_CLASSES",
         )
     )
+    errors.extend(
+        validate_optional_paths_setting(
+            config.get_setting(
+                f"{config.prefix}API_ADMIN_FORM_SUBMISSION_RENDERER_CLASSES", None
+            ),
+            f"{config.prefix}API_ADMIN_FORM_SUBMISSION_RENDERER_CLASSES",
+        )
+    )
     errors.extend(
         validate_optional_path_setting(
             config.get_setting(
@@ -767,5 +887,119 @@ def check_dynamic_form_settings(app_configs: Any, **kwargs: Any) -> List[Error]:
             f"{config.prefix}API_ADMIN_FORM_SUBMISSION_ALLOW_DELETE",
         )
     )
+    errors.extend(
+        validate_boolean_setting(
+            config.api_admin_form_submission_compact_representation,
+            f"{config.prefix}API_ADMIN_FORM_SUBMISSION_COMPACT_REPRESENTATION",
+        )
+    )
 
     return errors
+
+
+def _has_unapplied_migrations(connection: Any) -> bool:
+    from django.db.migrations.executor import MigrationExecutor
+
+    executor = MigrationExecutor(connection)
+    plan = executor.migration_plan(executor.loader.graph.leaf_nodes())
+    return any(migration.app_label == "dynamic_form" for migration, _ in plan)
+
+
+@register(Tags.database)
+def check_submission_data_indexes(
+    app_configs: Any, databases: Optional[Sequence[str]] = None, **kwargs: Any
+) -> List[CheckMessage]:
+    """Warn about submitted data keys that the FormSubmission APIs are
+    configured to order, search or filter on (``submitted_data__<key>``
+    ordering, search and filterset fields) but that have no index.
+
+    Like other database checks, this only runs when databases are
+    requested (e.g. `manage.py check --database default` or `migrate`).
+    `migrate` runs it before applying migrations, so databases with
+    unapplied migrations of this app are skipped.
+
+    Parameters:
+    -----------
+    app_configs : Any
+        Passed by Django during checks (not used here).
+    databases : Optional[Sequence[str]]
+        Aliases of the databases to check.
+
+    Returns:
+    --------
+    List[CheckMessage]
+        A list of warnings, one per configured but un-indexed key.
+
+    """
+    from dynamic_form.utils.indexes import (
+        key_index_name,
+        supports_data_indexes,
+        unindexed_filter_keys,
+    )
+
+    warnings: List[CheckMessage] = []
+    for alias in databases or []:
+        connection = connections[alias]
+        if not supports_data_indexes(connection):
+            continue
+        try:
+            if _has_unapplied_migrations(connection):
+                continue
+            keys = unindexed_filter_keys(connection)
+        except DatabaseError:
+            continue
+        for key in keys:
+            warnings.append(
+                Warning(
+                    f"Form submissions are configured to be filtered on key "
+                    f"'{key}' of submitted_data, which has no index in "
+                    f"database '{alias}'; such queries scan every submission.",
+                    hint=(
+                        "Set 'is_indexed' on the fields named "
+                        f"'{key}' and run 'python manage.py dynamic_form_indexes'."
+                    ),
+                    id=f"dynamic_form.W001_{key_index_name(key)}",
+                )
+            )
+    return warnings
+
+
+@register(Tags.caches)
+def check_shared_cache(app_configs: Any, **kwargs: Any) -> List[CheckMessage]:
+    """Warn when the cache holding the schema version tokens is local to
+    each process.
+
+    A schema change bumps the version token in the configured cache only.
+    With a process-local backend, the other workers never see the bump and
+    keep validating submissions (and answering conditional requests) with
+    the schema they loaded before the change.
+
+    Parameters:
+    -----------
+    app_configs : Any
+        Passed by Django during checks (not used here).
+
+    Returns:
+    --------
+    List[CheckMessage]
+        A warning if the cache of `DYNAMIC_FORM_CACHE_ALIAS` is process-local.
+
+    """
+    alias = config.cache_alias
+    if alias not in getattr(settings, "CACHES", {}):
+        return []
+    if not isinstance(caches[alias], PROCESS_LOCAL_CACHES):
+        return []
+    return [
+        Warning(
+            f"The cache '{alias}' used by dynamic_form is local to each "
+            f"process; schema changes are only seen by the process that "
+            f"made them.",
+            hint=(
+                "Point DYNAMIC_FORM_CACHE_ALIAS to a cache shared between "
+                "workers (e.g. Redis or Memcached), unless the site runs in "
+                "a single process."
+            ),
+            id="dynamic_form.W002",
+        )
+    ]
@@ -10,6 +10,11 @@ from dynamic_form.constants.default_settings import (
     api_field_type_settings,
     api_form_submission_settings,
     api_settings,
+    archive_settings,
+    cache_settings,
+    compression_settings,
+    export_settings,
+    idempotency_settings,
     serializer_settings,
     throttle_settings,
 )
@@ -27,6 +32,20 @@ class DynamicFormConfig:
 
     prefix = "DYNAMIC_FORM_"
 
+    # Incremented on every attribute change so that values derived from the
+    # config (e.g. viewset configuration snapshots) know when to rebuild
+    version: int = 0
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name != "version":
+            super().__setattr__("version", self.version + 1)
+
+    def reload(self) -> None:
+        """Re-read every setting from Django settings, e.g. after
+        `override_settings` in tests."""
+        self.__init__()  # type: ignore[misc]
+
     def __init__(self) -> None:
         # Admin settings (global)
         self.admin_has_add_permission: bool = self.get_setting(
@@ -71,6 +90,48 @@ class DynamicFormConfig:
             f"{self.prefix}API_USER_SERIALIZER_FIELDS",
             serializer_settings.user_serializer_fields,
         )
+        self.api_renderer_classes: OptionalPaths = self.get_optional_paths(
+            f"{self.prefix}API_RENDERER_CLASSES",
+            api_settings.renderer_classes,
+        )
+
+        # Cache settings
+        self.cache_alias: str = self.get_setting(
+            f"{self.prefix}CACHE_ALIAS",
+            cache_settings.cache_alias,
+        )
+        self.schema_cache_timeout: Optional[int] = self.get_setting(
+            f"{self.prefix}SCHEMA_CACHE_TIMEOUT",
+            cache_settings.schema_cache_timeout,
+        )
+
+        # Export settings
+        self.export_chunk_size: int = self.get_setting(
+            f"{self.prefix}EXPORT_CHUNK_SIZE",
+            export_settings.export_chunk_size,
+        )
+
+        # Archive settings
+        self.archive_dir: Optional[str] = self.get_setting(
+            f"{self.prefix}ARCHIVE_DIR",
+            archive_settings.archive_dir,
+        )
+
+        # Idempotency settings
+        self.idempotency_key_ttl: int = self.get_setting(
+            f"{self.prefix}IDEMPOTENCY_KEY_TTL",
+            idempotency_settings.idempotency_key_ttl,
+        )
+
+        # Compression settings
+        self.submission_compression: Optional[str] = self.get_setting(
+            f"{self.prefix}SUBMISSION_COMPRESSION",
+            compression_settings.submission_compression,
+        )
+        self.submission_compression_threshold: int = self.get_setting(
+            f"{self.prefix}SUBMISSION_COMPRESSION_THRESHOLD",
+            compression_settings.submission_compression_threshold,
+        )
 
         # DynamicForm-specific API settings
         self.api_dynamic_form_serializer_class: OptionalPaths = self.get_optional_paths(
@@ -297,6 +358,10 @@ class DynamicFormConfig:
             f"{self.prefix}API_ADMIN_DYNAMIC_FIELD_ALLOW_DELETE",
             api_dynamic_field_settings.admin_allow_delete,
         )
+        self.api_admin_dynamic_field_bulk_max_items: Optional[int] = self.get_setting(
+            f"{self.prefix}API_ADMIN_DYNAMIC_FIELD_BULK_MAX_ITEMS",
+            api_dynamic_field_settings.admin_bulk_max_items,
+        )
 
         # FieldType-specific API settings
         self.api_field_type_serializer_class: OptionalPaths = self.get_optional_paths(
@@ -432,7 +497,7 @@ class DynamicFormConfig:
         self.api_form_submission_pagination_class: OptionalPaths = (
             self.get_optional_paths(
                 f"{self.prefix}API_FORM_SUBMISSION_PAGINATION_CLASS",
-                api_settings.pagination_class,
+                api_form_submission_settings.pagination_class,
             )
         )
         self.api_form_submission_extra_permission_class: OptionalPaths = (
@@ -447,6 +512,12 @@ class DynamicFormConfig:
                 api_settings.parser_classes,
             )
         )
+        self.api_form_submission_renderer_classes: OptionalPaths = (
+            self.get_optional_paths(
+                f"{self.prefix}API_FORM_SUBMISSION_RENDERER_CLASSES",
+                api_settings.renderer_classes,
+            )
+        )
         self.api_form_submission_filterset_class: OptionalPaths = (
             self.get_optional_paths(
                 f"{self.prefix}API_FORM_SUBMISSION_FILTERSET_CLASS",
@@ -473,6 +544,18 @@ class DynamicFormConfig:
             f"{self.prefix}API_FORM_SUBMISSION_ALLOW_DELETE",
             api_form_submission_settings.allow_delete,
         )
+        self.api_form_submission_compact_representation: bool = self.get_setting(
+            f"{self.prefix}API_FORM_SUBMISSION_COMPACT_REPRESENTATION",
+            api_form_submission_settings.compact_representation,
+        )
+        self.api_form_submission_bulk_batch_size: Optional[int] = self.get_setting(
+            f"{self.prefix}API_FORM_SUBMISSION_BULK_BATCH_SIZE",
+            api_form_submission_settings.bulk_batch_size,
+        )
+        self.api_form_submission_bulk_max_items: Optional[int] = self.get_setting(
+            f"{self.prefix}API_FORM_SUBMISSION_BULK_MAX_ITEMS",
+            api_form_submission_settings.bulk_max_items,
+        )
 
         # AdminFormSubmission-specific API settings
         self.api_admin_form_submission_serializer_class: OptionalPaths = (
@@ -498,7 +581,7 @@ class DynamicFormConfig:
         self.api_admin_form_submission_pagination_class: OptionalPaths = (
             self.get_optional_paths(
                 f"{self.prefix}API_ADMIN_FORM_SUBMISSION_PAGINATION_CLASS",
-                api_settings.pagination_class,
+                api_form_submission_settings.pagination_class,
             )
         )
         self.api_admin_form_submission_extra_permission_class: OptionalPaths = (
@@ -513,6 +596,12 @@ class DynamicFormConfig:
                 api_settings.parser_classes,
             )
         )
+        self.api_admin_form_submission_renderer_classes: OptionalPaths = (
+            self.get_optional_paths(
+                f"{self.prefix}API_ADMIN_FORM_SUBMISSION_RENDERER_CLASSES",
+                api_settings.renderer_classes,
+            )
+        )
         self.api_admin_form_submission_filterset_class: OptionalPaths = (
             self.get_optional_paths(
                 f"{self.prefix}API_ADMIN_FORM_SUBMISSION_FILTERSET_CLASS",
@@ -539,6 +628,10 @@ class DynamicFormConfig:
             f"{self.prefix}API_ADMIN_FORM_SUBMISSION_ALLOW_DELETE",
             api_form_submission_settings.admin_allow_delete,
         )
+        self.api_admin_form_submission_compact_representation: bool = self.get_setting(
+            f"{self.prefix}API_ADMIN_FORM_SUBMISSION_COMPACT_REPRESENTATION",
+            api_form_submission_settings.admin_compact_representation,
+        )
 
     def get_setting(self, setting_name: str, default_value: Any) -> Any:
         """Retrieve a setting from Django settings with a default fallback.
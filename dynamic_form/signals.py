@@ -0,0 +1,56 @@
+from typing import Any
+
+from django.core.signals import setting_changed
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from dynamic_form.models import DynamicField, DynamicForm, FieldType, FormSubmission
+from dynamic_form.settings.conf import config
+from dynamic_form.utils.counters import record_submissions
+from dynamic_form.utils.form_schema import (
+    invalidate_field_types,
+    invalidate_form_schema,
+)
+
+
+@receiver([post_save, post_delete], sender=DynamicForm)
+def invalidate_schema_on_form_change(
+    sender: Any, instance: DynamicForm, **kwargs: Any
+) -> None:
+    """Invalidate the cached schema of a form when the form itself changes."""
+    invalidate_form_schema(instance.pk)
+
+
+@receiver([post_save, post_delete], sender=DynamicField)
+def invalidate_schema_on_field_change(
+    sender: Any, instance: DynamicField, **kwargs: Any
+) -> None:
+    """Invalidate the cached schema of the parent form when one of its fields
+    changes."""
+    invalidate_form_schema(instance.form_id)
+
+
+@receiver([post_save, post_delete], sender=FieldType)
+def invalidate_schema_on_field_type_change(
+    sender: Any, instance: FieldType, **kwargs: Any
+) -> None:
+    """Invalidate every cached form schema when a field type changes."""
+    invalidate_field_types()
+
+
+@receiver(post_save, sender=FormSubmission)
+def count_created_submission(
+    sender: Any, instance: FormSubmission, created: bool, **kwargs: Any
+) -> None:
+    """Increment the submission counters of the form of a new submission."""
+    if created and not kwargs.get("raw"):
+        record_submissions(instance.form_id, submitted_at=instance.submitted_at)
+
+
+@receiver(setting_changed)
+def reload_config_on_setting_change(sender: Any, setting: str, **kwargs: Any) -> None:
+    """Reload the package config when one of its settings is overridden
+    (e.g. with `override_settings`), which also invalidates the viewset
+    configuration snapshots."""
+    if setting.startswith(config.prefix):
+        config.reload()
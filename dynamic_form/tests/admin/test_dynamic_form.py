@@ -2,7 +2,9 @@ import sys
 
 import pytest
 from django.contrib import admin
+from django.contrib.messages.storage.fallback import FallbackStorage
 from django.http import HttpRequest
+from django.test import RequestFactory
 
 from dynamic_form.admin import DynamicFormAdmin
 from dynamic_form.models import DynamicForm
@@ -141,7 +143,12 @@ class TestDynamicFormAdmin:
         --------
             readonly_fields includes expected fields.
         """
-        expected_fields = {"created_at", "updated_at"}
+        expected_fields = {
+            "created_at",
+            "updated_at",
+            "submission_count",
+            "last_submitted_at",
+        }
         assert isinstance(dynamic_form_admin.readonly_fields, (tuple, list))
         assert set(dynamic_form_admin.readonly_fields) == expected_fields
 
@@ -159,3 +166,109 @@ class TestDynamicFormAdmin:
         expected_links = {"id", "name"}
         assert isinstance(dynamic_form_admin.list_display_links, (tuple, list))
         assert set(dynamic_form_admin.list_display_links) == expected_links
+
+    def test_field_count(
+        self,
+        dynamic_form_admin: DynamicFormAdmin,
+        mock_request: HttpRequest,
+        dynamic_field,
+    ) -> None:
+        """
+        Test that field_count reads the number of fields annotated on the queryset.
+
+        Args:
+            dynamic_form_admin (DynamicFormAdmin): The admin class instance being tested.
+            mock_request (HttpRequest): A mock request object.
+            dynamic_field (DynamicField): A field attached to the form.
+
+        Asserts:
+        --------
+            field_count returns the number of fields of each form.
+        """
+        DynamicForm.objects.create(name="Empty")
+        counts = {
+            form.name: dynamic_form_admin.field_count(form)
+            for form in dynamic_form_admin.get_queryset(mock_request)
+        }
+        assert counts == {dynamic_field.form.name: 1, "Empty": 0}
+
+    def test_export_submissions_action(
+        self,
+        dynamic_form_admin: DynamicFormAdmin,
+        mock_request,
+        form_submission,
+        dynamic_field,
+    ) -> None:
+        """
+        Test that the export actions stream the submissions of a single form.
+
+        Args:
+            dynamic_form_admin (DynamicFormAdmin): The admin class instance being tested.
+            mock_request: A request with messages support.
+            form_submission (FormSubmission): A submission of the form.
+            dynamic_field (DynamicField): A field attached to the form.
+
+        Asserts:
+        --------
+            A single selected form is exported; several forms are rejected.
+        """
+        queryset = DynamicForm.objects.filter(pk=form_submission.form_id)
+        response = dynamic_form_admin.export_submissions_csv(mock_request, queryset)
+        lines = b"".join(response.streaming_content).decode().splitlines()
+
+        assert response["Content-Type"] == "text/csv"
+        assert lines[0] == "id,submitted_at,user_id,email"
+        assert lines[1].endswith(",test@example.com")
+
+        response = dynamic_form_admin.export_submissions_ndjson(mock_request, queryset)
+        assert response["Content-Type"] == "application/x-ndjson"
+
+        DynamicForm.objects.create(name="Other Form")
+        assert (
+            dynamic_form_admin.export_submissions_csv(
+                mock_request, DynamicForm.objects.all()
+            )
+            is None
+        )
+
+    def test_rewrite_submission_data_actions(
+        self,
+        dynamic_form_admin: DynamicFormAdmin,
+        form_submission,
+    ) -> None:
+        """
+        Test that the submission data actions apply the operation given in the
+        action bar.
+
+        Args:
+            dynamic_form_admin (DynamicFormAdmin): The admin class instance being tested.
+            form_submission (FormSubmission): A submission of the form.
+
+        Asserts:
+        --------
+            Keys are renamed and values mapped; invalid parameters are rejected.
+        """
+        queryset = DynamicForm.objects.filter(pk=form_submission.form_id)
+
+        def run(action, **data):
+            request = RequestFactory().post("/", data)
+            setattr(request, "session", "session")
+            setattr(request, "_messages", FallbackStorage(request))
+            getattr(dynamic_form_admin, action)(request, queryset)
+            return [str(message) for message in request._messages]
+
+        assert run("rename_submission_key", data_key="email", new_key="mail") == [
+            "Rewrote 1 submission(s) of 1 form(s)."
+        ]
+        run(
+            "map_submission_values",
+            data_key="mail",
+            value_map='{"test@example.com": "x"}',
+        )
+        form_submission.refresh_from_db()
+        assert form_submission.submitted_data == {"mail": "x"}
+
+        assert run("drop_submission_key") == ["Enter the key to change."]
+        assert run("map_submission_values", data_key="mail", value_map="[]") == [
+            "The value map must be a JSON object."
+        ]
@@ -0,0 +1,267 @@
+import sys
+from typing import Dict, List
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from dynamic_form.models import DynamicField, DynamicForm, FieldType, FormSubmission
+from dynamic_form.settings.conf import config
+from dynamic_form.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+from dynamic_form.utils.form_schema import get_compiled_form
+
+pytestmark = [
+    pytest.mark.api,
+    pytest.mark.api_filters,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+@pytest.mark.django_db
+class TestSubmittedDataFilterBackend:
+    """
+    Tests for filtering submissions on their submitted data.
+    """
+
+    url = reverse("form-submission-list")
+
+    @pytest.fixture
+    def form(self, api_client: APIClient, user: User) -> DynamicForm:
+        api_client.force_authenticate(user=user)
+        form = DynamicForm.objects.create(name="Survey")
+        fields = [
+            ("country", "text", None),
+            ("age", "number", None),
+            ("member", "boolean", None),
+            ("joined", "date", None),
+            ("plan", "dropdown", [1, 2]),
+            ("tags", "checkbox", ["a", "b"]),
+        ]
+        for order, (name, type_name, choices) in enumerate(fields):
+            DynamicField.objects.create(
+                form=form,
+                name=name,
+                field_type=FieldType.objects.get(name=type_name),
+                choices=choices,
+                order=order,
+            )
+        rows = [
+            ("DE", 30, True, "2024-01-10", 1, ["a"]),
+            ("FR", 45, False, "2024-06-01", 2, ["b"]),
+            ("Germany", 18, True, "2025-02-01", 2, ["a", "b"]),
+        ]
+        FormSubmission.objects.bulk_create(
+            FormSubmission(
+                form=form,
+                user=user,
+                submitted_data=dict(zip([name for name, _, _ in fields], row)),
+            )
+            for row in rows
+        )
+        other = DynamicForm.objects.create(name="Other")
+        DynamicField.objects.create(
+            form=other, name="country", field_type=FieldType.objects.get(name="text")
+        )
+        FormSubmission.objects.create(
+            form=other, user=user, submitted_data={"country": "DE"}
+        )
+        return form
+
+    def teardown_method(self) -> None:
+        """
+        Clear the cache so that throttle history does not leak into other tests.
+        """
+        cache.clear()
+
+    def countries(self, api_client: APIClient, params: Dict[str, str]) -> List[str]:
+        response = api_client.get(self.url, {"compact": "true", **params})
+        assert response.status_code == 200, response.data
+        return sorted(item["submitted_data"]["country"] for item in response.data["results"])
+
+    @pytest.mark.parametrize(
+        "params, expected",
+        [
+            ({"submitted_data__country": "DE"}, ["DE"]),
+            ({"submitted_data__country__in": "DE,FR"}, ["DE", "FR"]),
+            ({"submitted_data__country__contains": "de"}, ["DE"]),
+            ({"submitted_data__age": "30"}, ["DE"]),
+            ({"submitted_data__age__range": "20,50"}, ["DE", "FR"]),
+            ({"submitted_data__age__range": ",29.5"}, ["Germany"]),
+            ({"submitted_data__member": "true"}, ["DE", "Germany"]),
+            ({"submitted_data__joined__range": "2024-03-01,"}, ["FR", "Germany"]),
+            ({"submitted_data__plan": "2"}, ["FR", "Germany"]),
+            (
+                {"submitted_data__plan__in": "2", "submitted_data__member": "no"},
+                ["FR"],
+            ),
+        ],
+    )
+    def test_filters(
+        self,
+        api_client: APIClient,
+        form: DynamicForm,
+        params: Dict[str, str],
+        expected: List[str],
+    ) -> None:
+        """
+        Test each supported predicate.
+
+        Args:
+            api_client (APIClient): The API client used to simulate requests.
+            form (DynamicForm): The form whose submissions are filtered.
+            params (Dict[str, str]): The filter query parameters.
+            expected (List[str]): Countries of the matching submissions.
+
+        Asserts:
+            Only the matching submissions of the form are returned.
+        """
+        assert self.countries(api_client, {"form_id": form.pk, **params}) == expected
+
+    @pytest.mark.parametrize(
+        "params, error_key",
+        [
+            ({"submitted_data__country": "DE"}, "form_id"),
+            ({"form_id": "999", "submitted_data__country": "DE"}, "form_id"),
+            ({"submitted_data__missing": "x"}, "submitted_data__missing"),
+            ({"submitted_data__age": "old"}, "submitted_data__age"),
+            ({"submitted_data__age": "inf"}, "submitted_data__age"),
+            ({"submitted_data__age": "nan"}, "submitted_data__age"),
+            ({"submitted_data__age": "1e400"}, "submitted_data__age"),
+            ({"submitted_data__age__in": "30,-inf"}, "submitted_data__age__in"),
+            ({"submitted_data__age__range": "NaN,50"}, "submitted_data__age__range"),
+            ({"submitted_data__member": "maybe"}, "submitted_data__member"),
+            ({"submitted_data__joined": "yesterday"}, "submitted_data__joined"),
+            ({"submitted_data__country__range": "A,B"}, "submitted_data__country__range"),
+            ({"submitted_data__age__range": "18"}, "submitted_data__age__range"),
+            ({"submitted_data__age__in": ","}, "submitted_data__age__in"),
+            ({"submitted_data__age__contains": "1"}, "submitted_data__age__contains"),
+            ({"submitted_data__tags__contains": "a"}, "submitted_data__tags__contains"),
+        ],
+    )
+    def test_invalid_filters(
+        self,
+        api_client: APIClient,
+        form: DynamicForm,
+        params: Dict[str, str],
+        error_key: str,
+    ) -> None:
+        """
+        Test that invalid predicates are rejected with a 400 response.
+
+        Args:
+            api_client (APIClient): The API client used to simulate requests.
+            form (DynamicForm): The form whose submissions are filtered.
+            params (Dict[str, str]): The filter query parameters.
+            error_key (str): The parameter the error is reported on.
+
+        Asserts:
+            The response is 400 with an error on the offending parameter.
+        """
+        if "form_id" not in params and error_key != "form_id":
+            params = {"form_id": form.pk, **params}
+
+        response = api_client.get(self.url, params)
+
+        assert response.status_code == 400
+        assert error_key in response.data
+
+    def test_field_names_like_lookups(
+        self, api_client: APIClient, form: DynamicForm
+    ) -> None:
+        """
+        Test fields named like ORM lookups or containing ``__``.
+
+        Args:
+            api_client (APIClient): The API client used to simulate requests.
+            form (DynamicForm): The form whose submissions are filtered.
+
+        Asserts:
+            Each name is matched as a single key of the submitted data, and
+            lookup suffixes are only split off names of the form.
+        """
+        for name, type_name in (("in", "number"), ("has_key", "text"), ("a__b", "text")):
+            DynamicField.objects.create(
+                form=form, name=name, field_type=FieldType.objects.get(name=type_name)
+            )
+        for submission, values in zip(
+            FormSubmission.objects.filter(form=form).order_by("pk"),
+            [(1, "x", "y"), (2, "z", "y"), (3, "x", "w")],
+        ):
+            submission.submitted_data.update(zip(("in", "has_key", "a__b"), values))
+            submission.save()
+
+        def countries(**params: str) -> List[str]:
+            return self.countries(api_client, {"form_id": form.pk, **params})
+
+        assert countries(submitted_data__in="2") == ["FR"]
+        assert countries(submitted_data__in__in="1,3") == ["DE", "Germany"]
+        assert countries(submitted_data__in__range="2,") == ["FR", "Germany"]
+        assert countries(submitted_data__has_key="x") == ["DE", "Germany"]
+        assert countries(submitted_data__a__b="y") == ["DE", "FR"]
+        assert countries(submitted_data__a__b__contains="W") == ["Germany"]
+
+    def test_single_query(
+        self, api_client: APIClient, form: DynamicForm, django_assert_num_queries
+    ) -> None:
+        """
+        Test that all predicates run in the one submission query.
+
+        Args:
+            api_client (APIClient): The API client used to simulate requests.
+            form (DynamicForm): The form whose submissions are filtered.
+            django_assert_num_queries: Pytest-django fixture asserting the query count.
+
+        Asserts:
+            A compact, filtered listing runs a single query once the schema is cached.
+        """
+        get_compiled_form(form.pk)
+        params = {
+            "form_id": form.pk,
+            "compact": "true",
+            "submitted_data__country__in": "DE,Germany",
+            "submitted_data__age__range": "18,40",
+            "submitted_data__member": "true",
+        }
+
+        with django_assert_num_queries(1):
+            response = api_client.get(self.url, params)
+
+        assert len(response.data["results"]) == 2
+
+    @pytest.mark.parametrize(
+        "params, status_code",
+        [
+            ({"submitted_data__country": "DE"}, 400),
+            ({"submitted_data__plan": "1"}, 200),
+            ({"submitted_data__age": "30"}, 200),
+        ],
+    )
+    def test_compressible_text_fields(
+        self,
+        api_client: APIClient,
+        form: DynamicForm,
+        monkeypatch,
+        params: Dict[str, str],
+        status_code: int,
+    ) -> None:
+        """
+        Test that text filters are rejected on fields whose answers may be
+        compressed.
+
+        Args:
+            api_client (APIClient): The API client used to simulate requests.
+            form (DynamicForm): The form whose submissions are filtered.
+            monkeypatch (MonkeyPatch): Used to enable compression.
+            params (Dict[str, str]): The filter query parameters.
+            status_code (int): The expected status code.
+
+        Asserts:
+            Free text fields are refused; short choices and numbers are not.
+        """
+        monkeypatch.setattr(config, "submission_compression", "zlib")
+
+        response = api_client.get(self.url, {"form_id": form.pk, **params})
+
+        assert response.status_code == status_code
@@ -0,0 +1,95 @@
+import sys
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from dynamic_form.api.paginations import SubmissionCursorPagination
+from dynamic_form.models import DynamicForm, FormSubmission
+from dynamic_form.settings.conf import config
+from dynamic_form.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+from dynamic_form.utils.form_schema import get_compiled_form
+
+pytestmark = [
+    pytest.mark.api,
+    pytest.mark.api_paginations,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+@pytest.mark.django_db
+class TestSubmissionCursorPagination:
+    """
+    Test suite for the SubmissionCursorPagination class.
+    """
+
+    def setup_method(self) -> None:
+        """
+        Initialize APIRequestFactory for each test.
+        """
+        self.factory = APIRequestFactory()
+
+    def teardown_method(self) -> None:
+        """
+        Clear the cache so that throttle history does not leak into other tests.
+        """
+        cache.clear()
+
+    @pytest.mark.parametrize(
+        "limit, expected",
+        [("5", 5), (None, 10), ("0", 10), ("1000", 100), ("invalid", 10)],
+    )
+    def test_get_page_size(self, limit, expected) -> None:
+        """
+        Test that the page size is read from `limit` and kept within bounds.
+
+        Asserts:
+        -------
+            - Valid limits are used, capped at the maximum page size.
+            - Missing, too small or invalid limits fall back to the default page size.
+        """
+        params = {"limit": limit} if limit is not None else {}
+        request = Request(self.factory.get("/some-url", params))
+        assert SubmissionCursorPagination().get_page_size(request) == expected
+
+    def test_pages_through_submissions_without_count(
+        self,
+        api_client: APIClient,
+        user: User,
+        dynamic_form: DynamicForm,
+        django_assert_num_queries,
+    ) -> None:
+        """
+        Test that the submission list is paginated with cursors and no COUNT query.
+
+        Asserts:
+        -------
+            - Each page runs a single query and pages do not overlap.
+            - Following the `next` links returns every submission, newest first.
+        """
+        api_client.force_authenticate(user=user)
+        config.api_form_submission_allow_list = True
+        FormSubmission.objects.bulk_create(
+            FormSubmission(user=user, form=dynamic_form, submitted_data={"n": index})
+            for index in range(5)
+        )
+        get_compiled_form(dynamic_form.pk)  # warm the schema cache
+
+        url = f"{reverse('form-submission-list')}?limit=2&compact=true"
+        seen = []
+        while url:
+            with django_assert_num_queries(1):
+                response = api_client.get(url)
+            assert "count" not in response.data
+            seen.extend(item["id"] for item in response.data["results"])
+            url = response.data["next"]
+
+        expected = list(
+            FormSubmission.objects.order_by("-submitted_at", "-id").values_list(
+                "id", flat=True
+            )
+        )
+        assert seen == expected
@@ -0,0 +1,73 @@
+import io
+import sys
+
+import pytest
+from rest_framework.exceptions import ParseError
+
+from dynamic_form.api.parsers import ORJSONParser
+from dynamic_form.api.parsers import orjson_parser
+from dynamic_form.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+
+pytestmark = [
+    pytest.mark.api,
+    pytest.mark.api_parsers,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+class TestORJSONParser:
+    """
+    Test suite for the ORJSONParser class.
+    """
+
+    body = '{"email": "user@example.com", "name": "Zoë", "tags": [1, 2]}'
+    expected = {"email": "user@example.com", "name": "Zoë", "tags": [1, 2]}
+
+    def test_parse(self) -> None:
+        """
+        Test that a UTF-8 body is parsed into Python data.
+
+        Asserts:
+            The parsed data matches the document.
+        """
+        stream = io.BytesIO(self.body.encode("utf-8"))
+
+        assert ORJSONParser().parse(stream) == self.expected
+
+    def test_parse_error(self) -> None:
+        """
+        Test that malformed JSON raises a ParseError.
+
+        Asserts:
+            ParseError is raised for an invalid document.
+        """
+        with pytest.raises(ParseError):
+            ORJSONParser().parse(io.BytesIO(b'{"email": '))
+
+    def test_non_utf8_encoding(self) -> None:
+        """
+        Test that bodies in other encodings are decoded by the stdlib parser.
+
+        Asserts:
+            A latin-1 body is parsed correctly.
+        """
+        stream = io.BytesIO(self.body.encode("latin-1"))
+
+        data = ORJSONParser().parse(stream, parser_context={"encoding": "latin-1"})
+
+        assert data == self.expected
+
+    def test_fallback_without_orjson(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Test that the stdlib parser is used when orjson is not installed.
+
+        Args:
+            monkeypatch (pytest.MonkeyPatch): Fixture simulating the missing library.
+
+        Asserts:
+            The parsed data matches the document.
+        """
+        monkeypatch.setattr(orjson_parser, "orjson_installed", False)
+        stream = io.BytesIO(self.body.encode("utf-8"))
+
+        assert ORJSONParser().parse(stream) == self.expected
@@ -0,0 +1,149 @@
+import json
+import sys
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils.translation import gettext_lazy as _
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from dynamic_form.api.parsers import ORJSONParser
+from dynamic_form.api.renderers import ORJSONRenderer
+from dynamic_form.api.renderers import orjson_renderer
+from dynamic_form.api.views.form_submission import FormSubmissionViewSet
+from dynamic_form.models import DynamicField
+from dynamic_form.settings.conf import config
+from dynamic_form.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+
+pytestmark = [
+    pytest.mark.api,
+    pytest.mark.api_renderers,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+class TestORJSONRenderer:
+    """
+    Test suite for the ORJSONRenderer class.
+    """
+
+    data = {
+        "id": uuid.UUID(int=1),
+        "amount": Decimal("1.50"),
+        "label": _("Email"),
+        "submitted_at": datetime(2025, 3, 24, 17, 15, tzinfo=timezone.utc),
+        "values": [1, "two", None],
+        3: "non-string key",
+    }
+
+    def test_matches_json_renderer(self) -> None:
+        """
+        Test that the rendered document equals the stdlib rendering.
+
+        Asserts:
+            Both renderers produce the same JSON document.
+        """
+        rendered = ORJSONRenderer().render(self.data)
+
+        assert json.loads(rendered) == json.loads(JSONRenderer().render(self.data))
+        assert json.loads(rendered)["submitted_at"] == "2025-03-24T17:15:00Z"
+
+    def test_render_none(self) -> None:
+        """
+        Test that rendering None produces an empty body.
+
+        Asserts:
+            The rendered value is empty bytes.
+        """
+        assert ORJSONRenderer().render(None) == b""
+
+    @pytest.mark.parametrize("indent", [2, 4])
+    def test_indent(self, indent: int) -> None:
+        """
+        Test that requested indentation is honoured.
+
+        Args:
+            indent (int): The indentation requested through the media type.
+
+        Asserts:
+            Nested lines are indented by the requested number of spaces.
+        """
+        rendered = ORJSONRenderer().render(
+            {"a": 1}, f"application/json; indent={indent}"
+        )
+
+        assert rendered.decode().splitlines()[1] == " " * indent + '"a": 1'
+
+    def test_fallback_without_orjson(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Test that the stdlib renderer is used when orjson is not installed.
+
+        Args:
+            monkeypatch (pytest.MonkeyPatch): Fixture simulating the missing library.
+
+        Asserts:
+            The output is identical to JSONRenderer's.
+        """
+        monkeypatch.setattr(orjson_renderer, "orjson_installed", False)
+
+        assert ORJSONRenderer().render(self.data) == JSONRenderer().render(self.data)
+
+
+@pytest.mark.django_db
+class TestORJSONSettings:
+    """
+    Tests for plugging the orjson classes in through the settings.
+    """
+
+    def teardown_method(self) -> None:
+        """
+        Clear the cache so that throttle history does not leak into other tests.
+        """
+        cache.clear()
+
+    def test_submission_viewset_uses_configured_classes(
+        self, api_client: APIClient, user: User, dynamic_field: DynamicField
+    ) -> None:
+        """
+        Test that the submission endpoints render and parse with orjson when configured.
+
+        Args:
+            api_client (APIClient): The API client used to simulate requests.
+            user (User): The submitting user.
+            dynamic_field (DynamicField): The required field of the form.
+
+        Asserts:
+            The viewset snapshot holds the configured classes and requests succeed.
+        """
+        api_client.force_authenticate(user=user)
+        renderers = config.api_form_submission_renderer_classes
+        parsers = config.api_form_submission_parser_classes
+        config.api_form_submission_renderer_classes = [ORJSONRenderer]
+        config.api_form_submission_parser_classes = [ORJSONParser]
+        attrs = FormSubmissionViewSet.get_config_snapshot().attrs
+
+        response = api_client.post(
+            reverse("form-submission-list"),
+            {
+                "form_id": dynamic_field.form_id,
+                "submitted_data": {"email": "user@example.com"},
+            },
+            format="json",
+        )
+        listing = api_client.get(reverse("form-submission-list"))
+
+        config.api_form_submission_renderer_classes = renderers
+        config.api_form_submission_parser_classes = parsers
+
+        assert tuple(attrs["renderer_classes"]) == (ORJSONRenderer,)
+        assert tuple(attrs["parser_classes"]) == (ORJSONParser,)
+        assert response.status_code == 201, response.content
+        assert listing.status_code == 200
+        assert listing.json()["results"][0]["submitted_data"] == {
+            "email": "user@example.com"
+        }
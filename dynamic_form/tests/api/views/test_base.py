@@ -2,11 +2,14 @@ import sys
 from unittest.mock import Mock, patch
 
 import pytest
+from django.test import override_settings
 from rest_framework.permissions import IsAdminUser
 from rest_framework.serializers import Serializer
 from rest_framework.throttling import UserRateThrottle
 
+from dynamic_form.api.views import AdminFormSubmissionViewSet, FormSubmissionViewSet
 from dynamic_form.api.views.base import BaseViewSet
+from dynamic_form.settings.conf import config
 from dynamic_form.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
 
 pytestmark = [
@@ -197,3 +200,76 @@ class TestBaseViewSet:
         with pytest.raises(ValueError) as exc_info:
             base_viewset._normalize_throttle_classes(NotAThrottle)
         assert "Invalid throttle setting" in str(exc_info.value)
+
+
+class TestConfigSnapshot:
+    """
+    Tests for the per-class configuration snapshot of the viewsets.
+    """
+
+    def test_snapshot_is_built_once_per_class(self):
+        """
+        Test that instances share the snapshot until the config changes.
+
+        Asserts:
+            The same snapshot is reused, and a config change rebuilds it.
+        """
+        snapshot = FormSubmissionViewSet.get_config_snapshot()
+        FormSubmissionViewSet()
+
+        assert FormSubmissionViewSet.get_config_snapshot() is snapshot
+
+        config.api_form_submission_allow_delete = config.api_form_submission_allow_delete
+        assert FormSubmissionViewSet.get_config_snapshot() is not snapshot
+
+    def test_snapshot_disables_methods(self):
+        """
+        Test that `allow_*` settings are applied from the snapshot.
+
+        Asserts:
+            A disabled method is replaced by the method-not-allowed handler.
+        """
+        config.api_form_submission_allow_list = False
+        disabled_methods = FormSubmissionViewSet.get_config_snapshot().disabled_methods
+        viewset = FormSubmissionViewSet()
+        config.api_form_submission_allow_list = True
+
+        assert "LIST" in disabled_methods
+        assert viewset.list == viewset._method_not_allowed
+
+        viewset = FormSubmissionViewSet()
+        assert viewset.list != viewset._method_not_allowed
+
+    def test_admin_permission_class(self):
+        """
+        Test that admin viewsets use the admin permission class.
+
+        Asserts:
+            The first permission class is the configured admin permission class.
+        """
+        viewset = AdminFormSubmissionViewSet()
+        assert viewset.permission_classes[0] is IsAdminUser
+
+    def test_override_settings_reloads_config(self):
+        """
+        Test that `override_settings` reloads the config and the snapshots.
+
+        Asserts:
+            Overridden settings are applied and restored afterwards.
+        """
+        with override_settings(DYNAMIC_FORM_API_FORM_SUBMISSION_ORDERING_FIELDS=["id"]):
+            assert FormSubmissionViewSet().ordering_fields == ("id",)
+        assert FormSubmissionViewSet().ordering_fields == ("submitted_at",)
+
+    def test_reset_config_snapshot(self):
+        """
+        Test that the reset hook drops the snapshot of the class.
+
+        Asserts:
+            A new snapshot is built after the reset.
+        """
+        snapshot = FormSubmissionViewSet.get_config_snapshot()
+        FormSubmissionViewSet.reset_config_snapshot()
+
+        assert "_config_snapshot" not in FormSubmissionViewSet.__dict__
+        assert FormSubmissionViewSet.get_config_snapshot() is not snapshot
@@ -1,16 +1,26 @@
 import sys
+from types import SimpleNamespace
 
 import pytest
 from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework.test import APIClient
 
+from dynamic_form.api.serializers.field import (
+    DUPLICATE_NAME_MESSAGE,
+    DynamicFieldSerializer,
+)
 from dynamic_form.models import DynamicField, DynamicForm, FieldType
 from dynamic_form.settings.conf import config
 from dynamic_form.tests.constants import (
     PYTHON_VERSION,
     PYTHON_VERSION_REASON,
 )
+from dynamic_form.utils.field_order import ORDER_GAP
+from dynamic_form.utils.field_types import get_field_types
+from dynamic_form.utils.form_schema import get_compiled_form
 
 pytestmark = [
     pytest.mark.api,
@@ -477,3 +487,524 @@ class TestAdminDynamicFieldViewSet:
         assert (
             "Invalid Form ID" in response.data["form_pk"][0]
         ), "Unexpected error message."
+
+
+@pytest.mark.django_db
+class TestDynamicFieldWritePath:
+    """
+    Tests for the query-free validation of DynamicFieldSerializer.
+    """
+
+    def test_create_runs_no_validation_queries(
+        self,
+        api_client: APIClient,
+        dynamic_form: DynamicForm,
+        dynamic_field: DynamicField,
+        field_type: FieldType,
+        admin_user: User,
+    ) -> None:
+        """
+        Test that creating a field resolves the form once and reads neither
+        the field types nor the existing names.
+
+        Args:
+            api_client (APIClient): The API client used to simulate requests.
+            dynamic_form (DynamicForm): The form to add the field to.
+            dynamic_field (DynamicField): An existing field of the form.
+            field_type (FieldType): The field type of the new field.
+            admin_user (User): The admin user for authentication.
+
+        Asserts:
+            - The field is created with a single form lookup.
+            - A duplicate name is reported on ``name`` by the constraint.
+        """
+        api_client.force_authenticate(user=admin_user)
+        url = reverse("admin-form-field-list", kwargs={"form_pk": dynamic_form.pk})
+        # With an explicit order, the position of the last field is not read
+        payload = {"field_type_id": field_type.pk, "name": "phone", "order": 5}
+        get_field_types()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.post(url, payload, format="json")
+
+        assert response.status_code == 201, response.data
+        selects = [q["sql"] for q in queries if q["sql"].startswith("SELECT")]
+        assert not any("dynamic_form_fields" in sql for sql in selects)
+        assert not any("field_type" in sql.split("FROM")[1] for sql in selects)
+        assert sum("dynamic_forms" in sql for sql in selects) == 1
+
+        payload["name"] = dynamic_field.name
+        response = api_client.post(url, payload, format="json")
+        assert response.status_code == 400
+        assert response.data["name"] == [DUPLICATE_NAME_MESSAGE]
+
+    def test_create_appends_field(
+        self,
+        api_client: APIClient,
+        dynamic_form: DynamicForm,
+        dynamic_field: DynamicField,
+        field_type: FieldType,
+        admin_user: User,
+    ) -> None:
+        """
+        Test that a field created without an order is placed after the last
+        field of the form.
+
+        Args:
+            api_client (APIClient): The API client used to simulate requests.
+            dynamic_form (DynamicForm): The form to add the fields to.
+            dynamic_field (DynamicField): An existing field of the form.
+            field_type (FieldType): The field type of the new fields.
+            admin_user (User): The admin user for authentication.
+
+        Asserts:
+            The new field follows the last one by ORDER_GAP; an explicit order
+            is kept.
+        """
+        api_client.force_authenticate(user=admin_user)
+        url = reverse("admin-form-field-list", kwargs={"form_pk": dynamic_form.pk})
+        dynamic_field.order = 3000
+        dynamic_field.save(update_fields=["order"])
+
+        appended = api_client.post(
+            url, {"field_type_id": field_type.pk, "name": "phone"}, format="json"
+        )
+        placed = api_client.post(
+            url,
+            {"field_type_id": field_type.pk, "name": "fax", "order": 7},
+            format="json",
+        )
+
+        assert appended.status_code == 201, appended.data
+        assert appended.data["order"] == 3000 + ORDER_GAP
+        assert placed.data["order"] == 7
+
+    def test_update_duplicate_name(
+        self,
+        api_client: APIClient,
+        dynamic_form: DynamicForm,
+        dynamic_field: DynamicField,
+        field_type: FieldType,
+        admin_user: User,
+    ) -> None:
+        """
+        Test that renaming a field to a taken name is rejected, and that
+        keeping its own name is not.
+
+        Args:
+            api_client (APIClient): The API client used to simulate requests.
+            dynamic_form (DynamicForm): The form of the fields.
+            dynamic_field (DynamicField): The renamed field.
+            field_type (FieldType): The field type of the fields.
+            admin_user (User): The admin user for authentication.
+
+        Asserts:
+            - A taken name gives 400 with the duplicate name error.
+            - Unchanged names and unknown field types behave as before.
+        """
+        api_client.force_authenticate(user=admin_user)
+        DynamicField.objects.create(
+            form=dynamic_form, field_type=field_type, name="phone"
+        )
+        url = reverse(
+            "admin-form-field-detail",
+            kwargs={"form_pk": dynamic_form.pk, "pk": dynamic_field.pk},
+        )
+
+        response = api_client.patch(url, {"name": "phone"}, format="json")
+        assert response.status_code == 400
+        assert response.data["name"] == [DUPLICATE_NAME_MESSAGE]
+
+        response = api_client.patch(url, {"is_required": False}, format="json")
+        assert response.status_code == 200, response.data
+
+        response = api_client.patch(url, {"field_type_id": 999}, format="json")
+        assert response.status_code == 400
+        assert "field_type_id" in response.data
+
+    def test_serializer_resolves_form_without_context(
+        self, dynamic_form: DynamicForm, field_type: FieldType
+    ) -> None:
+        """
+        Test that the serializer resolves the form from the URL kwargs when
+        the view does not pass it.
+
+        Args:
+            dynamic_form (DynamicForm): The form of the URL.
+            field_type (FieldType): The field type of the new field.
+
+        Asserts:
+            - Valid, malformed and missing form IDs are handled as by the view.
+        """
+        data = {"field_type_id": field_type.pk, "name": "phone"}
+
+        def serializer(form_pk):
+            view = SimpleNamespace(kwargs={"form_pk": form_pk})
+            return DynamicFieldSerializer(data=data, context={"view": view})
+
+        valid = serializer(str(dynamic_form.pk))
+        assert valid.is_valid(), valid.errors
+        assert valid.validated_data["form"] == dynamic_form
+
+        for form_pk, key in (("x", "form_pk"), ("999", "form")):
+            invalid = serializer(form_pk)
+            assert not invalid.is_valid()
+            assert key in invalid.errors
+
+
+@pytest.mark.django_db
+class TestAdminDynamicFieldBatchEndpoints:
+    """
+    Tests for the bulk and reorder endpoints of the AdminDynamicFieldViewSet.
+    """
+
+    def teardown_method(self) -> None:
+        config.api_admin_dynamic_field_allow_create = True
+        config.api_admin_dynamic_field_allow_update = True
+        config.api_admin_dynamic_field_bulk_max_items = 500
+
+    def test_bulk_create_and_update(
+        self,
+        api_client: APIClient,
+        dynamic_form: DynamicForm,
+        dynamic_field: DynamicField,
+        field_type: FieldType,
+        admin_user: User,
+    ) -> None:
+        """
+        Test that the bulk endpoint creates and updates fields with a constant
+        number of queries.
+
+        Args:
+            api_client (APIClient): The API client used to simulate requests.
+            dynamic_form (DynamicForm): The form the fields belong to.
+            dynamic_field (DynamicField): An existing field to update.
+            field_type (FieldType): The field type of the fields.
+            admin_user (User): The admin user for authentication.
+
+        Asserts:
+            - The response lists the fields in request order.
+            - The query count does not grow with the number of fields.
+            - The compiled form schema reflects the batch.
+        """
+        api_client.force_authenticate(user=admin_user)
+        url = reverse("admin-form-field-list", kwargs={"form_pk": dynamic_form.pk})
+        get_field_types()  # Warm the field type registry
+
+        def payload(count):
+            return {
+                "fields": [
+                    {
+                        "id": dynamic_field.pk,
+                        "name": "email",
+                        "field_type_id": field_type.pk,
+                        "label": "E-mail",
+                    },
+                    *(
+                        {
+                            "name": f"field_{index}",
+                            "field_type_id": field_type.pk,
+                            "order": index,
+                        }
+                        for index in range(count)
+                    ),
+                ]
+            }
+
+        with CaptureQueriesContext(connection) as small:
+            response = api_client.post(f"{url}bulk/", payload(2), format="json")
+        assert response.status_code == 200, response.data
+        assert response.data["created"] == 2
+        assert response.data["updated"] == 1
+        assert [item["name"] for item in response.data["fields"]] == [
+            "email",
+            "field_0",
+            "field_1",
+        ]
+        assert response.data["fields"][0]["label"] == "E-mail"
+
+        DynamicField.objects.exclude(pk=dynamic_field.pk).delete()
+        with CaptureQueriesContext(connection) as large:
+            response = api_client.post(f"{url}bulk/", payload(20), format="json")
+        assert response.status_code == 200, response.data
+        assert len(large) == len(small)
+        assert len(get_compiled_form(dynamic_form.pk).fields) == 21
+
+    def test_bulk_create_appends_fields(
+        self,
+        api_client: APIClient,
+        dynamic_form: DynamicForm,
+        dynamic_field: DynamicField,
+        field_type: FieldType,
+        admin_user: User,
+    ) -> None:
+        """
+        Test that the new fields of a batch without an order are appended in
+        request order.
+
+        Args:
+            api_client (APIClient): The API client used to simulate requests.
+            dynamic_form (DynamicForm): The form the fields belong to.
+            dynamic_field (DynamicField): An existing field of the form.
+            field_type (FieldType): The field type of the fields.
+            admin_user (User): The admin user for authentication.
+
+        Asserts:
+            Unordered fields follow the last field in request order; an
+            explicit order is kept.
+        """
+        api_client.force_authenticate(user=admin_user)
+        url = reverse("admin-form-field-bulk", kwargs={"form_pk": dynamic_form.pk})
+        dynamic_field.order = 3000
+        dynamic_field.save(update_fields=["order"])
+
+        response = api_client.post(
+            url,
+            {
+                "fields": [
+                    {"name": "b", "field_type_id": field_type.pk},
+                    {"name": "a", "field_type_id": field_type.pk, "order": 10},
+                    {"name": "c", "field_type_id": field_type.pk},
+                ]
+            },
+            format="json",
+        )
+
+        assert response.status_code == 200, response.data
+        assert [item["order"] for item in response.data["fields"]] == [
+            3000 + ORDER_GAP,
+            10,
+            3000 + 2 * ORDER_GAP,
+        ]
+
+    def test_bulk_errors(
+        self,
+        api_client: APIClient,
+        dynamic_form: DynamicForm,
+        dynamic_field: DynamicField,
+        field_type: FieldType,
+        admin_user: User,
+    ) -> None:
+        """
+        Test that the bulk endpoint reports the errors of each item and saves
+        nothing.
+
+        Args:
+            api_client (APIClient): The API client used to simulate requests.
+            dynamic_form (DynamicForm): The form the fields belong to.
+            dynamic_field (DynamicField): An existing field with a taken name.
+            field_type (FieldType): The field type of the fields.
+            admin_user (User): The admin user for authentication.
+
+        Asserts:
+            - Unknown IDs and types, taken and repeated names are reported by index.
+            - Renaming a field frees its name for another item.
+            - No field is created.
+        """
+        api_client.force_authenticate(user=admin_user)
+        url = reverse("admin-form-field-bulk", kwargs={"form_pk": dynamic_form.pk})
+        response = api_client.post(
+            url,
+            {
+                "fields": [
+                    {"name": "email", "field_type_id": field_type.pk},
+                    {"id": 999, "name": "other", "field_type_id": 999},
+                    {"name": "twice", "field_type_id": field_type.pk},
+                    {"name": "twice", "field_type_id": field_type.pk},
+                ]
+            },
+            format="json",
+        )
+
+        assert response.status_code == 400, response.data
+        errors = response.data["fields"]
+        assert set(errors) == {0, 1, 3}
+        assert set(errors[1]) == {"id", "field_type_id"}
+        assert "name" in errors[0] and "name" in errors[3]
+        assert DynamicField.objects.count() == 1
+
+        response = api_client.post(
+            url,
+            {
+                "fields": [
+                    {
+                        "id": dynamic_field.pk,
+                        "name": "contact",
+                        "field_type_id": field_type.pk,
+                    },
+                    {"name": "email", "field_type_id": field_type.pk},
+                ]
+            },
+            format="json",
+        )
+        assert response.status_code == 200, response.data
+        assert set(DynamicField.objects.values_list("name", flat=True)) == {
+            "contact",
+            "email",
+        }
+
+        new = DynamicField.objects.get(name="email")
+        type_id = field_type.pk
+        response = api_client.post(
+            url,
+            {
+                "fields": [
+                    {"id": dynamic_field.pk, "name": "email", "field_type_id": type_id},
+                    {"id": new.pk, "name": "contact", "field_type_id": type_id},
+                ]
+            },
+            format="json",
+        )
+        # Swapped names conflict in the database
+        assert response.status_code == 400, response.data
+        assert "name" in response.data
+
+    def test_bulk_limits(
+        self,
+        api_client: APIClient,
+        dynamic_form: DynamicForm,
+        dynamic_field: DynamicField,
+        field_type: FieldType,
+        admin_user: User,
+    ) -> None:
+        """
+        Test the size limit and the create and update settings of the bulk
+        endpoint.
+
+        Args:
+            api_client (APIClient): The API client used to simulate requests.
+            dynamic_form (DynamicForm): The form the fields belong to.
+            dynamic_field (DynamicField): An existing field.
+            field_type (FieldType): The field type of the fields.
+            admin_user (User): The admin user for authentication.
+
+        Asserts:
+            - Oversized batches are rejected with 400.
+            - Creates and updates follow their settings with 405.
+            - Inactive forms are rejected with 400.
+        """
+        api_client.force_authenticate(user=admin_user)
+        url = reverse("admin-form-field-bulk", kwargs={"form_pk": dynamic_form.pk})
+        item = {"id": dynamic_field.pk, "name": "email", "field_type_id": field_type.pk}
+        update = {"fields": [item]}
+
+        config.api_admin_dynamic_field_bulk_max_items = 1
+        response = api_client.post(url, {"fields": [{}, {}]}, format="json")
+        assert response.status_code == 400, response.data
+
+        config.api_admin_dynamic_field_allow_update = False
+        assert api_client.post(url, update, format="json").status_code == 405
+        config.api_admin_dynamic_field_allow_create = False
+        assert api_client.post(url, update, format="json").status_code == 405
+
+        config.api_admin_dynamic_field_allow_create = True
+        dynamic_form.is_active = False
+        dynamic_form.save()
+        response = api_client.post(url, update, format="json")
+        assert response.status_code == 400
+        assert "form" in response.data
+
+    def test_reorder(
+        self,
+        api_client: APIClient,
+        dynamic_form: DynamicForm,
+        dynamic_field: DynamicField,
+        field_type: FieldType,
+        admin_user: User,
+    ) -> None:
+        """
+        Test that the reorder endpoint renumbers the fields of the form.
+
+        Args:
+            api_client (APIClient): The API client used to simulate requests.
+            dynamic_form (DynamicForm): The form the fields belong to.
+            dynamic_field (DynamicField): The first field of the form.
+            field_type (FieldType): The field type of the fields.
+            admin_user (User): The admin user for authentication.
+
+        Asserts:
+            - The fields are returned and stored in their new, spaced order.
+            - Incomplete or repeated orders are rejected.
+            - Reordering follows the update setting.
+        """
+        api_client.force_authenticate(user=admin_user)
+        url = reverse("admin-form-field-reorder", kwargs={"form_pk": dynamic_form.pk})
+        second = DynamicField.objects.create(
+            form=dynamic_form, field_type=field_type, name="second", order=1
+        )
+
+        response = api_client.post(
+            url, {"order": [second.pk, dynamic_field.pk]}, format="json"
+        )
+        assert response.status_code == 200, response.data
+        assert [item["id"] for item in response.data["fields"]] == [
+            second.pk,
+            dynamic_field.pk,
+        ]
+        assert list(dynamic_form.fields.values_list("name", "order")) == [
+            ("second", 1024),
+            ("email", 2048),
+        ]
+
+        for order in ([second.pk], [second.pk, second.pk, dynamic_field.pk]):
+            response = api_client.post(url, {"order": order}, format="json")
+            assert response.status_code == 400
+            assert "order" in response.data
+
+        config.api_admin_dynamic_field_allow_update = False
+        response = api_client.post(url, {"order": [second.pk]}, format="json")
+        assert response.status_code == 405
+
+    def test_move(
+        self,
+        api_client: APIClient,
+        dynamic_form: DynamicForm,
+        dynamic_field: DynamicField,
+        field_type: FieldType,
+        admin_user: User,
+    ) -> None:
+        """
+        Test that the move endpoint moves a single field.
+
+        Args:
+            api_client (APIClient): The API client used to simulate requests.
+            dynamic_form (DynamicForm): The form the fields belong to.
+            dynamic_field (DynamicField): The first field of the form.
+            field_type (FieldType): The field type of the fields.
+            admin_user (User): The admin user for authentication.
+
+        Asserts:
+            - The field is moved first or after another field.
+            - Other forms' fields and the field itself are rejected as targets.
+            - Moving follows the update setting.
+        """
+        api_client.force_authenticate(user=admin_user)
+        second = DynamicField.objects.create(
+            form=dynamic_form, field_type=field_type, name="second", order=2048
+        )
+        dynamic_field.order = 1024
+        dynamic_field.save()
+        url = reverse(
+            "admin-form-field-move",
+            kwargs={"form_pk": dynamic_form.pk, "pk": second.pk},
+        )
+
+        response = api_client.post(url, {"after": None}, format="json")
+        assert response.status_code == 200, response.data
+        assert response.data["order"] == 511
+        assert list(dynamic_form.fields.values_list("name", flat=True)) == [
+            "second",
+            "email",
+        ]
+
+        response = api_client.post(url, {"after": dynamic_field.pk}, format="json")
+        assert response.status_code == 200, response.data
+        assert response.data["order"] == 2048
+
+        for after in (second.pk, 999):
+            response = api_client.post(url, {"after": after}, format="json")
+            assert response.status_code == 400
+            assert "after" in response.data
+
+        config.api_admin_dynamic_field_allow_update = False
+        assert api_client.post(url, {"after": None}, format="json").status_code == 405
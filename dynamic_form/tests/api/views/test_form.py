@@ -0,0 +1,310 @@
+import sys
+import time
+from types import SimpleNamespace
+
+import pytest
+from django.core.cache import cache
+from django.contrib.auth.models import User
+from django.urls import reverse
+from django.utils.http import http_date
+from rest_framework.test import APIClient
+
+from dynamic_form.mixins.api import conditional_get
+from dynamic_form.models import DynamicField, DynamicForm, FieldType
+from dynamic_form.settings.conf import config
+from dynamic_form.tests.constants import (
+    PYTHON_VERSION,
+    PYTHON_VERSION_REASON,
+)
+from dynamic_form.utils.field_types import get_field_types
+
+pytestmark = [
+    pytest.mark.api,
+    pytest.mark.api_views,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+@pytest.mark.django_db
+class TestDynamicFormViewSet:
+    """
+    Tests for the DynamicFormViewSet API endpoints.
+
+    Tests:
+    -------
+    - test_list_returns_each_form_once: Verifies forms are not duplicated per field.
+    - test_list_query_count_is_constant: Verifies the list cost does not grow with the field count.
+    """
+
+    @staticmethod
+    def _add_fields(form: DynamicForm, field_type: FieldType, count: int) -> None:
+        DynamicField.objects.bulk_create(
+            DynamicField(form=form, field_type=field_type, name=f"f{index}", order=index)
+            for index in range(count)
+        )
+
+    def test_list_returns_each_form_once(
+        self,
+        api_client: APIClient,
+        user: User,
+        dynamic_form: DynamicForm,
+        field_type: FieldType,
+    ):
+        """
+        Test that a form with many fields is listed once with its active-type fields only.
+
+        Args:
+            api_client (APIClient): The API client used to simulate requests.
+            user (User): The user listing forms.
+            dynamic_form (DynamicForm): A form with several fields.
+            field_type (FieldType): An active field type.
+
+        Asserts:
+            The count and results contain the form once.
+            Fields of inactive types are left out, and fields are ordered.
+        """
+        api_client.force_authenticate(user=user)
+        config.api_dynamic_form_allow_list = True
+
+        self._add_fields(dynamic_form, field_type, 3)
+        inactive = FieldType.objects.create(name="inactive", is_active=False)
+        DynamicField.objects.create(
+            form=dynamic_form, field_type=inactive, name="hidden", order=0
+        )
+        only_inactive = DynamicForm.objects.create(name="Only inactive")
+        DynamicField.objects.create(form=only_inactive, field_type=inactive, name="x")
+
+        response = api_client.get(reverse("form-list"))
+
+        assert (
+            response.status_code == 200
+        ), f"Expected 200 OK, got {response.status_code}."
+        assert response.data["count"] == 1
+        assert len(response.data["results"]) == 1
+        names = [field["name"] for field in response.data["results"][0]["fields"]]
+        assert names == ["f0", "f1", "f2"]
+
+    def test_list_query_count_is_constant(
+        self,
+        api_client: APIClient,
+        user: User,
+        field_type: FieldType,
+        django_assert_num_queries,
+    ):
+        """
+        Test that listing forms runs the same number of queries for 1 or 50 fields per form.
+
+        Args:
+            api_client (APIClient): The API client used to simulate requests.
+            user (User): The user listing forms.
+            field_type (FieldType): An active field type.
+            django_assert_num_queries: Pytest-django fixture asserting the query count.
+
+        Asserts:
+            The list endpoint runs three queries (count, forms, fields) in both cases.
+        """
+        api_client.force_authenticate(user=user)
+        config.api_dynamic_form_allow_list = True
+        url = reverse("form-list")
+        get_field_types()  # Warm the field type registry
+
+        small = DynamicForm.objects.create(name="Small")
+        self._add_fields(small, field_type, 1)
+        with django_assert_num_queries(3):
+            api_client.get(url)
+
+        for index in range(3):
+            form = DynamicForm.objects.create(name=f"Large {index}")
+            self._add_fields(form, field_type, 50)
+        with django_assert_num_queries(3):
+            response = api_client.get(url)
+
+        assert response.data["count"] == 4
+
+
+@pytest.mark.django_db
+class TestConditionalGet:
+    """
+    Tests for ETag / Last-Modified support on the form definition endpoints.
+
+    Tests:
+    -------
+    - test_form_retrieve_not_modified: Verifies a matching ETag yields 304 without queries.
+    - test_form_change_updates_etag: Verifies editing a form or its fields changes the ETag.
+    - test_form_list_not_modified: Verifies list responses honour If-None-Match.
+    - test_field_type_list_not_modified: Verifies field type responses are validated.
+    - test_missing_form_skips_validators: Verifies 404 responses carry no ETag.
+    """
+
+    def setup_method(self):
+        cache.clear()
+        config.api_dynamic_form_allow_list = True
+        config.api_dynamic_form_allow_retrieve = True
+
+    def teardown_method(self):
+        cache.clear()
+
+    def test_form_retrieve_not_modified(
+        self,
+        api_client: APIClient,
+        dynamic_field: DynamicField,
+        django_assert_num_queries,
+        monkeypatch,
+    ):
+        """
+        Test that retrieving an unchanged form with its ETag returns 304.
+
+        Args:
+            api_client (APIClient): The API client used to simulate requests.
+            dynamic_field (DynamicField): A field making the form visible.
+            django_assert_num_queries: Pytest-django fixture asserting the query count.
+            monkeypatch: Pytest fixture moving the clock past the last change.
+
+        Asserts:
+            The first response carries ETag and Last-Modified headers.
+            The conditional request is answered with 304 and no queries once the
+            schema cache is warm.
+        """
+        now = time.time() + 2
+        monkeypatch.setattr(conditional_get, "time", SimpleNamespace(time=lambda: now))
+        url = reverse("form-detail", kwargs={"pk": dynamic_field.form_id})
+        response = api_client.get(url)
+
+        assert response.status_code == 200
+        assert response.has_header("Last-Modified")
+        etag = response["ETag"]
+
+        with django_assert_num_queries(0):
+            response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+        assert response["ETag"] == etag
+
+        response = api_client.get(
+            url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]
+        )
+        assert response.status_code == 304
+
+    def test_last_modified_skipped_within_the_second_of_a_change(
+        self, api_client: APIClient, dynamic_field: DynamicField, monkeypatch
+    ):
+        """
+        Test that Last-Modified is left out until the second of the last change
+        has elapsed.
+
+        Args:
+            api_client (APIClient): The API client used to simulate requests.
+            dynamic_field (DynamicField): A field making the form visible.
+            monkeypatch: Pytest fixture pinning the clock to the last change.
+
+        Asserts:
+            The response carries an ETag only, so If-Modified-Since cannot
+            match a later change made within the same second.
+        """
+        url = reverse("form-detail", kwargs={"pk": dynamic_field.form_id})
+        now = time.time()
+        monkeypatch.setattr(conditional_get, "time", SimpleNamespace(time=lambda: now))
+        response = api_client.get(url)
+
+        assert response.has_header("ETag")
+        assert not response.has_header("Last-Modified")
+
+        dynamic_field.label = "Changed"
+        dynamic_field.save()
+        response = api_client.get(url, HTTP_IF_MODIFIED_SINCE=http_date(now))
+        assert response.status_code == 200
+
+    def test_form_change_updates_etag(
+        self, api_client: APIClient, dynamic_field: DynamicField
+    ):
+        """
+        Test that editing a field or its form invalidates the ETag.
+
+        Args:
+            api_client (APIClient): The API client used to simulate requests.
+            dynamic_field (DynamicField): A field of the retrieved form.
+
+        Asserts:
+            Each change yields a 200 response with a new ETag.
+        """
+        url = reverse("form-detail", kwargs={"pk": dynamic_field.form_id})
+        etag = api_client.get(url)["ETag"]
+
+        dynamic_field.label = "Changed"
+        dynamic_field.save()
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert response.data["fields"][0]["label"] == "Changed"
+        assert response["ETag"] != etag
+
+        etag = response["ETag"]
+        dynamic_field.form.name = "Renamed"
+        dynamic_field.form.save()
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+
+    def test_form_list_not_modified(
+        self, api_client: APIClient, dynamic_field: DynamicField
+    ):
+        """
+        Test that the form list honours If-None-Match and varies by query string.
+
+        Args:
+            api_client (APIClient): The API client used to simulate requests.
+            dynamic_field (DynamicField): A field making the form visible.
+
+        Asserts:
+            The same URL is answered with 304, another page with 200.
+        """
+        url = reverse("form-list")
+        etag = api_client.get(url)["ETag"]
+
+        assert api_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+        response = api_client.get(f"{url}?page=1", HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+
+        DynamicForm.objects.create(name="Another")
+        assert api_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+    def test_field_type_list_not_modified(
+        self, api_client: APIClient, field_type: FieldType
+    ):
+        """
+        Test that field type and field listings are validated as well.
+
+        Args:
+            api_client (APIClient): The API client used to simulate requests.
+            field_type (FieldType): An active field type.
+
+        Asserts:
+            Unchanged listings are answered with 304, changed ones with 200.
+        """
+        config.api_field_type_allow_list = True
+        config.api_dynamic_field_allow_list = True
+        url = reverse("field-type-list")
+        etag = api_client.get(url)["ETag"]
+        field_etag = api_client.get(reverse("field-list"))["ETag"]
+
+        assert api_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+        field_type.label = "Changed"
+        field_type.save()
+        assert api_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 200
+        response = api_client.get(reverse("field-list"), HTTP_IF_NONE_MATCH=field_etag)
+        assert response.status_code == 200
+
+    def test_missing_form_skips_validators(self, api_client: APIClient):
+        """
+        Test that a missing form is answered with 404 without validators.
+
+        Args:
+            api_client (APIClient): The API client used to simulate requests.
+
+        Asserts:
+            The response is 404 and has no ETag header.
+        """
+        response = api_client.get(reverse("form-detail", kwargs={"pk": 999}))
+
+        assert response.status_code == 404
+        assert not response.has_header("ETag")
@@ -1,12 +1,25 @@
 import sys
+from datetime import timedelta
+from unittest.mock import patch
 
 import pytest
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework.test import APIClient
 
-from dynamic_form.models import FormSubmission, DynamicForm, DynamicField
+from dynamic_form.api.serializers.form_submission import FormSubmissionSerializer
+from dynamic_form.api.views import AdminFormSubmissionViewSet
+from dynamic_form.models import (
+    FormSubmission,
+    DynamicForm,
+    DynamicField,
+    FieldType,
+    IdempotencyKey,
+)
 from dynamic_form.settings.conf import config
+from dynamic_form.utils.form_schema import get_compiled_form
 from dynamic_form.tests.constants import (
     PYTHON_VERSION,
     PYTHON_VERSION_REASON,
@@ -396,3 +409,642 @@ class TestFormSubmissionViewSet:
             response.status_code == 400
         ), f"Expected 400 Bad Request, got {response.status_code}."
         assert "form_id" in response.data, "Expected error for invalid form ID."
+
+    def test_create_form_submission_rule_violations(
+        self,
+        api_client: APIClient,
+        dynamic_form: DynamicForm,
+        dynamic_field: DynamicField,
+        user: User,
+    ):
+        """
+        Test the create endpoint with values violating the field rules and choices.
+
+        Args:
+            api_client (APIClient): The API client used to simulate requests.
+            dynamic_form (DynamicForm): The form to submit against.
+            dynamic_field (DynamicField): A required field in the form.
+            user (User): The user submitting the form.
+
+        Asserts:
+            The response status code is 400.
+            Every invalid field is reported at once.
+        """
+        api_client.force_authenticate(user=user)
+        config.api_form_submission_allow_create = True
+
+        dynamic_field.validation_rules = {"regex": r"@example\.com$"}
+        dynamic_field.save()
+        DynamicField.objects.create(
+            form=dynamic_form,
+            field_type=FieldType.objects.get_or_create(name="dropdown")[0],
+            name="color",
+            choices=["red", "green"],
+        )
+
+        url = reverse("form-submission-list")
+        payload = {
+            "form_id": dynamic_form.id,
+            "submitted_data": {"email": "test@other.com", "color": "blue"},
+        }
+        response = api_client.post(url, payload, format="json")
+
+        assert (
+            response.status_code == 400
+        ), f"Expected 400 Bad Request, got {response.status_code}."
+        assert set(response.data) == {"email", "color"}
+
+        payload["submitted_data"] = {"email": "test@example.com", "color": "red"}
+        response = api_client.post(url, payload, format="json")
+
+        assert (
+            response.status_code == 201
+        ), f"Expected 201 Created, got {response.status_code}."
+
+
+@pytest.mark.django_db
+class TestFormSubmissionBulkCreate:
+    """
+    Tests for the bulk submission endpoint of the FormSubmissionViewSet.
+    """
+
+    url = "form-submission-bulk"
+
+    def test_bulk_create_partial(
+        self,
+        api_client: APIClient,
+        dynamic_form: DynamicForm,
+        dynamic_field: DynamicField,
+        user: User,
+    ):
+        """
+        Test that valid items are saved and invalid items are reported by index.
+
+        Args:
+            api_client (APIClient): The API client used to simulate requests.
+            dynamic_form (DynamicForm): The form to submit against.
+            dynamic_field (DynamicField): A required field in the form.
+            user (User): The user submitting the form.
+
+        Asserts:
+            The response status code is 201.
+            Only the valid items are created, and the errors keep their index.
+        """
+        api_client.force_authenticate(user=user)
+        config.api_form_submission_allow_create = True
+
+        payload = {
+            "submissions": [
+                {"form_id": dynamic_form.id, "submitted_data": {"email": "a@x.com"}},
+                {"form_id": dynamic_form.id, "submitted_data": {"other": "b"}},
+                {"form_id": 999, "submitted_data": {"email": "c@x.com"}},
+                {"form_id": dynamic_form.id, "submitted_data": {"email": "d@x.com"}},
+                "invalid",
+            ]
+        }
+        response = api_client.post(reverse(self.url), payload, format="json")
+
+        assert (
+            response.status_code == 201
+        ), f"Expected 201 Created, got {response.status_code}."
+        assert response.data["created"] == 2
+        assert [error["index"] for error in response.data["errors"]] == [1, 2, 4]
+        assert "email" in response.data["errors"][0]["errors"]
+        assert "form_id" in response.data["errors"][1]["errors"]
+        submissions = FormSubmission.objects.filter(pk__in=response.data["ids"])
+        assert submissions.count() == 2
+        assert all(submission.user_id == user.id for submission in submissions)
+
+    def test_bulk_create_atomic(
+        self,
+        api_client: APIClient,
+        dynamic_form: DynamicForm,
+        dynamic_field: DynamicField,
+        user: User,
+    ):
+        """
+        Test that a single invalid item rejects the whole batch in atomic mode.
+
+        Args:
+            api_client (APIClient): The API client used to simulate requests.
+            dynamic_form (DynamicForm): The form to submit against.
+            dynamic_field (DynamicField): A required field in the form.
+            user (User): The user submitting the form.
+
+        Asserts:
+            The response status code is 400 and nothing is saved.
+        """
+        api_client.force_authenticate(user=user)
+        config.api_form_submission_allow_create = True
+
+        payload = {
+            "mode": "atomic",
+            "submissions": [
+                {"form_id": dynamic_form.id, "submitted_data": {"email": "a@x.com"}},
+                {"form_id": dynamic_form.id, "submitted_data": {}},
+            ],
+        }
+        response = api_client.post(reverse(self.url), payload, format="json")
+
+        assert (
+            response.status_code == 400
+        ), f"Expected 400 Bad Request, got {response.status_code}."
+        assert response.data["submissions"][0]["index"] == 1
+        assert not FormSubmission.objects.exists()
+
+    def test_bulk_create_max_items(
+        self,
+        api_client: APIClient,
+        dynamic_form: DynamicForm,
+        user: User,
+    ):
+        """
+        Test that batches larger than the configured maximum are rejected.
+
+        Args:
+            api_client (APIClient): The API client used to simulate requests.
+            dynamic_form (DynamicForm): The form to submit against.
+            user (User): The user submitting the form.
+
+        Asserts:
+            The response status code is 400.
+        """
+        api_client.force_authenticate(user=user)
+        config.api_form_submission_allow_create = True
+        config.api_form_submission_bulk_max_items = 1
+
+        item = {"form_id": dynamic_form.id, "submitted_data": {"email": "a@x.com"}}
+        response = api_client.post(
+            reverse(self.url), {"submissions": [item, item]}, format="json"
+        )
+        config.api_form_submission_bulk_max_items = 1000
+
+        assert (
+            response.status_code == 400
+        ), f"Expected 400 Bad Request, got {response.status_code}."
+        assert "submissions" in response.data
+
+    def test_bulk_create_disabled(
+        self,
+        api_client: APIClient,
+        user: User,
+    ):
+        """
+        Test that the bulk endpoint follows the create permission setting.
+
+        Args:
+            api_client (APIClient): The API client used to simulate requests.
+            user (User): The user submitting the form.
+
+        Asserts:
+            The response status code is 405.
+        """
+        api_client.force_authenticate(user=user)
+        config.api_form_submission_allow_create = False
+
+        response = api_client.post(reverse(self.url), {"submissions": []}, format="json")
+        config.api_form_submission_allow_create = True
+
+        assert (
+            response.status_code == 405
+        ), f"Expected 405 Method Not Allowed, got {response.status_code}."
+
+
+@pytest.mark.django_db
+class TestFormSubmissionIdempotency:
+    """
+    Tests for Idempotency-Key support on submission creation.
+    """
+
+    url = "form-submission-list"
+
+    def setup_method(self) -> None:
+        """
+        Enable submission creation.
+        """
+        config.api_form_submission_allow_create = True
+
+    def teardown_method(self) -> None:
+        """
+        Clear the cache so that throttle history does not leak into other tests.
+        """
+        cache.clear()
+
+    def payload(self, form: DynamicForm, email: str = "new@example.com") -> dict:
+        return {"form_id": form.id, "submitted_data": {"email": email}}
+
+    def test_replay(
+        self,
+        api_client: APIClient,
+        dynamic_form: DynamicForm,
+        dynamic_field: DynamicField,
+        user: User,
+        django_assert_max_num_queries,
+    ):
+        """
+        Test that a retried request returns the original response without
+        creating another submission.
+
+        Args:
+            api_client (APIClient): The API client used to simulate requests.
+            dynamic_form (DynamicForm): The form to submit against.
+            dynamic_field (DynamicField): A required field in the form.
+            user (User): The user submitting the form.
+            django_assert_max_num_queries: Pytest-django fixture bounding the query count.
+
+        Asserts:
+            Both responses are equal, even after the submission changed; the
+            retry is flagged as replayed and one submission exists.
+        """
+        api_client.force_authenticate(user=user)
+        headers = {"HTTP_IDEMPOTENCY_KEY": "retry-1"}
+
+        first = api_client.post(
+            reverse(self.url), self.payload(dynamic_form), format="json", **headers
+        )
+        FormSubmission.objects.update(submitted_data={"email": "changed@example.com"})
+        # The key lookup, inside the savepoint of the request transaction
+        with django_assert_max_num_queries(3):
+            second = api_client.post(
+                reverse(self.url), self.payload(dynamic_form), format="json", **headers
+            )
+
+        assert first.status_code == 201, first.data
+        assert second.status_code == 201
+        assert second["Idempotent-Replayed"] == "true"
+        assert second.json() == first.json()
+        assert FormSubmission.objects.count() == 1
+
+    def test_crash_after_insert_rolls_back_claim(
+        self,
+        api_client: APIClient,
+        dynamic_form: DynamicForm,
+        dynamic_field: DynamicField,
+        user: User,
+    ):
+        """
+        Test that a crash between the insert and the completion of a key
+        leaves neither a submission nor a pending key behind.
+
+        Args:
+            api_client (APIClient): The API client used to simulate requests.
+            dynamic_form (DynamicForm): The form to submit against.
+            dynamic_field (DynamicField): A required field in the form.
+            user (User): The user submitting the form.
+
+        Asserts:
+            The failed request is rolled back and its retry is processed.
+        """
+        api_client.force_authenticate(user=user)
+        headers = {"HTTP_IDEMPOTENCY_KEY": "crash"}
+
+        with patch(
+            "dynamic_form.mixins.api.idempotency.complete_key",
+            side_effect=RuntimeError("crash"),
+        ):
+            with pytest.raises(RuntimeError):
+                api_client.post(
+                    reverse(self.url),
+                    self.payload(dynamic_form),
+                    format="json",
+                    **headers,
+                )
+        assert not FormSubmission.objects.exists()
+        assert not IdempotencyKey.objects.exists()
+
+        response = api_client.post(
+            reverse(self.url), self.payload(dynamic_form), format="json", **headers
+        )
+        assert response.status_code == 201, response.data
+        assert FormSubmission.objects.count() == 1
+
+    def test_key_reused_for_other_request(
+        self,
+        api_client: APIClient,
+        dynamic_form: DynamicForm,
+        dynamic_field: DynamicField,
+        user: User,
+    ):
+        """
+        Test that reusing a key with a different body is rejected.
+
+        Args:
+            api_client (APIClient): The API client used to simulate requests.
+            dynamic_form (DynamicForm): The form to submit against.
+            dynamic_field (DynamicField): A required field in the form.
+            user (User): The user submitting the form.
+
+        Asserts:
+            The second request returns 422 and creates nothing.
+        """
+        api_client.force_authenticate(user=user)
+        headers = {"HTTP_IDEMPOTENCY_KEY": "retry-2"}
+
+        api_client.post(
+            reverse(self.url), self.payload(dynamic_form), format="json", **headers
+        )
+        response = api_client.post(
+            reverse(self.url),
+            self.payload(dynamic_form, "other@example.com"),
+            format="json",
+            **headers,
+        )
+
+        assert response.status_code == 422
+        assert FormSubmission.objects.count() == 1
+
+    def test_in_progress_and_failed_requests(
+        self,
+        api_client: APIClient,
+        dynamic_form: DynamicForm,
+        dynamic_field: DynamicField,
+        user: User,
+    ):
+        """
+        Test that an unfinished key conflicts and a failed request releases its key.
+
+        Args:
+            api_client (APIClient): The API client used to simulate requests.
+            dynamic_form (DynamicForm): The form to submit against.
+            dynamic_field (DynamicField): A required field in the form.
+            user (User): The user submitting the form.
+
+        Asserts:
+            An invalid request keeps no key, a pending key returns 409 and a
+            blank key returns 400.
+        """
+        api_client.force_authenticate(user=user)
+        invalid = {"form_id": dynamic_form.id, "submitted_data": {}}
+
+        response = api_client.post(
+            reverse(self.url), invalid, format="json", HTTP_IDEMPOTENCY_KEY="bad"
+        )
+        assert response.status_code == 400
+        assert not IdempotencyKey.objects.exists()
+
+        headers = {"HTTP_IDEMPOTENCY_KEY": "pending"}
+        api_client.post(
+            reverse(self.url), self.payload(dynamic_form), format="json", **headers
+        )
+        IdempotencyKey.objects.update(status_code=None, response_data=None)
+        response = api_client.post(
+            reverse(self.url), self.payload(dynamic_form), format="json", **headers
+        )
+        assert response.status_code == 409
+
+        response = api_client.post(
+            reverse(self.url),
+            self.payload(dynamic_form),
+            format="json",
+            HTTP_IDEMPOTENCY_KEY="  ",
+        )
+        assert response.status_code == 400
+
+    def test_expired_key_is_replaced(
+        self,
+        api_client: APIClient,
+        dynamic_form: DynamicForm,
+        dynamic_field: DynamicField,
+        user: User,
+    ):
+        """
+        Test that a key older than the TTL is treated as new.
+
+        Args:
+            api_client (APIClient): The API client used to simulate requests.
+            dynamic_form (DynamicForm): The form to submit against.
+            dynamic_field (DynamicField): A required field in the form.
+            user (User): The user submitting the form.
+
+        Asserts:
+            The request is processed again and the key is refreshed.
+        """
+        api_client.force_authenticate(user=user)
+        headers = {"HTTP_IDEMPOTENCY_KEY": "old"}
+        api_client.post(
+            reverse(self.url), self.payload(dynamic_form), format="json", **headers
+        )
+        IdempotencyKey.objects.update(
+            created_at=timezone.now() - timedelta(seconds=config.idempotency_key_ttl + 1)
+        )
+
+        response = api_client.post(
+            reverse(self.url), self.payload(dynamic_form), format="json", **headers
+        )
+
+        assert response.status_code == 201
+        assert "Idempotent-Replayed" not in response
+        assert FormSubmission.objects.count() == 2
+        assert IdempotencyKey.objects.count() == 1
+
+    def test_bulk_replay(
+        self,
+        api_client: APIClient,
+        dynamic_form: DynamicForm,
+        dynamic_field: DynamicField,
+        user: User,
+    ):
+        """
+        Test that bulk requests are idempotent too.
+
+        Args:
+            api_client (APIClient): The API client used to simulate requests.
+            dynamic_form (DynamicForm): The form to submit against.
+            dynamic_field (DynamicField): A required field in the form.
+            user (User): The user submitting the form.
+
+        Asserts:
+            The retry returns the original IDs and creates nothing.
+        """
+        api_client.force_authenticate(user=user)
+        payload = {"submissions": [self.payload(dynamic_form)]}
+        headers = {"HTTP_IDEMPOTENCY_KEY": "sync-1"}
+
+        first = api_client.post(
+            reverse("form-submission-bulk"), payload, format="json", **headers
+        )
+        second = api_client.post(
+            reverse("form-submission-bulk"), payload, format="json", **headers
+        )
+
+        assert second.status_code == 201
+        assert second.json()["ids"] == first.json()["ids"]
+        assert FormSubmission.objects.count() == 1
+
+
+@pytest.mark.django_db
+class TestAdminFormSubmissionExport:
+    """
+    Tests for the export endpoint of the AdminFormSubmissionViewSet.
+    """
+
+    def test_export_csv(
+        self,
+        api_client: APIClient,
+        admin_user: User,
+        form_submission: FormSubmission,
+        dynamic_field: DynamicField,
+    ):
+        """
+        Test that the endpoint streams the submissions of a form as CSV.
+
+        Args:
+            api_client (APIClient): The API client used to simulate requests.
+            admin_user (User): The admin user requesting the export.
+            form_submission (FormSubmission): A submission of the form.
+            dynamic_field (DynamicField): A field of the form.
+
+        Asserts:
+            The response is a streaming CSV attachment with one row per submission.
+        """
+        api_client.force_authenticate(user=admin_user)
+        config.api_admin_form_submission_allow_list = True
+
+        url = reverse("admin-form-submission-export")
+        response = api_client.get(url, {"form_id": form_submission.form_id})
+
+        assert (
+            response.status_code == 200
+        ), f"Expected 200 OK, got {response.status_code}."
+        assert response.streaming
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        assert lines[0] == "id,submitted_at,user_id,email"
+        assert len(lines) == 2
+
+    def test_export_invalid_requests(
+        self,
+        api_client: APIClient,
+        admin_user: User,
+        form_submission: FormSubmission,
+    ):
+        """
+        Test unknown forms, unsupported formats and the disabled endpoint.
+
+        Args:
+            api_client (APIClient): The API client used to simulate requests.
+            admin_user (User): The admin user requesting the export.
+            form_submission (FormSubmission): A submission of the form.
+
+        Asserts:
+            The responses are 404, 400 and 405 respectively.
+        """
+        api_client.force_authenticate(user=admin_user)
+        url = reverse("admin-form-submission-export")
+
+        config.api_admin_form_submission_allow_list = True
+        assert api_client.get(url, {"form_id": 999}).status_code == 404
+        response = api_client.get(
+            url, {"form_id": form_submission.form_id, "file_format": "xml"}
+        )
+        assert response.status_code == 400
+
+        config.api_admin_form_submission_allow_list = False
+        response = api_client.get(url, {"form_id": form_submission.form_id})
+        config.api_admin_form_submission_allow_list = True
+        assert response.status_code == 405
+
+
+@pytest.mark.django_db
+class TestCompactFormSubmission:
+    """
+    Tests for the compact representation of form submissions.
+    """
+
+    def test_list_compact(
+        self,
+        api_client: APIClient,
+        user: User,
+        form_submission: FormSubmission,
+        dynamic_field: DynamicField,
+    ):
+        """
+        Test that ``?compact=true`` returns the form ID and schema hash instead of the nested form.
+
+        Args:
+            api_client (APIClient): The API client used to simulate requests.
+            user (User): The user owning the submission.
+            form_submission (FormSubmission): The submission to list.
+            dynamic_field (DynamicField): A field of the form.
+
+        Asserts:
+            The nested form is replaced by `form_id` and `schema_hash`.
+        """
+        api_client.force_authenticate(user=user)
+        config.api_form_submission_allow_list = True
+
+        response = api_client.get(reverse("form-submission-list"), {"compact": "true"})
+
+        assert (
+            response.status_code == 200
+        ), f"Expected 200 OK, got {response.status_code}."
+        result = response.data["results"][0]
+        assert "form" not in result
+        assert result["form_id"] == form_submission.form_id
+        compiled = get_compiled_form(form_submission.form_id)
+        assert result["schema_hash"] == compiled.schema_hash
+
+    def test_compact_from_config(
+        self,
+        api_client: APIClient,
+        admin_user: User,
+        form_submission: FormSubmission,
+    ):
+        """
+        Test that the compact representation can be enabled through config and
+        disabled per request.
+
+        Args:
+            api_client (APIClient): The API client used to simulate requests.
+            admin_user (User): The admin user listing submissions.
+            form_submission (FormSubmission): The submission to retrieve.
+
+        Asserts:
+            The representation follows the setting unless the request overrides it.
+        """
+        api_client.force_authenticate(user=admin_user)
+        config.api_admin_form_submission_allow_retrieve = True
+        config.api_admin_form_submission_compact_representation = True
+
+        url = reverse("admin-form-submission-detail", kwargs={"pk": form_submission.pk})
+        compact = api_client.get(url)
+        full = api_client.get(url, {"compact": "false"})
+        config.api_admin_form_submission_compact_representation = False
+
+        assert "form_id" in compact.data and "form" not in compact.data
+        assert full.data["form"]["id"] == form_submission.form_id
+
+    def test_custom_serializer_class_takes_precedence(
+        self,
+        api_client: APIClient,
+        admin_user: User,
+        form_submission: FormSubmission,
+        monkeypatch,
+    ):
+        """
+        Test that a configured serializer class is not replaced by the compact one.
+
+        Args:
+            api_client (APIClient): The API client used to simulate requests.
+            admin_user (User): The admin user retrieving the submission.
+            form_submission (FormSubmission): The submission to retrieve.
+            monkeypatch: Pytest fixture replacing the configured serializer class.
+
+        Asserts:
+            ``?compact=true`` is ignored and the custom serializer is used.
+        """
+
+        class CustomSerializer(FormSubmissionSerializer):
+            pass
+
+        monkeypatch.setattr(
+            AdminFormSubmissionViewSet, "serializer_class", CustomSerializer
+        )
+        api_client.force_authenticate(user=admin_user)
+        config.api_admin_form_submission_allow_retrieve = True
+
+        url = reverse("admin-form-submission-detail", kwargs={"pk": form_submission.pk})
+        response = api_client.get(url, {"compact": "true"})
+        config.api_admin_form_submission_allow_retrieve = False
+
+        assert response.status_code == 200, response.data
+        assert response.data["form"]["id"] == form_submission.form_id
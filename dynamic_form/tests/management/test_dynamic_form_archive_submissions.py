@@ -0,0 +1,63 @@
+import sys
+from datetime import timedelta
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.utils import timezone
+
+from dynamic_form.models import FormSubmission
+from dynamic_form.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+
+pytestmark = [
+    pytest.mark.commands,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+@pytest.mark.django_db
+class TestArchiveSubmissionsCommand:
+    """
+    Tests for the dynamic_form_archive_submissions management command.
+    """
+
+    def test_archive(self, form_submission: FormSubmission, tmp_path: Path) -> None:
+        """
+        Test that the command reports and archives old submissions.
+
+        Args:
+            form_submission (FormSubmission): An old submission.
+            tmp_path (Path): The archive directory.
+
+        Asserts:
+            The dry run keeps the submission; the real run archives it.
+        """
+        FormSubmission.objects.update(submitted_at=timezone.now() - timedelta(days=100))
+        out = StringIO()
+        args = ["dynamic_form_archive_submissions", "--archive-dir", str(tmp_path)]
+
+        call_command(*args, "--dry-run", stdout=out)
+        assert "Would archive 1 submission(s)." in out.getvalue()
+        assert FormSubmission.objects.exists()
+
+        call_command(*args, "--form", str(form_submission.form_id), stdout=out)
+        assert f"Form #{form_submission.form_id}: 1 submission(s)" in out.getvalue()
+        assert "Archived 1 submission(s) in 1 segment(s)." in out.getvalue()
+        assert not FormSubmission.objects.exists()
+
+    @pytest.mark.parametrize(
+        "args", [["--days", "-1"], ["--batch-size", "0"], []]
+    )
+    def test_invalid_options(self, args) -> None:
+        """
+        Test that invalid options and a missing archive directory are rejected.
+
+        Args:
+            args (list): The command line arguments.
+
+        Asserts:
+            CommandError is raised.
+        """
+        with pytest.raises(CommandError):
+            call_command("dynamic_form_archive_submissions", *args)
@@ -0,0 +1,70 @@
+import sys
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from dynamic_form.models import DynamicForm, FormSubmission
+from dynamic_form.settings.conf import config
+from dynamic_form.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+
+pytestmark = [
+    pytest.mark.commands,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+@pytest.mark.django_db
+class TestCompressSubmissionsCommand:
+    """
+    Tests for the dynamic_form_compress_submissions management command.
+    """
+
+    def test_compress_and_decompress(self, dynamic_form: DynamicForm) -> None:
+        """
+        Test that existing submissions are compressed and expanded back.
+
+        Args:
+            dynamic_form (DynamicForm): The submitted form.
+
+        Asserts:
+            The rewritten submissions are reported and the data is unchanged.
+        """
+        data = {"bio": "x" * 5000}
+        submission = FormSubmission.objects.create(
+            form=dynamic_form, submitted_data=data
+        )
+        out = StringIO()
+
+        call_command(
+            "dynamic_form_compress_submissions", "--codec", "zlib", stdout=out
+        )
+        call_command("dynamic_form_compress_submissions", "--decompress", stdout=out)
+        call_command(
+            "dynamic_form_compress_submissions",
+            "--codec",
+            "zlib",
+            "--dry-run",
+            "--start-after",
+            str(submission.pk),
+            stdout=out,
+        )
+
+        lines = out.getvalue().splitlines()
+        assert lines[0] == f"Compressed 1 submission(s). Last ID: {submission.pk}."
+        assert lines[1] == f"Decompressed 1 submission(s). Last ID: {submission.pk}."
+        assert lines[2] == f"Would rewrite 0 submission(s). Last ID: {submission.pk}."
+        assert FormSubmission.objects.get().submitted_data == data
+
+    def test_invalid_options(self) -> None:
+        """
+        Test that invalid batch sizes and disabled compression are rejected.
+
+        Asserts:
+            A CommandError is raised.
+        """
+        assert config.submission_compression is None
+        with pytest.raises(CommandError, match="Compression is disabled"):
+            call_command("dynamic_form_compress_submissions")
+        with pytest.raises(CommandError, match="--batch-size"):
+            call_command("dynamic_form_compress_submissions", "--batch-size", "0")
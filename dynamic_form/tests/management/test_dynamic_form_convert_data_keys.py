@@ -0,0 +1,79 @@
+import sys
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from dynamic_form.models import DynamicField, DynamicForm, FormSubmission
+from dynamic_form.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+
+pytestmark = [
+    pytest.mark.commands,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+@pytest.mark.django_db
+class TestConvertDataKeysCommand:
+    """
+    Tests for the dynamic_form_convert_data_keys management command.
+    """
+
+    def test_convert(self, dynamic_field: DynamicField) -> None:
+        """
+        Test that the submissions of a form are rekeyed by field ID.
+
+        Args:
+            dynamic_field (DynamicField): The "email" field of the converted form.
+
+        Asserts:
+            The rewritten submissions are reported and stored by field ID.
+        """
+        submission = FormSubmission.objects.create(
+            form=dynamic_field.form, submitted_data={"email": "a@example.com"}
+        )
+        out = StringIO()
+
+        call_command(
+            "dynamic_form_convert_data_keys",
+            "--form",
+            str(dynamic_field.form_id),
+            "--to",
+            "id",
+            "--dry-run",
+            stdout=out,
+        )
+        call_command(
+            "dynamic_form_convert_data_keys",
+            "--form",
+            str(dynamic_field.form_id),
+            "--to",
+            "id",
+            stdout=out,
+        )
+
+        lines = out.getvalue().splitlines()
+        assert lines == [
+            f"Would rewrite 1 submission(s). Last ID: {submission.pk}.",
+            f"Rewrote 1 submission(s). Last ID: {submission.pk}.",
+        ]
+        stored = FormSubmission.objects.values_list("submitted_data", flat=True)
+        assert stored.get() == {str(dynamic_field.pk): "a@example.com"}
+        assert DynamicForm.objects.get().data_keys == "id"
+
+    def test_invalid_options(self) -> None:
+        """
+        Test that invalid batch sizes and unknown forms are rejected.
+
+        Asserts:
+            A CommandError is raised.
+        """
+        with pytest.raises(CommandError, match="--batch-size"):
+            call_command(
+                "dynamic_form_convert_data_keys",
+                "--form=1",
+                "--to=id",
+                "--batch-size=0",
+            )
+        with pytest.raises(CommandError, match="does not exist"):
+            call_command("dynamic_form_convert_data_keys", "--form=999", "--to=id")
@@ -0,0 +1,196 @@
+import sys
+from io import StringIO
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.db import OperationalError, connection
+
+from dynamic_form.models import DynamicField
+from dynamic_form.settings.checks import check_submission_data_indexes
+from dynamic_form.settings.conf import config
+from dynamic_form.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+from dynamic_form.utils.indexes import existing_index_names, key_index_name
+
+pytestmark = [
+    pytest.mark.commands,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+def run(*args: str) -> str:
+    out = StringIO()
+    call_command("dynamic_form_indexes", *args, stdout=out, stderr=out)
+    return out.getvalue()
+
+
+@pytest.mark.django_db
+class TestDynamicFormIndexesCommand:
+    """
+    Tests for the dynamic_form_indexes management command.
+    """
+
+    @pytest.fixture
+    def indexed_field(self, dynamic_field: DynamicField) -> DynamicField:
+        dynamic_field.is_indexed = True
+        dynamic_field.save()
+        return dynamic_field
+
+    def test_sync_creates_and_drops(self, indexed_field: DynamicField) -> None:
+        """
+        Test that declared indexes are created and undeclared ones dropped.
+
+        Args:
+            indexed_field (DynamicField): A field declared as indexed.
+
+        Asserts:
+            The index exists after a sync and is gone once the field is no longer indexed.
+        """
+        name = key_index_name(indexed_field.name)
+
+        assert "Created 1 and dropped 0" in run()
+        assert existing_index_names(connection) == {name}
+        assert "Created 0 and dropped 0" in run()
+
+        indexed_field.is_indexed = False
+        indexed_field.save()
+        assert "Created 0 and dropped 1" in run()
+        assert existing_index_names(connection) == set()
+
+    def test_list_and_dry_run(self, indexed_field: DynamicField) -> None:
+        """
+        Test that --list and --dry-run report without changing the database.
+
+        Args:
+            indexed_field (DynamicField): A field declared as indexed.
+
+        Asserts:
+            The index is reported missing, the SQL is printed and nothing is created.
+        """
+        name = key_index_name(indexed_field.name)
+
+        assert f"{name} (key 'email'): missing" in run("--list")
+        assert f'CREATE INDEX IF NOT EXISTS "{name}"' in run("--dry-run")
+        assert existing_index_names(connection) == set()
+
+        run()
+        indexed_field.is_indexed = False
+        indexed_field.save()
+        assert f"{name}: not declared" in run("--list")
+
+    def test_drop(self, indexed_field: DynamicField) -> None:
+        """
+        Test that --drop removes every managed index.
+
+        Args:
+            indexed_field (DynamicField): A field declared as indexed.
+
+        Asserts:
+            No managed index remains.
+        """
+        run()
+        assert "Created 0 and dropped 1" in run("--drop")
+        assert existing_index_names(connection) == set()
+
+    def test_unsafe_name_is_skipped(self, indexed_field: DynamicField) -> None:
+        """
+        Test that fields whose name cannot be indexed are reported.
+
+        Args:
+            indexed_field (DynamicField): A field declared as indexed.
+
+        Asserts:
+            The field is reported as skipped.
+        """
+        indexed_field.name = "e-mail address"
+        indexed_field.save()
+
+        assert "Skipping field 'e-mail address'" in run()
+
+    def test_unsupported_database(self) -> None:
+        """
+        Test that unsupported databases raise a CommandError.
+
+        Asserts:
+            CommandError is raised.
+        """
+        with patch.object(connection, "vendor", "mysql"):
+            with pytest.raises(CommandError):
+                run()
+
+    def test_check_warns_on_unindexed_filter_keys(
+        self, indexed_field: DynamicField, monkeypatch
+    ) -> None:
+        """
+        Test that the database check warns about configured filter keys until
+        their index exists.
+
+        Args:
+            indexed_field (DynamicField): A field declared as indexed.
+            monkeypatch: Pytest fixture configuring the filter fields.
+
+        Asserts:
+            Only keys used by the ordering, search or filterset fields are reported.
+            No warning is returned once the index exists.
+        """
+        assert check_submission_data_indexes(None, databases=["default"]) == []
+
+        monkeypatch.setattr(
+            config,
+            "api_form_submission_ordering_fields",
+            ["submitted_at", f"submitted_data__{indexed_field.name}"],
+        )
+        monkeypatch.setattr(
+            config, "api_admin_form_submission_search_fields", ["^submitted_data__city"]
+        )
+        monkeypatch.setattr(
+            config,
+            "api_admin_form_submission_filterset_class",
+            SimpleNamespace(
+                base_filters={
+                    "country": SimpleNamespace(
+                        field_name="submitted_data__country__iexact"
+                    )
+                }
+            ),
+        )
+        warnings = check_submission_data_indexes(None, databases=["default"])
+        assert [warning.id for warning in warnings] == [
+            f"dynamic_form.W001_{key_index_name(key)}"
+            for key in ("city", "country", indexed_field.name)
+        ]
+
+        run()
+        warnings = check_submission_data_indexes(None, databases=["default"])
+        assert len(warnings) == 2
+        assert check_submission_data_indexes(None) == []
+        with patch.object(connection, "vendor", "mysql"):
+            assert check_submission_data_indexes(None, databases=["default"]) == []
+
+    def test_check_skips_unmigrated_databases(self, monkeypatch) -> None:
+        """
+        Test that the database check, which `migrate` runs before applying
+        migrations, does not touch tables that may not exist yet.
+
+        Args:
+            monkeypatch: Pytest fixture configuring a filter field.
+
+        Asserts:
+            Databases with unapplied migrations or missing tables are skipped.
+        """
+        monkeypatch.setattr(
+            config, "api_form_submission_ordering_fields", ["submitted_data__city"]
+        )
+        assert check_submission_data_indexes(None, databases=["default"])
+
+        with patch(
+            "dynamic_form.settings.checks._has_unapplied_migrations",
+            return_value=True,
+        ):
+            assert check_submission_data_indexes(None, databases=["default"]) == []
+        with patch(
+            "dynamic_form.utils.indexes.existing_index_names",
+            side_effect=OperationalError("no such table"),
+        ):
+            assert check_submission_data_indexes(None, databases=["default"]) == []
@@ -0,0 +1,267 @@
+import sys
+from datetime import datetime, timedelta, timezone
+from io import StringIO
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.db import IntegrityError, connection, transaction
+
+from dynamic_form.models import FormSubmission
+
+from dynamic_form.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+from dynamic_form.utils.indexes import (
+    GIN_INDEX_NAME,
+    SubmissionIndex,
+    create_index_sql,
+    existing_index_names,
+)
+from dynamic_form.utils.partitioning import (
+    add_months,
+    default_partition_name,
+    existing_partitions,
+    is_partitioned,
+    month_start,
+    partition_name,
+)
+
+pytestmark = [
+    pytest.mark.commands,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+COMMAND = "dynamic_form.management.commands.dynamic_form_partitions"
+
+
+def utc(*args: int) -> datetime:
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+def postgres_connection() -> MagicMock:
+    mock_connection = MagicMock(vendor="postgresql", alias="default")
+    mock_connection.ops.quote_name = lambda name: f'"{name}"'
+    return mock_connection
+
+
+class TestPartitionsCommand:
+    """
+    Tests for the dynamic_form_partitions management command.
+    """
+
+    def test_unsupported_database(self) -> None:
+        """
+        Test that the command refuses to run on other databases than PostgreSQL.
+
+        Asserts:
+            CommandError is raised on SQLite.
+        """
+        sqlite = MagicMock(vendor="sqlite")
+        with patch(f"{COMMAND}.connections", {"default": sqlite}):
+            with pytest.raises(CommandError):
+                call_command("dynamic_form_partitions")
+
+    @patch(f"{COMMAND}.timezone.now", return_value=utc(2026, 10, 18))
+    def test_maintenance(self, _now) -> None:
+        """
+        Test that missing future partitions are created and old ones detached.
+
+        Asserts:
+            Only the missing months are created and the old month is detached.
+        """
+        pg = postgres_connection()
+        out = StringIO()
+        with patch(f"{COMMAND}.connections", {"default": pg}), patch(
+            f"{COMMAND}.is_partitioned", return_value=True
+        ), patch(
+            f"{COMMAND}.existing_partitions",
+            return_value=["form_submissions_p2026_06", "form_submissions_p2026_10"],
+        ):
+            call_command(
+                "dynamic_form_partitions",
+                "--ahead",
+                "1",
+                "--detach-older-than",
+                "3",
+                "--dry-run",
+                stdout=out,
+            )
+
+        lines = out.getvalue().splitlines()
+        assert len(lines) == 2
+        assert '"form_submissions_p2026_11"' in lines[0]
+        assert lines[1].endswith('DETACH PARTITION "form_submissions_p2026_06";')
+
+    @patch(f"{COMMAND}.timezone.now", return_value=utc(2026, 10, 18))
+    def test_maintenance_with_default_partition(self, _now) -> None:
+        """
+        Test that new partitions take over the rows of their month from the
+        default partition.
+
+        Asserts:
+            The partition is created as a table, filled from the default
+            partition and attached.
+        """
+        pg = postgres_connection()
+        out = StringIO()
+        with patch(f"{COMMAND}.connections", {"default": pg}), patch(
+            f"{COMMAND}.is_partitioned", return_value=True
+        ), patch(
+            f"{COMMAND}.existing_partitions",
+            return_value=["form_submissions_default", "form_submissions_p2026_10"],
+        ):
+            call_command(
+                "dynamic_form_partitions", "--ahead", "1", "--dry-run", stdout=out
+            )
+
+        lines = out.getvalue().splitlines()
+        assert len(lines) == 3
+        assert lines[0].startswith('CREATE TABLE "form_submissions_p2026_11" (LIKE')
+        assert 'DELETE FROM "form_submissions_default"' in lines[1]
+        assert 'ATTACH PARTITION "form_submissions_p2026_11"' in lines[2]
+
+    def test_setup_requires_unpartitioned_table(self) -> None:
+        """
+        Test that setup is refused on a partitioned table and maintenance on
+        a regular one.
+
+        Asserts:
+            CommandError is raised in both cases.
+        """
+        pg = postgres_connection()
+        with patch(f"{COMMAND}.connections", {"default": pg}):
+            with patch(f"{COMMAND}.is_partitioned", return_value=True):
+                with pytest.raises(CommandError):
+                    call_command("dynamic_form_partitions", "--setup")
+            with patch(f"{COMMAND}.is_partitioned", return_value=False):
+                with pytest.raises(CommandError):
+                    call_command("dynamic_form_partitions")
+
+    @pytest.mark.django_db
+    def test_setup_and_list(self) -> None:
+        """
+        Test that setup runs its statements in a transaction and list shows partitions.
+
+        Asserts:
+            Every statement is executed and the partitions are listed.
+        """
+        pg = postgres_connection()
+        cursor = pg.cursor.return_value.__enter__.return_value
+        cursor.fetchone.return_value = (None, None)
+        out = StringIO()
+        with patch(f"{COMMAND}.connections", {"default": pg}), patch(
+            f"{COMMAND}.transaction"
+        ) as transaction:
+            with patch(f"{COMMAND}.is_partitioned", return_value=False):
+                call_command("dynamic_form_partitions", "--setup", stdout=out)
+            with patch(f"{COMMAND}.is_partitioned", return_value=True), patch(
+                f"{COMMAND}.existing_partitions",
+                return_value=["form_submissions_p2026_10"],
+            ):
+                call_command("dynamic_form_partitions", "--list", stdout=out)
+
+        transaction.atomic.assert_called_once_with(using="default")
+        assert cursor.execute.call_count > 10
+        assert "form_submissions_p2026_10" in out.getvalue()
+
+    @pytest.mark.parametrize(
+        "args", [["--ahead", "-1"], ["--detach-older-than", "-1"]]
+    )
+    def test_invalid_options(self, args) -> None:
+        """
+        Test that negative month counts are rejected.
+
+        Args:
+            args (list): The command line arguments.
+
+        Asserts:
+            CommandError is raised.
+        """
+        with patch(f"{COMMAND}.connections", {"default": postgres_connection()}):
+            with pytest.raises(CommandError):
+                call_command("dynamic_form_partitions", *args)
+
+
+@pytest.mark.django_db
+@pytest.mark.skipif(
+    connection.vendor != "postgresql", reason="Partitioning requires PostgreSQL."
+)
+class TestPartitionsOnPostgreSQL:
+    """
+    End-to-end tests of the dynamic_form_partitions command on PostgreSQL.
+    """
+
+    def partition_rows(self, name: str) -> int:
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT COUNT(*) FROM {connection.ops.quote_name(name)}")
+            return cursor.fetchone()[0]
+
+    def test_setup_create_and_detach(self, user, dynamic_form) -> None:
+        """
+        Test that the table is converted, that new partitions take over the
+        rows of their month from the default partition and that old partitions
+        are detached.
+
+        Args:
+            user (User): The submitting user.
+            dynamic_form (DynamicForm): The form being submitted.
+
+        Asserts:
+            Rows, indexes and foreign keys survive the conversion, rows parked in
+            the default partition are moved, and detached months leave the table.
+        """
+        now = datetime.now(timezone.utc)
+        this_month = month_start(now)
+        old_month = add_months(this_month, -13)
+        late_month = add_months(this_month, 3)
+        for submitted_at in (now, old_month + timedelta(days=2)):
+            submission = FormSubmission.objects.create(
+                user=user, form=dynamic_form, submitted_data={}
+            )
+            FormSubmission.objects.filter(pk=submission.pk).update(
+                submitted_at=submitted_at
+            )
+        with connection.cursor() as cursor:
+            # The test transaction must not hold deferred checks during DDL
+            cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+            cursor.execute(
+                create_index_sql(
+                    SubmissionIndex(name=GIN_INDEX_NAME), connection, concurrently=False
+                )
+            )
+
+        call_command(
+            "dynamic_form_partitions", "--setup", "--ahead", "1", stdout=StringIO()
+        )
+
+        assert is_partitioned(connection)
+        assert FormSubmission.objects.count() == 2
+        assert GIN_INDEX_NAME in existing_index_names(connection)
+        with pytest.raises(IntegrityError), transaction.atomic():
+            FormSubmission.objects.create(
+                user=user, form_id=dynamic_form.pk + 1000, submitted_data={}
+            )
+
+        late = FormSubmission.objects.create(
+            user=user, form=dynamic_form, submitted_data={}
+        )
+        FormSubmission.objects.filter(pk=late.pk).update(
+            submitted_at=late_month + timedelta(days=5)
+        )
+        assert self.partition_rows(default_partition_name()) == 1
+
+        call_command(
+            "dynamic_form_partitions",
+            "--ahead",
+            "3",
+            "--detach-older-than",
+            "12",
+            stdout=StringIO(),
+        )
+
+        partitions = existing_partitions(connection)
+        assert partition_name(late_month) in partitions
+        assert partition_name(old_month) not in partitions
+        assert self.partition_rows(default_partition_name()) == 0
+        assert self.partition_rows(partition_name(late_month)) == 1
+        assert self.partition_rows(partition_name(old_month)) == 1
+        assert FormSubmission.objects.count() == 2
@@ -0,0 +1,50 @@
+import sys
+from io import StringIO
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.management import CommandError, call_command
+
+from dynamic_form.models import IdempotencyKey
+from dynamic_form.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+
+pytestmark = [
+    pytest.mark.commands,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+@pytest.mark.django_db
+class TestPurgeIdempotencyKeysCommand:
+    """
+    Tests for the dynamic_form_purge_idempotency_keys management command.
+    """
+
+    def test_purge(self, user: User) -> None:
+        """
+        Test that the command deletes expired keys.
+
+        Args:
+            user (User): The user owning the key.
+
+        Asserts:
+            The expired key is deleted and reported.
+        """
+        IdempotencyKey.objects.create(user=user, key="old", request_fingerprint="")
+        out = StringIO()
+
+        IdempotencyKey.objects.update(created_at="2000-01-01T00:00:00Z")
+        call_command("dynamic_form_purge_idempotency_keys", stdout=out)
+
+        assert "Deleted 1 expired idempotency key(s)." in out.getvalue()
+        assert not IdempotencyKey.objects.exists()
+
+    def test_invalid_batch_size(self) -> None:
+        """
+        Test that a non-positive batch size is rejected.
+
+        Asserts:
+            CommandError is raised.
+        """
+        with pytest.raises(CommandError):
+            call_command("dynamic_form_purge_idempotency_keys", "--batch-size", "0")
@@ -0,0 +1,66 @@
+import sys
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from dynamic_form.models import DynamicField
+from dynamic_form.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+
+pytestmark = [
+    pytest.mark.commands,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+@pytest.mark.django_db
+class TestRebalanceFieldOrderCommand:
+    """
+    Tests for the dynamic_form_rebalance_field_order management command.
+    """
+
+    def test_rebalance(self, dynamic_field: DynamicField) -> None:
+        """
+        Test that the command respaces the fields of crowded forms.
+
+        Args:
+            dynamic_field (DynamicField): A field of the rebalanced form.
+
+        Asserts:
+            The dry run only reports the form, and the run respaces its fields.
+        """
+        DynamicField.objects.create(
+            form=dynamic_field.form, field_type=dynamic_field.field_type, name="b"
+        )
+        out = StringIO()
+
+        call_command("dynamic_form_rebalance_field_order", "--dry-run", stdout=out)
+        call_command(
+            "dynamic_form_rebalance_field_order",
+            "--form",
+            str(dynamic_field.form_id),
+            "--gap",
+            "10",
+            stdout=out,
+        )
+
+        output = out.getvalue()
+        assert f"Would rebalance 1 form(s): {dynamic_field.form_id}." in output
+        assert f"Rebalanced 1 form(s): {dynamic_field.form_id}." in output
+        assert list(
+            DynamicField.objects.order_by("order").values_list("order", flat=True)
+        ) == [10, 20]
+
+    @pytest.mark.parametrize("option", [("--min-gap", "0"), ("--gap", "1")])
+    def test_invalid_options(self, option) -> None:
+        """
+        Test that invalid gaps are rejected.
+
+        Args:
+            option: The invalid option and value.
+
+        Asserts:
+            CommandError is raised.
+        """
+        with pytest.raises(CommandError):
+            call_command("dynamic_form_rebalance_field_order", *option)
@@ -0,0 +1,55 @@
+import sys
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from dynamic_form.models import DynamicForm, FormSubmission
+from dynamic_form.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+
+pytestmark = [
+    pytest.mark.commands,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+@pytest.mark.django_db
+class TestReconcileCountersCommand:
+    """
+    Tests for the dynamic_form_reconcile_counters management command.
+    """
+
+    def test_reconcile(self, form_submission: FormSubmission) -> None:
+        """
+        Test that the command repairs drifted counters.
+
+        Args:
+            form_submission (FormSubmission): A submission of the reconciled form.
+
+        Asserts:
+            The counter is recomputed and the number of updated forms is reported.
+        """
+        DynamicForm.objects.update(submission_count=0)
+        out = StringIO()
+
+        call_command(
+            "dynamic_form_reconcile_counters",
+            "--form",
+            str(form_submission.form_id),
+            "--chunk-size",
+            "10",
+            stdout=out,
+        )
+
+        assert "Updated the counters of 1 form(s)." in out.getvalue()
+        assert DynamicForm.objects.get().submission_count == 1
+
+    def test_invalid_chunk_size(self) -> None:
+        """
+        Test that a non-positive chunk size is rejected.
+
+        Asserts:
+            CommandError is raised.
+        """
+        with pytest.raises(CommandError):
+            call_command("dynamic_form_reconcile_counters", "--chunk-size", "0")
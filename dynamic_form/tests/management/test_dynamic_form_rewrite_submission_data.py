@@ -0,0 +1,82 @@
+import sys
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from dynamic_form.models import FormSubmission
+from dynamic_form.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+
+pytestmark = [
+    pytest.mark.commands,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+@pytest.mark.django_db
+class TestRewriteSubmissionDataCommand:
+    """
+    Tests for the dynamic_form_rewrite_submission_data management command.
+    """
+
+    def test_rewrite(self, form_submission: FormSubmission) -> None:
+        """
+        Test that the operations are applied in the given order.
+
+        Args:
+            form_submission (FormSubmission): A submission with an "email" answer.
+
+        Asserts:
+            The operations, batches and rewritten submissions are reported.
+        """
+        out = StringIO()
+
+        call_command(
+            "dynamic_form_rewrite_submission_data",
+            "--form",
+            str(form_submission.form_id),
+            "--rename",
+            "email",
+            "mail",
+            "--map",
+            "mail",
+            '{"test@example.com": "hidden"}',
+            "--drop",
+            "unused",
+            stdout=out,
+        )
+
+        lines = out.getvalue().splitlines()
+        assert lines == [
+            "Operation: rename 'email' to 'mail'",
+            "Operation: map 1 value(s) of 'mail'",
+            "Operation: drop 'unused'",
+            f"Batch 1: 1 rewritten so far, last ID {form_submission.pk}",
+            "Rewrote 1 submission(s).",
+        ]
+        form_submission.refresh_from_db()
+        assert form_submission.submitted_data == {"mail": "hidden"}
+
+    @pytest.mark.parametrize(
+        "args, message",
+        [
+            (["--drop", "a", "--batch-size", "0"], "--batch-size"),
+            (["--drop", "a", "--sleep", "-1"], "--sleep"),
+            ([], "at least one"),
+            (["--map", "a", "[]"], "JSON object"),
+            (["--map", "a", "{"], "Expecting"),
+        ],
+    )
+    def test_invalid_options(self, args, message) -> None:
+        """
+        Test that invalid options are rejected.
+
+        Args:
+            args: The command line arguments after --form.
+            message: Part of the expected error.
+
+        Asserts:
+            A CommandError is raised.
+        """
+        with pytest.raises(CommandError, match=message):
+            call_command("dynamic_form_rewrite_submission_data", "--form", "1", *args)
@@ -0,0 +1,68 @@
+import sys
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.utils import timezone
+
+from dynamic_form.models import FormSubmission
+from dynamic_form.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+
+pytestmark = [
+    pytest.mark.commands,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+@pytest.mark.django_db
+class TestPurgeFormSubmissionsCommand:
+    """
+    Tests for the purge_form_submissions management command.
+    """
+
+    def test_dry_run_then_purge(self, form_submission: FormSubmission) -> None:
+        """
+        Test that the command reports matching submissions and deletes them.
+
+        Args:
+            form_submission (FormSubmission): An old submission.
+
+        Asserts:
+            The dry run keeps the submission; the real run deletes it.
+        """
+        FormSubmission.objects.update(submitted_at=timezone.now() - timedelta(days=10))
+        out = StringIO()
+
+        call_command("purge_form_submissions", "--days", "7", "--dry-run", stdout=out)
+        assert f"Form #{form_submission.form_id}: 1 submission(s)" in out.getvalue()
+        assert "Would delete 1 submission(s)." in out.getvalue()
+        assert FormSubmission.objects.exists()
+
+        call_command(
+            "purge_form_submissions", "--days", "7", "--sleep", "0.01", stdout=out
+        )
+        assert f"last ID {form_submission.pk}" in out.getvalue()
+        assert "Deleted 1 submission(s)." in out.getvalue()
+        assert not FormSubmission.objects.exists()
+
+    @pytest.mark.parametrize(
+        "args",
+        [
+            ["--days", "-1"],
+            ["--days", "7", "--batch-size", "0"],
+            ["--days", "7", "--sleep", "-1"],
+        ],
+    )
+    def test_invalid_options(self, args) -> None:
+        """
+        Test that invalid options are rejected.
+
+        Args:
+            args (list): The command line arguments.
+
+        Asserts:
+            CommandError is raised.
+        """
+        with pytest.raises(CommandError):
+            call_command("purge_form_submissions", *args)
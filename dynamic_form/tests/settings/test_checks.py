@@ -2,8 +2,12 @@ import sys
 from unittest.mock import MagicMock, patch
 
 import pytest
+from django.test import override_settings
 
-from dynamic_form.settings.checks import check_dynamic_form_settings
+from dynamic_form.settings.checks import (
+    check_dynamic_form_settings,
+    check_shared_cache,
+)
 from dynamic_form.tests.constants import (
     PYTHON_VERSION,
     PYTHON_VERSION_REASON,
@@ -123,6 +127,7 @@ class TestDynamicFormSettings:
         mock_config.api_form_submission_allow_create = True
         mock_config.api_form_submission_allow_update = False
         mock_config.api_form_submission_allow_delete = True
+        mock_config.api_form_submission_compact_representation = False
         mock_config.api_form_submission_serializer_class = None
         mock_config.api_form_submission_ordering_fields = ["submitted_at"]
         mock_config.api_form_submission_search_fields = ["form__name"]
@@ -138,6 +143,7 @@ class TestDynamicFormSettings:
         mock_config.api_admin_form_submission_allow_create = True
         mock_config.api_admin_form_submission_allow_update = False
         mock_config.api_admin_form_submission_allow_delete = True
+        mock_config.api_admin_form_submission_compact_representation = False
         mock_config.api_admin_form_submission_serializer_class = None
         mock_config.api_admin_form_submission_ordering_fields = ["submitted_at"]
         mock_config.api_admin_form_submission_search_fields = ["form__name"]
@@ -232,18 +238,20 @@ class TestDynamicFormSettings:
         mock_config.api_form_submission_allow_create = "not_boolean"
         mock_config.api_form_submission_allow_update = "not_boolean"
         mock_config.api_form_submission_allow_delete = "not_boolean"
+        mock_config.api_form_submission_compact_representation = "not_boolean"
         mock_config.api_admin_form_submission_allow_list = "not_boolean"
         mock_config.api_admin_form_submission_allow_retrieve = "not_boolean"
         mock_config.api_admin_form_submission_allow_create = "not_boolean"
         mock_config.api_admin_form_submission_allow_update = "not_boolean"
         mock_config.api_admin_form_submission_allow_delete = "not_boolean"
+        mock_config.api_admin_form_submission_compact_representation = "not_boolean"
 
         mock_config.get_setting.side_effect = lambda name, default: default
 
         errors = check_dynamic_form_settings(None)
         assert (
-            len(errors) == 35
-        ), f"Expected 35 errors for invalid booleans, but got {len(errors)}"
+            len(errors) == 37
+        ), f"Expected 37 errors for invalid booleans, but got {len(errors)}"
         error_ids = [error.id for error in errors]
         expected_ids = [
             f"dynamic_form.E001_{mock_config.prefix}ADMIN_HAS_ADD_PERMISSION",
@@ -276,11 +284,13 @@ class TestDynamicFormSettings:
             f"dynamic_form.E001_{mock_config.prefix}API_FORM_SUBMISSION_ALLOW_CREATE",
             f"dynamic_form.E001_{mock_config.prefix}API_FORM_SUBMISSION_ALLOW_UPDATE",
             f"dynamic_form.E001_{mock_config.prefix}API_FORM_SUBMISSION_ALLOW_DELETE",
+            f"dynamic_form.E001_{mock_config.prefix}API_FORM_SUBMISSION_COMPACT_REPRESENTATION",
             f"dynamic_form.E001_{mock_config.prefix}API_ADMIN_FORM_SUBMISSION_ALLOW_LIST",
             f"dynamic_form.E001_{mock_config.prefix}API_ADMIN_FORM_SUBMISSION_ALLOW_RETRIEVE",
             f"dynamic_form.E001_{mock_config.prefix}API_ADMIN_FORM_SUBMISSION_ALLOW_CREATE",
             f"dynamic_form.E001_{mock_config.prefix}API_ADMIN_FORM_SUBMISSION_ALLOW_UPDATE",
             f"dynamic_form.E001_{mock_config.prefix}API_ADMIN_FORM_SUBMISSION_ALLOW_DELETE",
+            f"dynamic_form.E001_{mock_config.prefix}API_ADMIN_FORM_SUBMISSION_COMPACT_REPRESENTATION",
         ]
         assert all(
             eid in error_ids for eid in expected_ids
@@ -330,11 +340,13 @@ class TestDynamicFormSettings:
         mock_config.api_form_submission_allow_create = True
         mock_config.api_form_submission_allow_update = False
         mock_config.api_form_submission_allow_delete = True
+        mock_config.api_form_submission_compact_representation = False
         mock_config.api_admin_form_submission_allow_list = True
         mock_config.api_admin_form_submission_allow_retrieve = False
         mock_config.api_admin_form_submission_allow_create = True
         mock_config.api_admin_form_submission_allow_update = False
         mock_config.api_admin_form_submission_allow_delete = True
+        mock_config.api_admin_form_submission_compact_representation = False
 
         # Invalid list settings
         mock_config.user_serializer_fields = [123]  # Invalid type
@@ -427,11 +439,13 @@ class TestDynamicFormSettings:
         mock_config.api_form_submission_allow_create = True
         mock_config.api_form_submission_allow_update = False
         mock_config.api_form_submission_allow_delete = True
+        mock_config.api_form_submission_compact_representation = False
         mock_config.api_admin_form_submission_allow_list = True
         mock_config.api_admin_form_submission_allow_retrieve = False
         mock_config.api_admin_form_submission_allow_create = True
         mock_config.api_admin_form_submission_allow_update = False
         mock_config.api_admin_form_submission_allow_delete = True
+        mock_config.api_admin_form_submission_compact_representation = False
         mock_config.user_serializer_fields = ["id", "username"]
         mock_config.api_dynamic_form_ordering_fields = ["name"]
         mock_config.api_dynamic_form_search_fields = ["name"]
@@ -511,11 +525,13 @@ class TestDynamicFormSettings:
         mock_config.api_form_submission_allow_create = True
         mock_config.api_form_submission_allow_update = False
         mock_config.api_form_submission_allow_delete = True
+        mock_config.api_form_submission_compact_representation = False
         mock_config.api_admin_form_submission_allow_list = True
         mock_config.api_admin_form_submission_allow_retrieve = False
         mock_config.api_admin_form_submission_allow_create = True
         mock_config.api_admin_form_submission_allow_update = False
         mock_config.api_admin_form_submission_allow_delete = True
+        mock_config.api_admin_form_submission_compact_representation = False
         mock_config.base_user_throttle_rate = "100/day"
         mock_config.staff_user_throttle_rate = "200/hour"
         mock_config.user_serializer_fields = ["id", "username"]
@@ -543,13 +559,20 @@ class TestDynamicFormSettings:
 
         errors = check_dynamic_form_settings(None)
         assert (
-            len(errors) == 51
-        ), f"Expected 51 errors for invalid paths, but got {len(errors)}"
+            len(errors) == 63
+        ), f"Expected 63 errors for invalid paths, but got {len(errors)}"
         error_ids = [error.id for error in errors]
         expected_ids = [
             f"dynamic_form.E010_{mock_config.prefix}ADMIN_SITE_CLASS",
             f"dynamic_form.E010_{mock_config.prefix}API_ADMIN_PERMISSION_CLASS",
             f"dynamic_form.E010_{mock_config.prefix}API_USER_SERIALIZER_CLASS",
+            f"dynamic_form.E011_{mock_config.prefix}API_RENDERER_CLASSES",
+            f"dynamic_form.E015_{mock_config.prefix}CACHE_ALIAS",
+            f"dynamic_form.E014_{mock_config.prefix}SCHEMA_CACHE_TIMEOUT",
+            f"dynamic_form.E014_{mock_config.prefix}EXPORT_CHUNK_SIZE",
+            f"dynamic_form.E014_{mock_config.prefix}IDEMPOTENCY_KEY_TTL",
+            f"dynamic_form.E017_{mock_config.prefix}SUBMISSION_COMPRESSION",
+            f"dynamic_form.E014_{mock_config.prefix}SUBMISSION_COMPRESSION_THRESHOLD",
             f"dynamic_form.E010_{mock_config.prefix}API_DYNAMIC_FORM_SERIALIZER_CLASS",
             f"dynamic_form.E011_{mock_config.prefix}API_DYNAMIC_FORM_THROTTLE_CLASSES",
             f"dynamic_form.E010_{mock_config.prefix}API_DYNAMIC_FORM_PAGINATION_CLASS",
@@ -574,6 +597,7 @@ class TestDynamicFormSettings:
             f"dynamic_form.E010_{mock_config.prefix}API_ADMIN_DYNAMIC_FIELD_EXTRA_PERMISSION_CLASS",
             f"dynamic_form.E011_{mock_config.prefix}API_ADMIN_DYNAMIC_FIELD_PARSER_CLASSES",
             f"dynamic_form.E010_{mock_config.prefix}API_ADMIN_DYNAMIC_FIELD_FILTERSET_CLASS",
+            f"dynamic_form.E014_{mock_config.prefix}API_ADMIN_DYNAMIC_FIELD_BULK_MAX_ITEMS",
             f"dynamic_form.E010_{mock_config.prefix}API_FIELD_TYPE_SERIALIZER_CLASS",
             f"dynamic_form.E011_{mock_config.prefix}API_FIELD_TYPE_THROTTLE_CLASSES",
             f"dynamic_form.E010_{mock_config.prefix}API_FIELD_TYPE_PAGINATION_CLASS",
@@ -591,14 +615,65 @@ class TestDynamicFormSettings:
             f"dynamic_form.E010_{mock_config.prefix}API_FORM_SUBMISSION_PAGINATION_CLASS",
             f"dynamic_form.E010_{mock_config.prefix}API_FORM_SUBMISSION_EXTRA_PERMISSION_CLASS",
             f"dynamic_form.E011_{mock_config.prefix}API_FORM_SUBMISSION_PARSER_CLASSES",
+            f"dynamic_form.E011_{mock_config.prefix}API_FORM_SUBMISSION_RENDERER_CLASSES",
             f"dynamic_form.E010_{mock_config.prefix}API_FORM_SUBMISSION_FILTERSET_CLASS",
+            f"dynamic_form.E014_{mock_config.prefix}API_FORM_SUBMISSION_BULK_BATCH_SIZE",
+            f"dynamic_form.E014_{mock_config.prefix}API_FORM_SUBMISSION_BULK_MAX_ITEMS",
             f"dynamic_form.E010_{mock_config.prefix}API_ADMIN_FORM_SUBMISSION_SERIALIZER_CLASS",
             f"dynamic_form.E011_{mock_config.prefix}API_ADMIN_FORM_SUBMISSION_THROTTLE_CLASSES",
             f"dynamic_form.E010_{mock_config.prefix}API_ADMIN_FORM_SUBMISSION_PAGINATION_CLASS",
             f"dynamic_form.E010_{mock_config.prefix}API_ADMIN_FORM_SUBMISSION_EXTRA_PERMISSION_CLASS",
             f"dynamic_form.E011_{mock_config.prefix}API_ADMIN_FORM_SUBMISSION_PARSER_CLASSES",
+            f"dynamic_form.E011_{mock_config.prefix}API_ADMIN_FORM_SUBMISSION_RENDERER_CLASSES",
             f"dynamic_form.E010_{mock_config.prefix}API_ADMIN_FORM_SUBMISSION_FILTERSET_CLASS",
         ]
         assert all(
             eid in error_ids for eid in expected_ids
         ), f"Expected error IDs {expected_ids}, got {error_ids}"
+
+
+class TestSharedCacheCheck:
+    """
+    Tests for the warning about process-local schema caches.
+    """
+
+    @pytest.mark.parametrize(
+        "backend, warned",
+        [
+            ("django.core.cache.backends.locmem.LocMemCache", True),
+            ("django.core.cache.backends.dummy.DummyCache", True),
+            ("django.core.cache.backends.filebased.FileBasedCache", False),
+        ],
+    )
+    def test_process_local_backends(
+        self, backend: str, warned: bool, tmp_path
+    ) -> None:
+        """
+        Test that process-local cache backends are reported.
+
+        Args:
+            backend (str): The backend of the configured cache.
+            warned (bool): Whether a warning is expected.
+            tmp_path: The location of the file based cache.
+
+        Asserts:
+            Only LocMemCache and DummyCache raise dynamic_form.W002.
+        """
+        cache_settings = {"default": {"BACKEND": backend, "LOCATION": str(tmp_path)}}
+        with override_settings(CACHES=cache_settings):
+            warnings = check_shared_cache(None)
+
+        assert [warning.id for warning in warnings] == (
+            ["dynamic_form.W002"] if warned else []
+        )
+
+    def test_unknown_alias_is_left_to_the_settings_check(self) -> None:
+        """
+        Test that an alias missing from CACHES is not reported twice.
+
+        Asserts:
+            No warning is returned; E015 already reports the alias.
+        """
+        with patch("dynamic_form.settings.checks.config") as mock_config:
+            mock_config.cache_alias = "missing"
+            assert check_shared_cache(None) == []
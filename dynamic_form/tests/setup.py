@@ -1,19 +1,32 @@
+import os
+
 import django
 from django.conf import settings
 from django.core.management.utils import get_random_secret_key
 
 
+def database_settings() -> dict:
+    # PostgreSQL when DYNAMIC_FORM_TEST_POSTGRES_HOST is set (the credentials
+    # come from the PGUSER/PGPASSWORD variables), SQLite in memory otherwise
+    host = os.environ.get("DYNAMIC_FORM_TEST_POSTGRES_HOST")
+    if host:
+        return {
+            "ENGINE": "django.db.backends.postgresql",
+            "NAME": os.environ.get("PGDATABASE", "postgres"),
+            "HOST": host,
+        }
+    return {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": ":memory:",
+    }
+
+
 def configure_django_settings() -> None:
     if not settings.configured:
         settings.configure(
             DEBUG=True,
             SECRET_KEY=get_random_secret_key(),  # Add a secret key for testing
-            DATABASES={
-                "default": {
-                    "ENGINE": "django.db.backends.sqlite3",
-                    "NAME": ":memory:",
-                }
-            },
+            DATABASES={"default": database_settings()},
             INSTALLED_APPS=[
                 "django.contrib.admin",
                 "django.contrib.auth",
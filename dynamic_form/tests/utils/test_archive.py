@@ -0,0 +1,325 @@
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import List
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from dynamic_form.models import DynamicField, DynamicForm, FormSubmission
+from dynamic_form.settings.conf import config
+from dynamic_form.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+from dynamic_form.utils import archive
+from dynamic_form.utils.archive import (
+    MonthRanges,
+    archive_lock,
+    archive_submissions,
+    get_archived_submission,
+    iter_archived_rows,
+    load_index,
+    load_month_ranges,
+)
+
+pytestmark = [
+    pytest.mark.utils,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+NOW = datetime(2026, 10, 18, tzinfo=timezone.utc)
+
+
+def create_submissions(form: DynamicForm, *times: datetime) -> List[int]:
+    """Create one submission per time and return their IDs."""
+    ids = []
+    for index, submitted_at in enumerate(times):
+        submission = FormSubmission.objects.create(
+            form=form, submitted_data={"email": f"user{index}@example.com"}
+        )
+        FormSubmission.objects.filter(pk=submission.pk).update(
+            submitted_at=submitted_at
+        )
+        ids.append(submission.pk)
+    return ids
+
+
+@pytest.mark.django_db
+class TestArchiveSubmissions:
+    """
+    Tests for archiving submissions to compressed segment files.
+    """
+
+    def test_archive_and_read(self, dynamic_form: DynamicForm, tmp_path: Path) -> None:
+        """
+        Test that old submissions are moved to per-month segments and read back.
+
+        Args:
+            dynamic_form (DynamicForm): The form owning the submissions.
+            tmp_path (Path): The archive directory.
+
+        Asserts:
+            Old submissions leave the database but still count, one segment is
+            written per month, and each submission can be found by ID or time
+            range.
+        """
+        ids = create_submissions(
+            dynamic_form,
+            datetime(2026, 5, 30, tzinfo=timezone.utc),
+            datetime(2026, 5, 31, tzinfo=timezone.utc),
+            datetime(2026, 6, 2, tzinfo=timezone.utc),
+            NOW,
+        )
+
+        with patch.object(archive, "BLOCK_SIZE", 1):
+            result = archive_submissions(NOW - timedelta(days=90), root=str(tmp_path))
+        dynamic_form.refresh_from_db()
+
+        assert (result.archived, result.segments) == (3, 2)
+        assert list(FormSubmission.objects.values_list("pk", flat=True)) == [ids[3]]
+        assert dynamic_form.submission_count == 4
+        months = load_index(tmp_path)["forms"][str(dynamic_form.pk)]
+        assert sorted(months) == ["2026-05", "2026-06"]
+        assert months["2026-05"]["count"] == 2
+
+        record = get_archived_submission(ids[1], root=str(tmp_path))
+        assert record["form_id"] == dynamic_form.pk
+        assert record["submitted_data"] == {"email": "user1@example.com"}
+        assert get_archived_submission(ids[3], root=str(tmp_path)) is None
+
+        rows = list(
+            iter_archived_rows(
+                dynamic_form.pk,
+                after=datetime(2026, 5, 31, tzinfo=timezone.utc),
+                before=datetime(2026, 6, 1, tzinfo=timezone.utc),
+                root=str(tmp_path),
+            )
+        )
+        assert [row[0] for row in rows] == [ids[1]]
+        assert rows[0][1] == datetime(2026, 5, 31, tzinfo=timezone.utc)
+
+    def test_resume_and_dry_run(
+        self, dynamic_form: DynamicForm, tmp_path: Path
+    ) -> None:
+        """
+        Test that a rerun after an interrupted run does not archive rows twice.
+
+        Args:
+            dynamic_form (DynamicForm): The form owning the submissions.
+            tmp_path (Path): The archive directory.
+
+        Asserts:
+            The dry run counts without writing; rows archived before the
+            interruption are deleted without a second copy; archiving stops
+            at the first recent submission.
+        """
+        old = datetime(2026, 1, 10, tzinfo=timezone.utc)
+        ids = create_submissions(dynamic_form, old, NOW, old)
+
+        dry = archive_submissions(NOW, dry_run=True, root=str(tmp_path))
+        assert dry.per_form == {dynamic_form.pk: 1}
+        assert not (tmp_path / "index.json").exists()
+
+        with patch.object(archive, "delete_submissions"):
+            archive_submissions(NOW, root=str(tmp_path))
+        assert FormSubmission.objects.count() == 3
+
+        result = archive_submissions(NOW, root=str(tmp_path))
+        assert result.archived == 0
+        assert set(FormSubmission.objects.values_list("pk", flat=True)) == {
+            ids[1],
+            ids[2],
+        }
+        assert load_index(tmp_path)["forms"][str(dynamic_form.pk)]["2026-01"][
+            "count"
+        ] == 1
+
+    def test_rows_added_below_the_archived_ids(
+        self, dynamic_form: DynamicForm, tmp_path: Path
+    ) -> None:
+        """
+        Test that rows joining a form after it was archived are archived
+        before being deleted, even when their ID is below the archived ones.
+
+        Args:
+            dynamic_form (DynamicForm): The form owning the submissions.
+            tmp_path (Path): The archive directory.
+
+        Asserts:
+            The moved old row is written to the archive and deleted, the moved
+            recent row stays in the database, and the dry run counts the former.
+        """
+        other = DynamicForm.objects.create(name="Other")
+        old = datetime(2026, 1, 10, tzinfo=timezone.utc)
+        moved = create_submissions(other, old, NOW)
+        create_submissions(dynamic_form, old, old)
+        archive_submissions(NOW, form_ids=[dynamic_form.pk], root=str(tmp_path))
+
+        FormSubmission.objects.filter(pk__in=moved).update(form=dynamic_form)
+
+        dry = archive_submissions(NOW, dry_run=True, root=str(tmp_path))
+        assert dry.per_form == {dynamic_form.pk: 1}
+        result = archive_submissions(NOW, root=str(tmp_path))
+
+        assert (result.archived, result.segments) == (1, 1)
+        assert list(FormSubmission.objects.values_list("pk", flat=True)) == [moved[1]]
+        record = get_archived_submission(moved[0], root=str(tmp_path))
+        assert record["form_id"] == dynamic_form.pk
+        assert load_index(tmp_path)["forms"][str(dynamic_form.pk)]["2026-01"][
+            "count"
+        ] == 3
+
+    def test_concurrent_runs_are_rejected(
+        self, dynamic_form: DynamicForm, tmp_path: Path
+    ) -> None:
+        """
+        Test that a run fails while another one holds the archive lock.
+
+        Args:
+            dynamic_form (DynamicForm): The form owning the submissions.
+            tmp_path (Path): The archive directory.
+
+        Asserts:
+            The second run archives nothing until the lock is released; dry
+            runs do not need the lock.
+        """
+        create_submissions(dynamic_form, datetime(2026, 1, 10, tzinfo=timezone.utc))
+
+        with archive_lock(tmp_path):
+            with pytest.raises(ValueError, match="Another archive run"):
+                archive_submissions(NOW, root=str(tmp_path))
+            assert archive_submissions(NOW, dry_run=True, root=str(tmp_path)).archived
+        assert FormSubmission.objects.count() == 1
+
+        assert archive_submissions(NOW, root=str(tmp_path)).archived == 1
+        assert not FormSubmission.objects.exists()
+
+    def test_lookup_by_id_ranges(self, tmp_path: Path) -> None:
+        """
+        Test that lookups by ID only visit the months whose ID range
+        contains the ID.
+
+        Args:
+            tmp_path (Path): The archive directory.
+
+        Asserts:
+            - Submissions of forms with interleaved IDs are found.
+            - Overlapping and wide ranges are all returned by `covering`.
+            - The ranges are built once per version of the index.
+        """
+        forms = [DynamicForm.objects.create(name=f"Form {index}") for index in range(3)]
+        ids = {}
+        for month in (1, 2, 3):
+            for form in forms:
+                submitted_at = datetime(2026, month, 5, tzinfo=timezone.utc)
+                ids[create_submissions(form, submitted_at)[0]] = form.pk
+        archive_submissions(NOW, root=str(tmp_path))
+
+        for submission_id, form_id in ids.items():
+            record = get_archived_submission(submission_id, root=str(tmp_path))
+            assert record["form_id"] == form_id
+        assert get_archived_submission(max(ids) + 1, root=str(tmp_path)) is None
+        assert load_month_ranges(tmp_path) is load_month_ranges(tmp_path)
+
+        ranges = MonthRanges(
+            starts=[1, 5, 6, 40],
+            entries=[
+                (1, 100, "1", "2026-01"),
+                (5, 7, "2", "2026-01"),
+                (6, 30, "3", "2026-01"),
+                (40, 41, "2", "2026-02"),
+            ],
+            max_span=99,
+        )
+        assert list(ranges.covering(6)) == [
+            ("1", "2026-01"),
+            ("2", "2026-01"),
+            ("3", "2026-01"),
+        ]
+        assert list(ranges.covering(41)) == [("1", "2026-01"), ("2", "2026-02")]
+        assert list(ranges.covering(101)) == []
+
+    def test_archive_dir_required(self) -> None:
+        """
+        Test that archiving without a configured directory fails.
+
+        Asserts:
+            ValueError is raised.
+        """
+        with pytest.raises(ValueError):
+            archive_submissions(NOW)
+
+
+@pytest.mark.django_db
+class TestArchivedSubmissionsAPI:
+    """
+    Tests for reading archived submissions through the admin API.
+    """
+
+    def setup_method(self) -> None:
+        config.api_admin_form_submission_allow_list = True
+        config.api_admin_form_submission_allow_retrieve = True
+
+    def teardown_method(self) -> None:
+        config.archive_dir = None
+        cache.clear()
+
+    def test_retrieve_and_export(
+        self,
+        api_client: APIClient,
+        admin_user: User,
+        dynamic_field: DynamicField,
+        tmp_path: Path,
+    ) -> None:
+        """
+        Test that archived submissions are retrieved by ID and exported.
+
+        Args:
+            api_client (APIClient): The API client used to simulate requests.
+            admin_user (User): The admin user.
+            dynamic_field (DynamicField): A field of the archived form.
+            tmp_path (Path): The archive directory.
+
+        Asserts:
+            Retrieve falls back to the archive; exports include archived rows
+            first and honour the time range.
+        """
+        form = dynamic_field.form
+        archived, recent = create_submissions(
+            form, datetime(2026, 1, 10, tzinfo=timezone.utc), NOW
+        )
+        config.archive_dir = str(tmp_path)
+        archive_submissions(datetime(2026, 2, 1, tzinfo=timezone.utc))
+        api_client.force_authenticate(user=admin_user)
+
+        response = api_client.get(
+            reverse("admin-form-submission-detail", kwargs={"pk": archived})
+        )
+        assert response.status_code == 200
+        assert response.data["archived"] is True
+        assert response.data["form_id"] == form.pk
+        missing = reverse("admin-form-submission-detail", kwargs={"pk": 999})
+        assert api_client.get(missing).status_code == 404
+
+        url = reverse("admin-form-submission-export")
+        response = api_client.get(url, {"form_id": form.pk})
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        exported = [line.split(",")[0] for line in lines[1:]]
+        assert exported == [str(archived), str(recent)]
+
+        response = api_client.get(
+            url, {"form_id": form.pk, "submitted_after": "2026-01-11"}
+        )
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        assert [line.split(",")[0] for line in lines[1:]] == [str(recent)]
+
+        response = api_client.get(
+            url, {"form_id": form.pk, "submitted_before": "2026-01-11T00:00:00Z"}
+        )
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        assert [line.split(",")[0] for line in lines[1:]] == [str(archived)]
+
+        response = api_client.get(url, {"form_id": form.pk, "submitted_after": "x"})
+        assert response.status_code == 400
@@ -0,0 +1,295 @@
+import sys
+from typing import Iterator
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from dynamic_form.models import DynamicField, DynamicForm, FieldType, FormSubmission
+from dynamic_form.settings.conf import config
+from dynamic_form.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+from dynamic_form.utils.compression import (
+    compress_values,
+    decompress_values,
+    recompress_submissions,
+    split_submitted_data,
+)
+from dynamic_form.utils.export import iter_submission_rows
+from dynamic_form.utils.form_schema import get_compiled_form
+
+pytestmark = [
+    pytest.mark.utils,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+LONG_TEXT = "Lorem ipsum dolor sit amet. " * 20
+
+
+@pytest.fixture
+def compression() -> Iterator[None]:
+    """Enable zlib compression of submissions above 256 bytes."""
+    config.submission_compression = "zlib"
+    config.submission_compression_threshold = 256
+    yield
+    config.submission_compression = None
+    config.submission_compression_threshold = 4096
+
+
+class TestCompressionHelpers:
+    """
+    Tests for compressing and splitting submitted data.
+    """
+
+    def test_round_trip(self) -> None:
+        """
+        Test that compressed values are decompressed unchanged.
+
+        Asserts:
+            The blob starts with the zlib header and decompresses to the values.
+        """
+        blob = compress_values({"bio": LONG_TEXT})
+
+        assert blob[:1] == b"z"
+        assert decompress_values(memoryview(blob)) == {"bio": LONG_TEXT}
+
+    def test_unknown_header(self) -> None:
+        """
+        Test that a blob with an unknown header is rejected.
+
+        Asserts:
+            A ValueError is raised.
+        """
+        with pytest.raises(ValueError):
+            decompress_values(b"?payload")
+
+    def test_split(self) -> None:
+        """
+        Test that only long text values above the threshold are compressed.
+
+        Asserts:
+            - Short answers stay in the stored JSON.
+            - Data below the threshold, or when disabled, is not compressed.
+        """
+        data = {"bio": LONG_TEXT, "age": 30, "name": "Ann"}
+
+        stored, blob = split_submitted_data(data, "zlib", 256)
+
+        assert stored == {"age": 30, "name": "Ann"}
+        assert decompress_values(blob) == {"bio": LONG_TEXT}
+        assert split_submitted_data(data, "zlib", 100_000) == (data, None)
+        assert split_submitted_data({"name": "Ann" * 10}, "zlib", 1)[1] is None
+        assert split_submitted_data(data) == (data, None)
+
+    def test_split_keeps_filter_keys(self, monkeypatch) -> None:
+        """
+        Test that the keys the APIs are configured to filter on are never
+        compressed.
+
+        Args:
+            monkeypatch (MonkeyPatch): Used to configure the ordering fields.
+
+        Asserts:
+            The configured key stays in the stored JSON.
+        """
+        monkeypatch.setattr(
+            config, "api_form_submission_ordering_fields", ["submitted_data__bio"]
+        )
+        data = {"bio": LONG_TEXT, "notes": LONG_TEXT}
+
+        stored, blob = split_submitted_data(data, "zlib", 256)
+
+        assert stored == {"bio": LONG_TEXT}
+        assert decompress_values(blob) == {"notes": LONG_TEXT}
+
+    def test_field_path(self) -> None:
+        """
+        Test that migrations reference the submitted data field by its own path.
+
+        Asserts:
+            The deconstructed path is the SubmittedDataField class.
+        """
+        field = FormSubmission._meta.get_field("submitted_data")
+
+        assert field.deconstruct()[1] == (
+            "dynamic_form.models.form_submission.SubmittedDataField"
+        )
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("compression")
+class TestCompressedSubmissions:
+    """
+    Tests for submissions stored with compressed answers.
+    """
+
+    def test_save_and_load(self, dynamic_form: DynamicForm) -> None:
+        """
+        Test that long answers are stored compressed and merged on access.
+
+        Args:
+            dynamic_form (DynamicForm): The submitted form.
+
+        Asserts:
+            - The JSON column only holds the short answers.
+            - Loaded and refreshed instances expose the complete data.
+            - Filters still apply to the short answers.
+        """
+        data = {"bio": LONG_TEXT, "name": "Ann"}
+        submission = FormSubmission.objects.create(
+            form=dynamic_form, submitted_data=data
+        )
+
+        assert submission.submitted_data == data
+        assert submission.compressed_data is not None
+        assert FormSubmission.objects.values_list("submitted_data", flat=True).get() == {
+            "name": "Ann"
+        }
+        assert FormSubmission.objects.get().submitted_data == data
+        assert FormSubmission.objects.filter(submitted_data__name="Ann").exists()
+
+        deferred = FormSubmission.objects.defer("submitted_data").get()
+        assert deferred.submitted_data == data
+
+    def test_update_fields(self, dynamic_form: DynamicForm) -> None:
+        """
+        Test that saving the submitted data alone also rewrites the blob.
+
+        Args:
+            dynamic_form (DynamicForm): The submitted form.
+
+        Asserts:
+            Shortened data is stored uncompressed.
+        """
+        submission = FormSubmission.objects.create(
+            form=dynamic_form, submitted_data={"bio": LONG_TEXT}
+        )
+        submission = FormSubmission.objects.get(pk=submission.pk)
+        submission.submitted_data = {"bio": "Short."}
+        submission.save(update_fields=["submitted_data"])
+
+        stored = FormSubmission.objects.values("submitted_data", "compressed_data")
+        assert list(stored) == [
+            {"submitted_data": {"bio": "Short."}, "compressed_data": None}
+        ]
+
+    def test_export_and_api(
+        self, api_client: APIClient, dynamic_form: DynamicForm, admin_user: User
+    ) -> None:
+        """
+        Test that exports and API responses include the compressed answers.
+
+        Args:
+            api_client (APIClient): The API client used to simulate requests.
+            dynamic_form (DynamicForm): The submitted form.
+            admin_user (User): The admin user.
+
+        Asserts:
+            The exported row and the API response contain the complete data.
+        """
+        data = {"bio": LONG_TEXT, "name": "Ann"}
+        submission = FormSubmission.objects.create(
+            form=dynamic_form, submitted_data=data
+        )
+        config.api_admin_form_submission_allow_retrieve = True
+        api_client.force_authenticate(user=admin_user)
+
+        rows = list(iter_submission_rows(FormSubmission.objects.all()))
+        response = api_client.get(
+            reverse("admin-form-submission-detail", kwargs={"pk": submission.pk})
+        )
+        cache.clear()
+
+        assert rows[0][3] == data
+        assert response.status_code == 200
+        assert response.data["submitted_data"] == data
+
+    def test_indexed_fields_stay_filterable(
+        self, api_client: APIClient, dynamic_form: DynamicForm, user: User
+    ) -> None:
+        """
+        Test that indexed fields are never compressed and that text filters on
+        fields whose answers may be compressed are rejected.
+
+        Args:
+            api_client (APIClient): The API client used to simulate requests.
+            dynamic_form (DynamicForm): The submitted form.
+            user (User): The authenticated user.
+
+        Asserts:
+            - The indexed answer stays in the stored JSON and can be filtered.
+            - Filtering on the other long text field returns a 400 response,
+              until it is indexed and the rows are recompressed.
+            - The indexed state does not change the schema hash.
+        """
+        textarea = FieldType.objects.get(name="textarea")
+        DynamicField.objects.create(
+            form=dynamic_form, name="summary", field_type=textarea, is_indexed=True
+        )
+        bio = DynamicField.objects.create(
+            form=dynamic_form, name="bio", field_type=textarea
+        )
+        data = {"bio": LONG_TEXT, "summary": LONG_TEXT}
+        FormSubmission.objects.create(form=dynamic_form, user=user, submitted_data=data)
+        api_client.force_authenticate(user=user)
+        url = reverse("form-submission-list")
+        schema_hash = get_compiled_form(dynamic_form.pk).schema_hash
+
+        stored = FormSubmission.objects.values_list("submitted_data", flat=True).get()
+        indexed = api_client.get(
+            url, {"form_id": dynamic_form.pk, "submitted_data__summary": LONG_TEXT}
+        )
+        rejected = api_client.get(
+            url, {"form_id": dynamic_form.pk, "submitted_data__bio__contains": "Lorem"}
+        )
+
+        assert stored == {"summary": LONG_TEXT}
+        assert indexed.status_code == 200
+        assert len(indexed.data["results"]) == 1
+        assert rejected.status_code == 400
+        assert "submitted_data__bio__contains" in rejected.data
+
+        bio.is_indexed = True
+        bio.save()
+        assert recompress_submissions("zlib")[0] == 1
+        response = api_client.get(
+            url, {"form_id": dynamic_form.pk, "submitted_data__bio__contains": "Lorem"}
+        )
+        cache.clear()
+
+        assert response.status_code == 200
+        assert len(response.data["results"]) == 1
+        assert get_compiled_form(dynamic_form.pk).schema_hash == schema_hash
+
+    def test_recompress(self, dynamic_form: DynamicForm) -> None:
+        """
+        Test that existing rows are compressed and decompressed in batches.
+
+        Args:
+            dynamic_form (DynamicForm): The submitted form.
+
+        Asserts:
+            - Only rows whose stored form changes are counted.
+            - A dry run changes nothing.
+            - The data is unchanged after both rewrites.
+        """
+        config.submission_compression = None
+        data = {"bio": LONG_TEXT}
+        for _ in range(3):
+            FormSubmission.objects.create(form=dynamic_form, submitted_data=data)
+        FormSubmission.objects.create(form=dynamic_form, submitted_data={"a": "b"})
+        compressed = FormSubmission.objects.filter(compressed_data__isnull=False)
+
+        assert recompress_submissions("zlib", batch_size=2, dry_run=True)[0] == 3
+        assert not compressed.exists()
+        changed, last_pk = recompress_submissions("zlib", batch_size=2)
+        assert changed == 3
+        assert last_pk == FormSubmission.objects.latest("pk").pk
+        assert compressed.count() == 3
+        assert recompress_submissions("zlib")[0] == 0
+
+        assert recompress_submissions(None)[0] == 3
+        assert not compressed.exists()
+        rewritten = FormSubmission.objects.exclude(submitted_data={"a": "b"})
+        assert [submission.submitted_data for submission in rewritten] == [data] * 3
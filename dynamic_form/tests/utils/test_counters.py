@@ -0,0 +1,298 @@
+import sys
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from django.contrib import admin
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import RequestFactory
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from dynamic_form.admin import DynamicFormAdmin, FormSubmissionAdmin
+from dynamic_form.api.serializers.form import AdminDynamicFormSerializer
+from dynamic_form.models import DynamicField, DynamicForm, FormSubmission
+from dynamic_form.settings.conf import config
+from dynamic_form.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+from dynamic_form.utils.archive import archive_submissions
+from dynamic_form.utils.counters import deferred_counters, reconcile_counters
+
+pytestmark = [
+    pytest.mark.utils,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+@pytest.mark.django_db
+class TestSubmissionCounters:
+    """
+    Tests for the denormalized submission counters of forms.
+    """
+
+    def teardown_method(self) -> None:
+        """
+        Clear the cache so that throttle history does not leak into other tests.
+        """
+        cache.clear()
+
+    def test_create_and_delete(self, dynamic_form: DynamicForm) -> None:
+        """
+        Test that saving and deleting submissions updates the counters.
+
+        Args:
+            dynamic_form (DynamicForm): The form being submitted.
+
+        Asserts:
+            The count follows creates and deletes; the last submission time is kept.
+        """
+        first = FormSubmission.objects.create(form=dynamic_form, submitted_data={})
+        second = FormSubmission.objects.create(form=dynamic_form, submitted_data={})
+        dynamic_form.refresh_from_db()
+
+        assert dynamic_form.submission_count == 2
+        assert dynamic_form.last_submitted_at == second.submitted_at
+
+        first.delete()
+        dynamic_form.refresh_from_db()
+        assert dynamic_form.submission_count == 1
+
+        assert FormSubmission.objects.filter(form=dynamic_form).delete()[0] == 1
+        dynamic_form.refresh_from_db()
+        assert dynamic_form.submission_count == 0
+
+    def test_queryset_delete_is_fast(
+        self, dynamic_form: DynamicForm, django_assert_num_queries
+    ) -> None:
+        """
+        Test that a queryset delete does not load the deleted submissions.
+
+        Args:
+            dynamic_form (DynamicForm): The form being submitted.
+            django_assert_num_queries: Pytest-django fixture counting queries.
+
+        Asserts:
+            The delete takes a count, a DELETE and one counter update.
+        """
+        for _ in range(5):
+            FormSubmission.objects.create(form=dynamic_form, submitted_data={})
+
+        with django_assert_num_queries(3):
+            FormSubmission.objects.filter(form=dynamic_form).delete()
+
+        dynamic_form.refresh_from_db()
+        assert dynamic_form.submission_count == 0
+
+    def test_deferred_delete(self, dynamic_form: DynamicForm, django_assert_num_queries) -> None:
+        """
+        Test that deferred counters update each form once for a queryset delete.
+
+        Args:
+            dynamic_form (DynamicForm): The form being submitted.
+            django_assert_num_queries: Pytest-django fixture asserting the query count.
+
+        Asserts:
+            The counter update runs once and the count drops to zero.
+        """
+        for _ in range(3):
+            FormSubmission.objects.create(form=dynamic_form, submitted_data={})
+
+        with django_assert_num_queries(3):  # select, delete, counter update
+            with deferred_counters():
+                FormSubmission.objects.filter(form=dynamic_form).delete()
+
+        dynamic_form.refresh_from_db()
+        assert dynamic_form.submission_count == 0
+
+    def test_api_update_keeps_counters(self, dynamic_form: DynamicForm) -> None:
+        """
+        Test that updating a stale form through its serializer does not
+        overwrite the counters.
+
+        Args:
+            dynamic_form (DynamicForm): The form being submitted.
+
+        Asserts:
+            The count written by the submission survives the update.
+        """
+        FormSubmission.objects.create(form=dynamic_form, submitted_data={})
+        serializer = AdminDynamicFormSerializer(
+            dynamic_form, data={"name": "Renamed"}, partial=True
+        )
+        assert serializer.is_valid(), serializer.errors
+        serializer.save()
+        dynamic_form.refresh_from_db()
+
+        assert dynamic_form.name == "Renamed"
+        assert dynamic_form.submission_count == 1
+
+    def test_admin_change_keeps_counters(
+        self, dynamic_form: DynamicForm, admin_user: User
+    ) -> None:
+        """
+        Test that changing a stale form in the admin does not overwrite the
+        counters, while new forms are saved in full.
+
+        Args:
+            dynamic_form (DynamicForm): The form being submitted.
+            admin_user (User): The user changing the form.
+
+        Asserts:
+            The count written by the submission survives the change.
+        """
+        model_admin = DynamicFormAdmin(DynamicForm, admin.site)
+        request = RequestFactory().post("/")
+        request.user = admin_user
+        FormSubmission.objects.create(form=dynamic_form, submitted_data={})
+
+        dynamic_form.name = "Renamed"
+        form = SimpleNamespace(changed_data=["name"])
+        model_admin.save_model(request, dynamic_form, form, change=True)
+        dynamic_form.refresh_from_db()
+        assert dynamic_form.name == "Renamed"
+        assert dynamic_form.submission_count == 1
+
+        new_form = DynamicForm(name="New")
+        model_admin.save_model(request, new_form, form, change=False)
+        assert DynamicForm.objects.filter(name="New").exists()
+
+    @pytest.mark.parametrize("bulk", [False, True])
+    def test_form_delete_does_not_load_submissions(
+        self, dynamic_form: DynamicForm, bulk: bool, django_assert_max_num_queries
+    ) -> None:
+        """
+        Test that deleting a form removes its submissions without loading them
+        or updating the counters once per submission.
+
+        Args:
+            dynamic_form (DynamicForm): The form being deleted.
+            bulk (bool): Whether the form is deleted through a queryset.
+            django_assert_max_num_queries: Pytest-django fixture bounding the
+                query count.
+
+        Asserts:
+            The query count does not depend on the number of submissions.
+            The deletion result still counts the submissions.
+        """
+        FormSubmission.objects.bulk_create(
+            FormSubmission(form=dynamic_form, submitted_data={}) for _ in range(50)
+        )
+
+        with django_assert_max_num_queries(10):
+            if bulk:
+                total, per_model = DynamicForm.objects.filter(
+                    pk=dynamic_form.pk
+                ).delete()
+            else:
+                total, per_model = dynamic_form.delete()
+
+        assert per_model["dynamic_form.FormSubmission"] == 50
+        assert not FormSubmission.objects.exists()
+
+    def test_bulk_create(
+        self, api_client: APIClient, user: User, dynamic_field: DynamicField
+    ) -> None:
+        """
+        Test that the bulk endpoint updates the counters.
+
+        Args:
+            api_client (APIClient): The API client used to simulate requests.
+            user (User): The submitting user.
+            dynamic_field (DynamicField): The required field of the form.
+
+        Asserts:
+            The count matches the number of created submissions.
+        """
+        api_client.force_authenticate(user=user)
+        item = {
+            "form_id": dynamic_field.form_id,
+            "submitted_data": {"email": "user@example.com"},
+        }
+
+        response = api_client.post(
+            reverse("form-submission-bulk"),
+            {"submissions": [item, item, item]},
+            format="json",
+        )
+        form = DynamicForm.objects.get(pk=dynamic_field.form_id)
+
+        assert response.status_code == 201, response.data
+        assert form.submission_count == 3
+        assert form.last_submitted_at is not None
+
+    def test_admin_delete_queryset(
+        self,
+        form_submission_admin: FormSubmissionAdmin,
+        mock_request,
+        form_submission: FormSubmission,
+    ) -> None:
+        """
+        Test that deleting submissions from the admin updates the counters.
+
+        Args:
+            form_submission_admin (FormSubmissionAdmin): The submission admin.
+            mock_request: A mock admin request.
+            form_submission (FormSubmission): The submission to delete.
+
+        Asserts:
+            The count drops to zero.
+        """
+        form_submission_admin.delete_queryset(
+            mock_request, FormSubmission.objects.all()
+        )
+        form_submission.form.refresh_from_db()
+
+        assert form_submission.form.submission_count == 0
+
+    def test_reconcile(self, dynamic_form: DynamicForm) -> None:
+        """
+        Test that reconciling recomputes drifted counters in chunks.
+
+        Args:
+            dynamic_form (DynamicForm): A form with submissions.
+
+        Asserts:
+            Only drifted forms are updated and their counters match the submissions.
+        """
+        empty = DynamicForm.objects.create(name="Empty")
+        submission = FormSubmission.objects.create(form=dynamic_form, submitted_data={})
+        DynamicForm.objects.update(submission_count=7, last_submitted_at=None)
+
+        assert reconcile_counters(chunk_size=1) == 2
+        assert reconcile_counters(form_ids=[empty.pk]) == 0
+
+        dynamic_form.refresh_from_db()
+        empty.refresh_from_db()
+        assert dynamic_form.submission_count == 1
+        assert dynamic_form.last_submitted_at == submission.submitted_at
+        assert (empty.submission_count, empty.last_submitted_at) == (0, None)
+
+    def test_reconcile_counts_archived(
+        self, dynamic_form: DynamicForm, tmp_path, monkeypatch
+    ) -> None:
+        """
+        Test that reconciling keeps counting archived submissions.
+
+        Args:
+            dynamic_form (DynamicForm): A form with submissions.
+            tmp_path (Path): The archive directory.
+            monkeypatch (MonkeyPatch): Used to configure the archive directory.
+
+        Asserts:
+            The counters include the archived submissions and their latest time.
+        """
+        old = FormSubmission.objects.create(form=dynamic_form, submitted_data={})
+        archived_at = datetime(2026, 1, 10, tzinfo=timezone.utc)
+        FormSubmission.objects.filter(pk=old.pk).update(submitted_at=archived_at)
+        archive_submissions(
+            datetime(2026, 2, 1, tzinfo=timezone.utc), root=str(tmp_path)
+        )
+        monkeypatch.setattr(config, "archive_dir", str(tmp_path))
+        DynamicForm.objects.update(submission_count=0, last_submitted_at=None)
+
+        assert reconcile_counters() == 1
+
+        dynamic_form.refresh_from_db()
+        assert FormSubmission.objects.count() == 0
+        assert dynamic_form.submission_count == 1
+        assert dynamic_form.last_submitted_at == archived_at
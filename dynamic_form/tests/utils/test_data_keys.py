@@ -0,0 +1,155 @@
+import sys
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from dynamic_form.models import DynamicField, DynamicForm, FieldType, FormSubmission
+from dynamic_form.settings.conf import config
+from dynamic_form.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+from dynamic_form.utils.data_keys import convert_data_keys
+from dynamic_form.utils.form_schema import get_compiled_form
+from dynamic_form.utils.indexes import declared_indexes, key_index_name
+
+pytestmark = [
+    pytest.mark.utils,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+@pytest.mark.django_db
+class TestDataKeys:
+    """
+    Tests for storing submitted answers keyed by field ID.
+    """
+
+    @pytest.fixture
+    def form(self) -> DynamicForm:
+        form = DynamicForm.objects.create(name="Survey", data_keys="id")
+        for order, name in enumerate(["country", "comment"]):
+            DynamicField.objects.create(
+                form=form,
+                name=name,
+                field_type=FieldType.objects.get(name="text"),
+                order=order,
+                is_indexed=name == "country",
+            )
+        return form
+
+    def teardown_method(self) -> None:
+        config.api_form_submission_allow_create = False
+        cache.clear()
+
+    def test_encode_and_decode(self, form: DynamicForm) -> None:
+        """
+        Test that answers are translated between field names and IDs.
+
+        Args:
+            form (DynamicForm): A form storing answers by field ID.
+
+        Asserts:
+            - Field names are replaced by IDs and unknown keys are kept.
+            - Name and ID keys are both decoded to names.
+        """
+        compiled = get_compiled_form(form.pk)
+        country = compiled.field_map["country"]
+        data = {"country": "DE", "other": 1}
+
+        stored = compiled.encode_data(data)
+
+        assert country.key == str(country.id)
+        assert stored == {str(country.id): "DE", "other": 1}
+        assert compiled.encode_data(data, "name") is data
+        assert compiled.decode_data(stored) == data
+        assert compiled.decode_data(data) is data
+        assert compiled.decode_data(["DE"]) == ["DE"]
+
+    def test_api_round_trip(
+        self, api_client: APIClient, user: User, form: DynamicForm
+    ) -> None:
+        """
+        Test that the API exposes field names while IDs are stored, across
+        field renames and filters.
+
+        Args:
+            api_client (APIClient): The API client used to simulate requests.
+            user (User): The submitting user.
+            form (DynamicForm): A form storing answers by field ID.
+
+        Asserts:
+            - The stored data is keyed by field ID.
+            - Filters and indexes use the current field names, responses
+              the names of the submission's form version.
+        """
+        config.api_form_submission_allow_create = True
+        api_client.force_authenticate(user=user)
+        country = form.fields.get(name="country")
+        url = reverse("form-submission-list")
+
+        response = api_client.post(
+            url,
+            {"form_id": form.pk, "submitted_data": {"country": "DE"}},
+            format="json",
+        )
+        assert response.status_code == 201, response.data
+        assert response.data["submitted_data"] == {"country": "DE"}
+        stored = FormSubmission.objects.values_list("submitted_data", flat=True)
+        assert stored.get() == {str(country.pk): "DE"}
+
+        country.name = "nation"
+        country.save()
+        response = api_client.get(
+            url, {"form_id": form.pk, "submitted_data__nation": "DE"}
+        )
+        assert response.status_code == 200, response.data
+        assert response.data["results"][0]["submitted_data"] == {"country": "DE"}
+
+        indexes, _skipped = declared_indexes(connection)
+        assert [index.name for index in indexes if index.key] == [
+            key_index_name(str(country.pk))
+        ]
+
+    def test_convert(self, form: DynamicForm) -> None:
+        """
+        Test that existing submissions are converted in batches.
+
+        Args:
+            form (DynamicForm): The converted form.
+
+        Asserts:
+            - A dry run leaves the form and its submissions unchanged.
+            - Converting switches the form and rewrites every submission.
+            - Converting back restores the original data.
+        """
+        DynamicForm.objects.filter(pk=form.pk).update(data_keys="name")
+        data = {"country": "DE", "comment": "x" * 5000}
+        for _ in range(3):
+            FormSubmission.objects.create(form=form, submitted_data=data)
+        ids = {
+            name: str(pk) for pk, name in form.fields.values_list("pk", "name")
+        }
+
+        assert convert_data_keys(form.pk, "id", batch_size=2, dry_run=True)[0] == 3
+        assert DynamicForm.objects.get(pk=form.pk).data_keys == "name"
+
+        changed, last_pk = convert_data_keys(form.pk, "id", batch_size=2)
+        assert changed == 3
+        assert last_pk == FormSubmission.objects.latest("pk").pk
+        assert DynamicForm.objects.get(pk=form.pk).data_keys == "id"
+        assert FormSubmission.objects.first().submitted_data == {
+            ids["country"]: "DE",
+            ids["comment"]: "x" * 5000,
+        }
+
+        assert convert_data_keys(form.pk, "name")[0] == 3
+        assert all(
+            submission.submitted_data == data
+            for submission in FormSubmission.objects.all()
+        )
+        with pytest.raises(ValueError):
+            convert_data_keys(form.pk, "slot")
+        with pytest.raises(ValueError):
+            convert_data_keys(0, "id")
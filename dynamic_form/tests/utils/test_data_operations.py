@@ -0,0 +1,174 @@
+import sys
+from typing import Dict, List
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from dynamic_form.models import DynamicForm, FormSubmission
+from dynamic_form.settings.conf import config
+from dynamic_form.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+from dynamic_form.utils import data_operations
+from dynamic_form.utils.data_operations import (
+    DROP,
+    MAP,
+    RENAME,
+    DataOperation,
+    rewrite_submission_data,
+)
+
+pytestmark = [
+    pytest.mark.utils,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+OPERATIONS = [
+    DataOperation(RENAME, "country", new_key="nation"),
+    DataOperation(MAP, "nation", mapping={"DE": "Germany", "FR": {"code": "FR"}}),
+    DataOperation(DROP, "legacy"),
+]
+
+EXPECTED = [
+    {"nation": "Germany", "flag": True},
+    {"nation": {"code": "FR"}, "flag": False},
+    {"nation": "IT", "flag": None},
+    {"other": 1},
+]
+
+
+def create_submissions(form: DynamicForm) -> List[int]:
+    """Create submissions covering every operation and return their IDs."""
+    rows: List[Dict] = [
+        {"country": "DE", "flag": True, "legacy": "x"},
+        {"country": "FR", "flag": False},
+        {"country": "IT", "flag": None, "legacy": [1]},
+        {"other": 1},
+    ]
+    return [
+        FormSubmission.objects.create(form=form, submitted_data=data).pk
+        for data in rows
+    ]
+
+
+def stored_data(ids: List[int]) -> List[Dict]:
+    return [FormSubmission.objects.get(pk=pk).submitted_data for pk in ids]
+
+
+@pytest.mark.django_db
+class TestRewriteSubmissionData:
+    """
+    Tests for the batched rename, drop and value map operations.
+    """
+
+    def test_in_database(self, dynamic_form: DynamicForm) -> None:
+        """
+        Test that SQLite rewrites the submissions with SQL statements.
+
+        Args:
+            dynamic_form (DynamicForm): The rewritten form.
+
+        Asserts:
+            - A dry run counts the changed submissions without rewriting them.
+            - Operations are applied in order, keeping JSON types.
+            - Progress is reported per batch and other forms are untouched.
+        """
+        ids = create_submissions(dynamic_form)
+        other = DynamicForm.objects.create(name="Other")
+        untouched = FormSubmission.objects.create(
+            form=other, submitted_data={"country": "DE"}
+        )
+        batches = []
+
+        result = rewrite_submission_data(dynamic_form.pk, OPERATIONS, dry_run=True)
+        assert (result.updated, result.in_database) == (3, True)
+        assert stored_data(ids)[0]["country"] == "DE"
+
+        with patch.object(data_operations.time, "sleep") as sleep:
+            result = rewrite_submission_data(
+                dynamic_form.pk,
+                OPERATIONS,
+                batch_size=2,
+                sleep=0.5,
+                progress=lambda result: batches.append(result.last_pk),
+            )
+        assert result.updated == 3
+        assert batches == [ids[1], ids[3]]
+        assert sleep.call_count == 2
+        assert stored_data(ids) == EXPECTED
+        assert stored_data([untouched.pk]) == [{"country": "DE"}]
+
+        resumed = rewrite_submission_data(
+            dynamic_form.pk, OPERATIONS, start_after=ids[-1]
+        )
+        assert (resumed.updated, resumed.batches) == (0, 0)
+
+    def test_loaded(self, dynamic_form: DynamicForm) -> None:
+        """
+        Test the `bulk_update` fallback and submissions with compressed answers.
+
+        Args:
+            dynamic_form (DynamicForm): The rewritten form.
+
+        Asserts:
+            Both paths produce the same data as the SQL statements.
+        """
+        ids = create_submissions(dynamic_form)
+        with patch.object(data_operations, "SQLITE_JSON_OPERATORS", (99,)):
+            result = rewrite_submission_data(dynamic_form.pk, OPERATIONS)
+        assert (result.updated, result.in_database) == (3, False)
+        assert stored_data(ids) == EXPECTED
+
+        config.submission_compression = "zlib"
+        try:
+            submission = FormSubmission.objects.create(
+                form=dynamic_form,
+                submitted_data={"country": "DE", "legacy": "x" * 5000},
+            )
+            result = rewrite_submission_data(dynamic_form.pk, OPERATIONS)
+        finally:
+            config.submission_compression = None
+        assert result.updated == 1
+        assert stored_data([submission.pk]) == [{"nation": "Germany"}]
+
+    def test_postgresql_sql(self) -> None:
+        """
+        Test the statements generated for PostgreSQL.
+
+        Asserts:
+            The jsonb operators receive every key and value as a parameter.
+        """
+        connection = MagicMock(vendor="postgresql")
+        connection.ops.quote_name = lambda name: f'"{name}"'
+
+        rename, mapping, drop = (op.expression(connection) for op in OPERATIONS)
+
+        assert rename.sql == (
+            '("submitted_data" - %s::text) || '
+            'jsonb_build_object(%s::text, "submitted_data" -> %s::text)'
+        )
+        assert rename.params == ["country", "nation", "country"]
+        assert drop.sql == '"submitted_data" - %s::text'
+        assert mapping.sql.startswith('jsonb_set("submitted_data", ARRAY[%s::text]')
+        assert mapping.params[2:6] == ['"DE"', '"Germany"', '"FR"', '{"code": "FR"}']
+        assert DataOperation(DROP, "a").expression(MagicMock(vendor="oracle")) is None
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"action": "move", "key": "a"},
+            {"action": RENAME, "key": "a"},
+            {"action": RENAME, "key": "a", "new_key": "a"},
+            {"action": MAP, "key": "a"},
+        ],
+    )
+    def test_invalid_operation(self, kwargs: Dict) -> None:
+        """
+        Test that incomplete operations are rejected.
+
+        Args:
+            kwargs (Dict): The operation arguments.
+
+        Asserts:
+            A ValueError is raised.
+        """
+        with pytest.raises(ValueError):
+            DataOperation(**kwargs)
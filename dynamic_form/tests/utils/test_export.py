@@ -0,0 +1,107 @@
+import json
+import sys
+
+import pytest
+
+from dynamic_form.models import DynamicField, DynamicForm, FormSubmission
+from dynamic_form.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+from dynamic_form.utils.export import export_submissions
+from dynamic_form.utils.form_schema import get_compiled_form
+
+pytestmark = [
+    pytest.mark.utils,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+@pytest.mark.django_db
+class TestExportSubmissions:
+    """
+    Tests for the streaming CSV / NDJSON export of form submissions.
+    """
+
+    @pytest.fixture
+    def form(self, dynamic_form: DynamicForm, dynamic_field: DynamicField):
+        dynamic_field.order = 2
+        dynamic_field.save()
+        DynamicField.objects.create(
+            form=dynamic_form,
+            field_type=dynamic_field.field_type,
+            name="tags",
+            order=1,
+        )
+        FormSubmission.objects.create(
+            form=dynamic_form,
+            submitted_data={"email": "a@example.com", "tags": ["x", "y"], "extra": 1},
+        )
+        FormSubmission.objects.create(form=dynamic_form, submitted_data={"tags": []})
+        return get_compiled_form(dynamic_form.pk)
+
+    def test_csv(self, form) -> None:
+        """
+        Test that CSV columns follow the field order and nested values are JSON-encoded.
+
+        Asserts:
+        -------
+            - The header lists the metadata columns, then the fields in order.
+            - Missing values are empty and keys outside the form are dropped.
+        """
+        response = export_submissions(
+            form, FormSubmission.objects.filter(form_id=form.id), "csv", chunk_size=1
+        )
+        lines = b"".join(response.streaming_content).decode().splitlines()
+
+        assert "form_" in response["Content-Disposition"]
+        assert lines[0] == "id,submitted_at,user_id,tags,email"
+        assert lines[1].endswith(',"[""x"", ""y""]",a@example.com')
+        assert lines[2].endswith(",[],")
+        assert len(lines) == 3
+
+    def test_csv_escapes_formulas(self, form) -> None:
+        """
+        Test that text starting like a spreadsheet formula is escaped.
+
+        Asserts:
+        -------
+            - Such cells are prefixed with a quote; numbers are left as is.
+        """
+        FormSubmission.objects.all().delete()
+        FormSubmission.objects.create(
+            form_id=form.id, submitted_data={"tags": -1, "email": "=SUM(A1)"}
+        )
+        response = export_submissions(
+            form, FormSubmission.objects.filter(form_id=form.id), "csv"
+        )
+        lines = b"".join(response.streaming_content).decode().splitlines()
+
+        assert lines[1].endswith(",-1,'=SUM(A1)")
+
+    def test_ndjson(self, form) -> None:
+        """
+        Test that NDJSON keeps every key, with form fields first.
+
+        Asserts:
+        -------
+            - One JSON document is written per submission.
+        """
+        response = export_submissions(
+            form, FormSubmission.objects.filter(form_id=form.id), "ndjson"
+        )
+        documents = [
+            json.loads(line) for line in b"".join(response.streaming_content).splitlines()
+        ]
+
+        assert len(documents) == 2
+        assert list(documents[0]["submitted_data"]) == ["tags", "email", "extra"]
+        assert documents[0]["user_id"] is None
+
+    def test_unsupported_format(self, form) -> None:
+        """
+        Test that unknown formats are rejected.
+
+        Asserts:
+        -------
+            - A ValueError is raised.
+        """
+        with pytest.raises(ValueError):
+            export_submissions(form, FormSubmission.objects.none(), "xml")
@@ -0,0 +1,135 @@
+import sys
+from typing import List
+
+import pytest
+
+from dynamic_form.models import DynamicField, DynamicForm, FieldType
+from dynamic_form.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+from dynamic_form.utils.field_order import (
+    ORDER_GAP,
+    min_gap,
+    move_field,
+    position_between,
+    rebalance_form,
+    rebalance_forms,
+)
+from dynamic_form.utils.form_schema import get_compiled_form
+
+pytestmark = [
+    pytest.mark.utils,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+@pytest.mark.django_db
+class TestFieldOrder:
+    """
+    Tests for the gap-based ordering of form fields.
+    """
+
+    @pytest.fixture
+    def fields(self, dynamic_form: DynamicForm) -> List[DynamicField]:
+        text = FieldType.objects.get(name="text")
+        return [
+            DynamicField.objects.create(
+                form=dynamic_form, field_type=text, name=name, order=order
+            )
+            for name, order in [("a", 0), ("b", 1), ("c", 1)]
+        ]
+
+    @staticmethod
+    def names(form: DynamicForm) -> List[str]:
+        return list(form.fields.order_by("order", "id").values_list("name", flat=True))
+
+    def test_position_between(self) -> None:
+        """
+        Test the positions computed between neighbours.
+
+        Asserts:
+            - Positions fall in the middle of the gap, or after the last field.
+            - None is returned when there is no room left.
+        """
+        assert position_between(None, None) == ORDER_GAP
+        assert position_between(ORDER_GAP, None) == 2 * ORDER_GAP
+        assert position_between(None, ORDER_GAP) == (ORDER_GAP - 1) // 2
+        assert position_between(10, 20) == 15
+        assert position_between(10, 11) is None
+        assert position_between(None, 0) is None
+        assert min_gap([1]) is None
+        assert min_gap([1, 5, 6]) == 1
+
+    def test_rebalance_form(
+        self, dynamic_form: DynamicForm, fields: List[DynamicField]
+    ) -> None:
+        """
+        Test that a rebalance respaces the positions and keeps the order.
+
+        Args:
+            dynamic_form (DynamicForm): The form of the fields.
+            fields (List[DynamicField]): Fields with tied positions.
+
+        Asserts:
+            - Positions are spaced by the gap, ties broken by ID.
+            - The compiled schema is invalidated.
+            - A second rebalance changes nothing.
+        """
+        get_compiled_form(dynamic_form.pk)
+
+        assert rebalance_form(dynamic_form.pk) == 3
+        assert list(
+            dynamic_form.fields.order_by("order").values_list("name", "order")
+        ) == [("a", ORDER_GAP), ("b", 2 * ORDER_GAP), ("c", 3 * ORDER_GAP)]
+        assert get_compiled_form(dynamic_form.pk).fields[0].order == ORDER_GAP
+        assert rebalance_form(dynamic_form.pk) == 0
+
+    def test_move_field(
+        self, dynamic_form: DynamicForm, fields: List[DynamicField]
+    ) -> None:
+        """
+        Test that moving a field writes only that field when there is room.
+
+        Args:
+            dynamic_form (DynamicForm): The form of the fields.
+            fields (List[DynamicField]): Fields with tied positions.
+
+        Asserts:
+            - A move between tied neighbours rebalances the form first.
+            - Later moves only change the moved field.
+        """
+        a, b, c = fields
+
+        move_field(c, a)
+        assert self.names(dynamic_form) == ["a", "c", "b"]
+
+        positions = dict(dynamic_form.fields.values_list("name", "order"))
+        move_field(a, None)
+        move_field(b, a)
+        after = dict(dynamic_form.fields.values_list("name", "order"))
+        assert self.names(dynamic_form) == ["a", "b", "c"]
+        assert after["c"] == positions["c"]
+        assert after["a"] < after["b"] < after["c"]
+
+        move_field(a, c)
+        assert self.names(dynamic_form) == ["b", "c", "a"]
+
+    def test_rebalance_forms(
+        self, dynamic_form: DynamicForm, fields: List[DynamicField]
+    ) -> None:
+        """
+        Test that only the forms whose fields are too close are rebalanced.
+
+        Args:
+            dynamic_form (DynamicForm): The form of the fields.
+            fields (List[DynamicField]): Fields with tied positions.
+
+        Asserts:
+            - Dry runs report the forms without writing.
+            - Spaced forms are left alone.
+        """
+        other = DynamicForm.objects.create(name="Empty")
+
+        assert rebalance_forms(dry_run=True) == [dynamic_form.pk]
+        assert self.names(dynamic_form) == ["a", "b", "c"]
+        assert rebalance_forms([dynamic_form.pk, other.pk]) == [dynamic_form.pk]
+        assert rebalance_forms() == []
+        assert rebalance_forms(threshold=ORDER_GAP + 1) == [dynamic_form.pk]
@@ -0,0 +1,123 @@
+import sys
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from dynamic_form.models import DynamicField, DynamicForm, FieldType
+from dynamic_form.settings.conf import config
+from dynamic_form.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+from dynamic_form.utils.field_types import (
+    clear_field_type_registry,
+    get_active_field_types,
+    get_field_type,
+    get_field_types,
+)
+from dynamic_form.utils.form_schema import load_form_schema
+
+pytestmark = [
+    pytest.mark.utils,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+@pytest.mark.django_db
+class TestFieldTypeRegistry:
+    """
+    Tests for the process-local field type registry.
+    """
+
+    def teardown_method(self) -> None:
+        config.api_field_type_allow_list = False
+        clear_field_type_registry()
+        cache.clear()
+
+    def test_registry_follows_field_type_changes(self, field_type: FieldType) -> None:
+        """
+        Test that the registry is loaded once and reloaded after a field
+        type is saved or deleted.
+
+        Args:
+            field_type (FieldType): An active field type.
+
+        Asserts:
+            - Warm lookups execute no query.
+            - Saved and deleted field types are reflected on the next lookup.
+            - Unknown or invalid IDs resolve to None.
+        """
+        assert get_field_type(field_type.pk).name == field_type.name
+        with CaptureQueriesContext(connection) as queries:
+            get_field_types()
+            assert get_field_type(str(field_type.pk)) is not None
+        assert len(queries) == 0
+
+        field_type.name = "renamed"
+        field_type.is_active = False
+        field_type.save()
+        assert get_field_type(field_type.pk).name == "renamed"
+        assert field_type.pk not in {item.pk for item in get_active_field_types()}
+
+        field_type.delete()
+        assert get_field_type(field_type.pk) is None
+        assert get_field_type("invalid") is None
+        assert get_field_type(None) is None
+
+    def test_schema_resolves_unseen_field_types(self) -> None:
+        """
+        Test that a form schema resolves a field type created without
+        signals after the registry was loaded.
+
+        Asserts:
+            - The schema carries the name and state of the new field type.
+        """
+        get_field_types()
+        # Bulk writes send no signals, so the version is not bumped
+        (field_type,) = FieldType.objects.bulk_create([FieldType(name="slider")])
+        form = DynamicForm.objects.create(name="Survey")
+        DynamicField.objects.create(form=form, name="level", field_type=field_type)
+
+        schema = load_form_schema(form.pk)
+
+        assert schema["fields"][0]["field_type"] == "slider"
+        assert schema["fields"][0]["field_type_is_active"] is True
+
+    def test_field_type_list_is_served_from_memory(
+        self, api_client: APIClient, field_type: FieldType
+    ) -> None:
+        """
+        Test that unfiltered field type listings are served from the
+        registry.
+
+        Args:
+            api_client (APIClient): The API client used to simulate requests.
+            field_type (FieldType): An active field type.
+
+        Asserts:
+            - A warm, paginated listing executes no query.
+            - Inactive field types are left out, as in the database listing.
+            - Searched listings still use the database.
+        """
+        config.api_field_type_allow_list = True
+        FieldType.objects.create(name="hidden", is_active=False)
+        url = reverse("field-type-list")
+        expected = list(
+            FieldType.objects.filter(is_active=True)
+            .order_by("name")
+            .values_list("name", flat=True)
+        )
+
+        get_field_types()
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get(url, {"limit": 100})
+        assert response.status_code == 200, response.data
+        assert len(queries) == 0
+        assert response.data["count"] == len(expected)
+        assert [item["name"] for item in response.data["results"]] == expected
+
+        response = api_client.get(url, {"search": field_type.name})
+        assert response.status_code == 200, response.data
+        assert field_type.name in [item["name"] for item in response.data["results"]]
+        assert "hidden" not in [item["name"] for item in response.data["results"]]
@@ -0,0 +1,120 @@
+import sys
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from dynamic_form.models import DynamicField, DynamicForm, FieldType
+from dynamic_form.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+from dynamic_form.utils.form_schema import (
+    clear_local_schema_cache,
+    get_compiled_form,
+)
+
+pytestmark = [
+    pytest.mark.utils,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+@pytest.mark.django_db
+class TestCompiledFormCache:
+    """
+    Tests for the compiled, versioned form-schema cache.
+    """
+
+    def test_compiled_form_contents(
+        self, dynamic_form: DynamicForm, dynamic_field: DynamicField
+    ) -> None:
+        """
+        Test that the compiled form exposes the required names, field map and types.
+
+        Asserts:
+        -------
+            - The compiled form mirrors the form and its fields.
+        """
+        compiled = get_compiled_form(dynamic_form.pk)
+
+        assert compiled.id == dynamic_form.pk
+        assert compiled.is_active is True
+        assert compiled.required_names == frozenset({"email"})
+        assert compiled.field_map["email"].id == dynamic_field.pk
+        assert compiled.field_types == {"email": dynamic_field.field_type.name}
+        assert compiled.rules == {"email": {}}
+        assert compiled.schema_hash
+
+    def test_compiled_form_is_reused_without_queries(
+        self, dynamic_form: DynamicForm, dynamic_field: DynamicField
+    ) -> None:
+        """
+        Test that a warm cache serves the compiled form without database queries.
+
+        Asserts:
+        -------
+            - The same object is returned and no query is executed.
+        """
+        compiled = get_compiled_form(dynamic_form.pk)
+
+        with CaptureQueriesContext(connection) as queries:
+            assert get_compiled_form(dynamic_form.pk) is compiled
+            clear_local_schema_cache()
+            # Served from the shared Django cache after the local copy is gone
+            assert get_compiled_form(dynamic_form.pk).version == compiled.version
+
+        assert len(queries) == 0
+
+    def test_field_change_invalidates_schema(
+        self, dynamic_form: DynamicForm, dynamic_field: DynamicField
+    ) -> None:
+        """
+        Test that saving or deleting a field invalidates the compiled form.
+
+        Asserts:
+        -------
+            - The compiled form reflects the field changes.
+        """
+        compiled = get_compiled_form(dynamic_form.pk)
+
+        dynamic_field.is_required = False
+        dynamic_field.save()
+        updated = get_compiled_form(dynamic_form.pk)
+        assert updated.version != compiled.version
+        assert updated.required_names == frozenset()
+
+        dynamic_field.delete()
+        assert get_compiled_form(dynamic_form.pk).fields == ()
+
+    def test_form_and_field_type_change_invalidate_schema(
+        self,
+        dynamic_form: DynamicForm,
+        dynamic_field: DynamicField,
+        field_type: FieldType,
+    ) -> None:
+        """
+        Test that saving the form or a field type invalidates the compiled form.
+
+        Asserts:
+        -------
+            - The compiled form reflects the form and field type changes.
+        """
+        get_compiled_form(dynamic_form.pk)
+
+        dynamic_form.is_active = False
+        dynamic_form.save()
+        assert get_compiled_form(dynamic_form.pk).is_active is False
+
+        field_type.name = "renamed"
+        field_type.save()
+        assert get_compiled_form(dynamic_form.pk).field_types == {"email": "renamed"}
+
+    def test_missing_or_invalid_form(self, db) -> None:
+        """
+        Test that unknown or malformed form ids return None.
+
+        Asserts:
+        -------
+            - None is returned for unknown and non-numeric ids.
+        """
+        assert get_compiled_form(999) is None
+        assert get_compiled_form("abc") is None
+        assert get_compiled_form(None) is None
@@ -0,0 +1,202 @@
+import sys
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from dynamic_form.models import (
+    DynamicField,
+    DynamicForm,
+    FieldType,
+    FormSubmission,
+    FormVersion,
+)
+from dynamic_form.settings.conf import config
+from dynamic_form.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+from dynamic_form.utils.form_schema import get_compiled_form
+from dynamic_form.utils.form_versions import (
+    clear_local_version_cache,
+    get_current_version_id,
+    get_form_version,
+    record_form_version,
+    snapshot_form,
+)
+
+pytestmark = [
+    pytest.mark.utils,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+@pytest.mark.django_db
+class TestFormVersions:
+    """
+    Tests for the immutable form schema versions referenced by submissions.
+    """
+
+    @pytest.fixture
+    def form(self) -> DynamicForm:
+        form = DynamicForm.objects.create(name="Survey", data_keys="id")
+        for order, name in enumerate(["country", "comment"]):
+            DynamicField.objects.create(
+                form=form,
+                name=name,
+                field_type=FieldType.objects.get(name="text"),
+                order=order,
+            )
+        return form
+
+    def teardown_method(self) -> None:
+        config.api_form_submission_allow_create = False
+        clear_local_version_cache()
+        cache.clear()
+
+    def test_version_is_recorded_once_per_schema(self, form: DynamicForm) -> None:
+        """
+        Test that a version is recorded for each distinct schema of a form.
+
+        Args:
+            form (DynamicForm): A form with two fields.
+
+        Asserts:
+            - The same schema resolves to the same version.
+            - A field change records a new version with the new snapshot.
+        """
+        compiled = get_compiled_form(form.pk)
+        version_id = get_current_version_id(compiled)
+
+        assert get_current_version_id(compiled) == version_id
+        version = FormVersion.objects.get()
+        assert version.schema_hash == compiled.schema_hash
+        assert [item["name"] for item in version.schema["fields"]] == [
+            "country",
+            "comment",
+        ]
+        assert str(version) == f"Version {compiled.schema_hash[:12]} of Form #{form.pk}"
+
+        form.fields.filter(name="comment").delete()
+        updated = get_compiled_form(form.pk)
+
+        assert get_current_version_id(updated) != version_id
+        assert FormVersion.objects.count() == 2
+        assert record_form_version(updated).schema_hash == updated.schema_hash
+
+    def test_versions_are_cached_after_commit(
+        self, form: DynamicForm, django_capture_on_commit_callbacks
+    ) -> None:
+        """
+        Test that version IDs and blobs are served from the caches once the
+        recording transaction commits.
+
+        Args:
+            form (DynamicForm): A form with two fields.
+            django_capture_on_commit_callbacks: Runs the on-commit callbacks.
+
+        Asserts:
+            - Cached lookups execute no query.
+            - The compiled version maps field IDs to names.
+        """
+        compiled = get_compiled_form(form.pk)
+        with django_capture_on_commit_callbacks(execute=True):
+            version_id = get_current_version_id(compiled)
+            version = get_form_version(version_id)
+
+        with CaptureQueriesContext(connection) as queries:
+            assert get_current_version_id(compiled) == version_id
+            assert get_form_version(version_id) is version
+            clear_local_version_cache()
+            # Served from the shared Django cache after the local copy is gone
+            assert get_current_version_id(compiled) == version_id
+            assert get_form_version(version_id).form == version.form
+
+        assert len(queries) == 0
+        country = compiled.field_map["country"]
+        assert version.decode_data({str(country.id): "DE"}) == {"country": "DE"}
+
+    def test_missing_versions(self, form: DynamicForm) -> None:
+        """
+        Test the lookups of versions and forms that do not exist.
+
+        Args:
+            form (DynamicForm): A form with two fields.
+
+        Asserts:
+            - Missing versions and forms resolve to None.
+        """
+        compiled = get_compiled_form(form.pk)
+        form.delete()
+
+        assert get_form_version(None) is None
+        assert get_form_version(999) is None
+        assert snapshot_form(form.pk) is None
+        assert get_current_version_id(compiled) is None
+
+    def test_api_renders_submissions_with_their_version(
+        self, api_client: APIClient, user: User, form: DynamicForm
+    ) -> None:
+        """
+        Test that submissions keep the form and field names they were made
+        with after the form changes.
+
+        Args:
+            api_client (APIClient): The API client used to simulate requests.
+            user (User): The submitting user.
+            form (DynamicForm): A form storing answers by field ID.
+
+        Asserts:
+            - Each submission references the version it was validated with.
+            - Old submissions are rendered with the fields of their version.
+            - Submissions without a version fall back to the current form.
+        """
+        config.api_form_submission_allow_create = True
+        api_client.force_authenticate(user=user)
+        url = reverse("form-submission-list")
+
+        response = api_client.post(
+            url,
+            {"form_id": form.pk, "submitted_data": {"country": "DE"}},
+            format="json",
+        )
+        assert response.status_code == 201, response.data
+        old = FormSubmission.objects.get()
+        assert old.form_version.form_id == form.pk
+        assert response.data["form_version"] == old.form_version_id
+
+        country = form.fields.get(name="country")
+        country.name = "nation"
+        country.save()
+        response = api_client.post(
+            reverse("form-submission-bulk"),
+            {"submissions": [{"form_id": form.pk, "submitted_data": {"nation": "FR"}}]},
+            format="json",
+        )
+        assert response.status_code == 201, response.data
+        new = FormSubmission.objects.exclude(pk=old.pk).get()
+        assert new.form_version_id not in (None, old.form_version_id)
+        FormSubmission.objects.create(
+            form=form, user=user, submitted_data={str(country.pk): "IT"}
+        )
+
+        response = api_client.get(url)
+        assert response.status_code == 200, response.data
+        results = {item["id"]: item for item in response.data["results"]}
+        legacy = next(
+            item for item in results.values() if item["form_version"] is None
+        )
+        assert results[old.pk]["submitted_data"] == {"country": "DE"}
+        assert [field["name"] for field in results[old.pk]["form"]["fields"]] == [
+            "country",
+            "comment",
+        ]
+        assert results[new.pk]["submitted_data"] == {"nation": "FR"}
+        assert legacy["submitted_data"] == {"nation": "IT"}
+        assert legacy["form"]["fields"][0]["name"] == "nation"
+
+        response = api_client.get(url, {"compact": "true"})
+        hashes = {item["id"]: item["schema_hash"] for item in response.data["results"]}
+        assert hashes[old.pk] == old.form_version.schema_hash
+        assert hashes[new.pk] == get_compiled_form(form.pk).schema_hash
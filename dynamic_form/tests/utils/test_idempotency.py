@@ -0,0 +1,69 @@
+import sys
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth.models import User
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from dynamic_form.models import IdempotencyKey
+from dynamic_form.settings.conf import config
+from dynamic_form.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+from dynamic_form.utils.idempotency import claim_key, purge_expired_keys
+
+pytestmark = [
+    pytest.mark.utils,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+@pytest.mark.django_db
+class TestIdempotencyKeys:
+    """
+    Tests for claiming and purging idempotency keys.
+    """
+
+    def test_concurrent_claim(self, user: User) -> None:
+        """
+        Test that a key inserted by a concurrent request is not claimed twice.
+
+        Args:
+            user (User): The user owning the key.
+
+        Asserts:
+            The unique constraint makes the second claim return the existing key.
+        """
+        existing = IdempotencyKey.objects.create(
+            user=user, key="race", request_fingerprint="a"
+        )
+
+        # The key is inserted between the lookup and the insert of this claim
+        with patch.object(QuerySet, "first", side_effect=[None, existing]):
+            record, claimed = claim_key(user, "race", "a")
+
+        assert (record, claimed) == (existing, False)
+        assert IdempotencyKey.objects.count() == 1
+
+    def test_purge_expired_keys(self, user: User) -> None:
+        """
+        Test that only keys older than the TTL are purged, in batches.
+
+        Args:
+            user (User): The user owning the keys.
+
+        Asserts:
+            Expired keys are deleted and fresh keys are kept.
+        """
+        for index in range(3):
+            IdempotencyKey.objects.create(
+                user=user, key=f"old-{index}", request_fingerprint=""
+            )
+        IdempotencyKey.objects.update(
+            created_at=timezone.now()
+            - timedelta(seconds=config.idempotency_key_ttl + 1)
+        )
+        IdempotencyKey.objects.create(user=user, key="fresh", request_fingerprint="")
+
+        assert purge_expired_keys(batch_size=2) == 3
+        assert list(IdempotencyKey.objects.values_list("key", flat=True)) == ["fresh"]
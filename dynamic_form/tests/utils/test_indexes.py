@@ -0,0 +1,187 @@
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+from django.db import connection
+
+from dynamic_form.models import DynamicField, DynamicForm, FormSubmission
+from dynamic_form.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+from dynamic_form.utils.indexes import (
+    GIN_INDEX_NAME,
+    SubmissionIndex,
+    SubmittedValue,
+    create_index_sql,
+    data_key_sql,
+    declared_indexes,
+    drop_index_sql,
+    key_index_name,
+    missing_indexes,
+)
+
+pytestmark = [
+    pytest.mark.utils,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+def postgres_connection(partitioned: bool = False) -> MagicMock:
+    mock_connection = MagicMock(vendor="postgresql")
+    mock_connection.ops.quote_name = lambda name: f'"{name}"'
+    cursor = mock_connection.cursor.return_value.__enter__.return_value
+    cursor.fetchone.return_value = (1,) if partitioned else None
+    return mock_connection
+
+
+class TestIndexSQL:
+    """
+    Tests for the SQL generated for submitted data indexes.
+    """
+
+    def test_data_key_sql(self) -> None:
+        """
+        Test the key extraction SQL of each supported vendor.
+
+        Asserts:
+            PostgreSQL extracts text and SQLite uses json_extract.
+        """
+        assert data_key_sql("postgresql", '"data"', "country") == "(\"data\" ->> 'country')"
+        assert data_key_sql("sqlite", '"data"', "country") == (
+            "json_extract(\"data\", '$.\"country\"')"
+        )
+
+    @pytest.mark.parametrize(
+        "vendor, key", [("mysql", "country"), ("sqlite", "it's"), ("sqlite", "a.b")]
+    )
+    def test_data_key_sql_rejected(self, vendor: str, key: str) -> None:
+        """
+        Test that unsupported vendors and unsafe keys are rejected.
+
+        Args:
+            vendor (str): The database vendor.
+            key (str): The field name.
+
+        Asserts:
+            ValueError is raised.
+        """
+        with pytest.raises(ValueError):
+            data_key_sql(vendor, '"data"', key)
+
+    def test_postgresql_statements(self) -> None:
+        """
+        Test the PostgreSQL statements for the GIN and expression indexes.
+
+        Asserts:
+            Indexes are created and dropped concurrently; the GIN index uses jsonb_path_ops.
+        """
+        pg = postgres_connection()
+        gin = create_index_sql(SubmissionIndex(name=GIN_INDEX_NAME), pg)
+        key = create_index_sql(
+            SubmissionIndex(name=key_index_name("country"), key="country"), pg
+        )
+
+        assert gin == (
+            f'CREATE INDEX CONCURRENTLY IF NOT EXISTS "{GIN_INDEX_NAME}" '
+            'ON "form_submissions" USING GIN ("submitted_data" jsonb_path_ops)'
+        )
+        assert key.endswith(
+            '("form_id", (("submitted_data" ->> \'country\')))'
+        )
+        assert drop_index_sql(GIN_INDEX_NAME, pg) == (
+            f'DROP INDEX CONCURRENTLY IF EXISTS "{GIN_INDEX_NAME}"'
+        )
+
+    def test_partitioned_table_statements(self) -> None:
+        """
+        Test that indexes of a partitioned table are not built concurrently.
+
+        Asserts:
+            CONCURRENTLY is omitted, as PostgreSQL rejects it on partitioned tables.
+        """
+        pg = postgres_connection(partitioned=True)
+
+        assert create_index_sql(SubmissionIndex(name=GIN_INDEX_NAME), pg).startswith(
+            f'CREATE INDEX IF NOT EXISTS "{GIN_INDEX_NAME}"'
+        )
+        assert drop_index_sql(GIN_INDEX_NAME, pg) == (
+            f'DROP INDEX IF EXISTS "{GIN_INDEX_NAME}"'
+        )
+
+
+@pytest.mark.django_db
+class TestDeclaredIndexes:
+    """
+    Tests for the indexes declared through DynamicField.is_indexed.
+    """
+
+    def test_declared_indexes(
+        self, dynamic_form: DynamicForm, dynamic_field: DynamicField
+    ) -> None:
+        """
+        Test that a key declared by several forms gets one index and unsafe names are skipped.
+
+        Args:
+            dynamic_form (DynamicForm): The first form.
+            dynamic_field (DynamicField): A field of the first form.
+
+        Asserts:
+            One index per key, the GIN index on PostgreSQL only, unsafe names skipped.
+        """
+        dynamic_field.is_indexed = True
+        dynamic_field.save()
+        other = DynamicForm.objects.create(name="Other")
+        DynamicField.objects.create(
+            form=other, field_type=dynamic_field.field_type, name="email", is_indexed=True
+        )
+        unsafe = DynamicField.objects.create(
+            form=other, field_type=dynamic_field.field_type, name="e mail", is_indexed=True
+        )
+
+        indexes, skipped = declared_indexes(connection)
+        pg_indexes, _ = declared_indexes(postgres_connection())
+
+        assert indexes == [
+            SubmissionIndex(
+                name=key_index_name("email"),
+                key="email",
+                form_ids=(dynamic_form.pk, other.pk),
+            )
+        ]
+        assert skipped == [unsafe]
+        assert [index.name for index in pg_indexes] == [
+            GIN_INDEX_NAME,
+            key_index_name("email"),
+        ]
+
+    def test_filter_uses_index(
+        self, dynamic_form: DynamicForm, dynamic_field: DynamicField
+    ) -> None:
+        """
+        Test that filtering on SubmittedValue is served by the expression index.
+
+        Args:
+            dynamic_form (DynamicForm): The form of the submissions.
+            dynamic_field (DynamicField): The indexed field.
+
+        Asserts:
+            The index is missing until created, then appears in the query plan.
+        """
+        dynamic_field.is_indexed = True
+        dynamic_field.save()
+        FormSubmission.objects.bulk_create(
+            FormSubmission(form=dynamic_form, submitted_data={"email": f"{i}@x.io"})
+            for i in range(20)
+        )
+        (index,) = missing_indexes(connection)
+        with connection.cursor() as cursor:
+            cursor.execute(create_index_sql(index, connection))
+            cursor.execute("ANALYZE")
+
+        queryset = FormSubmission.objects.alias(
+            email=SubmittedValue("email")
+        ).filter(form=dynamic_form, email="3@x.io")
+
+        assert missing_indexes(connection) == []
+        assert list(queryset.values_list("submitted_data", flat=True)) == [
+            {"email": "3@x.io"}
+        ]
+        assert index.name in queryset.explain()
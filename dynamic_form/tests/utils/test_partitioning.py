@@ -0,0 +1,157 @@
+import sys
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from dynamic_form.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+from dynamic_form.utils.partitioning import (
+    add_months,
+    create_partition_sql,
+    detach_partition_sql,
+    month_range,
+    month_start,
+    move_default_rows_sql,
+    partition_month,
+    partition_name,
+    partitions_to_detach,
+    setup_sql,
+)
+
+pytestmark = [
+    pytest.mark.utils,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+def utc(*args: int) -> datetime:
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+def postgres_connection() -> MagicMock:
+    mock_connection = MagicMock(vendor="postgresql", alias="default")
+    mock_connection.ops.quote_name = lambda name: f'"{name}"'
+    cursor = mock_connection.cursor.return_value.__enter__.return_value
+    cursor.fetchall.side_effect = [
+        [
+            (
+                "CREATE INDEX df_sub_data_gin ON public.form_submissions "
+                "USING gin (submitted_data jsonb_path_ops)",
+            ),
+            (
+                "CREATE INDEX form_submissions_form_id ON public.form_submissions "
+                "USING btree (form_id)",
+            ),
+        ],
+        [
+            (
+                "form_submissions_form_id_fk",
+                "FOREIGN KEY (form_id) REFERENCES dynamic_forms(id) "
+                "DEFERRABLE INITIALLY DEFERRED",
+            ),
+        ],
+    ]
+    return mock_connection
+
+
+class TestPartitionSQL:
+    """
+    Tests for the monthly partitioning helpers.
+    """
+
+    def test_months(self) -> None:
+        """
+        Test month arithmetic and partition naming.
+
+        Asserts:
+            Months wrap around years and names round-trip to their month.
+        """
+        assert month_start(utc(2026, 12, 31, 23, 59)) == utc(2026, 12, 1)
+        assert add_months(utc(2026, 11, 1), 3) == utc(2027, 2, 1)
+        assert add_months(utc(2026, 1, 1), -1) == utc(2025, 12, 1)
+        assert month_range(utc(2026, 11, 20), utc(2027, 1, 5)) == [
+            utc(2026, 11, 1),
+            utc(2026, 12, 1),
+            utc(2027, 1, 1),
+        ]
+        assert partition_name(utc(2026, 3, 1)) == "form_submissions_p2026_03"
+        assert partition_month("form_submissions_p2026_03") == utc(2026, 3, 1)
+        assert partition_month("form_submissions_default") is None
+
+    def test_statements(self) -> None:
+        """
+        Test the partition creation and detach statements.
+
+        Asserts:
+            Partitions cover one month; only months ended before the cutoff are detached.
+        """
+        pg = postgres_connection()
+
+        assert create_partition_sql(utc(2026, 12, 1), pg) == (
+            'CREATE TABLE IF NOT EXISTS "form_submissions_p2026_12" '
+            'PARTITION OF "form_submissions" FOR VALUES '
+            "FROM ('2026-12-01T00:00:00+00:00') TO ('2027-01-01T00:00:00+00:00')"
+        )
+        assert detach_partition_sql("form_submissions_p2026_01", pg) == (
+            'ALTER TABLE "form_submissions" DETACH PARTITION '
+            '"form_submissions_p2026_01"'
+        )
+        names = [
+            "form_submissions_default",
+            "form_submissions_p2026_07",
+            "form_submissions_p2026_08",
+        ]
+        assert partitions_to_detach(names, 2, utc(2026, 10, 18)) == [
+            "form_submissions_p2026_07"
+        ]
+
+    def test_move_default_rows_sql(self) -> None:
+        """
+        Test the statements creating a partition next to a default partition.
+
+        Asserts:
+            The rows of the month are moved out of the default partition into
+            the new table before it is attached.
+        """
+        assert move_default_rows_sql(utc(2026, 12, 1), postgres_connection()) == [
+            'CREATE TABLE "form_submissions_p2026_12" (LIKE "form_submissions" '
+            "INCLUDING DEFAULTS INCLUDING CONSTRAINTS)",
+            'WITH moved AS (DELETE FROM "form_submissions_default" '
+            "WHERE \"submitted_at\" >= '2026-12-01T00:00:00+00:00' "
+            "AND \"submitted_at\" < '2027-01-01T00:00:00+00:00' RETURNING *) "
+            'INSERT INTO "form_submissions_p2026_12" SELECT * FROM moved',
+            'ALTER TABLE "form_submissions" ATTACH PARTITION '
+            '"form_submissions_p2026_12" FOR VALUES '
+            "FROM ('2026-12-01T00:00:00+00:00') TO ('2027-01-01T00:00:00+00:00')",
+        ]
+
+    def test_setup_sql(self) -> None:
+        """
+        Test the statements converting the table into a partitioned table.
+
+        Asserts:
+            Rows are copied into monthly partitions before the legacy table is
+            dropped, then the primary key and the indexes and foreign keys read
+            from the catalog are recreated.
+        """
+        statements = setup_sql(postgres_connection(), utc(2026, 9, 3), utc(2026, 10, 1))
+
+        assert statements[0] == (
+            'ALTER TABLE "form_submissions" RENAME TO "form_submissions_legacy"'
+        )
+        assert "PARTITION BY RANGE" in statements[1]
+        assert sum("PARTITION OF" in statement for statement in statements) == 3
+        copy = statements.index(
+            'INSERT INTO "form_submissions" SELECT * FROM "form_submissions_legacy"'
+        )
+        assert statements[copy + 1] == 'DROP TABLE "form_submissions_legacy"'
+        assert statements[copy + 2:] == [
+            'ALTER TABLE "form_submissions" ADD PRIMARY KEY ("id", "submitted_at")',
+            "CREATE INDEX df_sub_data_gin ON public.form_submissions USING gin "
+            "(submitted_data jsonb_path_ops)",
+            "CREATE INDEX form_submissions_form_id ON public.form_submissions "
+            "USING btree (form_id)",
+            'ALTER TABLE "form_submissions" ADD CONSTRAINT '
+            '"form_submissions_form_id_fk" FOREIGN KEY (form_id) '
+            "REFERENCES dynamic_forms(id) DEFERRABLE INITIALLY DEFERRED",
+        ]
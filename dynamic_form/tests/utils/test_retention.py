@@ -0,0 +1,141 @@
+import sys
+from datetime import timedelta
+from typing import List
+
+import pytest
+from django.db.models.signals import post_delete, pre_delete
+from django.utils import timezone
+
+from dynamic_form.models import DynamicForm, FormSubmission
+from dynamic_form.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+from dynamic_form.utils.retention import can_raw_delete, purge_submissions
+
+pytestmark = [
+    pytest.mark.utils,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+def create_submissions(form: DynamicForm, count: int, days_ago: int) -> List[int]:
+    """Create submissions made `days_ago` days ago and return their IDs."""
+    ids = [
+        FormSubmission.objects.create(form=form, submitted_data={}).pk
+        for _ in range(count)
+    ]
+    FormSubmission.objects.filter(pk__in=ids).update(
+        submitted_at=timezone.now() - timedelta(days=days_ago)
+    )
+    return ids
+
+
+@pytest.mark.django_db
+class TestPurgeSubmissions:
+    """
+    Tests for the batched submission purge.
+    """
+
+    def test_raw_purge(self, dynamic_form: DynamicForm) -> None:
+        """
+        Test that old submissions are deleted in batches without loading them.
+
+        Args:
+            dynamic_form (DynamicForm): The form owning the submissions.
+
+        Asserts:
+            Only old submissions are deleted, batch by batch, and the form
+            counter is decremented.
+        """
+        old = create_submissions(dynamic_form, 5, days_ago=40)
+        recent = create_submissions(dynamic_form, 1, days_ago=1)
+        batches = []
+
+        result = purge_submissions(
+            timezone.now() - timedelta(days=30),
+            batch_size=2,
+            progress=lambda progress: batches.append(progress.last_pk),
+        )
+        dynamic_form.refresh_from_db()
+
+        assert result.raw
+        assert (result.deleted, result.batches) == (5, 3)
+        assert batches == [old[1], old[3], old[4]]
+        assert result.per_form == {dynamic_form.pk: 5}
+        assert list(FormSubmission.objects.values_list("pk", flat=True)) == recent
+        assert dynamic_form.submission_count == 1
+
+    def test_purge_with_receivers(self, dynamic_form: DynamicForm) -> None:
+        """
+        Test that submissions go through the regular delete when other
+        receivers listen to deletions.
+
+        Args:
+            dynamic_form (DynamicForm): The form owning the submissions.
+
+        Asserts:
+            The receiver is called for every submission and counters stay correct.
+        """
+        create_submissions(dynamic_form, 3, days_ago=40)
+        deleted = []
+
+        def receiver(sender, instance, **kwargs):
+            deleted.append(instance.pk)
+
+        post_delete.connect(receiver, sender=FormSubmission)
+        try:
+            assert not can_raw_delete()
+            result = purge_submissions(timezone.now(), batch_size=2)
+        finally:
+            post_delete.disconnect(receiver, sender=FormSubmission)
+        dynamic_form.refresh_from_db()
+
+        assert not result.raw
+        assert len(deleted) == result.deleted == 3
+        assert dynamic_form.submission_count == 0
+
+    def test_can_raw_delete(self) -> None:
+        """
+        Test that raw deletes are allowed until any deletion receiver,
+        even one listening to every sender, is connected.
+
+        Asserts:
+            The package alone connects no receiver that disables raw deletes.
+        """
+
+        def receiver(sender, instance, **kwargs):
+            pass  # pragma: no cover
+
+        assert can_raw_delete()
+        pre_delete.connect(receiver)
+        try:
+            assert not can_raw_delete()
+        finally:
+            pre_delete.disconnect(receiver)
+        assert can_raw_delete()
+
+    def test_dry_run_and_resume(self, dynamic_form: DynamicForm) -> None:
+        """
+        Test that a dry run only counts and a resumed run skips processed IDs.
+
+        Args:
+            dynamic_form (DynamicForm): The form owning the submissions.
+
+        Asserts:
+            The dry run deletes nothing; resuming after an ID keeps earlier rows.
+        """
+        other = DynamicForm.objects.create(name="Other")
+        ids = create_submissions(dynamic_form, 3, days_ago=40)
+        create_submissions(other, 2, days_ago=40)
+
+        dry = purge_submissions(timezone.now(), dry_run=True)
+        assert dry.per_form == {dynamic_form.pk: 3, other.pk: 2}
+        assert FormSubmission.objects.count() == 5
+
+        result = purge_submissions(
+            timezone.now(), form_ids=[dynamic_form.pk], start_after=ids[0]
+        )
+        assert result.deleted == 2
+        assert set(FormSubmission.objects.values_list("form_id", flat=True)) == {
+            dynamic_form.pk,
+            other.pk,
+        }
+        assert FormSubmission.objects.filter(form=dynamic_form).get().pk == ids[0]
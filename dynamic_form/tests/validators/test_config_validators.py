@@ -6,9 +6,13 @@ import pytest
 from dynamic_form.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
 from dynamic_form.validators.config_validators import (
     validate_boolean_setting,
+    validate_cache_alias,
+    validate_choice_setting,
     validate_list_fields,
+    validate_optional_directory,
     validate_optional_path_setting,
     validate_optional_paths_setting,
+    validate_positive_integer_setting,
     validate_throttle_rate,
 )
 
@@ -294,3 +298,118 @@ class TestValidateOptionalClassSetting:
             )
             assert len(errors) == 1
             assert errors[0].id == "dynamic_form.E013_SOME_CLASS_SETTING"
+
+
+class TestValidatePositiveIntegerSetting:
+    def test_valid_positive_integer(self) -> None:
+        """
+        Test that a positive integer or None returns no errors.
+
+        Asserts:
+        -------
+            The result should have no errors.
+        """
+        assert not validate_positive_integer_setting(10, "SOME_INT_SETTING")
+        assert not validate_positive_integer_setting(None, "SOME_INT_SETTING")
+
+    @pytest.mark.parametrize("value", [0, -5, True, "10", 1.5])
+    def test_invalid_positive_integer(self, value) -> None:
+        """
+        Test that non-positive, boolean or non-integer values return an error.
+
+        Asserts:
+        -------
+            The result should contain one error with the expected error ID.
+        """
+        errors = validate_positive_integer_setting(value, "SOME_INT_SETTING")
+        assert len(errors) == 1
+        assert errors[0].id == "dynamic_form.E014_SOME_INT_SETTING"
+
+
+class TestValidateCacheAlias:
+    def test_valid_cache_alias(self) -> None:
+        """
+        Test that a configured cache alias or None returns no errors.
+
+        Asserts:
+        -------
+            The result should have no errors.
+        """
+        assert not validate_cache_alias("default", "SOME_CACHE_SETTING")
+        assert not validate_cache_alias(None, "SOME_CACHE_SETTING")
+
+    def test_unknown_cache_alias(self) -> None:
+        """
+        Test that an alias missing from CACHES returns an error.
+
+        Asserts:
+        -------
+            The result should contain one error with the expected error ID.
+        """
+        errors = validate_cache_alias("missing", "SOME_CACHE_SETTING")
+        assert len(errors) == 1
+        assert errors[0].id == "dynamic_form.E015_SOME_CACHE_SETTING"
+
+
+class TestValidateOptionalDirectory:
+    def test_valid_directory(self, tmp_path) -> None:
+        """
+        Test that a directory path, existing or not, or None returns no errors.
+
+        Args:
+        ----
+            tmp_path: Pytest fixture providing a temporary directory.
+
+        Asserts:
+        -------
+            The result should have no errors.
+        """
+        assert not validate_optional_directory(str(tmp_path), "SOME_DIR_SETTING")
+        assert not validate_optional_directory(tmp_path / "new", "SOME_DIR_SETTING")
+        assert not validate_optional_directory(None, "SOME_DIR_SETTING")
+
+    @pytest.mark.parametrize("value", ["", 1, "file"])
+    def test_invalid_directory(self, value, tmp_path) -> None:
+        """
+        Test that empty values, non-strings and files return an error.
+
+        Args:
+        ----
+            value: The invalid setting value; "file" is replaced by a file path.
+            tmp_path: Pytest fixture providing a temporary directory.
+
+        Asserts:
+        -------
+            The result should contain one error with the expected error ID.
+        """
+        if value == "file":
+            value = tmp_path / "archive.txt"
+            value.write_text("")
+        errors = validate_optional_directory(value, "SOME_DIR_SETTING")
+        assert len(errors) == 1
+        assert errors[0].id == "dynamic_form.E016_SOME_DIR_SETTING"
+
+
+class TestValidateChoiceSetting:
+    def test_valid_choice(self) -> None:
+        """
+        Test that one of the choices, or None, returns no errors.
+
+        Asserts:
+        -------
+            The result should have no errors.
+        """
+        assert not validate_choice_setting("zlib", "SOME_CHOICE_SETTING", ["zlib"])
+        assert not validate_choice_setting(None, "SOME_CHOICE_SETTING", ["zlib"])
+
+    def test_invalid_choice(self) -> None:
+        """
+        Test that a value outside the choices returns an error.
+
+        Asserts:
+        -------
+            The result should contain one error with the expected error ID.
+        """
+        errors = validate_choice_setting("lz4", "SOME_CHOICE_SETTING", ["zlib"])
+        assert len(errors) == 1
+        assert errors[0].id == "dynamic_form.E017_SOME_CHOICE_SETTING"
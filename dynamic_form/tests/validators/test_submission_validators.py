@@ -0,0 +1,205 @@
+import sys
+
+import pytest
+
+from dynamic_form.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
+from dynamic_form.validators.submission_validators import (
+    compile_field_validators,
+    normalize_choices,
+    run_validators,
+    validate_rules_definition,
+)
+
+pytestmark = [
+    pytest.mark.validators,
+    pytest.mark.submission_validators,
+    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+]
+
+
+def _errors(field_type, value, choices=None, rules=None, is_required=False):
+    validators = (
+        ("field", is_required, compile_field_validators(field_type, choices, rules)),
+    )
+    return run_validators(validators, {"field": value}).get("field", [])
+
+
+class TestNormalizeChoices:
+    def test_supported_formats(self) -> None:
+        """
+        Test that list, object-list and mapping choices are normalized to frozensets.
+
+        Asserts:
+        -------
+            - Each format yields the same set of allowed values.
+            - Empty or unsupported choices yield None.
+        """
+        expected = frozenset({"a", "b"})
+        assert normalize_choices(["a", "b"]) == expected
+        assert normalize_choices([{"value": "a"}, {"value": "b"}]) == expected
+        assert normalize_choices({"a": "A", "b": "B"}) == expected
+        assert normalize_choices(None) is None
+        assert normalize_choices("a,b") is None
+
+
+class TestCompileFieldValidators:
+    @pytest.mark.parametrize(
+        "field_type, valid, invalid",
+        [
+            ("text", "hello", 5),
+            ("textarea", "hello", ["hello"]),
+            ("number", 3.5, "3.5"),
+            ("boolean", False, "false"),
+            ("checkbox", True, 1),
+            ("email", "test@example.com", "not-an-email"),
+            ("date", "2024-01-31", "31/01/2024"),
+        ],
+    )
+    def test_type_checks(self, field_type, valid, invalid) -> None:
+        """
+        Test that values are checked against the field type.
+
+        Asserts:
+        -------
+            - A value of the right type passes and a value of the wrong type fails.
+        """
+        assert not _errors(field_type, valid)
+        assert _errors(field_type, invalid)
+
+    def test_number_rejects_booleans(self) -> None:
+        """
+        Test that booleans are not accepted as numbers.
+
+        Asserts:
+        -------
+            - `True` is rejected by a number field.
+        """
+        assert _errors("number", True)
+
+    def test_unknown_types_are_not_type_checked(self) -> None:
+        """
+        Test that unknown field types (e.g. file) skip the type check.
+
+        Asserts:
+        -------
+            - Any value passes when no rule is defined.
+        """
+        assert not _errors("file", {"url": "x"})
+
+    def test_choices(self) -> None:
+        """
+        Test choices membership for single and multiple choice fields.
+
+        Asserts:
+        -------
+            - Dropdown values must be one of the choices.
+            - Checkbox values must be a list of choices.
+        """
+        choices = ["red", "green"]
+        assert not _errors("dropdown", "red", choices=choices)
+        assert _errors("radio", "blue", choices=choices)
+        assert not _errors("checkbox", ["red", "green"], choices=choices)
+        assert _errors("checkbox", ["red", "blue"], choices=choices)
+        assert _errors("checkbox", "red", choices=choices)
+
+    def test_rules(self) -> None:
+        """
+        Test length, value and regex rules.
+
+        Asserts:
+        -------
+            - Values outside the configured bounds or not matching the regex fail.
+        """
+        length = {"min_length": 2, "max_length": 4}
+        assert not _errors("text", "abc", rules=length)
+        assert _errors("text", "a", rules=length)
+        assert _errors("text", "abcde", rules=length)
+
+        bounds = {"min_value": 1, "max_value": 10}
+        assert not _errors("number", 5, rules=bounds)
+        assert _errors("number", 0, rules=bounds)
+        assert _errors("number", 11, rules=bounds)
+
+        assert not _errors("text", "AB12", rules={"regex": r"^[A-Z]+\d+$"})
+        assert _errors("text", "ab12", rules={"pattern": r"^[A-Z]+\d+$"})
+
+    def test_rule_messages(self) -> None:
+        """
+        Test the wording of the rule messages.
+
+        Asserts:
+        -------
+            - Length messages count characters for strings and items for lists.
+            - Messages are rendered with the configured limit.
+        """
+        length = {"min_length": 2, "max_length": 1}
+        assert [str(item) for item in _errors("text", "a", rules=length)] == [
+            "Ensure this value has at least 2 characters."
+        ]
+        assert [str(item) for item in _errors("tags", [1, 2], rules=length)] == [
+            "Ensure this value has at most 1 item."
+        ]
+        assert [str(item) for item in _errors("number", 0, rules={"min_value": 1})] == [
+            "Ensure this value is greater than or equal to 1."
+        ]
+
+    def test_invalid_rules_are_ignored(self) -> None:
+        """
+        Test that malformed rules do not break validation.
+
+        Asserts:
+        -------
+            - Non-numeric bounds and invalid regexes are skipped.
+        """
+        assert not _errors("text", "a", rules={"min_length": "2", "regex": "("})
+
+    def test_errors_are_collected(self) -> None:
+        """
+        Test that every failing validator of a field is reported.
+
+        Asserts:
+        -------
+            - A value failing the type check and a rule yields two messages.
+        """
+        assert len(_errors("text", "abc", rules={"max_length": 2, "regex": r"\d"})) == 2
+
+    def test_required_and_empty_values(self) -> None:
+        """
+        Test missing and empty values for required and optional fields.
+
+        Asserts:
+        -------
+            - Empty values fail only when the field is required.
+        """
+        assert _errors("number", "", is_required=True)
+        assert _errors("number", None, is_required=True)
+        assert not _errors("number", "", rules={"min_value": 1})
+
+
+class TestValidateRulesDefinition:
+    def test_valid_rules(self) -> None:
+        """
+        Test that well-formed rules are accepted.
+
+        Asserts:
+        -------
+            - No errors are returned.
+        """
+        assert not validate_rules_definition(None)
+        assert not validate_rules_definition(
+            {"min_length": 1, "max_value": 2.5, "regex": r"^\d+$"}
+        )
+
+    def test_invalid_rules(self) -> None:
+        """
+        Test that malformed rules are reported.
+
+        Asserts:
+        -------
+            - One error is returned per invalid rule.
+        """
+        assert validate_rules_definition(["min_length"])
+        errors = validate_rules_definition(
+            {"min_length": True, "min_value": "1", "pattern": "("}
+        )
+        assert len(errors) == 3
@@ -0,0 +1,578 @@
+import json
+import mmap
+import os
+import tempfile
+import zlib
+from bisect import bisect_left, bisect_right
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import takewhile
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.utils.dateparse import parse_datetime
+
+from dynamic_form.models import FormSubmission
+from dynamic_form.settings.conf import config
+from dynamic_form.utils.counters import uncounted_deletions
+from dynamic_form.utils.export import ROW_COLUMNS, SubmissionRow, expand_row
+from dynamic_form.utils.retention import can_raw_delete, delete_submissions
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore[assignment]
+    import msvcrt
+
+# Name of the index of every archived month, at the root of the archive
+INDEX_FILE = "index.json"
+
+# Name of the manifest of the segments of one form and month
+MANIFEST_FILE = "manifest.json"
+
+# Name of the file locked by an archive run, at the root of the archive
+LOCK_FILE = ".lock"
+
+# Number of submissions per independently compressed block of a segment
+BLOCK_SIZE = 256
+
+# Parsed JSON files, keyed by path, with the modification time they were read at
+_json_cache: Dict[str, Tuple[float, Any]] = {}
+
+# ID ranges of the archived months, keyed by index path, with the parsed
+# index they were built from
+_range_cache: Dict[str, Tuple[Any, "MonthRanges"]] = {}
+
+
+@dataclass
+class ArchiveResult:
+    """Outcome of an archive run.
+
+    Attributes:
+        archived (int): Number of archived (or, in a dry run, matching) submissions
+        segments (int): Number of written segment files
+        per_form (Dict[int, int]): Archived (or matching) submissions per form ID
+
+    """
+
+    archived: int = 0
+    segments: int = 0
+    per_form: Dict[int, int] = field(default_factory=dict)
+
+    def add(self, form_id: int, count: int) -> None:
+        self.archived += count
+        self.per_form[form_id] = self.per_form.get(form_id, 0) + count
+
+
+@dataclass
+class MonthRanges:
+    """The ID ranges of every archived form and month, sorted by first ID.
+
+    Attributes:
+        starts (List[int]): First ID of each range, for bisection
+        entries (List[Tuple[int, int, str, str]]): ``(first_id, last_id,
+            form_id, month)`` of each range
+        max_span (int): Largest ``last_id - first_id`` of the ranges
+
+    """
+
+    starts: List[int] = field(default_factory=list)
+    entries: List[Tuple[int, int, str, str]] = field(default_factory=list)
+    max_span: int = 0
+
+    def covering(self, submission_id: int) -> Iterator[Tuple[str, str]]:
+        """Yield the form and month of the ranges containing an ID.
+
+        Only ranges starting within `max_span` before the ID can contain
+        it, so the candidates are found by bisection.
+
+        """
+        low = bisect_left(self.starts, submission_id - self.max_span)
+        high = bisect_right(self.starts, submission_id)
+        for _first_id, last_id, form_key, month in self.entries[low:high]:
+            if submission_id <= last_id:
+                yield form_key, month
+
+
+def archive_root(root: Optional[str] = None) -> Path:
+    """Return the archive directory, `DYNAMIC_FORM_ARCHIVE_DIR` by default.
+
+    Raises:
+        ValueError: If no archive directory is configured.
+
+    """
+    root = root or config.archive_dir
+    if not root:
+        raise ValueError("DYNAMIC_FORM_ARCHIVE_DIR is not configured.")
+    return Path(root)
+
+
+def month_key(value: datetime) -> str:
+    return f"{value.year:04d}-{value.month:02d}"
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write a file through a temporary file, so that readers never see a
+    partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    handle, temporary = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(handle, "wb") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+def _read_json(path: Path, default: Any) -> Any:
+    """Read a JSON file, reusing the parsed content while it is unchanged."""
+    try:
+        mtime = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return default
+    cached = _json_cache.get(str(path))
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, json.loads(path.read_bytes()))
+        _json_cache[str(path)] = cached
+    return cached[1]
+
+
+def _write_json(path: Path, data: Any) -> None:
+    _write_atomic(path, json.dumps(data, sort_keys=True).encode("utf-8"))
+
+
+@contextmanager
+def archive_lock(root: Path) -> Iterator[None]:
+    """Hold the lock of an archive directory.
+
+    Manifests and the index are rewritten from their current content, so
+    two runs writing to the same archive would lose each other's
+    segments. The lock is released when the run ends or its process dies.
+
+    Raises:
+        ValueError: If another run holds the lock.
+
+    """
+    root.mkdir(parents=True, exist_ok=True)
+    with open(root / LOCK_FILE, "a+b") as file:
+        try:
+            if fcntl is not None:
+                fcntl.flock(file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:  # pragma: no cover
+                msvcrt.locking(file.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            raise ValueError(f"Another archive run is writing to {root}.")
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+            else:  # pragma: no cover
+                file.seek(0)
+                msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def encode_record(row: SubmissionRow) -> Dict[str, Any]:
+    pk, submitted_at, user_id, data = row
+    return {
+        "id": pk,
+        "submitted_at": submitted_at,
+        "user_id": user_id,
+        "submitted_data": data,
+    }
+
+
+def decode_record(record: Dict[str, Any]) -> SubmissionRow:
+    return (
+        record["id"],
+        parse_datetime(record["submitted_at"]),
+        record["user_id"],
+        record["submitted_data"],
+    )
+
+
+def write_segment(
+    root: Path,
+    form_id: int,
+    rows: List[SubmissionRow],
+    block_size: int = BLOCK_SIZE,
+) -> Dict[str, Any]:
+    """Write rows of one form and month to a new segment file.
+
+    A segment is a sequence of zlib-compressed NDJSON blocks; the offsets
+    of the blocks are recorded in the returned manifest entry, so that a
+    single block can be decompressed to read one submission.
+
+    Returns:
+        Dict[str, Any]: The manifest entry of the segment.
+
+    """
+    blocks, content, offset = [], bytearray(), 0
+    for start in range(0, len(rows), block_size):
+        chunk = rows[start : start + block_size]
+        lines = "".join(
+            json.dumps(encode_record(row), cls=DjangoJSONEncoder) + "\n"
+            for row in chunk
+        )
+        compressed = zlib.compress(lines.encode("utf-8"))
+        blocks.append(
+            {
+                "offset": offset,
+                "length": len(compressed),
+                "first_id": chunk[0][0],
+                "last_id": chunk[-1][0],
+                "first_at": min(row[1] for row in chunk).isoformat(),
+                "last_at": max(row[1] for row in chunk).isoformat(),
+            }
+        )
+        content += compressed
+        offset += len(compressed)
+
+    name = f"segment-{rows[0][0]:012d}-{rows[-1][0]:012d}.ndjson.z"
+    path = root / str(form_id) / month_key(rows[0][1]) / name
+    _write_atomic(path, bytes(content))
+    return {
+        "file": name,
+        "count": len(rows),
+        "first_id": rows[0][0],
+        "last_id": rows[-1][0],
+        "first_at": min(block["first_at"] for block in blocks),
+        "last_at": max(block["last_at"] for block in blocks),
+        "blocks": blocks,
+    }
+
+
+def load_manifest(root: Path, form_id: int, month: str) -> Dict[str, Any]:
+    return _read_json(root / str(form_id) / month / MANIFEST_FILE, {"segments": []})
+
+
+def load_index(root: Path) -> Dict[str, Any]:
+    return _read_json(root / INDEX_FILE, {"forms": {}})
+
+
+def load_month_ranges(root: Path) -> MonthRanges:
+    """Return the ID ranges of the index, rebuilt only when it changed."""
+    index = load_index(root)
+    cached = _range_cache.get(str(root))
+    if cached is not None and cached[0] is index:
+        return cached[1]
+
+    entries = sorted(
+        (bounds["first_id"], bounds["last_id"], form_key, month)
+        for form_key, months in index["forms"].items()
+        for month, bounds in months.items()
+    )
+    ranges = MonthRanges(
+        starts=[entry[0] for entry in entries],
+        entries=entries,
+        max_span=max((entry[1] - entry[0] for entry in entries), default=0),
+    )
+    _range_cache[str(root)] = (index, ranges)
+    return ranges
+
+
+def summarize_manifest(manifest: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the index entry of a month: its ID and time bounds."""
+    segments = manifest["segments"]
+    return {
+        "count": sum(segment["count"] for segment in segments),
+        "first_id": min(segment["first_id"] for segment in segments),
+        "last_id": max(segment["last_id"] for segment in segments),
+        "first_at": min(segment["first_at"] for segment in segments),
+        "last_at": max(segment["last_at"] for segment in segments),
+    }
+
+
+def rebuild_form_index(root: Path, form_id: int) -> Dict[str, Any]:
+    """Recompute the index entries of a form from its month manifests,
+    which are the source of truth, and store them in the index."""
+    months = {}
+    form_dir = root / str(form_id)
+    if form_dir.is_dir():
+        for month_dir in sorted(form_dir.iterdir()):
+            manifest = load_manifest(root, form_id, month_dir.name)
+            if manifest["segments"]:
+                months[month_dir.name] = summarize_manifest(manifest)
+
+    index = load_index(root)
+    forms = dict(index["forms"])
+    forms[str(form_id)] = months
+    _write_json(root / INDEX_FILE, {"forms": forms})
+    return months
+
+
+def archived_through(months: Dict[str, Any]) -> int:
+    """Return the highest archived submission ID of a form."""
+    return max((month["last_id"] for month in months.values()), default=0)
+
+
+def archived_ids(
+    root: Path, form_id: int, months: Dict[str, Any], ids: List[int]
+) -> Set[int]:
+    """Return which of the sorted submission IDs are stored in the segments
+    of a form. Only the blocks whose ID range contains one of the IDs are
+    decompressed."""
+    found: Set[int] = set()
+    for month in sorted(months):
+        for segment in load_manifest(root, form_id, month)["segments"]:
+            for block in segment["blocks"]:
+                position = bisect_left(ids, block["first_id"])
+                if position == len(ids) or ids[position] > block["last_id"]:
+                    continue
+                path = root / str(form_id) / month / segment["file"]
+                found.update(record["id"] for record in _read_block(path, block))
+    return found.intersection(ids)
+
+
+def archived_counts(
+    root: Optional[str] = None,
+) -> Dict[int, Tuple[int, Optional[datetime]]]:
+    """Return the number of archived submissions of each form and the time
+    of the latest one, as recorded in the index."""
+    return {
+        int(form_key): (
+            sum(month["count"] for month in months.values()),
+            max(
+                (parse_datetime(month["last_at"]) for month in months.values()),
+                default=None,
+            ),
+        )
+        for form_key, months in load_index(archive_root(root))["forms"].items()
+    }
+
+
+def archive_submissions(
+    before: datetime,
+    form_ids: Optional[Iterable[int]] = None,
+    batch_size: int = 5000,
+    dry_run: bool = False,
+    root: Optional[str] = None,
+    using: str = DEFAULT_DB_ALIAS,
+) -> ArchiveResult:
+    """Move the submissions made before `before` to the archive.
+
+    Each form is archived in ID order, one segment per batch and month:
+    the segment is written and synced, the month manifest (the commit point
+    of the segment) and the index are replaced atomically, then the rows
+    are deleted from the database. Archiving stops at the first submission
+    of a form made after `before`. The rows of a form with an ID up to the
+    highest archived one are checked against the segments: the archived
+    ones, left behind by an interrupted run, are deleted without being
+    written twice, and the others (e.g. moved from another form later) are
+    archived first. So an interrupted run is resumed by running it again,
+    and only rows found in the archive are ever deleted. A run holds the
+    lock of the archive directory (see `archive_lock`), so concurrent runs
+    fail instead of overwriting each other's manifests.
+
+    Archived submissions still count in the submission counters of their
+    forms.
+
+    Args:
+        before (datetime): Archive submissions made strictly before this time.
+        form_ids (Optional[Iterable[int]]): Restrict archiving to these forms.
+        batch_size (int): Maximum number of submissions per segment.
+        dry_run (bool): Only count the matching submissions.
+        root (Optional[str]): The archive directory, defaults to the setting.
+        using (str): The database alias.
+
+    Returns:
+        ArchiveResult: The number of archived submissions, per form and in total.
+
+    Raises:
+        ValueError: If no archive directory is configured or another run
+            holds its lock.
+
+    """
+    archive = archive_root(root)
+    if dry_run:
+        return _archive_submissions(archive, before, form_ids, batch_size, True, using)
+    with archive_lock(archive):
+        return _archive_submissions(archive, before, form_ids, batch_size, False, using)
+
+
+def _archive_submissions(
+    archive: Path,
+    before: datetime,
+    form_ids: Optional[Iterable[int]],
+    batch_size: int,
+    dry_run: bool,
+    using: str,
+) -> ArchiveResult:
+    submissions = FormSubmission.objects.using(using)
+    if form_ids is None:
+        form_ids = (
+            submissions.filter(submitted_at__lt=before)
+            .order_by("form_id")
+            .values_list("form_id", flat=True)
+            .distinct()
+        )
+
+    result = ArchiveResult()
+    raw = can_raw_delete()
+    for form_id in list(form_ids):
+        rows_of_form = submissions.filter(form_id=form_id)
+        if dry_run:
+            months = load_index(archive)["forms"].get(str(form_id), {})
+        else:
+            months = rebuild_form_index(archive, form_id)
+        through = archived_through(months)
+
+        # Rows up to the highest archived ID are archived already, unless
+        # they joined the form after it was archived
+        stale = list(
+            rows_of_form.filter(pk__lte=through)
+            .order_by("pk")
+            .values_list("pk", "submitted_at")
+        )
+        if stale:
+            archived = archived_ids(archive, form_id, months, [pk for pk, _at in stale])
+            if archived and not dry_run:
+                with transaction.atomic(using=using), uncounted_deletions():
+                    delete_submissions(
+                        [(pk, form_id) for pk in sorted(archived)], using, raw
+                    )
+            late = [
+                pk
+                for pk, submitted_at in stale
+                if pk not in archived and submitted_at < before
+            ]
+            for start in range(0, len(late), batch_size):
+                late_rows = [
+                    expand_row(row)
+                    for row in rows_of_form.filter(
+                        pk__in=late[start : start + batch_size]
+                    )
+                    .order_by("pk")
+                    .values_list(*ROW_COLUMNS)
+                ]
+                for month in sorted({month_key(row[1]) for row in late_rows}):
+                    batch = [row for row in late_rows if month_key(row[1]) == month]
+                    if not dry_run:
+                        _archive_batch(archive, form_id, batch, using, raw)
+                        result.segments += 1
+                    result.add(form_id, len(batch))
+
+        while True:
+            rows: List[SubmissionRow] = [
+                expand_row(row)
+                for row in rows_of_form.filter(pk__gt=through)
+                .order_by("pk")
+                .values_list(*ROW_COLUMNS)[:batch_size]
+            ]
+            eligible = list(takewhile(lambda row: row[1] < before, rows))
+            if eligible:
+                month = month_key(eligible[0][1])
+                eligible = list(
+                    takewhile(lambda row: month_key(row[1]) == month, eligible)
+                )
+            if not eligible:
+                break
+
+            if not dry_run:
+                _archive_batch(archive, form_id, eligible, using, raw)
+                result.segments += 1
+            result.add(form_id, len(eligible))
+            through = eligible[-1][0]
+    return result
+
+
+def _archive_batch(
+    root: Path, form_id: int, rows: List[SubmissionRow], using: str, raw: bool
+) -> None:
+    month = month_key(rows[0][1])
+    entry = write_segment(root, form_id, rows)
+    manifest = load_manifest(root, form_id, month)
+    segments = [*manifest["segments"], entry]
+    _write_json(
+        root / str(form_id) / month / MANIFEST_FILE,
+        {"form_id": form_id, "month": month, "segments": segments},
+    )
+    rebuild_form_index(root, form_id)
+    with transaction.atomic(using=using), uncounted_deletions():
+        delete_submissions([(row[0], form_id) for row in rows], using, raw)
+
+
+def _read_block(path: Path, block: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Decompress one block of a segment, reading it through a memory map."""
+    with (
+        open(path, "rb") as file,
+        mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data,
+    ):
+        start = block["offset"]
+        content = zlib.decompress(data[start : start + block["length"]])
+    return [json.loads(line) for line in content.splitlines() if line]
+
+
+def get_archived_submission(
+    submission_id: int, root: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """Find an archived submission by ID.
+
+    The sorted ID ranges of the index narrow the search down to the
+    months containing the ID, and their manifests to one block, so a
+    lookup decompresses at most one block per matching month.
+
+    Returns:
+        Optional[Dict[str, Any]]: The archived submission, with its
+            `form_id`, or None if it is not archived.
+
+    """
+    archive = archive_root(root)
+    for form_key, month in load_month_ranges(archive).covering(submission_id):
+        for segment in load_manifest(archive, int(form_key), month)["segments"]:
+            if not segment["first_id"] <= submission_id <= segment["last_id"]:
+                continue
+            for block in segment["blocks"]:
+                if not block["first_id"] <= submission_id <= block["last_id"]:
+                    continue
+                path = archive / form_key / month / segment["file"]
+                for record in _read_block(path, block):
+                    if record["id"] == submission_id:
+                        return {"form_id": int(form_key), **record}
+    return None
+
+
+def iter_archived_rows(
+    form_id: int,
+    after: Optional[datetime] = None,
+    before: Optional[datetime] = None,
+    root: Optional[str] = None,
+) -> Iterator[SubmissionRow]:
+    """Iterate over the archived submissions of a form, month by month and
+    in ID order within each segment.
+
+    Months and blocks outside the ``[after, before)`` range are skipped
+    without being decompressed.
+
+    Yields:
+        SubmissionRow: ``(id, submitted_at, user_id, submitted_data)`` tuples.
+
+    """
+    archive = archive_root(root)
+    months = load_index(archive)["forms"].get(str(form_id), {})
+
+    def overlaps(bounds: Dict[str, Any]) -> bool:
+        return (after is None or parse_datetime(bounds["last_at"]) >= after) and (
+            before is None or parse_datetime(bounds["first_at"]) < before
+        )
+
+    for month in sorted(months):
+        if not overlaps(months[month]):
+            continue
+        for segment in load_manifest(archive, form_id, month)["segments"]:
+            for block in segment["blocks"]:
+                if not overlaps(block):
+                    continue
+                path = archive / str(form_id) / month / segment["file"]
+                for record in _read_block(path, block):
+                    row = decode_record(record)
+                    if (after is None or row[1] >= after) and (
+                        before is None or row[1] < before
+                    ):
+                        yield row
@@ -0,0 +1,98 @@
+import time
+from typing import Any, Dict, Iterable
+
+from django.core.cache import BaseCache, caches
+from django.db import transaction
+
+from dynamic_form.settings.conf import config
+
+# Prefix shared by every key this package stores in the Django cache
+CACHE_KEY_PREFIX = "dynamic_form"
+
+
+def get_cache() -> BaseCache:
+    """Return the Django cache backend configured for the package."""
+    return caches[config.cache_alias]
+
+
+def make_key(*parts: Any) -> str:
+    """Build a namespaced cache key from the given parts.
+
+    Example:
+        ``make_key("version", "form", 1)`` -> ``"dynamic_form:version:form:1"``
+
+    """
+    return ":".join([CACHE_KEY_PREFIX, *map(str, parts)])
+
+
+def _version_key(namespace: str) -> str:
+    return make_key("version", namespace)
+
+
+def new_version() -> str:
+    """Generate a new version token.
+
+    Tokens are nanosecond timestamps, so besides being unique they also tell
+    *when* the namespace last changed.
+
+    """
+    return str(time.time_ns())
+
+
+def get_versions(*namespaces: str) -> Dict[str, str]:
+    """Fetch the current version token of each namespace in one round trip.
+
+    Namespaces without a token (never bumped, or evicted from the cache) get
+    a fresh one, which forces every process to reload what they cached under
+    the previous token.
+
+    Args:
+        *namespaces (str): Names of the versioned namespaces (e.g. ``"form:1"``).
+
+    Returns:
+        Dict[str, str]: A mapping of namespace to its version token.
+
+    """
+    cache = get_cache()
+    keys = {_version_key(namespace): namespace for namespace in namespaces}
+    found = cache.get_many(list(keys))
+
+    versions: Dict[str, str] = {}
+    for key, namespace in keys.items():
+        token = found.get(key)
+        if token is None:
+            token = new_version()
+            # Another process may have created the token in the meantime
+            if not cache.add(key, token, timeout=None):
+                token = cache.get(key, token)
+        versions[namespace] = token
+    return versions
+
+
+def get_version(namespace: str) -> str:
+    """Fetch the current version token of a single namespace."""
+    return get_versions(namespace)[namespace]
+
+
+def bump_versions(namespaces: Iterable[str]) -> None:
+    """Invalidate everything cached under the given namespaces.
+
+    The bump is applied immediately and once more when the surrounding
+    transaction commits, so that readers which reloaded data while the
+    transaction was still open do not keep the uncommitted state around.
+
+    Args:
+        namespaces (Iterable[str]): Names of the namespaces to invalidate.
+
+    """
+    namespaces = list(namespaces)
+
+    def _bump() -> None:
+        token = new_version()
+        get_cache().set_many(
+            {_version_key(namespace): token for namespace in namespaces},
+            timeout=None,
+        )
+
+    _bump()
+    transaction.on_commit(_bump)
@@ -0,0 +1,187 @@
+import json
+import zlib
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+from dynamic_form.settings.conf import config
+
+try:
+    import zstandard
+
+    zstandard_installed = True
+except ImportError:  # pragma: no cover
+    zstandard_installed = False
+
+# One-byte header identifying the codec of a compressed blob
+CODEC_HEADERS = {"zlib": b"z", "zstd": b"s"}
+
+# Text answers shorter than this are kept in the JSON column, where they
+# can be filtered and indexed
+MIN_COMPRESSED_VALUE_LENGTH = 128
+
+
+def uncompressed_keys(form_id: Optional[int]) -> FrozenSet[str]:
+    """Return the keys of the answers of a form that are never compressed:
+    those of its indexed fields and the configured filter keys (see
+    `configured_filter_keys`), which filters and indexes read from the JSON
+    column."""
+    # The model module imports this one
+    from dynamic_form.utils.form_schema import get_compiled_form
+    from dynamic_form.utils.indexes import configured_filter_keys
+
+    form = get_compiled_form(form_id) if form_id is not None else None
+    indexed = form.indexed_keys if form is not None else frozenset()
+    return indexed | frozenset(configured_filter_keys())
+
+
+def available_codecs() -> List[str]:
+    """Return the compression codecs usable in this environment."""
+    return [codec for codec in CODEC_HEADERS if codec != "zstd" or zstandard_installed]
+
+
+def compress_values(values: Dict[str, Any], codec: str = "zlib") -> bytes:
+    """Compress answers into a blob starting with the header of its codec."""
+    encoded = json.dumps(values, cls=DjangoJSONEncoder, separators=(",", ":")).encode(
+        "utf-8"
+    )
+    if codec == "zstd":
+        return CODEC_HEADERS[codec] + zstandard.ZstdCompressor().compress(encoded)
+    return CODEC_HEADERS["zlib"] + zlib.compress(encoded)
+
+
+def decompress_values(blob: Any) -> Dict[str, Any]:
+    """Decompress a blob written by `compress_values`, whatever its codec.
+
+    Raises:
+        ValueError: If the blob has an unknown header.
+
+    """
+    blob = bytes(blob)  # PostgreSQL returns a memoryview
+    header, payload = blob[:1], blob[1:]
+    if header == CODEC_HEADERS["zstd"]:
+        return json.loads(zstandard.ZstdDecompressor().decompress(payload))
+    if header == CODEC_HEADERS["zlib"]:
+        return json.loads(zlib.decompress(payload))
+    raise ValueError("Unknown submitted data compression header.")
+
+
+def split_submitted_data(
+    data: Any,
+    codec: Optional[str] = None,
+    threshold: Optional[int] = None,
+    form_id: Optional[int] = None,
+) -> Tuple[Any, Optional[bytes]]:
+    """Split submitted data into the part stored as JSON and the compressed
+    part.
+
+    When compression is enabled and the encoded data reaches the threshold,
+    text answers of at least `MIN_COMPRESSED_VALUE_LENGTH` characters are
+    moved to the compressed blob, except the answers that filters and
+    indexes need (see `uncompressed_keys`); other answers stay in the JSON
+    column.
+
+    Args:
+        data (Any): The complete submitted data.
+        codec (Optional[str]): Defaults to `DYNAMIC_FORM_SUBMISSION_COMPRESSION`;
+            compression is disabled when it is None.
+        threshold (Optional[int]): Defaults to
+            `DYNAMIC_FORM_SUBMISSION_COMPRESSION_THRESHOLD`.
+        form_id (Optional[int]): The form of the submission, whose indexed
+            fields are never compressed.
+
+    Returns:
+        Tuple[Any, Optional[bytes]]: The JSON part and the blob, or None.
+
+    """
+    codec = codec or config.submission_compression
+    threshold = threshold or config.submission_compression_threshold
+    if not codec or not isinstance(data, dict):
+        return data, None
+
+    size = len(json.dumps(data, cls=DjangoJSONEncoder).encode("utf-8"))
+    if size < threshold:
+        return data, None
+
+    large = {
+        key: value
+        for key, value in data.items()
+        if isinstance(value, str) and len(value) >= MIN_COMPRESSED_VALUE_LENGTH
+    }
+    if large:
+        kept = uncompressed_keys(form_id)
+        large = {key: value for key, value in large.items() if key not in kept}
+    if not large:
+        return data, None
+    stored = {key: value for key, value in data.items() if key not in large}
+    return stored, compress_values(large, codec)
+
+
+def expand_submitted_data(data: Any, blob: Any) -> Any:
+    """Merge the compressed answers of a submission back into its data."""
+    if blob is None or not isinstance(data, dict):
+        return data
+    return {**data, **decompress_values(blob)}
+
+
+def recompress_submissions(
+    codec: Optional[str],
+    batch_size: int = 1000,
+    start_after: int = 0,
+    dry_run: bool = False,
+    using: str = DEFAULT_DB_ALIAS,
+) -> Tuple[int, int]:
+    """Rewrite the stored submitted data of existing submissions with the
+    given codec, or expand it back to plain JSON when `codec` is None.
+
+    Submissions are processed in primary key order, one batch per
+    transaction, and only rows whose stored form changes are updated.
+
+    Args:
+        codec (Optional[str]): The codec to compress with; None decompresses.
+        batch_size (int): Number of submissions read per batch.
+        start_after (int): Resume after this submission ID.
+        dry_run (bool): Only count the submissions that would change.
+        using (str): The database alias.
+
+    Returns:
+        Tuple[int, int]: The number of changed submissions and the ID of
+            the last submission processed.
+
+    """
+    # The model module imports this one
+    from dynamic_form.models import FormSubmission
+
+    submissions = FormSubmission.objects.using(using).order_by("pk")
+    changed = 0
+    last_pk = start_after
+    while True:
+        with transaction.atomic(using=using):
+            batch = list(
+                submissions.filter(pk__gt=last_pk)
+                .select_for_update()
+                .only("pk", "form_id", "submitted_data", "compressed_data")[:batch_size]
+            )
+            if not batch:
+                return changed, last_pk
+            last_pk = batch[-1].pk
+
+            stale = []
+            for submission in batch:
+                data = submission.submitted_data
+                current = submission.compressed_data
+                stored, blob = (
+                    split_submitted_data(data, codec, form_id=submission.form_id)
+                    if codec
+                    else (data, None)
+                )
+                if blob != (bytes(current) if current is not None else None):
+                    submission.submitted_data = stored
+                    submission.compressed_data = blob
+                    stale.append(submission)
+            if not dry_run:
+                FormSubmission.objects.using(using).bulk_update(
+                    stale, ["submitted_data", "compressed_data"]
+                )
+            changed += len(stale)
@@ -0,0 +1,187 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import Count, F, Max, Value
+from django.db.models.functions import Coalesce, Greatest
+
+from dynamic_form.models import DynamicForm, FormSubmission
+from dynamic_form.settings.conf import config
+
+# Pending counter changes, keyed by form ID, while updates are deferred:
+# (submission count delta, latest submission time)
+CounterChanges = Dict[int, Tuple[int, Optional[datetime]]]
+
+_deferred: ContextVar[Optional[CounterChanges]] = ContextVar(
+    "dynamic_form_deferred_counters", default=None
+)
+
+# Whether deletions leave the counters unchanged (see `uncounted_deletions`)
+_uncounted: ContextVar[bool] = ContextVar(
+    "dynamic_form_uncounted_deletions", default=False
+)
+
+
+def _merge(
+    changes: CounterChanges, form_id: int, delta: int, submitted_at: Optional[datetime]
+) -> None:
+    current_delta, current_last = changes.get(form_id, (0, None))
+    if current_last is None or (
+        submitted_at is not None and submitted_at > current_last
+    ):
+        current_last = submitted_at
+    changes[form_id] = (current_delta + delta, current_last)
+
+
+def apply_counter_changes(changes: CounterChanges) -> None:
+    """Apply counter changes with one atomic `UPDATE` per form.
+
+    Counts are updated with `F()` expressions, so concurrent writers never
+    overwrite each other, and never drop below zero.
+
+    """
+    for form_id, (delta, submitted_at) in changes.items():
+        updates = {}
+        if delta:
+            updates["submission_count"] = Greatest(
+                F("submission_count") + delta, Value(0)
+            )
+        if submitted_at is not None:
+            updates["last_submitted_at"] = Greatest(
+                Coalesce(F("last_submitted_at"), Value(submitted_at)),
+                Value(submitted_at),
+            )
+        if updates:
+            DynamicForm.objects.filter(pk=form_id).update(**updates)
+
+
+def record_submissions(
+    form_id: int, count: int = 1, submitted_at: Optional[datetime] = None
+) -> None:
+    """Count `count` new submissions of a form, the latest made at
+    `submitted_at`."""
+    changes = _deferred.get()
+    if changes is not None:
+        _merge(changes, form_id, count, submitted_at)
+    else:
+        apply_counter_changes({form_id: (count, submitted_at)})
+
+
+def record_deletions(form_id: int, count: int = 1) -> None:
+    """Uncount `count` deleted submissions of a form.
+
+    `last_submitted_at` is left untouched; `reconcile_counters` recomputes
+    it when needed.
+
+    """
+    if _uncounted.get():
+        return
+    changes = _deferred.get()
+    if changes is not None:
+        _merge(changes, form_id, -count, None)
+    else:
+        apply_counter_changes({form_id: (-count, None)})
+
+
+def record_bulk_submissions(submissions: Iterable[FormSubmission]) -> None:
+    """Count submissions inserted with `bulk_create`, which sends no
+    signals, with one update per form."""
+    changes: CounterChanges = {}
+    for submission in submissions:
+        _merge(changes, submission.form_id, 1, submission.submitted_at)
+    for form_id, (count, submitted_at) in changes.items():
+        record_submissions(form_id, count, submitted_at)
+
+
+@contextmanager
+def deferred_counters() -> Iterator[None]:
+    """Collect the counter changes made inside the block and apply them
+    once per form when it exits, e.g. around a queryset delete that would
+    otherwise update the form once per deleted submission."""
+    if _deferred.get() is not None:
+        yield
+        return
+
+    changes: CounterChanges = {}
+    token = _deferred.set(changes)
+    try:
+        yield
+    finally:
+        _deferred.reset(token)
+    apply_counter_changes(changes)
+
+
+@contextmanager
+def uncounted_deletions() -> Iterator[None]:
+    """Leave the counters unchanged by the submissions deleted inside the
+    block, e.g. when they are moved to the archive."""
+    token = _uncounted.set(True)
+    try:
+        yield
+    finally:
+        _uncounted.reset(token)
+
+
+def reconcile_counters(
+    form_ids: Optional[Iterable[int]] = None, chunk_size: int = 500
+) -> int:
+    """Recompute the counters of forms from their submissions, archived
+    submissions included when an archive is configured.
+
+    Forms are processed in chunks of `chunk_size`; each chunk runs one
+    aggregate query and one bulk update inside a transaction holding a
+    lock on the chunk's forms.
+
+    Args:
+        form_ids (Optional[Iterable[int]]): Forms to reconcile, all forms if None.
+        chunk_size (int): Number of forms per chunk.
+
+    Returns:
+        int: The number of forms whose counters were changed.
+
+    """
+    # Imported here, as the archive helpers depend on this module
+    from dynamic_form.utils.archive import archived_counts
+
+    forms = DynamicForm.objects.order_by("pk")
+    if form_ids is not None:
+        forms = forms.filter(pk__in=list(form_ids))
+    archived = archived_counts() if config.archive_dir else {}
+
+    changed = 0
+    last_pk = 0
+    while True:
+        with transaction.atomic():
+            chunk: List[DynamicForm] = list(
+                forms.filter(pk__gt=last_pk)
+                .select_for_update()
+                .only("pk", "submission_count", "last_submitted_at")[:chunk_size]
+            )
+            if not chunk:
+                return changed
+            last_pk = chunk[-1].pk
+
+            stats = {
+                row["form_id"]: (row["count"], row["last"])
+                for row in FormSubmission.objects.filter(
+                    form_id__in=[form.pk for form in chunk]
+                )
+                .order_by()
+                .values("form_id")
+                .annotate(count=Count("pk"), last=Max("submitted_at"))
+            }
+            stale = []
+            for form in chunk:
+                count, last = stats.get(form.pk, (0, None))
+                archived_count, archived_last = archived.get(form.pk, (0, None))
+                count += archived_count
+                last = max(filter(None, (last, archived_last)), default=None)
+                if (form.submission_count, form.last_submitted_at) != (count, last):
+                    form.submission_count, form.last_submitted_at = count, last
+                    stale.append(form)
+            DynamicForm.objects.bulk_update(
+                stale, ["submission_count", "last_submitted_at"]
+            )
+            changed += len(stale)
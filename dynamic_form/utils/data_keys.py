@@ -0,0 +1,83 @@
+from typing import Tuple
+
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+from dynamic_form.models import DynamicForm, FormSubmission
+from dynamic_form.models.form import DATA_KEYS_CHOICES
+from dynamic_form.utils.compression import split_submitted_data
+from dynamic_form.utils.form_schema import get_compiled_form
+
+
+def convert_data_keys(
+    form_id: int,
+    data_keys: str,
+    batch_size: int = 1000,
+    start_after: int = 0,
+    dry_run: bool = False,
+    using: str = DEFAULT_DB_ALIAS,
+) -> Tuple[int, int]:
+    """Switch the key format of a form's stored answers and rewrite its
+    existing submissions accordingly.
+
+    The form is switched first, so that new submissions use the new format
+    while old ones are rewritten; reads translate both formats in the
+    meantime. Submissions are processed in primary key order, one batch per
+    transaction, and only rows whose data changes are updated.
+
+    Args:
+        form_id (int): The form to convert.
+        data_keys (str): The target format, ``"name"`` or ``"id"``.
+        batch_size (int): Number of submissions read per batch.
+        start_after (int): Resume after this submission ID.
+        dry_run (bool): Only count the submissions that would change.
+        using (str): The database alias.
+
+    Returns:
+        Tuple[int, int]: The number of changed submissions and the ID of
+            the last submission processed.
+
+    Raises:
+        ValueError: If the form does not exist or the format is unknown.
+
+    """
+    if data_keys not in dict(DATA_KEYS_CHOICES):
+        raise ValueError(f"Unknown data keys format: {data_keys}")
+    form = DynamicForm.objects.using(using).filter(pk=form_id).first()
+    if form is None:
+        raise ValueError(f"Form #{form_id} does not exist.")
+    if not dry_run and form.data_keys != data_keys:
+        form.data_keys = data_keys
+        form.save(update_fields=["data_keys", "updated_at"])
+
+    compiled = get_compiled_form(form_id)
+    submissions = FormSubmission.objects.using(using).filter(form_id=form_id)
+    changed = 0
+    last_pk = start_after
+    while True:
+        with transaction.atomic(using=using):
+            batch = list(
+                submissions.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .select_for_update()
+                .only("pk", "form_id", "submitted_data", "compressed_data")[:batch_size]
+            )
+            if not batch:
+                return changed, last_pk
+            last_pk = batch[-1].pk
+
+            stale = []
+            for submission in batch:
+                data = submission.submitted_data
+                converted = compiled.encode_data(compiled.decode_data(data), data_keys)
+                if converted != data:
+                    stored, blob = split_submitted_data(
+                        converted, form_id=submission.form_id
+                    )
+                    submission.submitted_data = stored
+                    submission.compressed_data = blob
+                    stale.append(submission)
+            if not dry_run:
+                FormSubmission.objects.using(using).bulk_update(
+                    stale, ["submitted_data", "compressed_data"]
+                )
+            changed += len(stale)
@@ -0,0 +1,262 @@
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.models import JSONField, Q, QuerySet
+from django.db.models.expressions import RawSQL
+from django.db.models.fields.json import KeyTransform, KeyTransformIn
+
+from dynamic_form.models import FormSubmission
+from dynamic_form.utils.compression import split_submitted_data
+
+# Supported operations on the answers of submissions
+RENAME = "rename"
+DROP = "drop"
+MAP = "map"
+
+# SQLite version introducing the `->` operator used by the SQL operations
+SQLITE_JSON_OPERATORS = (3, 38, 0)
+
+
+@dataclass(frozen=True)
+class DataOperation:
+    """A change applied to one key of the stored submitted data.
+
+    Attributes:
+        action (str): One of `RENAME`, `DROP` or `MAP`
+        key (str): The key of the answer in the stored data
+        new_key (Optional[str]): The new key of a `RENAME`
+        mapping (Dict[str, Any]): Replacement values of a `MAP`, keyed by the
+            string values they replace
+
+    """
+
+    action: str
+    key: str
+    new_key: Optional[str] = None
+    mapping: Dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if self.action not in (RENAME, DROP, MAP):
+            raise ValueError(f"Unknown operation: {self.action}")
+        if self.action == RENAME and (not self.new_key or self.new_key == self.key):
+            raise ValueError("A rename needs a new key different from the old one.")
+        if self.action == MAP and not self.mapping:
+            raise ValueError("A value map needs at least one value.")
+
+    def __str__(self) -> str:
+        if self.action == RENAME:
+            return f"rename '{self.key}' to '{self.new_key}'"
+        if self.action == DROP:
+            return f"drop '{self.key}'"
+        return f"map {len(self.mapping)} value(s) of '{self.key}'"
+
+    def condition(self) -> Any:
+        """Return the filter matching the stored data this operation changes."""
+        if self.action == MAP:
+            key = KeyTransform(self.key, "submitted_data")
+            return KeyTransformIn(key, list(self.mapping))
+        return Q(submitted_data__has_key=self.key)
+
+    def apply(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply the operation to submitted data in Python."""
+        if self.key not in data:
+            return data
+        data = dict(data)
+        if self.action == RENAME:
+            data[str(self.new_key)] = data.pop(self.key)
+        elif self.action == DROP:
+            del data[self.key]
+        elif isinstance(data[self.key], str) and data[self.key] in self.mapping:
+            data[self.key] = self.mapping[data[self.key]]
+        return data
+
+    def expression(self, connection: BaseDatabaseWrapper) -> Optional[RawSQL]:
+        """Return the SQL computing the new submitted data in the database,
+        or None when the database cannot run it."""
+        column = connection.ops.quote_name(
+            FormSubmission._meta.get_field("submitted_data").column
+        )
+        if connection.vendor == "postgresql":
+            sql, params = self._postgresql_sql(column)
+        elif (
+            connection.vendor == "sqlite"
+            and connection.Database.sqlite_version_info >= SQLITE_JSON_OPERATORS
+            and '"' not in self.key + (self.new_key or "")
+        ):
+            sql, params = self._sqlite_sql(column)
+        else:
+            return None
+        return RawSQL(sql, params, output_field=JSONField())
+
+    def _postgresql_sql(self, column: str) -> Tuple[str, List[Any]]:
+        if self.action == RENAME:
+            return (
+                f"({column} - %s::text) || "
+                f"jsonb_build_object(%s::text, {column} -> %s::text)",
+                [self.key, self.new_key, self.key],
+            )
+        if self.action == DROP:
+            return f"{column} - %s::text", [self.key]
+        cases, params = self._cases("%s::jsonb")
+        return (
+            f"jsonb_set({column}, ARRAY[%s::text], "
+            f"CASE {column} -> %s::text {cases} ELSE {column} -> %s::text END)",
+            [self.key, self.key, *params, self.key],
+        )
+
+    def _sqlite_sql(self, column: str) -> Tuple[str, List[Any]]:
+        path = f'$."{self.key}"'
+        if self.action == RENAME:
+            return (
+                f"json_set(json_remove({column}, %s), %s, json({column} -> %s))",
+                [path, f'$."{self.new_key}"', path],
+            )
+        if self.action == DROP:
+            return f"json_remove({column}, %s)", [path]
+        cases, params = self._cases("json(%s)")
+        return (
+            f"json_set({column}, %s, "
+            f"json(CASE {column} -> %s {cases} ELSE {column} -> %s END))",
+            [path, path, *params, path],
+        )
+
+    def _cases(self, placeholder: str) -> Tuple[str, List[Any]]:
+        cases, params = [], []
+        for old, new in self.mapping.items():
+            cases.append(f"WHEN {placeholder} THEN {placeholder}")
+            params.extend([json.dumps(old), json.dumps(new)])
+        return " ".join(cases), params
+
+
+@dataclass
+class DataOperationResult:
+    """Outcome of a rewrite run.
+
+    Attributes:
+        updated (int): Number of changed (or, in a dry run, matching) submissions
+        batches (int): Number of processed batches
+        last_pk (int): Primary key of the last processed submission; pass it
+            as `start_after` to resume an interrupted run
+        in_database (bool): Whether uncompressed rows were rewritten by SQL
+            statements instead of being loaded
+
+    """
+
+    updated: int = 0
+    batches: int = 0
+    last_pk: int = 0
+    in_database: bool = False
+
+
+def _rewrite_loaded(
+    submissions: QuerySet, operations: Sequence[DataOperation], dry_run: bool
+) -> int:
+    """Apply the operations to the loaded submissions and save the changed
+    ones with `bulk_update`."""
+    stale = []
+    for submission in submissions.only(
+        "pk", "form_id", "submitted_data", "compressed_data"
+    ):
+        data = submission.submitted_data
+        if not isinstance(data, dict):
+            continue
+        changed = data
+        for operation in operations:
+            changed = operation.apply(changed)
+        if changed != data:
+            submission.submitted_data, submission.compressed_data = (
+                split_submitted_data(changed, form_id=submission.form_id)
+            )
+            stale.append(submission)
+    if not dry_run:
+        submissions.model.objects.using(submissions.db).bulk_update(
+            stale, ["submitted_data", "compressed_data"]
+        )
+    return len(stale)
+
+
+def rewrite_submission_data(
+    form_id: int,
+    operations: Iterable[DataOperation],
+    batch_size: int = 1000,
+    sleep: float = 0,
+    dry_run: bool = False,
+    start_after: int = 0,
+    using: str = DEFAULT_DB_ALIAS,
+    progress: Optional[Callable[[DataOperationResult], None]] = None,
+) -> DataOperationResult:
+    """Rename, drop or map keys of the stored data of a form's submissions,
+    in batches.
+
+    Submissions are processed in primary key order, `batch_size` rows per
+    transaction, pausing `sleep` seconds between batches. On PostgreSQL
+    (jsonb operators) and SQLite 3.38+ (JSON1 functions) each operation is
+    a single `UPDATE` per batch, restricted to the rows it changes; other
+    databases, and submissions with compressed answers, are loaded and
+    saved with `bulk_update`. Operations are applied in order.
+
+    The operations work on stored keys: field IDs for forms storing
+    answers by ID (see `DynamicForm.data_keys`).
+
+    Args:
+        form_id (int): The form whose submissions are rewritten.
+        operations (Iterable[DataOperation]): The operations to apply.
+        batch_size (int): Number of submissions per batch.
+        sleep (float): Seconds to wait between batches.
+        dry_run (bool): Only count the submissions that would change.
+        start_after (int): Skip submissions with a primary key up to this one.
+        using (str): The database alias.
+        progress (Optional[Callable[[DataOperationResult], None]]): Called
+            after each batch.
+
+    Returns:
+        DataOperationResult: The number of changed submissions.
+
+    """
+    operations = list(operations)
+    connection = connections[using]
+    expressions = [operation.expression(connection) for operation in operations]
+    in_database = all(expression is not None for expression in expressions)
+    matching = Q()
+    for operation in operations:
+        matching |= Q(operation.condition())
+
+    submissions = FormSubmission.objects.using(using).filter(form_id=form_id)
+    result = DataOperationResult(last_pk=start_after, in_database=in_database)
+    while True:
+        with transaction.atomic(using=using):
+            pks = list(
+                submissions.filter(pk__gt=result.last_pk)
+                .order_by("pk")
+                .values_list("pk", flat=True)[:batch_size]
+            )
+            if not pks:
+                return result
+
+            batch = submissions.filter(pk__gte=pks[0], pk__lte=pks[-1])
+            plain = batch.filter(compressed_data__isnull=True).filter(matching)
+            if in_database:
+                result.updated += plain.count()
+                if not dry_run:
+                    for operation, expression in zip(operations, expressions):
+                        plain.filter(operation.condition()).update(
+                            submitted_data=expression
+                        )
+            else:
+                result.updated += _rewrite_loaded(plain, operations, dry_run)
+            result.updated += _rewrite_loaded(
+                batch.filter(compressed_data__isnull=False), operations, dry_run
+            )
+
+        result.batches += 1
+        result.last_pk = pks[-1]
+        if progress is not None:
+            progress(result)
+        if len(pks) < batch_size:
+            return result
+        if sleep:
+            time.sleep(sleep)
@@ -0,0 +1,173 @@
+from typing import Iterable, List, Optional, Sequence
+
+from django.db import transaction
+from django.db.models import Max
+
+from dynamic_form.models import DynamicField, DynamicForm
+from dynamic_form.utils.form_schema import invalidate_form_schema
+
+# Distance between consecutive field positions after a rebalance, leaving
+# room for about ten inserts at the same place before the next one
+ORDER_GAP = 1024
+
+
+def position_between(lower: Optional[int], upper: Optional[int]) -> Optional[int]:
+    """Return a position strictly between two neighbouring positions.
+
+    Args:
+        lower (Optional[int]): Position of the previous field, None at the start.
+        upper (Optional[int]): Position of the next field, None at the end.
+
+    Returns:
+        Optional[int]: The new position, or None if there is no room left
+            and the form must be rebalanced.
+
+    """
+    if upper is None:
+        return (lower or 0) + ORDER_GAP
+    low = -1 if lower is None else lower
+    if upper - low < 2:
+        return None
+    return (low + upper) // 2
+
+
+def spaced_positions(count: int, gap: int = ORDER_GAP) -> List[int]:
+    """Return `count` positions spaced by `gap`."""
+    return [gap * (index + 1) for index in range(count)]
+
+
+def min_gap(positions: Sequence[int]) -> Optional[int]:
+    """Return the smallest distance between consecutive sorted positions,
+    None for fewer than two positions."""
+    if len(positions) < 2:
+        return None
+    return min(upper - lower for lower, upper in zip(positions, positions[1:]))
+
+
+def _lock_form(form_id: int) -> None:
+    # Serializes the ordering operations of a form
+    list(DynamicForm.objects.select_for_update().filter(pk=form_id).values("pk"))
+
+
+def rebalance_form(form_id: int, gap: int = ORDER_GAP) -> int:
+    """Respace the positions of the fields of a form by `gap`, keeping their
+    order (ties are broken by ID).
+
+    Args:
+        form_id (int): Primary key of the DynamicForm.
+        gap (int): Distance between consecutive positions.
+
+    Returns:
+        int: The number of fields whose position changed.
+
+    """
+    with transaction.atomic():
+        _lock_form(form_id)
+        fields = list(
+            DynamicField.objects.filter(form_id=form_id)
+            .order_by("order", "id")
+            .only("id", "order")
+        )
+        changed = []
+        for field, position in zip(fields, spaced_positions(len(fields), gap)):
+            if field.order != position:
+                field.order = position
+                changed.append(field)
+        DynamicField.objects.bulk_update(changed, ["order"])
+
+    if changed:
+        # Bulk writes send no signals
+        invalidate_form_schema(form_id)
+    return len(changed)
+
+
+def append_positions(form_id: int, count: int) -> List[int]:
+    """Return `count` positions after the last field of a form, for fields
+    appended in that order. Call it inside a transaction; the form is
+    locked until it ends, so concurrent appends do not share positions."""
+    _lock_form(form_id)
+    last = DynamicField.objects.filter(form_id=form_id).aggregate(last=Max("order"))[
+        "last"
+    ]
+    positions = []
+    for _index in range(count):
+        last = position_between(last, None)
+        positions.append(last)
+    return positions
+
+
+def _free_position(field: DynamicField, after: Optional[DynamicField]) -> Optional[int]:
+    siblings = DynamicField.objects.filter(form_id=field.form_id).exclude(pk=field.pk)
+    lower = None
+    if after is not None:
+        after.refresh_from_db(fields=["order"])
+        lower = after.order
+        siblings = siblings.filter(order__gte=lower).exclude(pk=after.pk)
+    upper = siblings.order_by("order", "id").values_list("order", flat=True).first()
+    return position_between(lower, upper)
+
+
+def move_field(field: DynamicField, after: Optional[DynamicField]) -> DynamicField:
+    """Move a field right after another field of its form, or first.
+
+    Only the moved field is written, unless its neighbours leave no room
+    between them, in which case the form is rebalanced first.
+
+    Args:
+        field (DynamicField): The field to move.
+        after (Optional[DynamicField]): The field to move it after, None to
+            move it first.
+
+    Returns:
+        DynamicField: The moved field, with its new position.
+
+    """
+    with transaction.atomic():
+        _lock_form(field.form_id)
+        position = _free_position(field, after)
+        if position is None:
+            rebalance_form(field.form_id)
+            position = _free_position(field, after)
+        field.order = position
+        field.save(update_fields=["order"])
+    return field
+
+
+def rebalance_forms(
+    form_ids: Optional[Iterable[int]] = None,
+    threshold: int = 2,
+    gap: int = ORDER_GAP,
+    dry_run: bool = False,
+) -> List[int]:
+    """Rebalance the forms having two fields closer than `threshold`
+    positions apart; the default finds the forms where some insert would
+    need a rebalance.
+
+    Args:
+        form_ids (Optional[Iterable[int]]): Forms to check, all forms if None.
+        threshold (int): Minimum distance between consecutive positions.
+        gap (int): Distance between consecutive positions after a rebalance.
+        dry_run (bool): Only report the forms that need a rebalance.
+
+    Returns:
+        List[int]: The IDs of the forms that were (or would be) rebalanced.
+
+    """
+    forms = DynamicForm.objects.order_by("pk")
+    if form_ids is not None:
+        forms = forms.filter(pk__in=list(form_ids))
+
+    rebalanced = []
+    for form_id in forms.values_list("pk", flat=True).iterator():
+        positions = list(
+            DynamicField.objects.filter(form_id=form_id)
+            .order_by("order")
+            .values_list("order", flat=True)
+        )
+        smallest = min_gap(positions)
+        if smallest is None or smallest >= threshold:
+            continue
+        rebalanced.append(form_id)
+        if not dry_run:
+            rebalance_form(form_id, gap)
+    return rebalanced
@@ -0,0 +1,45 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from dynamic_form.models import FieldType
+from dynamic_form.utils.cache import get_version
+from dynamic_form.utils.form_schema import FIELD_TYPES_NAMESPACE
+
+# Process-local registry: (field type version, field types keyed by ID)
+_registry: Optional[Tuple[str, Dict[int, FieldType]]] = None
+
+
+def get_field_types() -> Dict[int, FieldType]:
+    """Return every field type keyed by ID and ordered by name, loaded at
+    most once per field type version.
+
+    Saving or deleting a FieldType bumps the version (see
+    `invalidate_field_types`), so every process reloads the table on its
+    next lookup. The returned instances are shared; do not modify them.
+
+    """
+    global _registry
+    version = get_version(FIELD_TYPES_NAMESPACE)
+    if _registry is None or _registry[0] != version:
+        types = FieldType.objects.order_by("name")
+        _registry = (version, {field_type.pk: field_type for field_type in types})
+    return _registry[1]
+
+
+def get_active_field_types() -> List[FieldType]:
+    """Return the active field types from the registry, ordered by name."""
+    return [item for item in get_field_types().values() if item.is_active]
+
+
+def get_field_type(field_type_id: Any) -> Optional[FieldType]:
+    """Return a field type by ID from the registry, or None if it does not
+    exist."""
+    try:
+        return get_field_types().get(int(field_type_id))
+    except (TypeError, ValueError):
+        return None
+
+
+def clear_field_type_registry() -> None:
+    """Drop the field types held in process memory."""
+    global _registry
+    _registry = None
@@ -0,0 +1,377 @@
+import hashlib
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Container, Dict, FrozenSet, List, Optional, Tuple
+
+from dynamic_form.models.form import DATA_KEYS_ID, DATA_KEYS_NAME
+from dynamic_form.settings.conf import config
+from dynamic_form.utils.cache import bump_versions, get_cache, get_versions, make_key
+from dynamic_form.validators.submission_validators import (
+    CompiledValidators,
+    compile_form_validators,
+    run_validators,
+)
+
+# Versioned namespaces used to invalidate compiled form schemas
+FIELD_TYPES_NAMESPACE = "field_types"
+FORMS_NAMESPACE = "forms"
+
+# Upper bound for the number of compiled forms kept in process memory
+LOCAL_CACHE_MAX_SIZE = 1024
+
+# Process-local store of compiled forms keyed by form id
+_local_cache: Dict[int, "CompiledForm"] = {}
+
+
+def form_namespace(form_id: int) -> str:
+    """Return the versioned namespace of a single form."""
+    return f"form:{form_id}"
+
+
+@dataclass(frozen=True)
+class CompiledField:
+    """An immutable, pre-resolved view of a single DynamicField.
+
+    Attributes:
+        id (int): Primary key of the DynamicField
+        name (str): Name of the field, the key of its answer in the API
+        key (str): Key of the answer in the stored submitted data: the name,
+            or the ID as a string when the form stores answers by field ID
+        label (str): Display label (falls back to the name)
+        field_type_id (int): Primary key of the related FieldType
+        field_type (str): Name of the related FieldType (e.g. "text", "number")
+        field_type_is_active (bool): Whether the related FieldType is active
+        is_required (bool): Whether the field must be present in submissions
+        choices (Any): Raw choices as stored on the field
+        default_value (Any): Raw default value as stored on the field
+        validation_rules (Dict[str, Any]): Raw validation rules as stored on the field
+        order (int): Position of the field in the form layout
+
+    """
+
+    id: int
+    name: str
+    key: str
+    label: str
+    field_type_id: int
+    field_type: str
+    field_type_is_active: bool
+    is_required: bool
+    choices: Any
+    default_value: Any
+    validation_rules: Dict[str, Any]
+    order: int
+
+
+@dataclass(frozen=True)
+class CompiledForm:
+    """An immutable, pre-computed representation of a DynamicForm and its
+    fields, built once per schema version and shared across requests.
+
+    Attributes:
+        id (int): Primary key of the DynamicForm
+        name (str): Name of the form
+        data_keys (str): Key of the stored answers, ``"name"`` or ``"id"``
+        is_active (bool): Whether the form accepts submissions
+        updated_at (datetime): Last modification time of the form row
+        version (str): Opaque token identifying the cached schema version
+        schema_hash (str): Content hash of the field definitions
+        fields (Tuple[CompiledField, ...]): Fields in display order
+        field_map (Dict[str, CompiledField]): Fields keyed by name
+        required_names (FrozenSet[str]): Names of the required fields
+        field_types (Dict[str, str]): Field type name keyed by field name
+        rules (Dict[str, Dict[str, Any]]): Validation rules keyed by field name
+        validators (CompiledValidators): Pre-compiled validators of every field
+        names (Dict[str, str]): Field names keyed by field ID, as a string
+        indexed_keys (FrozenSet[str]): Names and IDs (as strings) of the
+            indexed fields, whose answers are never compressed
+
+    """
+
+    id: int
+    name: str
+    data_keys: str
+    is_active: bool
+    updated_at: Optional[datetime]
+    version: str
+    schema_hash: str
+    fields: Tuple[CompiledField, ...]
+    field_map: Dict[str, CompiledField] = field(repr=False)
+    required_names: FrozenSet[str] = field(repr=False)
+    field_types: Dict[str, str] = field(repr=False)
+    rules: Dict[str, Dict[str, Any]] = field(repr=False)
+    validators: CompiledValidators = field(repr=False)
+    names: Dict[str, str] = field(repr=False)
+    indexed_keys: FrozenSet[str] = field(repr=False, default=frozenset())
+
+    @classmethod
+    def from_schema(cls, schema: Dict[str, Any], version: str) -> "CompiledForm":
+        """Build a CompiledForm from the plain schema payload produced by
+        `load_form_schema`.
+
+        Args:
+            schema (Dict[str, Any]): The cached schema payload.
+            version (str): The schema version token the payload belongs to.
+
+        Returns:
+            CompiledForm: The compiled form.
+
+        """
+        form = schema["form"]
+        # Schemas cached before data keys were configurable store names
+        data_keys = form.get("data_keys", DATA_KEYS_NAME)
+        fields = tuple(
+            CompiledField(
+                id=item["id"],
+                name=item["name"],
+                key=str(item["id"]) if data_keys == DATA_KEYS_ID else item["name"],
+                label=item["label"] or item["name"],
+                field_type_id=item["field_type_id"],
+                field_type=item["field_type"],
+                field_type_is_active=item["field_type_is_active"],
+                is_required=item["is_required"],
+                choices=item["choices"],
+                default_value=item["default_value"],
+                validation_rules=item["validation_rules"] or {},
+                order=item["order"],
+            )
+            for item in schema["fields"]
+        )
+        return cls(
+            id=form["id"],
+            name=form["name"],
+            data_keys=data_keys,
+            is_active=form["is_active"],
+            updated_at=form["updated_at"],
+            version=version,
+            schema_hash=schema["schema_hash"],
+            fields=fields,
+            field_map={item.name: item for item in fields},
+            required_names=frozenset(item.name for item in fields if item.is_required),
+            field_types={item.name: item.field_type for item in fields},
+            rules={item.name: item.validation_rules for item in fields},
+            validators=compile_form_validators(fields),
+            names={str(item.id): item.name for item in fields},
+            # Schemas cached before indexed fields were recorded have none
+            indexed_keys=frozenset(
+                key
+                for item in fields
+                if item.id in schema.get("indexed_field_ids", ())
+                for key in (item.name, str(item.id))
+            ),
+        )
+
+    def encode_data(self, data: Any, data_keys: Optional[str] = None) -> Any:
+        """Translate submitted data keyed by field name into its stored
+        form; keys that are not fields of the form are kept as is.
+
+        Args:
+            data (Any): The submitted data keyed by field name.
+            data_keys (Optional[str]): The stored key format, defaults to the
+                form's `data_keys`.
+
+        """
+        if (data_keys or self.data_keys) != DATA_KEYS_ID or not isinstance(data, dict):
+            return data
+        return {
+            (str(item.id) if (item := self.field_map.get(key)) else key): value
+            for key, value in data.items()
+        }
+
+    def decode_data(self, data: Any) -> Any:
+        """Translate stored submitted data back to field names.
+
+        Field ID keys are translated whatever the current `data_keys`, so
+        submissions stay readable while a form is being converted.
+
+        """
+        return decode_stored_data(data, self.names, self.field_map)
+
+    def validate(self, data: Dict[str, Any]) -> Dict[str, List[str]]:
+        """Validate submitted data against the compiled validators.
+
+        Args:
+            data (Dict[str, Any]): The submitted data keyed by field name.
+
+        Returns:
+            Dict[str, List[str]]: Error messages keyed by field name, empty if the data is valid.
+
+        """
+        return run_validators(self.validators, data)
+
+
+def decode_stored_data(
+    data: Any, names: Dict[str, str], field_names: Container[str]
+) -> Any:
+    """Translate the field ID keys of stored submitted data to field names.
+
+    Args:
+        data (Any): The stored submitted data.
+        names (Dict[str, str]): Field names keyed by field ID, as a string.
+        field_names (Container[str]): Names of the fields; keys that are
+            field names are never translated.
+
+    Returns:
+        Any: The data keyed by field name.
+
+    """
+    if not isinstance(data, dict):
+        return data
+    if not any(key in names and key not in field_names for key in data):
+        return data
+    return {
+        (names[key] if key in names and key not in field_names else key): value
+        for key, value in data.items()
+    }
+
+
+def compute_schema_hash(fields: Any) -> str:
+    """Return a stable content hash of the given field definitions."""
+    payload = json.dumps(fields, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def load_form_schema(form_id: int) -> Optional[Dict[str, Any]]:
+    """Load the schema payload of a form from the database.
+
+    The payload only contains plain data so that it can be stored in any
+    Django cache backend.
+
+    Args:
+        form_id (int): Primary key of the DynamicForm.
+
+    Returns:
+        Optional[Dict[str, Any]]: The schema payload, or None if the form does not exist.
+
+    """
+    from dynamic_form.models import DynamicField, DynamicForm
+    from dynamic_form.utils.field_types import (
+        clear_field_type_registry,
+        get_field_types,
+    )
+
+    form = (
+        DynamicForm.objects.filter(pk=form_id)
+        .values("id", "name", "data_keys", "is_active", "updated_at")
+        .first()
+    )
+    if form is None:
+        return None
+
+    rows = list(
+        DynamicField.objects.filter(form_id=form_id)
+        .order_by("order", "id")
+        .values(
+            "id",
+            "name",
+            "label",
+            "field_type_id",
+            "is_required",
+            "choices",
+            "default_value",
+            "validation_rules",
+            "order",
+            "is_indexed",
+        )
+    )
+    # Field types come from the registry, whose version is part of the
+    # schema version, rather than from a join
+    field_types = get_field_types()
+    if any(row["field_type_id"] not in field_types for row in rows):
+        # A field type this process has not seen yet
+        clear_field_type_registry()
+        field_types = get_field_types()
+
+    fields = [
+        {
+            "id": row["id"],
+            "name": row["name"],
+            "label": row["label"],
+            "field_type_id": row["field_type_id"],
+            "field_type": field_types[row["field_type_id"]].name,
+            "field_type_is_active": field_types[row["field_type_id"]].is_active,
+            "is_required": row["is_required"],
+            "choices": row["choices"],
+            "default_value": row["default_value"],
+            "validation_rules": row["validation_rules"],
+            "order": row["order"],
+        }
+        for row in rows
+    ]
+    return {
+        "form": form,
+        "fields": fields,
+        # Kept out of the field definitions, so that indexing a field does
+        # not change the schema hash
+        "indexed_field_ids": [row["id"] for row in rows if row["is_indexed"]],
+        "schema_hash": compute_schema_hash(fields),
+    }
+
+
+def get_schema_version(form_id: int) -> str:
+    """Return the current schema version token of a form."""
+    namespace = form_namespace(form_id)
+    versions = get_versions(FIELD_TYPES_NAMESPACE, namespace)
+    return f"{versions[FIELD_TYPES_NAMESPACE]}.{versions[namespace]}"
+
+
+def get_compiled_form(form_id: Any) -> Optional[CompiledForm]:
+    """Return the compiled schema of a form, loading it at most once per
+    schema version.
+
+    Lookups are served from process memory first, then from the configured
+    Django cache (shared between workers), and only hit the database when
+    both miss.
+
+    Args:
+        form_id (Any): Primary key of the DynamicForm.
+
+    Returns:
+        Optional[CompiledForm]: The compiled form, or None if it does not exist.
+
+    """
+    try:
+        form_id = int(form_id)
+    except (TypeError, ValueError):
+        return None
+
+    version = get_schema_version(form_id)
+    compiled = _local_cache.get(form_id)
+    if compiled is not None and compiled.version == version:
+        return compiled
+
+    cache = get_cache()
+    key = make_key("schema", form_id, version)
+    schema = cache.get(key)
+    if schema is None:
+        schema = load_form_schema(form_id)
+        if schema is None:
+            return None
+        cache.set(key, schema, timeout=config.schema_cache_timeout)
+
+    compiled = CompiledForm.from_schema(schema, version)
+    if len(_local_cache) >= LOCAL_CACHE_MAX_SIZE:
+        _local_cache.clear()
+    _local_cache[form_id] = compiled
+    return compiled
+
+
+def invalidate_form_schema(form_id: Optional[int]) -> None:
+    """Invalidate the compiled schema of a single form in every process."""
+    if form_id is None:
+        return
+    _local_cache.pop(form_id, None)
+    bump_versions([form_namespace(form_id), FORMS_NAMESPACE])
+
+
+def invalidate_field_types() -> None:
+    """Invalidate the compiled schema of every form, e.g. after a FieldType
+    change."""
+    _local_cache.clear()
+    bump_versions([FIELD_TYPES_NAMESPACE, FORMS_NAMESPACE])
+
+
+def clear_local_schema_cache() -> None:
+    """Drop every compiled form held in process memory."""
+    _local_cache.clear()
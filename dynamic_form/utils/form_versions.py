@@ -0,0 +1,193 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+
+from django.db import IntegrityError, transaction
+from django.db.models import prefetch_related_objects
+
+from dynamic_form.models import DynamicForm, FormVersion
+from dynamic_form.settings.conf import config
+from dynamic_form.utils.cache import get_cache, make_key
+from dynamic_form.utils.form_schema import (
+    LOCAL_CACHE_MAX_SIZE,
+    CompiledForm,
+    decode_stored_data,
+)
+
+# Process-local stores: compiled versions keyed by version ID, and version
+# IDs keyed by (form ID, schema hash). Versions are immutable, so entries
+# never go stale.
+_versions: Dict[int, "CompiledVersion"] = {}
+_version_ids: Dict[Tuple[int, str], int] = {}
+
+
+@dataclass(frozen=True)
+class CompiledVersion:
+    """An immutable, pre-resolved view of a FormVersion.
+
+    Attributes:
+        id (int): Primary key of the FormVersion
+        form_id (int): Primary key of the DynamicForm
+        schema_hash (str): Content hash of the field definitions
+        form (Dict[str, Any]): The form as serialized by the API when the
+            version was recorded
+        names (Dict[str, str]): Field names keyed by field ID, as a string
+        field_names (FrozenSet[str]): Names of the fields of the version
+
+    """
+
+    id: int
+    form_id: int
+    schema_hash: str
+    form: Dict[str, Any] = field(repr=False)
+    names: Dict[str, str] = field(repr=False)
+    field_names: FrozenSet[str] = field(repr=False)
+
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> "CompiledVersion":
+        """Build a CompiledVersion from the values of a FormVersion row."""
+        fields = row["schema"].get("fields") or []
+        return cls(
+            id=row["id"],
+            form_id=row["form_id"],
+            schema_hash=row["schema_hash"],
+            form=row["schema"],
+            names={str(item["id"]): item["name"] for item in fields},
+            field_names=frozenset(item["name"] for item in fields),
+        )
+
+    def decode_data(self, data: Any) -> Any:
+        """Translate stored submitted data to the field names of the
+        version."""
+        return decode_stored_data(data, self.names, self.field_names)
+
+
+def _remember(store: Dict[Any, Any], key: Any, value: Any) -> None:
+    if len(store) >= LOCAL_CACHE_MAX_SIZE:
+        store.clear()
+    store[key] = value
+
+
+def snapshot_form(form_id: int) -> Optional[Dict[str, Any]]:
+    """Return the API representation of a form and its fields, as stored in
+    a FormVersion, or None if the form does not exist."""
+    # The API serializers import this module
+    from dynamic_form.api.serializers.form import DynamicFormSerializer
+
+    form = DynamicForm.objects.filter(pk=form_id).first()
+    if form is None:
+        return None
+    prefetch_related_objects([form], "fields")
+    return dict(DynamicFormSerializer(form).data)
+
+
+def record_form_version(form: CompiledForm) -> Optional[FormVersion]:
+    """Return the version of a form matching its compiled schema, recording
+    a snapshot of the form if there is none yet.
+
+    Concurrent writers recording the same version are resolved by the
+    unique constraint on (form, schema_hash).
+
+    """
+    version = FormVersion.objects.filter(
+        form_id=form.id, schema_hash=form.schema_hash
+    ).first()
+    if version is not None:
+        return version
+
+    schema = snapshot_form(form.id)
+    if schema is None:
+        return None
+    try:
+        with transaction.atomic():
+            return FormVersion.objects.create(
+                form_id=form.id, schema_hash=form.schema_hash, schema=schema
+            )
+    except IntegrityError:
+        return FormVersion.objects.filter(
+            form_id=form.id, schema_hash=form.schema_hash
+        ).first()
+
+
+def get_current_version_id(form: CompiledForm) -> Optional[int]:
+    """Return the ID of the version matching the compiled schema of a form,
+    which new submissions reference.
+
+    Lookups are served from process memory first, then from the configured
+    Django cache, and the version is only recorded on the first submission
+    made against a schema. Version IDs are cached once the transaction that
+    recorded them commits.
+
+    Args:
+        form (CompiledForm): The compiled form submissions are validated with.
+
+    Returns:
+        Optional[int]: The version ID, or None if the form no longer exists.
+
+    """
+    key = (form.id, form.schema_hash)
+    version_id = _version_ids.get(key)
+    if version_id is not None:
+        return version_id
+
+    cache = get_cache()
+    cache_key = make_key("form_version_id", form.id, form.schema_hash)
+    version_id = cache.get(cache_key)
+    if version_id is not None:
+        _remember(_version_ids, key, version_id)
+        return version_id
+
+    version = record_form_version(form)
+    if version is None:
+        return None
+
+    def remember() -> None:
+        cache.set(cache_key, version.pk, timeout=config.schema_cache_timeout)
+        _remember(_version_ids, key, version.pk)
+
+    # A version recorded by a transaction that is rolled back must not be
+    # referenced by later submissions
+    transaction.on_commit(remember)
+    return version.pk
+
+
+def get_form_version(version_id: Optional[int]) -> Optional[CompiledVersion]:
+    """Return a compiled form version, loading its blob at most once.
+
+    Args:
+        version_id (Optional[int]): Primary key of the FormVersion.
+
+    Returns:
+        Optional[CompiledVersion]: The compiled version, or None if it does
+            not exist.
+
+    """
+    if version_id is None:
+        return None
+    compiled = _versions.get(version_id)
+    if compiled is not None:
+        return compiled
+
+    cache = get_cache()
+    cache_key = make_key("form_version", version_id)
+    row = cache.get(cache_key)
+    if row is None:
+        row = (
+            FormVersion.objects.filter(pk=version_id)
+            .values("id", "form_id", "schema_hash", "schema")
+            .first()
+        )
+        if row is None:
+            return None
+        transaction.on_commit(
+            lambda: cache.set(cache_key, row, timeout=config.schema_cache_timeout)
+        )
+
+    compiled = CompiledVersion.from_row(row)
+    transaction.on_commit(lambda: _remember(_versions, version_id, compiled))
+    return compiled
+
+
+def clear_local_version_cache() -> None:
+    """Drop every form version held in process memory."""
+    _versions.clear()
+    _version_ids.clear()
@@ -0,0 +1,100 @@
+import hashlib
+import json
+from datetime import timedelta
+from typing import Any, Optional, Tuple
+
+from django.contrib.auth.models import AbstractBaseUser
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework.request import Request
+
+from dynamic_form.models import IdempotencyKey
+from dynamic_form.settings.conf import config
+
+# Request header carrying the client-generated key
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+
+# Response header set on responses replayed from a stored result
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+
+def request_fingerprint(request: Request) -> str:
+    """Hash the method, path and parsed body of a request, so that a key
+    reused for a different request can be detected."""
+    data: Any = request.data
+    if hasattr(data, "lists"):
+        data = dict(data.lists())
+    body = json.dumps(data, sort_keys=True, cls=DjangoJSONEncoder, default=str)
+    key = "|".join([request.method or "", request.path, body])
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def expiry_cutoff() -> Any:
+    """Return the creation time before which keys are expired."""
+    return timezone.now() - timedelta(seconds=config.idempotency_key_ttl)
+
+
+def claim_key(
+    user: AbstractBaseUser, key: str, fingerprint: str
+) -> Tuple[Optional[IdempotencyKey], bool]:
+    """Claim an idempotency key before processing its request.
+
+    The key is looked up first, so replays cost a single query. The insert
+    relies on the unique constraint, so only one of several concurrent
+    requests sharing a key can claim it; when called in the transaction of
+    the request, the others wait for that transaction to end. An expired
+    key is replaced.
+
+    Returns:
+        Tuple[Optional[IdempotencyKey], bool]: The key and whether it was
+            claimed by this call; the key is None if it vanished meanwhile.
+
+    """
+    record = IdempotencyKey.objects.filter(user=user, key=key).first()
+    if record is not None:
+        if record.created_at >= expiry_cutoff():
+            return record, False
+        record.delete()
+
+    try:
+        with transaction.atomic():
+            record = IdempotencyKey.objects.create(
+                user=user, key=key, request_fingerprint=fingerprint
+            )
+        return record, True
+    except IntegrityError:
+        # A concurrent request claimed the key first
+        return IdempotencyKey.objects.filter(user=user, key=key).first(), False
+
+
+def complete_key(record: IdempotencyKey, status_code: int, data: Any) -> None:
+    """Store the response of a processed request for replay."""
+    IdempotencyKey.objects.filter(pk=record.pk).update(
+        status_code=status_code, response_data=data
+    )
+
+
+def release_key(record: IdempotencyKey) -> None:
+    """Delete a claimed key whose request failed, so that it can be retried."""
+    IdempotencyKey.objects.filter(pk=record.pk, status_code__isnull=True).delete()
+
+
+def purge_expired_keys(batch_size: int = 1000) -> int:
+    """Delete expired idempotency keys in batches of `batch_size` rows.
+
+    Returns:
+        int: The number of deleted keys.
+
+    """
+    cutoff = expiry_cutoff()
+    deleted = 0
+    while True:
+        ids = list(
+            IdempotencyKey.objects.filter(created_at__lt=cutoff).values_list(
+                "pk", flat=True
+            )[:batch_size]
+        )
+        if not ids:
+            return deleted
+        deleted += IdempotencyKey.objects.filter(pk__in=ids).delete()[0]
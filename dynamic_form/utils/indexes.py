@@ -0,0 +1,260 @@
+import hashlib
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.models import F, Func, TextField
+from django.db.models.sql.compiler import SQLCompiler
+
+from dynamic_form.models import DynamicField, FormSubmission
+from dynamic_form.models.form import DATA_KEYS_ID
+from dynamic_form.settings.conf import config
+from dynamic_form.utils.partitioning import is_partitioned
+
+# Prefix of every index managed by the `dynamic_form_indexes` command
+INDEX_PREFIX = "df_sub_"
+
+# Name of the PostgreSQL GIN index over the whole submitted_data document
+GIN_INDEX_NAME = f"{INDEX_PREFIX}data_gin"
+
+# Database vendors supporting submitted_data indexes
+SUPPORTED_VENDORS = ("postgresql", "sqlite")
+
+# Field names that can safely be embedded in index expressions
+INDEXABLE_KEY = re.compile(r"^[\w\-]+$")
+
+# Prefix of the ordering, search and filterset fields on submitted answers
+DATA_FIELD_PREFIX = "submitted_data__"
+
+
+@dataclass(frozen=True)
+class SubmissionIndex:
+    """An index on the submitted data of FormSubmission.
+
+    Attributes:
+        name (str): Name of the index in the database
+        key (Optional[str]): Indexed key of the stored data (a field name, or
+            a field ID for forms storing answers by ID), None for the whole
+            document
+        form_ids (Tuple[int, ...]): Forms declaring the key as indexed
+
+    """
+
+    name: str
+    key: Optional[str] = None
+    form_ids: Tuple[int, ...] = ()
+
+    @property
+    def is_gin(self) -> bool:
+        return self.key is None
+
+
+def is_indexable_key(key: str) -> bool:
+    """Return whether a field name can be used in an index expression."""
+    return bool(INDEXABLE_KEY.match(key))
+
+
+def supports_data_indexes(connection: BaseDatabaseWrapper) -> bool:
+    """Return whether submitted_data indexes are supported on the
+    connection's database."""
+    return connection.vendor in SUPPORTED_VENDORS
+
+
+def can_index_concurrently(connection: BaseDatabaseWrapper) -> bool:
+    """Return whether indexes on the submission table can be built and
+    dropped `CONCURRENTLY`."""
+    return connection.vendor == "postgresql" and not is_partitioned(connection)
+
+
+def key_index_name(key: str) -> str:
+    """Return the name of the expression index of a field name.
+
+    The key is hashed so the name stays below the identifier length
+    limits of every database.
+
+    """
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+    return f"{INDEX_PREFIX}key_{digest}"
+
+
+def data_key_sql(vendor: str, column: str, key: str) -> str:
+    """Return the SQL extracting a key of the submitted data as a scalar.
+
+    The same SQL is used to create the expression indexes and by
+    `SubmittedValue` in queries, so the database can match them.
+
+    Args:
+        vendor (str): The database vendor.
+        column (str): The quoted submitted_data column, optionally qualified.
+        key (str): The field name; must pass `is_indexable_key`.
+
+    Returns:
+        str: The SQL expression.
+
+    Raises:
+        ValueError: If the key cannot be embedded or the vendor is unsupported.
+
+    """
+    if not is_indexable_key(key):
+        raise ValueError(f"Field name '{key}' cannot be used in an index.")
+    if vendor == "postgresql":
+        return f"({column} ->> '{key}')"
+    if vendor == "sqlite":
+        return f"json_extract({column}, '$.\"{key}\"')"
+    raise ValueError(f"Submitted data indexes are not supported on '{vendor}'.")
+
+
+class SubmittedValue(Func):
+    """The value of a field in `FormSubmission.submitted_data`, compiled to
+    the same SQL as the expression indexes so that filters can use them.
+
+    On PostgreSQL the value is extracted as text; on SQLite it keeps its
+    JSON type.
+
+    """
+
+    output_field = TextField()
+
+    def __init__(self, key: str, column: str = "submitted_data") -> None:
+        super().__init__(F(column))
+        self.key = key
+
+    def as_sql(
+        self,
+        compiler: SQLCompiler,
+        connection: BaseDatabaseWrapper,
+        **extra_context: Any,
+    ) -> Tuple[str, List[Any]]:
+        column_sql, params = compiler.compile(self.source_expressions[0])
+        return data_key_sql(connection.vendor, column_sql, self.key), list(params)
+
+
+def declared_indexes(
+    connection: BaseDatabaseWrapper,
+) -> Tuple[List[SubmissionIndex], List[DynamicField]]:
+    """Return the indexes declared through `DynamicField.is_indexed`, plus
+    the GIN index on PostgreSQL.
+
+    Each indexed key gets one index on `(form_id, <value of key>)`, shared
+    by every form declaring it, so lookups within a form are index seeks
+    with bound parameters on every supported database. Fields of forms
+    storing answers by field ID are indexed on their ID.
+
+    Args:
+        connection (BaseDatabaseWrapper): The database the indexes live in.
+
+    Returns:
+        Tuple[List[SubmissionIndex], List[DynamicField]]: The declared indexes
+            and the declared fields whose name cannot be indexed.
+
+    """
+    indexes: List[SubmissionIndex] = []
+    if connection.vendor == "postgresql":
+        indexes.append(SubmissionIndex(name=GIN_INDEX_NAME))
+
+    form_ids: Dict[str, List[int]] = {}
+    skipped: List[DynamicField] = []
+    fields = DynamicField.objects.filter(is_indexed=True).order_by("name", "form_id")
+    for field in fields.select_related("form").only(
+        "id", "form_id", "name", "form__data_keys"
+    ):
+        key = str(field.pk) if field.form.data_keys == DATA_KEYS_ID else field.name
+        if is_indexable_key(key):
+            form_ids.setdefault(key, []).append(field.form_id)
+        else:
+            skipped.append(field)
+
+    indexes.extend(
+        SubmissionIndex(name=key_index_name(key), key=key, form_ids=tuple(ids))
+        for key, ids in form_ids.items()
+    )
+    return indexes, skipped
+
+
+def existing_index_names(connection: BaseDatabaseWrapper) -> Set[str]:
+    """Return the names of the managed indexes present in the database."""
+    table = FormSubmission._meta.db_table
+    with connection.cursor() as cursor:
+        constraints = connection.introspection.get_constraints(cursor, table)
+    return {
+        name
+        for name, info in constraints.items()
+        if info.get("index") and name.startswith(INDEX_PREFIX)
+    }
+
+
+def create_index_sql(
+    index: SubmissionIndex,
+    connection: BaseDatabaseWrapper,
+    concurrently: Optional[bool] = None,
+) -> str:
+    """Return the statement creating an index.
+
+    Indexes are built `CONCURRENTLY` on PostgreSQL so that writes are not
+    blocked; such statements must run outside a transaction. Partitioned
+    tables do not support concurrent builds, so their indexes are built
+    normally. Pass `concurrently` to override the detection.
+
+    """
+    quote = connection.ops.quote_name
+    table = quote(FormSubmission._meta.db_table)
+    column = quote(FormSubmission._meta.get_field("submitted_data").column)
+    if concurrently is None:
+        concurrently = can_index_concurrently(connection)
+    prefix = (
+        f"CREATE INDEX {'CONCURRENTLY ' if concurrently else ''}IF NOT EXISTS "
+        f"{quote(index.name)} ON {table}"
+    )
+
+    if index.is_gin:
+        return f"{prefix} USING GIN ({column} jsonb_path_ops)"
+
+    expression = data_key_sql(connection.vendor, column, str(index.key))
+    form_column = quote(FormSubmission._meta.get_field("form").column)
+    return f"{prefix} ({form_column}, ({expression}))"
+
+
+def drop_index_sql(name: str, connection: BaseDatabaseWrapper) -> str:
+    """Return the statement dropping a managed index."""
+    concurrently = "CONCURRENTLY " if can_index_concurrently(connection) else ""
+    return f"DROP INDEX {concurrently}IF EXISTS {connection.ops.quote_name(name)}"
+
+
+def missing_indexes(connection: BaseDatabaseWrapper) -> List[SubmissionIndex]:
+    """Return the declared indexes that do not exist in the database."""
+    existing = existing_index_names(connection)
+    indexes, _ = declared_indexes(connection)
+    return [index for index in indexes if index.name not in existing]
+
+
+def _filter_paths() -> Iterable[str]:
+    for prefix in ("api_form_submission", "api_admin_form_submission"):
+        yield from getattr(config, f"{prefix}_ordering_fields", None) or []
+        for path in getattr(config, f"{prefix}_search_fields", None) or []:
+            yield path.lstrip("^=@$")
+        filterset_class = getattr(config, f"{prefix}_filterset_class", None)
+        for item in getattr(filterset_class, "base_filters", {}).values():
+            yield getattr(item, "field_name", None) or ""
+
+
+def configured_filter_keys() -> List[str]:
+    """Return the keys of the submitted data that the FormSubmission APIs
+    are configured to order, search or filter on (``submitted_data__<key>``
+    ordering, search and filterset fields)."""
+    keys = {
+        path[len(DATA_FIELD_PREFIX) :].split("__")[0]
+        for path in _filter_paths()
+        if path.startswith(DATA_FIELD_PREFIX)
+    }
+    return sorted(key for key in keys if key)
+
+
+def unindexed_filter_keys(connection: BaseDatabaseWrapper) -> List[str]:
+    """Return the configured filter keys without an expression index in
+    the database."""
+    keys = configured_filter_keys()
+    if not keys:
+        return []
+    existing = existing_index_names(connection)
+    return [key for key in keys if key_index_name(key) not in existing]
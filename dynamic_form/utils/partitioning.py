@@ -0,0 +1,240 @@
+import re
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+
+from django.db.backends.base.base import BaseDatabaseWrapper
+
+from dynamic_form.models import FormSubmission
+
+# Suffix of the monthly partitions, e.g. form_submissions_p2026_10
+PARTITION_SUFFIX = re.compile(r"_p(\d{4})_(\d{2})$")
+
+# Suffix of the partition receiving rows outside every monthly partition
+DEFAULT_PARTITION_SUFFIX = "_default"
+
+
+def table_name() -> str:
+    return FormSubmission._meta.db_table
+
+
+def month_start(value: datetime) -> datetime:
+    """Return the first instant (UTC) of the month of `value`."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.replace(
+        day=1, hour=0, minute=0, second=0, microsecond=0, tzinfo=timezone.utc
+    )
+
+
+def add_months(month: datetime, count: int) -> datetime:
+    """Shift the first instant of a month by `count` months."""
+    years, index = divmod(month.month - 1 + count, 12)
+    return month.replace(year=month.year + years, month=index + 1)
+
+
+def month_range(first: datetime, last: datetime) -> List[datetime]:
+    """Return the starts of every month from `first` to `last`, inclusive."""
+    months, month = [], month_start(first)
+    while month <= month_start(last):
+        months.append(month)
+        month = add_months(month, 1)
+    return months
+
+
+def partition_name(month: datetime) -> str:
+    return f"{table_name()}_p{month.year:04d}_{month.month:02d}"
+
+
+def default_partition_name() -> str:
+    return f"{table_name()}{DEFAULT_PARTITION_SUFFIX}"
+
+
+def partition_month(name: str) -> Optional[datetime]:
+    """Return the month of a monthly partition from its name, or None for
+    other tables (e.g. the default partition)."""
+    match = PARTITION_SUFFIX.search(name)
+    if match is None or not name.startswith(table_name()):
+        return None
+    return datetime(int(match[1]), int(match[2]), 1, tzinfo=timezone.utc)
+
+
+def is_partitioned(connection: BaseDatabaseWrapper) -> bool:
+    """Return whether the submission table is a partitioned PostgreSQL
+    table."""
+    if connection.vendor != "postgresql":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table pt "
+            "JOIN pg_class c ON c.oid = pt.partrelid "
+            "WHERE c.relname = %s AND pg_table_is_visible(c.oid)",
+            [table_name()],
+        )
+        return cursor.fetchone() is not None
+
+
+def existing_partitions(connection: BaseDatabaseWrapper) -> List[str]:
+    """Return the names of the partitions attached to the submission table."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = %s AND pg_table_is_visible(p.oid) "
+            "ORDER BY c.relname",
+            [table_name()],
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+def partition_bounds(month: datetime) -> str:
+    """Return the range clause of the partition of a month."""
+    upper = add_months(month, 1)
+    return f"FOR VALUES FROM ('{month.isoformat()}') TO ('{upper.isoformat()}')"
+
+
+def create_partition_sql(month: datetime, connection: BaseDatabaseWrapper) -> str:
+    """Return the statement creating the partition of a month."""
+    quote = connection.ops.quote_name
+    return (
+        f"CREATE TABLE IF NOT EXISTS {quote(partition_name(month))} "
+        f"PARTITION OF {quote(table_name())} {partition_bounds(month)}"
+    )
+
+
+def move_default_rows_sql(
+    month: datetime, connection: BaseDatabaseWrapper
+) -> List[str]:
+    """Return the statements creating the partition of a month when the
+    table has a default partition.
+
+    PostgreSQL refuses to create a partition while the default partition
+    holds rows of its range, so the partition is created as a regular
+    table, the rows of the month are moved out of the default partition
+    into it, and it is then attached. The statements must run in one
+    transaction.
+
+    """
+    quote = connection.ops.quote_name
+    name = quote(partition_name(month))
+    submitted_at = quote(FormSubmission._meta.get_field("submitted_at").column)
+    upper = add_months(month, 1)
+    return [
+        f"CREATE TABLE {name} (LIKE {quote(table_name())} "
+        f"INCLUDING DEFAULTS INCLUDING CONSTRAINTS)",
+        f"WITH moved AS (DELETE FROM {quote(default_partition_name())} "
+        f"WHERE {submitted_at} >= '{month.isoformat()}' "
+        f"AND {submitted_at} < '{upper.isoformat()}' RETURNING *) "
+        f"INSERT INTO {name} SELECT * FROM moved",
+        f"ALTER TABLE {quote(table_name())} ATTACH PARTITION {name} "
+        f"{partition_bounds(month)}",
+    ]
+
+
+def detach_partition_sql(name: str, connection: BaseDatabaseWrapper) -> str:
+    """Return the statement detaching a partition; the detached table keeps
+    its rows and can be archived or dropped."""
+    quote = connection.ops.quote_name
+    return f"ALTER TABLE {quote(table_name())} DETACH PARTITION {quote(name)}"
+
+
+def partitions_to_detach(names: List[str], older_than: int, now: datetime) -> List[str]:
+    """Return the monthly partitions ending before the start of the month
+    `older_than` months before `now`."""
+    cutoff = add_months(month_start(now), -older_than)
+    return [
+        name
+        for name in names
+        if (month := partition_month(name)) is not None
+        and add_months(month, 1) <= cutoff
+    ]
+
+
+def table_definitions_sql(connection: BaseDatabaseWrapper) -> List[str]:
+    """Return the statements recreating the valid secondary indexes and the
+    foreign keys of the submission table, as read from the PostgreSQL
+    catalog."""
+    quote = connection.ops.quote_name
+    table = quote(table_name())
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT pg_get_indexdef(i.indexrelid) FROM pg_index i "
+            "JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE i.indrelid = %s::regclass AND NOT i.indisprimary "
+            "AND i.indisvalid ORDER BY c.relname",
+            [table],
+        )
+        statements = [row[0] for row in cursor.fetchall()]
+        cursor.execute(
+            "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+            "WHERE conrelid = %s::regclass AND contype = 'f' ORDER BY conname",
+            [table],
+        )
+        statements.extend(
+            f"ALTER TABLE {table} ADD CONSTRAINT {quote(name)} {definition}"
+            for name, definition in cursor.fetchall()
+        )
+    return statements
+
+
+def setup_sql(
+    connection: BaseDatabaseWrapper,
+    first: datetime,
+    last: datetime,
+) -> List[str]:
+    """Return the statements converting the submission table into a table
+    partitioned by month of `submitted_at`.
+
+    The rows are copied into monthly partitions covering `first` to `last`
+    (plus a default partition for anything outside them), then the primary
+    key, indexes and foreign keys of the table are recreated, including
+    the submitted data indexes. The primary key becomes
+    `(id, submitted_at)`, as PostgreSQL requires the partition key in
+    unique constraints; IDs keep coming from a sequence, so the model is
+    unchanged. The statements must run in one transaction.
+
+    """
+    quote = connection.ops.quote_name
+    table = table_name()
+    legacy = f"{table}_legacy"
+    sequence = f"{table}_id_seq_p"
+    pk = quote(FormSubmission._meta.pk.column)
+    submitted_at = quote(FormSubmission._meta.get_field("submitted_at").column)
+
+    # Read before the rename, so the definitions name the new table
+    definitions = table_definitions_sql(connection)
+    return [
+        f"ALTER TABLE {quote(table)} RENAME TO {quote(legacy)}",
+        f"CREATE TABLE {quote(table)} (LIKE {quote(legacy)} "
+        f"INCLUDING DEFAULTS INCLUDING COMMENTS) PARTITION BY RANGE ({submitted_at})",
+        f"CREATE SEQUENCE {quote(sequence)} OWNED BY {quote(table)}.{pk}",
+        f"SELECT setval('{sequence}', COALESCE((SELECT MAX({pk}) FROM "
+        f"{quote(legacy)}), 0) + 1, false)",
+        f"ALTER TABLE {quote(table)} ALTER COLUMN {pk} "
+        f"SET DEFAULT nextval('{sequence}')",
+        *(
+            create_partition_sql(month, connection)
+            for month in month_range(first, last)
+        ),
+        f"CREATE TABLE {quote(default_partition_name())} "
+        f"PARTITION OF {quote(table)} DEFAULT",
+        f"INSERT INTO {quote(table)} SELECT * FROM {quote(legacy)}",
+        f"DROP TABLE {quote(legacy)}",
+        f"ALTER TABLE {quote(table)} ADD PRIMARY KEY ({pk}, {submitted_at})",
+        *definitions,
+    ]
+
+
+def data_range(
+    connection: BaseDatabaseWrapper,
+) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """Return the earliest and latest submission times."""
+    with connection.cursor() as cursor:
+        column = connection.ops.quote_name(
+            FormSubmission._meta.get_field("submitted_at").column
+        )
+        cursor.execute(
+            f"SELECT MIN({column}), MAX({column}) "
+            f"FROM {connection.ops.quote_name(table_name())}"
+        )
+        return cursor.fetchone()
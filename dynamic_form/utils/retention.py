@@ -0,0 +1,173 @@
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models import DO_NOTHING, Count
+from django.db.models.signals import post_delete, pre_delete
+
+from dynamic_form.models import FormSubmission
+from dynamic_form.utils.counters import deferred_counters, record_deletions
+
+
+@dataclass
+class PurgeResult:
+    """Outcome of a purge run.
+
+    Attributes:
+        deleted (int): Number of deleted (or, in a dry run, matching) submissions
+        batches (int): Number of deleted batches
+        last_pk (int): Primary key of the last deleted submission; pass it as
+            `start_after` to resume an interrupted run
+        per_form (Dict[int, int]): Deleted (or matching) submissions per form ID
+        raw (bool): Whether rows were deleted without loading them
+
+    """
+
+    deleted: int = 0
+    batches: int = 0
+    last_pk: int = 0
+    per_form: Dict[int, int] = field(default_factory=dict)
+    raw: bool = False
+
+
+def can_raw_delete() -> bool:
+    """Return whether submissions can be deleted with a plain `DELETE`.
+
+    That is the case when no deletion signal receiver is connected to
+    `FormSubmission` (the package counts deletions without receivers, see
+    `FormSubmissionQuerySet`) and no model relation needs cascading.
+
+    """
+    if pre_delete.has_listeners(FormSubmission) or post_delete.has_listeners(
+        FormSubmission
+    ):
+        return False
+    return all(
+        relation.on_delete is DO_NOTHING
+        for relation in FormSubmission._meta.related_objects
+    )
+
+
+def delete_form_submissions(form_ids: Any, using: str = DEFAULT_DB_ALIAS) -> int:
+    """Delete every submission of forms that are being deleted with a single
+    `DELETE`, called by `DynamicForm.delete()` and `DynamicFormQuerySet.delete()`.
+
+    The counters of the forms are not updated, since the forms go away.
+    When raw deletes are not possible (see `can_raw_delete`) nothing is
+    deleted and the cascade deletes the submissions with signals.
+
+    Args:
+        form_ids (Any): IDs of the forms, or a queryset of them.
+        using (str): Alias of the database.
+
+    Returns:
+        int: The number of deleted submissions.
+
+    """
+    if not can_raw_delete():
+        return 0
+    return (
+        FormSubmission.objects.using(using)
+        .filter(form_id__in=form_ids)
+        ._raw_delete(using)
+    )
+
+
+def delete_submissions(
+    rows: List[Tuple[int, int]], using: str = DEFAULT_DB_ALIAS, raw: bool = False
+) -> None:
+    """Delete submissions given as ``(id, form_id)`` pairs, keeping the
+    form submission counters up to date.
+
+    With `raw`, the rows are deleted with a single `DELETE` (see
+    `can_raw_delete`); otherwise they are loaded and deleted with signals.
+    Call it inside a transaction.
+
+    """
+    batch = FormSubmission.objects.using(using).filter(pk__in=[pk for pk, _ in rows])
+    if not raw:
+        with deferred_counters():
+            batch.delete()
+        return
+
+    batch._raw_delete(using)
+    for form_id, count in Counter(form_id for _pk, form_id in rows).items():
+        record_deletions(form_id, count)
+
+
+def purge_submissions(
+    before: datetime,
+    form_ids: Optional[Iterable[int]] = None,
+    batch_size: int = 1000,
+    sleep: float = 0,
+    dry_run: bool = False,
+    start_after: int = 0,
+    using: str = DEFAULT_DB_ALIAS,
+    progress: Optional[Callable[[PurgeResult], None]] = None,
+) -> PurgeResult:
+    """Delete the submissions made before `before`, in batches.
+
+    Submissions are deleted in primary key order, `batch_size` rows per
+    transaction, pausing `sleep` seconds between batches so that other
+    writers are not starved. When no foreign deletion signal receivers are
+    connected, rows are deleted with `_raw_delete` without being loaded;
+    otherwise each batch goes through the regular (signal-sending) delete.
+    Form submission counters are kept up to date either way.
+
+    An interrupted purge can be resumed by passing the `last_pk` of the
+    last reported batch as `start_after`; rerunning from the start is also
+    safe, only slower.
+
+    Args:
+        before (datetime): Delete submissions made strictly before this time.
+        form_ids (Optional[Iterable[int]]): Restrict the purge to these forms.
+        batch_size (int): Number of submissions deleted per batch.
+        sleep (float): Seconds to wait between batches.
+        dry_run (bool): Only count the matching submissions.
+        start_after (int): Skip submissions with a primary key up to this one.
+        using (str): The database alias.
+        progress (Optional[Callable[[PurgeResult], None]]): Called after each batch.
+
+    Returns:
+        PurgeResult: The number of deleted submissions, per form and in total.
+
+    """
+    queryset = FormSubmission.objects.using(using).filter(
+        submitted_at__lt=before, pk__gt=start_after
+    )
+    if form_ids is not None:
+        queryset = queryset.filter(form_id__in=list(form_ids))
+
+    result = PurgeResult(last_pk=start_after, raw=can_raw_delete())
+    if dry_run:
+        for row in queryset.order_by().values("form_id").annotate(count=Count("pk")):
+            result.per_form[row["form_id"]] = row["count"]
+        result.deleted = sum(result.per_form.values())
+        return result
+
+    while True:
+        with transaction.atomic(using=using):
+            rows = list(
+                queryset.filter(pk__gt=result.last_pk)
+                .order_by("pk")
+                .values_list("pk", "form_id")[:batch_size]
+            )
+            if not rows:
+                return result
+
+            delete_submissions(rows, using, result.raw)
+
+        result.batches += 1
+        result.deleted += len(rows)
+        result.last_pk = rows[-1][0]
+        for form_id, count in Counter(form_id for _pk, form_id in rows).items():
+            result.per_form[form_id] = result.per_form.get(form_id, 0) + count
+        if progress is not None:
+            progress(result)
+        if len(rows) < batch_size:
+            return result
+        if sleep:
+            time.sleep(sleep)
@@ -1,5 +1,7 @@
-from typing import List
+import os
+from typing import List, Optional, Sequence
 
+from django.conf import settings
 from django.core.checks import Error
 from django.utils.module_loading import import_string
 
@@ -209,3 +211,136 @@ def validate_optional_paths_setting(
                 )
 
     return errors
+
+
+def validate_positive_integer_setting(
+    setting_value: Optional[int], setting_name: str
+) -> List[Error]:
+    """Validate that the setting is a positive integer.
+
+    Args:
+        setting_value (Optional[int]): The value of the setting to validate.
+        setting_name (str): The name of the setting being validated (for error reporting).
+
+    Returns:
+        List[Error]: A list of validation errors, or an empty list if valid.
+
+    """
+    errors: List[Error] = []
+
+    # If the setting is None, it's optional (or unlimited), so we consider it valid.
+    if setting_value is None:
+        return errors
+
+    if (
+        isinstance(setting_value, bool)
+        or not isinstance(setting_value, int)
+        or setting_value <= 0
+    ):
+        errors.append(
+            Error(
+                f"The setting '{setting_name}' must be a positive integer.",
+                hint=f"Ensure '{setting_name}' is set to an integer greater than zero.",
+                id=f"dynamic_form.E014_{setting_name}",
+            )
+        )
+
+    return errors
+
+
+def validate_cache_alias(
+    setting_value: Optional[str], setting_name: str
+) -> List[Error]:
+    """Validate that the setting refers to a cache configured in
+    ``settings.CACHES``.
+
+    Args:
+        setting_value (Optional[str]): The cache alias to validate.
+        setting_name (str): The name of the setting being validated (for error reporting).
+
+    Returns:
+        List[Error]: A list of validation errors, or an empty list if valid.
+
+    """
+    errors: List[Error] = []
+
+    if setting_value is None:
+        return errors
+
+    caches = getattr(settings, "CACHES", {"default": {}})
+    if not isinstance(setting_value, str) or setting_value not in caches:
+        errors.append(
+            Error(
+                f"The setting '{setting_name}' does not refer to a configured cache.",
+                hint=f"Ensure '{setting_name}' is one of the aliases defined in CACHES.",
+                id=f"dynamic_form.E015_{setting_name}",
+            )
+        )
+
+    return errors
+
+
+def validate_optional_directory(
+    setting_value: Optional[str], setting_name: str
+) -> List[Error]:
+    """Validate that the setting is a directory path, which does not need
+    to exist yet.
+
+    Args:
+        setting_value (Optional[str]): The directory path to validate.
+        setting_name (str): The name of the setting being validated (for error reporting).
+
+    Returns:
+        List[Error]: A list of validation errors, or an empty list if valid.
+
+    """
+    errors: List[Error] = []
+
+    if setting_value is None:
+        return errors
+
+    if (
+        not isinstance(setting_value, (str, os.PathLike))
+        or not str(setting_value)
+        or os.path.isfile(setting_value)
+    ):
+        errors.append(
+            Error(
+                f"The setting '{setting_name}' must be a directory path.",
+                hint=f"Set '{setting_name}' to a writable directory, or None.",
+                id=f"dynamic_form.E016_{setting_name}",
+            )
+        )
+
+    return errors
+
+
+def validate_choice_setting(
+    setting_value: Optional[str], setting_name: str, choices: Sequence[str]
+) -> List[Error]:
+    """Validate that the setting is one of the given choices.
+
+    Args:
+        setting_value (Optional[str]): The value of the setting to validate.
+        setting_name (str): The name of the setting being validated (for error reporting).
+        choices (Sequence[str]): The accepted values.
+
+    Returns:
+        List[Error]: A list of validation errors, or an empty list if valid.
+
+    """
+    errors: List[Error] = []
+
+    if setting_value is None:
+        return errors
+
+    if setting_value not in choices:
+        errors.append(
+            Error(
+                f"The setting '{setting_name}' must be one of: {', '.join(choices)}.",
+                hint=f"Set '{setting_name}' to one of the supported values, or None.",
+                id=f"dynamic_form.E017_{setting_name}",
+            )
+        )
+
+    return errors
@@ -0,0 +1,342 @@
+import re
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.validators import validate_email
+from django.utils.dateparse import parse_date, parse_datetime
+from django.utils.translation import gettext_lazy as _
+from django.utils.translation import ngettext_lazy
+
+# A compiled validator receives the submitted value and returns an error
+# message, or None when the value is valid.
+FieldValidator = Callable[[Any], Optional[str]]
+
+# (field name, is required, compiled validators) for every field of a form
+CompiledValidators = Tuple[Tuple[str, bool, Tuple[FieldValidator, ...]], ...]
+
+TEXT_TYPES = frozenset({"text", "textarea"})
+CHOICE_TYPES = frozenset({"dropdown", "radio"})
+
+MIN_LENGTH_CHARACTERS_MESSAGE = ngettext_lazy(
+    "Ensure this value has at least %(limit)s character.",
+    "Ensure this value has at least %(limit)s characters.",
+    "limit",
+)
+MIN_LENGTH_ITEMS_MESSAGE = ngettext_lazy(
+    "Ensure this value has at least %(limit)s item.",
+    "Ensure this value has at least %(limit)s items.",
+    "limit",
+)
+MAX_LENGTH_CHARACTERS_MESSAGE = ngettext_lazy(
+    "Ensure this value has at most %(limit)s character.",
+    "Ensure this value has at most %(limit)s characters.",
+    "limit",
+)
+MAX_LENGTH_ITEMS_MESSAGE = ngettext_lazy(
+    "Ensure this value has at most %(limit)s item.",
+    "Ensure this value has at most %(limit)s items.",
+    "limit",
+)
+MIN_VALUE_MESSAGE = _("Ensure this value is greater than or equal to %(limit)s.")
+MAX_VALUE_MESSAGE = _("Ensure this value is less than or equal to %(limit)s.")
+
+
+def normalize_choices(choices: Any) -> Optional[FrozenSet[Any]]:
+    """Turn stored choices into a frozenset of allowed values.
+
+    Choices may be stored as a list of values, a list of ``{"value": ...,
+    "label": ...}`` objects, or a mapping of value to label.
+
+    Args:
+        choices (Any): The raw choices stored on a DynamicField.
+
+    Returns:
+        Optional[FrozenSet[Any]]: The allowed values, or None if no choices are defined.
+
+    """
+    if not choices:
+        return None
+    if isinstance(choices, dict):
+        values: Iterable[Any] = choices.keys()
+    elif isinstance(choices, (list, tuple)):
+        values = (
+            item.get("value") if isinstance(item, dict) else item for item in choices
+        )
+    else:
+        return None
+    return frozenset(
+        value for value in values if isinstance(value, (str, int, float, bool))
+    )
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _type_validator(field_type: str, has_choices: bool) -> Optional[FieldValidator]:
+    """Build the validator checking the value against the field type."""
+    if field_type in TEXT_TYPES:
+        message = _("Expected a string.")
+        return lambda value: None if isinstance(value, str) else message
+
+    if field_type == "number":
+        message = _("Expected a number.")
+        return lambda value: None if _is_number(value) else message
+
+    if field_type == "boolean" or (field_type == "checkbox" and not has_choices):
+        message = _("Expected a boolean.")
+        return lambda value: None if isinstance(value, bool) else message
+
+    if field_type == "checkbox":
+        message = _("Expected a list of choices.")
+        return lambda value: None if isinstance(value, list) else message
+
+    if field_type == "email":
+        message = _("Enter a valid email address.")
+
+        def check_email(value: Any) -> Optional[str]:
+            if not isinstance(value, str):
+                return message
+            try:
+                validate_email(value)
+            except DjangoValidationError:
+                return message
+            return None
+
+        return check_email
+
+    if field_type == "date":
+        message = _("Enter a valid date in ISO 8601 format.")
+
+        def check_date(value: Any) -> Optional[str]:
+            try:
+                valid = isinstance(value, str) and bool(
+                    parse_date(value) or parse_datetime(value)
+                )
+            except ValueError:
+                valid = False
+            return None if valid else message
+
+        return check_date
+
+    return None
+
+
+def _choices_validator(field_type: str, allowed: FrozenSet[Any]) -> FieldValidator:
+    """Build the validator checking the value against the allowed
+    choices."""
+    message = _("Select a valid choice.")
+
+    if field_type == "checkbox":
+        return lambda value: (
+            None
+            if isinstance(value, list)
+            and all(
+                isinstance(item, (str, int, float, bool)) and item in allowed
+                for item in value
+            )
+            else message
+        )
+
+    return lambda value: (
+        None
+        if isinstance(value, (str, int, float, bool)) and value in allowed
+        else message
+    )
+
+
+def _rule_validators(rules: Dict[str, Any]) -> List[FieldValidator]:
+    """Build the validators of the generic validation rules."""
+    validators: List[FieldValidator] = []
+
+    # Messages stay lazy and are only rendered when a value fails, so each
+    # request gets them in its own language although validators are cached
+    min_length = rules.get("min_length")
+    if isinstance(min_length, int):
+
+        def check_min_length(value: Any) -> Optional[str]:
+            if not isinstance(value, (str, list)) or len(value) >= min_length:
+                return None
+            if isinstance(value, str):
+                message = MIN_LENGTH_CHARACTERS_MESSAGE
+            else:
+                message = MIN_LENGTH_ITEMS_MESSAGE
+            return message % {"limit": min_length}
+
+        validators.append(check_min_length)
+
+    max_length = rules.get("max_length")
+    if isinstance(max_length, int):
+
+        def check_max_length(value: Any) -> Optional[str]:
+            if not isinstance(value, (str, list)) or len(value) <= max_length:
+                return None
+            if isinstance(value, str):
+                message = MAX_LENGTH_CHARACTERS_MESSAGE
+            else:
+                message = MAX_LENGTH_ITEMS_MESSAGE
+            return message % {"limit": max_length}
+
+        validators.append(check_max_length)
+
+    min_value = rules.get("min_value")
+    if _is_number(min_value):
+        validators.append(
+            lambda value: (
+                MIN_VALUE_MESSAGE % {"limit": min_value}
+                if _is_number(value) and value < min_value
+                else None
+            )
+        )
+
+    max_value = rules.get("max_value")
+    if _is_number(max_value):
+        validators.append(
+            lambda value: (
+                MAX_VALUE_MESSAGE % {"limit": max_value}
+                if _is_number(value) and value > max_value
+                else None
+            )
+        )
+
+    pattern = rules.get("regex", rules.get("pattern"))
+    if isinstance(pattern, str):
+        try:
+            regex = re.compile(pattern)
+        except re.error:
+            regex = None
+        if regex is not None:
+            regex_message = _("Enter a valid value.")
+            search = regex.search
+            validators.append(
+                lambda value: (
+                    regex_message
+                    if isinstance(value, str) and search(value) is None
+                    else None
+                )
+            )
+
+    return validators
+
+
+def compile_field_validators(
+    field_type: str, choices: Any, rules: Optional[Dict[str, Any]]
+) -> Tuple[FieldValidator, ...]:
+    """Compile the type check, choices membership and validation rules of a
+    single field into a tuple of callables.
+
+    Args:
+        field_type (str): Name of the field's FieldType.
+        choices (Any): The raw choices stored on the field.
+        rules (Optional[Dict[str, Any]]): The raw validation rules stored on the field.
+
+    Returns:
+        Tuple[FieldValidator, ...]: The compiled validators, in evaluation order.
+
+    """
+    allowed = normalize_choices(choices)
+    validators: List[FieldValidator] = []
+
+    type_validator = _type_validator(field_type, allowed is not None)
+    if type_validator is not None:
+        validators.append(type_validator)
+
+    if allowed is not None and (field_type in CHOICE_TYPES or field_type == "checkbox"):
+        validators.append(_choices_validator(field_type, allowed))
+
+    if isinstance(rules, dict):
+        validators.extend(_rule_validators(rules))
+
+    return tuple(validators)
+
+
+def compile_form_validators(fields: Iterable[Any]) -> CompiledValidators:
+    """Compile the validators of every field of a form.
+
+    Args:
+        fields (Iterable[Any]): Objects exposing `name`, `is_required`, `field_type`,
+            `choices` and `validation_rules` (e.g. CompiledField instances).
+
+    Returns:
+        CompiledValidators: One entry per field, in the given order.
+
+    """
+    return tuple(
+        (
+            field.name,
+            field.is_required,
+            compile_field_validators(
+                field.field_type, field.choices, field.validation_rules
+            ),
+        )
+        for field in fields
+    )
+
+
+def run_validators(
+    validators: CompiledValidators, data: Dict[str, Any]
+) -> Dict[str, List[str]]:
+    """Validate submitted data against compiled validators.
+
+    Missing, null and empty-string values are only rejected for required
+    fields; the remaining validators are skipped for them.
+
+    Args:
+        validators (CompiledValidators): The compiled validators of the form.
+        data (Dict[str, Any]): The submitted data keyed by field name.
+
+    Returns:
+        Dict[str, List[str]]: Error messages keyed by field name, empty if the data is valid.
+
+    """
+    errors: Dict[str, List[str]] = {}
+    for name, is_required, field_validators in validators:
+        value = data.get(name)
+        if value is None or value == "":
+            if is_required:
+                errors[name] = [_("This field is required.")]
+            continue
+        for validator in field_validators:
+            message = validator(value)
+            if message is not None:
+                errors.setdefault(name, []).append(message)
+    return errors
+
+
+def validate_rules_definition(rules: Any) -> List[str]:
+    """Check that stored validation rules can be compiled.
+
+    Args:
+        rules (Any): The raw validation rules of a DynamicField.
+
+    Returns:
+        List[str]: Error messages describing invalid rules, empty if they are valid.
+
+    """
+    if rules in (None, {}):
+        return []
+    if not isinstance(rules, dict):
+        return [_("Validation rules must be a JSON object.")]
+
+    errors: List[str] = []
+    for key in ("min_length", "max_length"):
+        value = rules.get(key)
+        if value is not None and (
+            not isinstance(value, int) or isinstance(value, bool)
+        ):
+            errors.append(_("'%(rule)s' must be an integer.") % {"rule": key})
+    for key in ("min_value", "max_value"):
+        value = rules.get(key)
+        if value is not None and not _is_number(value):
+            errors.append(_("'%(rule)s' must be a number.") % {"rule": key})
+    for key in ("regex", "pattern"):
+        value = rules.get(key)
+        if value is None:
+            continue
+        try:
+            re.compile(value)
+        except (re.error, TypeError):
+            errors.append(
+                _("'%(rule)s' must be a valid regular expression.") % {"rule": key}
+            )
+    return errors